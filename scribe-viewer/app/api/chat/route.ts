@@ -5,6 +5,7 @@
 
 import { NextRequest, NextResponse } from 'next/server';
 import { getSearchEngine } from '@/lib/search';
+import { retrievePassages } from '@/lib/retrieval';
 import { Interview, SearchResult } from '@/lib/types';
 import OpenAI from 'openai';
 
@@ -119,12 +120,15 @@ class ChatEngine {
 	}> {
 		const startTime = Date.now();
 
-		// Step 1: Search for relevant content
-		const searchResults = this.searchEngine.search({
-			query,
-			limit: options.maxResults || 10,
-			includeTranscripts: true,
-		});
+		// Step 1: Search for relevant content, preferring the segment retrieval
+		// service and falling back to in-memory search of the manifest
+		const searchResults =
+			(await this.retrieve(query, options)) ??
+			this.searchEngine.search({
+				query,
+				limit: options.maxResults || 10,
+				includeTranscripts: true,
+			});
 
 		if (searchResults.length === 0) {
 			return {
@@ -152,6 +156,39 @@ class ChatEngine {
 		};
 	}
 
+	/**
+	 * Retrieve time-coded passages from the retrieval service (see lib/retrieval.ts).
+	 * Returns null when the service is not configured or unavailable.
+	 */
+	private async retrieve(
+		query: string,
+		options: { language?: string; maxResults?: number }
+	): Promise<SearchResult[] | null> {
+		const passages = await retrievePassages(query, {
+			language: options.language,
+			limit: options.maxResults || 10,
+		});
+		if (!passages) return null;
+
+		const byId = new Map(this.interviews.map(interview => [interview.id, interview]));
+		const topScore = passages[0]?.score || 1;
+		const results: SearchResult[] = [];
+		for (const passage of passages) {
+			const interview = byId.get(passage.interviewId);
+			if (!interview) continue;
+			results.push({
+				interview,
+				// Match Fuse.js semantics: 0 is the best match
+				score: 1 - passage.score / topScore,
+				snippet: passage.text,
+				timestamp: passage.startTime,
+				context: passage.text,
+				matchedField: 'transcript',
+			});
+		}
+		return results;
+	}
+
 	private prepareContext(searchResults: SearchResult[], query: string): string {
 		const contextParts: string[] = [];
 		
@@ -0,0 +1,127 @@
+/**
+ * Transcript search API backed by the prebuilt inverted index
+ *
+ * Answers queries from public/search-index.json and returns one result per
+ * interview, with its earliest matching cue as snippet and timestamp.
+ * Responds 404 when build_manifest.py wrote no index; the search page then
+ * falls back to Fuse over the full manifest.
+ */
+
+import { NextRequest, NextResponse } from 'next/server';
+import { IndexHit, loadSearchIndex } from '@/lib/search-index';
+import { loadInterviewIndex, loadTranscriptShard } from '@/lib/manifest';
+import { Interview, SearchResult } from '@/lib/types';
+
+const DEFAULT_LIMIT = 60;
+const MAX_LIMIT = 200;
+// Cue hits considered before grouping them by interview
+const MAX_HITS = 10000;
+
+function listParam(params: URLSearchParams, name: string): string[] {
+  const value = params.get(name);
+  return value ? value.split(',').filter(Boolean) : [];
+}
+
+function escapeHtml(text: string): string {
+  return text
+    .replace(/&/g, '&amp;')
+    .replace(/</g, '&lt;')
+    .replace(/>/g, '&gt;')
+    .replace(/"/g, '&quot;');
+}
+
+/** Escape cue text and mark the query words in it. */
+function highlight(text: string, query: string): string {
+  const words = query
+    .split(/\s+/)
+    .filter(Boolean)
+    .map(word => escapeHtml(word).replace(/[.*+?^${}()|[\]\\]/g, '\\$&'));
+  const escaped = escapeHtml(text);
+  if (words.length === 0) return escaped;
+  return escaped.replace(new RegExp(`(${words.join('|')})`, 'gi'), '<mark>$1</mark>');
+}
+
+function matchesFilters(
+  interview: Interview,
+  interviewees: string[],
+  dateStart: string | null,
+  dateEnd: string | null
+): boolean {
+  if (interviewees.length > 0) {
+    const name = interview.metadata?.interviewee?.toLowerCase();
+    if (!name || !interviewees.some(filter => name.includes(filter))) return false;
+  }
+  if (dateStart && dateEnd) {
+    const date = interview.metadata?.date;
+    if (!date || date < dateStart || date > dateEnd) return false;
+  }
+  return true;
+}
+
+// GET /api/search?q=...&lang=en,de&interviewees=...&dateStart=...&dateEnd=...&limit=...
+export async function GET(request: NextRequest) {
+  try {
+    const index = await loadSearchIndex();
+    const interviewIndex = index ? await loadInterviewIndex() : null;
+    if (!index || !interviewIndex) {
+      return NextResponse.json({ error: 'Search index not available' }, { status: 404 });
+    }
+
+    const params = new URL(request.url).searchParams;
+    const query = params.get('q') || '';
+    const languages = listParam(params, 'lang');
+    const interviewees = listParam(params, 'interviewees').map(name => name.toLowerCase());
+    const dateStart = params.get('dateStart');
+    const dateEnd = params.get('dateEnd');
+    const limit = Math.min(Number(params.get('limit')) || DEFAULT_LIMIT, MAX_LIMIT);
+
+    const hits = languages.length > 0
+      ? languages.flatMap(language => index.search(query, { language, limit: MAX_HITS }))
+      : index.search(query, { limit: MAX_HITS });
+
+    // Group cue hits by interview, keeping the earliest cue
+    const groups = new Map<string, { first: IndexHit; count: number }>();
+    for (const hit of hits) {
+      const group = groups.get(hit.interviewId);
+      if (!group) {
+        groups.set(hit.interviewId, { first: hit, count: 1 });
+      } else {
+        group.count++;
+        if (hit.time < group.first.time) group.first = hit;
+      }
+    }
+
+    const interviews = new Map(interviewIndex.map(interview => [interview.id, interview]));
+    const matched = Array.from(groups.entries())
+      .map(([id, group]) => ({ interview: interviews.get(id), ...group }))
+      .filter((match): match is { interview: Interview; first: IndexHit; count: number } =>
+        !!match.interview && matchesFilters(match.interview, interviewees, dateStart, dateEnd)
+      )
+      .sort((a, b) => b.count - a.count)
+      .slice(0, limit);
+
+    const results: SearchResult[] = await Promise.all(matched.map(async ({ interview, first, count }) => {
+      const transcripts = await loadTranscriptShard(interview.id);
+      const cue = transcripts?.find(t => t.language === first.language)?.cues[first.cueIndex];
+      const snippet = cue ? highlight(cue.text, query) : escapeHtml(interview.metadata?.summary || '');
+
+      return {
+        interview: {
+          ...interview,
+          transcripts: index.languagesFor(interview.id).map(language => ({ language, text: '', cues: [] })),
+        },
+        // More matching cues rank higher; lower is better as with Fuse
+        score: 1 / (1 + count),
+        snippet,
+        context: `From transcript: ${snippet}`,
+        matchedField: 'transcript',
+        timestamp: first.time,
+      };
+    }));
+
+    return NextResponse.json({ results });
+  } catch (error) {
+    console.error('Search error:', error);
+    return NextResponse.json({ error: 'Search failed' }, { status: 500 });
+  }
+}
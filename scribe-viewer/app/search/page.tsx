@@ -7,6 +7,8 @@ import { Suspense } from 'react';
 import { Metadata } from 'next';
 import SearchPageClient from './search-client';
 import { Interview } from '@/lib/types';
+import { loadInterviewIndex } from '@/lib/manifest';
+import { loadSearchIndex } from '@/lib/search-index';
 import { readFile } from 'fs/promises';
 import { join } from 'path';
 
@@ -26,12 +28,32 @@ async function loadManifest(): Promise<Interview[]> {
   }
 }
 
+/**
+ * Load the interviews to search.
+ * With a prebuilt search index only the interview index is read, and transcript
+ * queries go to /api/search; otherwise Fuse searches the full manifest.
+ */
+async function loadSearchData(): Promise<{ interviews: Interview[]; useSearchIndex: boolean }> {
+  const searchIndex = await loadSearchIndex();
+  const interviewIndex = searchIndex ? await loadInterviewIndex() : null;
+
+  if (searchIndex && interviewIndex) {
+    const interviews = interviewIndex.map(interview => ({
+      ...interview,
+      transcripts: searchIndex.languagesFor(interview.id).map(language => ({ language, text: '', cues: [] })),
+    }));
+    return { interviews, useSearchIndex: true };
+  }
+
+  return { interviews: await loadManifest(), useSearchIndex: false };
+}
+
 export default async function SearchPage({
   searchParams,
 }: {
   searchParams: { [key: string]: string | string[] | undefined };
 }) {
-  const interviews = await loadManifest();
+  const { interviews, useSearchIndex } = await loadSearchData();
   
   // Extract search parameters
   const initialQuery = typeof searchParams.q === 'string' ? searchParams.q : '';
@@ -67,6 +89,7 @@ export default async function SearchPage({
         <Suspense fallback={<SearchPageSkeleton />}>
           <SearchPageClient
             interviews={interviews}
+            useSearchIndex={useSearchIndex}
             initialQuery={initialQuery}
             initialLanguages={initialLanguages}
             initialInterviewees={initialInterviewees}
@@ -32,6 +32,8 @@ import SearchResults from '@/components/SearchResults';
 
 interface SearchPageClientProps {
   interviews: Interview[];
+  /** Search transcripts through the prebuilt index instead of Fuse */
+  useSearchIndex?: boolean;
   initialQuery?: string;
   initialLanguages?: string[];
   initialInterviewees?: string[];
@@ -39,8 +41,33 @@ interface SearchPageClientProps {
 
 const RESULTS_PER_PAGE = 20;
 
+/**
+ * Search transcripts through the prebuilt index (/api/search).
+ * Returns null if the index is unavailable so the caller can fall back to Fuse.
+ */
+async function fetchIndexedResults(options: SearchOptions): Promise<SearchResult[] | null> {
+  const params = new URLSearchParams({ q: options.query, limit: String(options.limit) });
+  if (options.languages?.length) params.set('lang', options.languages.join(','));
+  if (options.interviewees?.length) params.set('interviewees', options.interviewees.join(','));
+  if (options.dateRange) {
+    params.set('dateStart', options.dateRange.start);
+    params.set('dateEnd', options.dateRange.end);
+  }
+
+  try {
+    const response = await fetch(`/api/search?${params.toString()}`);
+    if (!response.ok) return null;
+    const data = await response.json();
+    return data.results;
+  } catch (error) {
+    console.error('Indexed search failed, falling back to Fuse:', error);
+    return null;
+  }
+}
+
 export default function SearchPageClient({
   interviews,
+  useSearchIndex = false,
   initialQuery = '',
   initialLanguages = [],
   initialInterviewees = [],
@@ -100,7 +127,11 @@ export default function SearchPageClient({
         includeTranscripts: true,
       };
 
-      const results = searchEngine.search(searchOptions);
+      // Transcript queries use the prebuilt index when there is one
+      const indexedResults = useSearchIndex && searchQuery.trim()
+        ? await fetchIndexedResults(searchOptions)
+        : null;
+      const results = indexedResults || searchEngine.search(searchOptions);
       
       // Apply sorting
       const sortedResults = sortResults(results, searchFilters.sortBy, searchFilters.sortDirection);
@@ -125,7 +156,7 @@ export default function SearchPageClient({
     } finally {
       setIsSearching(false);
     }
-  }, [searchEngine, searchHistory]);
+  }, [searchEngine, searchHistory, useSearchIndex]);
 
   // Sort results
   const sortResults = (results: SearchResult[], sortBy: string, direction: string): SearchResult[] => {
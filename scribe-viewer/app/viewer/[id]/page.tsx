@@ -1,18 +1,14 @@
-import { promises as fs } from 'fs'
-import path from 'path'
 import { Interview } from "@/lib/types"
+import { loadInterview as loadInterviewShard } from "@/lib/manifest"
 import Link from "next/link"
 import { Button } from "@/components/ui/button"
 import { ArrowLeft } from "lucide-react"
 import ViewerClient from "./viewer-client"
 
 async function loadInterview(id: string): Promise<Interview | null> {
-  const manifestPath = path.join(process.cwd(), 'public', 'manifest.json')
-  
   try {
-    const fileContents = await fs.readFile(manifestPath, 'utf8')
-    const interviews: Interview[] = JSON.parse(fileContents)
-    return interviews.find(interview => interview.id === id) || null
+    // Index + one transcript shard rather than the full manifest
+    return await loadInterviewShard(id)
   } catch (error) {
     console.error('Error loading interview:', error)
     return null
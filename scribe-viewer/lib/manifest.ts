@@ -0,0 +1,74 @@
+/**
+ * Server-side manifest loading
+ *
+ * build_manifest.py writes manifest.min.json (id, metadata, assets for every
+ * interview) as the index, plus one transcript shard per interview under
+ * public/transcripts/. Loading a single interview reads the index and one
+ * shard instead of parsing the full manifest.json.
+ */
+
+import { promises as fs } from 'fs';
+import path from 'path';
+import { gunzipSync } from 'zlib';
+import { Interview, InterviewTranscript } from './types';
+
+const PUBLIC_DIR = path.join(process.cwd(), 'public');
+const INDEX_PATH = path.join(PUBLIC_DIR, 'manifest.min.json');
+const FULL_MANIFEST_PATH = path.join(PUBLIC_DIR, 'manifest.json');
+const SHARD_DIR = path.join(PUBLIC_DIR, 'transcripts');
+
+// Interview ids are UUIDs; anything else must not reach the filesystem
+const SAFE_ID = /^[A-Za-z0-9_-]+$/;
+
+/**
+ * Load the transcripts of one interview from its shard.
+ * Returns null if no shard exists (manifest built without shards).
+ */
+export async function loadTranscriptShard(id: string): Promise<InterviewTranscript[] | null> {
+  if (!SAFE_ID.test(id)) return null;
+
+  const base = path.join(SHARD_DIR, id);
+  try {
+    const data = await fs.readFile(`${base}.json`, 'utf8');
+    return JSON.parse(data).transcripts;
+  } catch {}
+
+  try {
+    const data = await fs.readFile(`${base}.json.gz`);
+    return JSON.parse(gunzipSync(data).toString('utf8')).transcripts;
+  } catch {}
+
+  return null;
+}
+
+/**
+ * Load the interview index (metadata and assets, no transcripts).
+ * Returns null if manifest.min.json is missing or unreadable.
+ */
+export async function loadInterviewIndex(): Promise<Interview[] | null> {
+  try {
+    return JSON.parse(await fs.readFile(INDEX_PATH, 'utf8'));
+  } catch {
+    return null;
+  }
+}
+
+/**
+ * Load a single interview with its transcripts.
+ * Falls back to the full manifest when the index or shard is missing.
+ */
+export async function loadInterview(id: string): Promise<Interview | null> {
+  const index = await loadInterviewIndex();
+  if (index) {
+    const entry = index.find(interview => interview.id === id);
+    if (!entry) return null;
+
+    const transcripts = await loadTranscriptShard(id);
+    if (transcripts) {
+      return { ...entry, transcripts };
+    }
+  }
+
+  const interviews: Interview[] = JSON.parse(await fs.readFile(FULL_MANIFEST_PATH, 'utf8'));
+  return interviews.find(interview => interview.id === id) || null;
+}
@@ -0,0 +1,82 @@
+/**
+ * Client for the Python retrieval service (scribe/retrieval.py)
+ *
+ * Start it with `python scribe_cli.py retrieval serve` and set
+ * SCRIBE_RETRIEVAL_URL (e.g. http://127.0.0.1:8765). It ranks subtitle
+ * segments from the database with bm25 (plus vectors when an index is built)
+ * and returns time-coded passages, so retrieval cost no longer grows with the
+ * size of the manifest held in the route.
+ */
+
+export interface Passage {
+  interviewId: string;
+  language: string;
+  /** Passage start/end in seconds */
+  startTime: number;
+  endTime: number;
+  text: string;
+  /** Fused relevance score (higher is better) */
+  score: number;
+  /** Segment indexes that matched the query */
+  matchedSegments: number[];
+}
+
+export interface RetrievalOptions {
+  language?: string;
+  limit?: number;
+  mode?: 'bm25' | 'vector' | 'hybrid';
+}
+
+// Fall back to in-process search rather than hold up the chat response
+const RETRIEVAL_TIMEOUT_MS = 3000;
+
+export function retrievalConfigured(): boolean {
+  return !!process.env.SCRIBE_RETRIEVAL_URL;
+}
+
+/**
+ * Retrieve passages for a query.
+ * Returns null if the service is not configured or not reachable.
+ */
+export async function retrievePassages(
+  query: string,
+  options: RetrievalOptions = {}
+): Promise<Passage[] | null> {
+  const baseUrl = process.env.SCRIBE_RETRIEVAL_URL;
+  if (!baseUrl) return null;
+
+  const params = new URLSearchParams({ q: query });
+  if (options.language) params.set('lang', options.language);
+  if (options.limit) params.set('limit', String(options.limit));
+  if (options.mode) params.set('mode', options.mode);
+
+  const controller = new AbortController();
+  const timer = setTimeout(() => controller.abort(), RETRIEVAL_TIMEOUT_MS);
+
+  try {
+    const response = await fetch(`${baseUrl.replace(/\/$/, '')}/search?${params}`, {
+      signal: controller.signal,
+      cache: 'no-store',
+    });
+    if (!response.ok) {
+      console.error(`Retrieval service returned ${response.status}`);
+      return null;
+    }
+
+    const data = await response.json();
+    return data.passages.map((p: any) => ({
+      interviewId: p.interview_id,
+      language: p.lang,
+      startTime: p.start_time,
+      endTime: p.end_time,
+      text: p.text,
+      score: p.score,
+      matchedSegments: p.matched_segments,
+    }));
+  } catch (error) {
+    console.error('Retrieval service unavailable:', error);
+    return null;
+  } finally {
+    clearTimeout(timer);
+  }
+}
@@ -0,0 +1,189 @@
+/**
+ * Reader for the prebuilt inverted search index
+ *
+ * build_manifest.py writes public/search-index.json (format documented in
+ * scripts/search_index.py). Queries are dictionary lookups plus a binary
+ * search over the sorted vocabulary for prefix terms, so query time depends
+ * on the number of matches rather than on total transcript size.
+ */
+
+import { promises as fs } from 'fs';
+import path from 'path';
+import { gunzipSync } from 'zlib';
+
+interface SearchIndexData {
+  version: number;
+  docs: [string, string][];
+  times: number[][];
+  terms: Record<string, Record<string, number[][]>>;
+}
+
+export interface IndexHit {
+  interviewId: string;
+  language: string;
+  /** Index of the matching cue in the transcript */
+  cueIndex: number;
+  /** Cue start time in seconds */
+  time: number;
+}
+
+export interface IndexSearchOptions {
+  /** Restrict to one transcript language ('orig', 'en', 'de', 'he') */
+  language?: string;
+  /** Treat the last query term as a prefix (default: true) */
+  prefix?: boolean;
+  limit?: number;
+}
+
+// Must match tokenize() in scripts/search_index.py
+const COMBINING_MARKS = /[\u0300-\u036f\u0591-\u05bd\u05bf\u05c1\u05c2\u05c4\u05c5\u05c7]/g;
+const HEBREW_QUOTES = /[\u05f3\u05f4]/g;
+// Constructed at runtime: property escapes are newer than the ES6 compile target
+const TOKEN_RE = new RegExp('[\\p{L}\\p{N}]+', 'gu');
+
+// Cap on vocabulary entries a prefix term may expand to
+const MAX_PREFIX_EXPANSION = 200;
+
+export function tokenize(text: string): string[] {
+  const normalized = text
+    .normalize('NFKD')
+    .replace(COMBINING_MARKS, '')
+    .replace(HEBREW_QUOTES, '')
+    .toLowerCase();
+  return normalized.match(TOKEN_RE) || [];
+}
+
+/** Decode a posting into its doc number and absolute cue indexes. */
+function decodePosting(posting: number[]): [number, number[]] {
+  const cues: number[] = [];
+  let cue = 0;
+  for (let i = 1; i < posting.length; i++) {
+    cue = i === 1 ? posting[i] : cue + posting[i];
+    cues.push(cue);
+  }
+  return [posting[0], cues];
+}
+
+export class SearchIndex {
+  private data: SearchIndexData;
+  /** Sorted vocabulary per language, for prefix lookups */
+  private vocabulary: Record<string, string[]> = {};
+  /** Transcript languages per interview */
+  private interviewLanguages = new Map<string, string[]>();
+
+  constructor(data: SearchIndexData) {
+    this.data = data;
+    for (const [language, terms] of Object.entries(data.terms)) {
+      this.vocabulary[language] = Object.keys(terms).sort();
+    }
+    for (const [interviewId, language] of data.docs) {
+      const languages = this.interviewLanguages.get(interviewId) || [];
+      languages.push(language);
+      this.interviewLanguages.set(interviewId, languages);
+    }
+  }
+
+  /** Languages present in the index */
+  get languages(): string[] {
+    return Object.keys(this.data.terms);
+  }
+
+  /** Indexed transcript languages of one interview */
+  languagesFor(interviewId: string): string[] {
+    return this.interviewLanguages.get(interviewId) || [];
+  }
+
+  /** Tokens in the vocabulary starting with prefix (binary search). */
+  private expandPrefix(language: string, prefix: string): string[] {
+    const words = this.vocabulary[language] || [];
+    let lo = 0;
+    let hi = words.length;
+    while (lo < hi) {
+      const mid = (lo + hi) >> 1;
+      if (words[mid] < prefix) lo = mid + 1;
+      else hi = mid;
+    }
+    const matches: string[] = [];
+    for (let i = lo; i < words.length && words[i].startsWith(prefix); i++) {
+      matches.push(words[i]);
+      if (matches.length >= MAX_PREFIX_EXPANSION) break;
+    }
+    return matches;
+  }
+
+  /** Cues (as "doc:cue" keys) containing any of the given tokens. */
+  private cuesFor(language: string, tokens: string[]): Set<string> {
+    const cues = new Set<string>();
+    const terms = this.data.terms[language] || {};
+    for (const token of tokens) {
+      for (const posting of terms[token] || []) {
+        const [doc, cueIndexes] = decodePosting(posting);
+        for (const cue of cueIndexes) cues.add(`${doc}:${cue}`);
+      }
+    }
+    return cues;
+  }
+
+  /**
+   * Find cues containing every query term.
+   * Results are ordered by interview, language and time.
+   */
+  search(query: string, options: IndexSearchOptions = {}): IndexHit[] {
+    const { language, prefix = true, limit = 50 } = options;
+    const tokens = tokenize(query);
+    if (tokens.length === 0) return [];
+
+    const languages = language ? [language] : this.languages;
+    const hits: IndexHit[] = [];
+
+    for (const lang of languages) {
+      let matched: Set<string> | null = null;
+
+      for (let i = 0; i < tokens.length; i++) {
+        const isLast = i === tokens.length - 1;
+        const variants = prefix && isLast ? this.expandPrefix(lang, tokens[i]) : [tokens[i]];
+        const cues = this.cuesFor(lang, variants);
+        matched = matched === null ? cues : new Set([...matched].filter(key => cues.has(key)));
+        if (matched.size === 0) break;
+      }
+
+      for (const key of matched || []) {
+        const [doc, cue] = key.split(':').map(Number);
+        const [interviewId, docLanguage] = this.data.docs[doc];
+        hits.push({ interviewId, language: docLanguage, cueIndex: cue, time: this.data.times[doc][cue] });
+      }
+    }
+
+    hits.sort((a, b) =>
+      a.interviewId.localeCompare(b.interviewId) ||
+      a.language.localeCompare(b.language) ||
+      a.time - b.time
+    );
+    return hits.slice(0, limit);
+  }
+}
+
+let cachedIndex: SearchIndex | null = null;
+
+/**
+ * Load the prebuilt index from public/ (server side), cached per process.
+ * Returns null if build_manifest.py was run without a search index.
+ */
+export async function loadSearchIndex(): Promise<SearchIndex | null> {
+  if (cachedIndex) return cachedIndex;
+
+  const base = path.join(process.cwd(), 'public', 'search-index.json');
+  try {
+    cachedIndex = new SearchIndex(JSON.parse(await fs.readFile(base, 'utf8')));
+    return cachedIndex;
+  } catch {}
+
+  try {
+    const data = await fs.readFile(`${base}.gz`);
+    cachedIndex = new SearchIndex(JSON.parse(gunzipSync(data).toString('utf8')));
+    return cachedIndex;
+  } catch {}
+
+  return null;
+}
+
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Benchmark the prebuilt search index on the full archive.
+
+Reports index build time, serialized size (plain and gzipped) and lookup
+latency compared with scanning every cue, which is what a runtime index over
+all transcript text has to do.
+
+Usage (from scribe-viewer/):
+    python scripts/benchmark_search_index.py
+    python scripts/benchmark_search_index.py --manifest public/manifest.json
+    python scripts/benchmark_search_index.py --synthetic 700   # no manifest needed
+"""
+
+import argparse
+import gzip
+import json
+import random
+import statistics
+import time
+from typing import Dict, List
+
+from search_index import SearchIndexBuilder, tokenize
+
+SYNTHETIC_WORDS = [
+    'wehrmacht', 'family', 'mother', 'father', 'berlin', 'hamburg', 'school',
+    'soldier', 'officer', 'jewish', 'papers', 'front', 'russia', 'france',
+    'grandfather', 'war', 'camp', 'letter', 'uniform', 'train', 'home', 'church',
+    'mischling', 'army', 'deported', 'friend', 'neighbor', 'hidden', 'escape',
+    'remember', 'afraid', 'after', 'before', 'during', 'years', 'brother'
+]
+
+
+def synthetic_manifest(interviews: int, cues_per_transcript: int = 1500) -> List[Dict]:
+    """Generate manifest entries shaped like real ones, with random cue text."""
+    rng = random.Random(42)
+    vocabulary = SYNTHETIC_WORDS + [f"name{i}" for i in range(5000)]
+    entries = []
+    for i in range(interviews):
+        transcripts = []
+        for language in ('orig', 'en', 'de', 'he'):
+            cues = [
+                {'time': c * 2.5, 'text': ' '.join(rng.choices(vocabulary, k=rng.randint(4, 12)))}
+                for c in range(cues_per_transcript)
+            ]
+            transcripts.append({'language': language, 'text': '', 'cues': cues})
+        entries.append({'id': f"synthetic-{i:05d}", 'transcripts': transcripts})
+    return entries
+
+
+def lookup(index: Dict, token: str, language: str) -> List[tuple]:
+    """(doc, cue) pairs for a token, decoding postings like the viewer does."""
+    hits = []
+    for posting in index['terms'].get(language, {}).get(token, []):
+        cue = posting[1]
+        hits.append((posting[0], cue))
+        for gap in posting[2:]:
+            cue += gap
+            hits.append((posting[0], cue))
+    return hits
+
+
+def scan(entries: List[Dict], token: str, language: str) -> List[tuple]:
+    """(interview, cue) pairs found by tokenizing every cue of every transcript."""
+    hits = []
+    for entry in entries:
+        for transcript in entry['transcripts']:
+            if transcript['language'] != language:
+                continue
+            for cue_index, cue in enumerate(transcript.get('cues') or []):
+                if token in tokenize(cue['text']):
+                    hits.append((entry['id'], cue_index))
+    return hits
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the prebuilt search index")
+    parser.add_argument('--manifest', default='public/manifest.json',
+                        help='Manifest to index (default: public/manifest.json)')
+    parser.add_argument('--synthetic', type=int, metavar='N',
+                        help='Benchmark N synthetic interviews instead of a manifest')
+    parser.add_argument('--queries', type=int, default=20,
+                        help='Number of sample query tokens (default: 20)')
+    args = parser.parse_args()
+
+    if args.synthetic:
+        entries = synthetic_manifest(args.synthetic)
+        source = f"{args.synthetic} synthetic interviews"
+    else:
+        with open(args.manifest, 'r', encoding='utf-8') as f:
+            entries = json.load(f)
+        source = args.manifest
+
+    cue_count = sum(len(t.get('cues') or []) for e in entries for t in e.get('transcripts', []))
+    text_bytes = sum(len(c['text'].encode('utf-8'))
+                     for e in entries for t in e.get('transcripts', []) for c in (t.get('cues') or []))
+    print(f"Source: {source}")
+    print(f"  {len(entries):,} interviews, {cue_count:,} cues, {text_bytes / 1e6:.1f} MB of cue text")
+
+    start = time.perf_counter()
+    builder = SearchIndexBuilder()
+    for entry in entries:
+        builder.add_interview(entry)
+    build_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    data = builder.serialize()
+    serialize_seconds = time.perf_counter() - start
+    compressed = gzip.compress(data)
+
+    vocabulary = sum(len(t) for t in builder.terms.values())
+    print("\nBuild")
+    print(f"  index build:   {build_seconds:.2f} s ({cue_count / max(build_seconds, 1e-9):,.0f} cues/s)")
+    print(f"  serialize:     {serialize_seconds:.2f} s")
+    print(f"  vocabulary:    {vocabulary:,} terms in {len(builder.terms)} languages")
+    print(f"  postings:      {builder.posting_count:,}")
+    print(f"  size (json):   {len(data) / 1e6:.1f} MB")
+    print(f"  size (gzip):   {len(compressed) / 1e6:.1f} MB")
+
+    index = builder.to_dict()
+    language = 'en' if 'en' in index['terms'] else next(iter(index['terms']), None)
+    if language is None:
+        print("\nNo cues to query")
+        return
+
+    rng = random.Random(7)
+    tokens = rng.sample(sorted(index['terms'][language]), min(args.queries, len(index['terms'][language])))
+
+    index_times, scan_times = [], []
+    for token in tokens:
+        start = time.perf_counter()
+        indexed = lookup(index, token, language)
+        index_times.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        scanned = scan(entries, token, language)
+        scan_times.append(time.perf_counter() - start)
+
+        if len(indexed) != len(scanned):
+            raise AssertionError(f"Index and scan disagree for {token!r}: {len(indexed)} vs {len(scanned)}")
+
+    print(f"\nQueries ({len(tokens)} random '{language}' terms, results verified against a full scan)")
+    print(f"  index lookup:  median {statistics.median(index_times) * 1e3:.3f} ms")
+    print(f"  full scan:     median {statistics.median(scan_times) * 1e3:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
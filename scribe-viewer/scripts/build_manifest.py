@@ -8,15 +8,31 @@ that serves as the sole data source for the Next.js front-end application.
 Main responsibilities:
 1. Retrieve all files from the database
 2. Parse metadata from original filenames
-3. Convert SRT files to VTT format
-4. Generate transcript cues for synchronized highlighting
-5. Assemble and output the manifest.json file
+3. Convert SRT files to VTT format and generate transcript cues for
+   synchronized highlighting in a single read (scribe.srt)
+4. Assemble and output the manifest.json file
+
+With --incremental, source SRT/TXT files are tracked by size, mtime and hash in
+scribe-viewer/.manifest_state.json; only interviews whose sources changed are
+reconverted, and the rest of the manifest is carried over from the last run.
+
+Transcripts and cues are also written as one shard per interview under
+public/transcripts/ (optionally gzipped); manifest.min.json is the index, so a
+page showing one interview reads a single shard instead of the full manifest.
+
+A prebuilt inverted index over all cues is written to public/search-index.json
+(see search_index.py).
 """
 
+import argparse
+import gzip
+import hashlib
 import os
 import re
 import json
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat, tee
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime
@@ -30,7 +46,23 @@ logger = logging.getLogger(__name__)
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
 from scribe.database import Database
-import webvtt
+from scribe.srt import parse_srt_file, srt_to_vtt
+from search_index import SearchIndexBuilder
+
+# Languages published to the viewer, including the original transcript
+LANGUAGES = [
+    ('orig', 'Original'),
+    ('en', 'English'),
+    ('de', 'German'),
+    ('he', 'Hebrew')
+]
+
+# Source file fingerprints from the last run, stored in scribe-viewer/
+STATE_FILENAME = ".manifest_state.json"
+
+# Per-interview transcript shards, relative to the manifest directory
+SHARD_DIRNAME = "transcripts"
+SHARD_EXTENSIONS = {'json': '.json', 'gzip': '.json.gz'}
 
 
 def parse_filename_metadata(filename: str) -> Dict[str, str]:
@@ -111,61 +143,29 @@ def parse_filename_metadata(filename: str) -> Dict[str, str]:
     return metadata
 
 
-def convert_srt_to_vtt(srt_path: str, vtt_path: str) -> bool:
+def convert_srt(srt_path: str, vtt_path: str, write_vtt: bool = True) -> Optional[List[Dict[str, any]]]:
     """
-    Convert an SRT file to VTT format.
+    Read an SRT file once, writing its VTT version and returning its cues.
     
     Args:
         srt_path: Path to the source SRT file
         vtt_path: Path where the VTT file should be saved
+        write_vtt: False when the existing VTT is already up to date
         
     Returns:
-        True if conversion successful, False otherwise
+        List of cue objects with 'time' (in seconds) and 'text' fields,
+        or None if conversion failed
     """
     try:
-        # The webvtt-py library can read the file directly
-        vtt = webvtt.from_srt(srt_path)
-        vtt.save(vtt_path)
-        return True
-        
+        if write_vtt:
+            srt_cues = srt_to_vtt(srt_path, vtt_path)
+        else:
+            srt_cues = parse_srt_file(srt_path)
     except Exception as e:
         logger.error(f"Error converting {srt_path} to VTT: {e}")
-        return False
-
-
-def parse_vtt_for_cues(vtt_path: str) -> List[Dict[str, any]]:
-    """
-    Parse a VTT file to extract cues for synchronized highlighting.
-    
-    Args:
-        vtt_path: Path to the VTT file
-        
-    Returns:
-        List of cue objects with 'time' (in seconds) and 'text' fields
-    """
-    cues = []
-    
-    try:
-        vtt = webvtt.read(vtt_path)
-        
-        for caption in vtt:
-            # Convert timestamp to seconds
-            # webvtt-py provides start as a string like "00:00:01.000"
-            time_parts = caption.start.split(':')
-            hours = float(time_parts[0])
-            minutes = float(time_parts[1])
-            seconds = float(time_parts[2])
-            total_seconds = hours * 3600 + minutes * 60 + seconds
-            
-            cues.append({
-                'time': total_seconds,
-                'text': caption.text
-            })
-            
-    except Exception as e:
-        logger.error(f"Error parsing VTT file {vtt_path}: {e}")
+        return None
     
-    return cues
+    return [{'time': cue.start, 'text': cue.text} for cue in srt_cues]
 
 
 def read_full_transcript(file_path: str) -> str:
@@ -186,13 +186,14 @@ def read_full_transcript(file_path: str) -> str:
         return ""
 
 
-def process_interview(file_record: Dict, project_root: Path) -> Optional[Dict]:
+def process_interview(file_record: Dict, project_root: Path, reuse_vtt: bool = False) -> Optional[Dict]:
     """
     Process a single interview file record to create its manifest entry.
     
     Args:
         file_record: Database record for the file
         project_root: The root directory of the scribe project
+        reuse_vtt: Skip SRT to VTT conversion when the VTT is newer than its SRT
         
     Returns:
         Manifest entry for this interview or None if processing fails
@@ -224,7 +225,7 @@ def process_interview(file_record: Dict, project_root: Path) -> Optional[Dict]:
     safe_filename = f"{file_id}{file_extension}"
     symlink_path = media_dir / safe_filename
     
-    if not symlink_path.exists():
+    if not os.path.lexists(symlink_path):
         try:
             os.symlink(original_path.resolve(), symlink_path)
             logger.info(f"  ✓ Created symlink for video: {symlink_path}")
@@ -245,14 +246,7 @@ def process_interview(file_record: Dict, project_root: Path) -> Optional[Dict]:
     }
     
     # Process each language, including original
-    languages = [
-        ('orig', 'Original'),
-        ('en', 'English'),
-        ('de', 'German'),
-        ('he', 'Hebrew')
-    ]
-    
-    for lang_code, lang_name in languages:
+    for lang_code, lang_name in LANGUAGES:
         # Paths for this language
         srt_path = os.path.join(interview_dir, f"{file_id}.{lang_code}.srt")
         vtt_path = os.path.join(interview_dir, f"{file_id}.{lang_code}.vtt")
@@ -263,13 +257,16 @@ def process_interview(file_record: Dict, project_root: Path) -> Optional[Dict]:
             logger.warning(f"SRT file not found for {file_id} in {lang_code}, skipping this language.")
             continue
         
-        # Convert SRT to VTT
-        if convert_srt_to_vtt(srt_path, vtt_path):
+        # Convert SRT to VTT and extract cues in one read of the SRT
+        vtt_current = (reuse_vtt and os.path.exists(vtt_path)
+                       and os.path.getmtime(vtt_path) >= os.path.getmtime(srt_path))
+        cues = convert_srt(srt_path, vtt_path, write_vtt=not vtt_current)
+        if cues is not None:
             # Create symlink for VTT file
             vtt_filename = f"{file_id}.{lang_code}.vtt"
             vtt_symlink_path = media_dir / vtt_filename
             
-            if not vtt_symlink_path.exists():
+            if not os.path.lexists(vtt_symlink_path):
                 try:
                     os.symlink(Path(vtt_path).resolve(), vtt_symlink_path)
                     logger.info(f"  ✓ Created symlink for {lang_code} subtitles: {vtt_symlink_path}")
@@ -280,9 +277,6 @@ def process_interview(file_record: Dict, project_root: Path) -> Optional[Dict]:
             # Add subtitle asset
             manifest_entry['assets']['subtitles'][lang_code] = f"/media/{file_id}/{vtt_filename}"
             
-            # Parse cues from VTT
-            cues = parse_vtt_for_cues(vtt_path)
-            
             # Read full transcript
             full_text = read_full_transcript(txt_path)
             
@@ -296,10 +290,197 @@ def process_interview(file_record: Dict, project_root: Path) -> Optional[Dict]:
     return manifest_entry
 
 
-def main():
+def file_sha256(path: Path) -> str:
+    """SHA-256 of a file, read in 1MB blocks."""
+    sha256_hash = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1024 * 1024), b''):
+            sha256_hash.update(block)
+    return sha256_hash.hexdigest()
+
+
+def source_fingerprints(interview_dir: Path, file_id: str, previous: Dict) -> Dict[str, Dict]:
+    """
+    Fingerprint the SRT/TXT sources of an interview.
+    
+    Files whose size and mtime match the previous fingerprint keep its hash
+    without being read, so an unchanged interview costs only a few stats.
+    
+    Args:
+        interview_dir: The interview's output directory
+        file_id: ID of the interview
+        previous: Fingerprints from the last run, keyed by file name
+        
+    Returns:
+        Dictionary of file name -> {'size', 'mtime_ns', 'sha256'}
+    """
+    fingerprints = {}
+    
+    for lang_code, _ in LANGUAGES:
+        for extension in ('srt', 'txt'):
+            name = f"{file_id}.{lang_code}.{extension}"
+            path = interview_dir / name
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            
+            old = previous.get(name)
+            if old and old['size'] == stat.st_size and old['mtime_ns'] == stat.st_mtime_ns:
+                sha256 = old['sha256']
+            else:
+                sha256 = file_sha256(path)
+            
+            fingerprints[name] = {
+                'size': stat.st_size,
+                'mtime_ns': stat.st_mtime_ns,
+                'sha256': sha256
+            }
+    
+    return fingerprints
+
+
+def refresh_interview(file_record: Dict, project_root: Path, previous_state: Optional[Dict],
+                      reuse_vtt: bool = True) -> Tuple[Dict, Optional[Dict], bool]:
+    """
+    Rebuild an interview's manifest entry only if its sources changed.
+    
+    Args:
+        file_record: Database record for the file
+        project_root: The root directory of the scribe project
+        previous_state: State recorded for this interview by the last run, or
+            None to always rebuild
+        reuse_vtt: Keep VTT files that are newer than their SRT
+        
+    Returns:
+        Tuple of (new state, manifest entry or None, whether it was rebuilt).
+        The entry is None when it was not rebuilt; the caller keeps the
+        previous one.
+    """
+    file_id = file_record['file_id']
+    interview_dir = project_root / "output" / file_id
+    previous_sources = previous_state['sources'] if previous_state else {}
+    
+    state = {
+        'original_path': file_record['original_path'],
+        'sources': source_fingerprints(interview_dir, file_id, previous_sources)
+    }
+    
+    if previous_state and previous_state['original_path'] == state['original_path']:
+        old_hashes = {name: fp['sha256'] for name, fp in previous_sources.items()}
+        new_hashes = {name: fp['sha256'] for name, fp in state['sources'].items()}
+        if old_hashes == new_hashes:
+            return state, None, False
+    
+    return state, process_interview(file_record, project_root, reuse_vtt=reuse_vtt), True
+
+
+def load_previous_build(manifest_path: str, state_path: str) -> Tuple[Dict[str, Dict], Dict[str, Dict]]:
+    """
+    Load the entries and source state written by the last run.
+    
+    Returns:
+        Tuple of (manifest entries by id, state by id); both empty if either
+        file is missing or unreadable, which forces a full rebuild
+    """
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            entries = {entry['id']: entry for entry in json.load(f)}
+        with open(state_path, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+        return entries, state
+    except FileNotFoundError:
+        return {}, {}
+    except Exception as e:
+        logger.warning(f"Could not load previous build ({e}), rebuilding everything")
+        return {}, {}
+
+
+def write_transcript_shard(shard_dir: str, entry: Dict, shard_format: str) -> str:
+    """
+    Write an interview's transcripts and cues to its own shard file.
+    
+    Args:
+        shard_dir: Directory holding the shards
+        entry: Manifest entry for the interview
+        shard_format: 'json' or 'gzip'
+        
+    Returns:
+        File name of the shard
+    """
+    name = entry['id'] + SHARD_EXTENSIONS[shard_format]
+    data = json.dumps(
+        {'id': entry['id'], 'transcripts': entry['transcripts']},
+        ensure_ascii=False, separators=(',', ':')
+    ).encode('utf-8')
+    if shard_format == 'gzip':
+        data = gzip.compress(data, mtime=0)
+    
+    path = os.path.join(shard_dir, name)
+    with open(path + '.tmp', 'wb') as f:
+        f.write(data)
+    os.replace(path + '.tmp', path)
+    return name
+
+
+def remove_stale_shards(shard_dir: str, current: set) -> int:
+    """Delete shards of interviews (or formats) no longer in the manifest."""
+    removed = 0
+    for name in os.listdir(shard_dir):
+        if name not in current:
+            os.remove(os.path.join(shard_dir, name))
+            removed += 1
+    return removed
+
+
+class JsonArrayWriter:
+    """
+    Write a JSON array one element at a time.
+
+    Output is byte-identical to json.dump(items, f, indent=2, ensure_ascii=False),
+    but only the current element is held in memory.
+    """
+
+    def __init__(self, path: str):
+        self.file = open(path, 'w', encoding='utf-8')
+        self.count = 0
+
+    def write(self, item) -> None:
+        body = json.dumps(item, indent=2, ensure_ascii=False).replace('\n', '\n  ')
+        self.file.write(('[\n  ' if self.count == 0 else ',\n  ') + body)
+        self.count += 1
+
+    def close(self) -> None:
+        self.file.write('\n]' if self.count else '[]')
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command line options."""
+    parser = argparse.ArgumentParser(description="Build the Scribe Viewer manifest")
+    parser.add_argument('--incremental', action='store_true',
+                        help='Only reconvert interviews whose SRT/TXT sources changed since the last run')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                        help='Interviews processed in parallel (default: CPU count)')
+    parser.add_argument('--shard-format', choices=['json', 'gzip', 'none'], default='json',
+                        help='Format of the per-interview transcript shards (default: json)')
+    parser.add_argument('--search-index', choices=['json', 'gzip', 'none'], default='json',
+                        help='Format of the prebuilt search index (default: json)')
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None):
     """
     Main function to orchestrate the manifest building process.
     """
+    args = parse_args(argv)
+    
     logger.info("Scribe Viewer Manifest Builder")
     logger.info("=" * 50)
     
@@ -309,54 +490,114 @@ def main():
     logger.info("Connecting to database...")
     db = Database()
     
-    # Get all files from database
+    # Entries are written as they are produced; only the file records and
+    # (for incremental builds) the previous manifest are held in memory
     logger.info("Retrieving files from database...")
-    files = db.get_all_files()
-    logger.info(f"Found {len(files)} files to process")
-    
-    # Process each file
-    manifest = []
-    failures = []
-    
-    for i, file_record in enumerate(files, 1):
-        logger.info(f"Processing file {i}/{len(files)}: {file_record['file_id']}")
-        
-        entry = process_interview(file_record, project_root)
-        if entry:
-            manifest.append(entry)
-            logger.info(f"  ✓ Successfully processed: {entry['metadata']['interviewee']}")
-        else:
-            logger.error(f"  ✗ Failed to process {file_record['file_id']}")
-            failures.append(file_record['file_id'])
+    total_files = db.get_summary()['total_files']
+    logger.info(f"Found {total_files} files to process")
     
     # Create output directory if it doesn't exist
     manifest_dir = "scribe-viewer/public"
     os.makedirs(manifest_dir, exist_ok=True)
-    
-    # --- Write Full Manifest ---
     manifest_path = os.path.join(manifest_dir, "manifest.json")
-    logger.info(f"Writing full manifest to {manifest_path}...")
-    with open(manifest_path, 'w', encoding='utf-8') as f:
-        json.dump(manifest, f, indent=2, ensure_ascii=False)
-    
-    # --- Write Minified Manifest for Gallery ---
-    mini_manifest = []
-    for entry in manifest:
-        mini_entry = {
-            "id": entry["id"],
-            "metadata": entry["metadata"],
-            "assets": entry["assets"]  # Include assets for thumbnails and video info
-        }
-        mini_manifest.append(mini_entry)
-        
     mini_manifest_path = os.path.join(manifest_dir, "manifest.min.json")
+    # Kept out of public/: it records original media paths
+    state_path = os.path.join(os.path.dirname(manifest_dir), STATE_FILENAME)
+    shard_dir = os.path.join(manifest_dir, SHARD_DIRNAME)
+    shards = set()
+    if args.shard_format != 'none':
+        os.makedirs(shard_dir, exist_ok=True)
+    search_index = SearchIndexBuilder() if args.search_index != 'none' else None
+    
+    if args.incremental:
+        previous_entries, previous_state = load_previous_build(manifest_path, state_path)
+        logger.info(f"Incremental build: {len(previous_entries)} interviews in previous manifest")
+    else:
+        previous_entries, previous_state = {}, {}
+    
+    # Records are streamed from the database; previous state only counts for
+    # interviews that are still in the manifest
+    records, to_refresh, to_lookup = tee(db.iter_files(), 3)
+    states = (previous_state.get(r['file_id']) if r['file_id'] in previous_entries else None
+              for r in to_lookup)
+    
+    failures = []
+    new_state = {}
+    rebuilt = 0
+    
+    if args.workers > 1:
+        executor = ProcessPoolExecutor(max_workers=args.workers)
+        results = executor.map(refresh_interview, to_refresh, repeat(project_root), states,
+                               repeat(args.incremental), chunksize=4)
+    else:
+        executor = None
+        results = map(refresh_interview, to_refresh, repeat(project_root), states, repeat(args.incremental))
+    
+    # --- Write Full Manifest and Minified Manifest for Gallery together ---
+    # Written to temporary files and swapped in, so the viewer never reads a
+    # half-written manifest
+    logger.info(f"Writing full manifest to {manifest_path}...")
     logger.info(f"Writing minified manifest to {mini_manifest_path}...")
-    with open(mini_manifest_path, 'w', encoding='utf-8') as f:
-        json.dump(mini_manifest, f, indent=2, ensure_ascii=False)
+    try:
+        with JsonArrayWriter(manifest_path + '.tmp') as manifest, \
+                JsonArrayWriter(mini_manifest_path + '.tmp') as mini_manifest:
+            for i, (file_record, (state, entry, was_rebuilt)) in enumerate(zip(records, results), 1):
+                file_id = file_record['file_id']
+                if was_rebuilt:
+                    rebuilt += 1
+                    logger.info(f"Processed file {i}/{total_files}: {file_id}")
+                else:
+                    entry = previous_entries[file_id]
+                
+                if not entry:
+                    logger.error(f"  ✗ Failed to process {file_id}")
+                    failures.append(file_id)
+                    continue
+                
+                # Failed interviews get no state, so the next run retries them
+                new_state[file_id] = state
+                manifest.write(entry)
+                
+                if args.shard_format != 'none':
+                    shard_name = file_id + SHARD_EXTENSIONS[args.shard_format]
+                    if was_rebuilt or not os.path.exists(os.path.join(shard_dir, shard_name)):
+                        write_transcript_shard(shard_dir, entry, args.shard_format)
+                    shards.add(shard_name)
+                
+                if search_index:
+                    search_index.add_interview(entry)
 
+                mini_manifest.write({
+                    "id": entry["id"],
+                    "metadata": entry["metadata"],
+                    "assets": entry["assets"]  # Include assets for thumbnails and video info
+                })
+                if was_rebuilt:
+                    logger.info(f"  ✓ Successfully processed: {entry['metadata']['interviewee']}")
+    finally:
+        if executor:
+            executor.shutdown()
+    
+    os.replace(manifest_path + '.tmp', manifest_path)
+    os.replace(mini_manifest_path + '.tmp', mini_manifest_path)
+    with open(state_path + '.tmp', 'w', encoding='utf-8') as f:
+        json.dump(new_state, f, ensure_ascii=False, separators=(',', ':'))
+    os.replace(state_path + '.tmp', state_path)
+    
+    if search_index:
+        compress = args.search_index == 'gzip'
+        index_path = os.path.join(manifest_dir, 'search-index.json' + ('.gz' if compress else ''))
+        size = search_index.write(index_path, compress=compress)
+        logger.info(f"  - Search index: {sum(len(t) for t in search_index.terms.values())} terms, "
+                    f"{search_index.posting_count} postings, {size:,} bytes ({index_path})")
+    
+    if args.shard_format != 'none':
+        removed = remove_stale_shards(shard_dir, shards)
+        logger.info(f"  - Transcript shards: {len(shards)} in {shard_dir} ({removed} stale removed)")
     
     logger.info(f"✓ Manifest generation complete!")
-    logger.info(f"  - Total interviews processed: {len(manifest)}")
+    logger.info(f"  - Total interviews processed: {manifest.count}")
+    logger.info(f"  - Rebuilt: {rebuilt}, unchanged: {len(new_state) + len(failures) - rebuilt}")
     
     if failures:
         logger.warning(f"  - Failed to process {len(failures)} interviews:")
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Inverted Search Index for Scribe Viewer
+
+Builds a precomputed word index over the transcript cues in the manifest, so
+the viewer can answer queries with dictionary lookups instead of scanning
+every transcript (see lib/search-index.ts for the reader).
+
+Index format (public/search-index.json):
+
+    {
+      "version": 1,
+      "docs":  [[interview_id, language], ...],
+      "times": [[cue start seconds, ...], ...],          # one list per doc
+      "terms": {language: {token: [[doc, cue, +cue, ...], ...]}}
+    }
+
+A posting lists the cues of one doc (transcript) containing the token: the doc
+number, the first cue index, then gaps to each following cue index. A cue
+index maps to a timestamp through times[doc].
+
+Tokenization must match lib/search-index.ts exactly: NFKD, drop Latin
+diacritics and Hebrew points/cantillation, drop geresh/gershayim (so צה״ל
+is one token), lowercase, then split into runs of letters and digits.
+"""
+
+import gzip
+import json
+import os
+import re
+import unicodedata
+from typing import Dict, List
+
+INDEX_VERSION = 1
+
+# Combining marks removed after NFKD: Latin diacritics, Hebrew cantillation and
+# points. Maqaf (05BE), paseq (05C0), sof pasuq (05C3) and nun hafukha (05C6)
+# are punctuation and stay as separators.
+COMBINING_MARKS = re.compile('[\u0300-\u036f\u0591-\u05bd\u05bf\u05c1\u05c2\u05c4\u05c5\u05c7]')
+HEBREW_QUOTES = re.compile('[\u05f3\u05f4]')
+TOKEN_RE = re.compile(r'[^\W_]+')
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Split text into normalized search tokens.
+
+    Args:
+        text: Cue or query text in any language
+
+    Returns:
+        List of tokens in order of appearance
+    """
+    text = unicodedata.normalize('NFKD', text)
+    text = COMBINING_MARKS.sub('', text)
+    text = HEBREW_QUOTES.sub('', text)
+    return TOKEN_RE.findall(text.lower())
+
+
+class SearchIndexBuilder:
+    """Accumulates manifest entries into an inverted index."""
+
+    def __init__(self):
+        self.docs: List[List[str]] = []
+        self.times: List[List[float]] = []
+        self.terms: Dict[str, Dict[str, List[List[int]]]] = {}
+        self.posting_count = 0
+
+    def add_interview(self, entry: Dict) -> None:
+        """
+        Index every transcript of a manifest entry, one doc per language.
+
+        Args:
+            entry: Manifest entry with 'id' and 'transcripts'
+        """
+        for transcript in entry.get('transcripts', []):
+            cues = transcript.get('cues') or []
+            if not cues:
+                continue
+
+            doc = len(self.docs)
+            language = transcript['language']
+            self.docs.append([entry['id'], language])
+            self.times.append([round(cue['time'], 2) for cue in cues])
+
+            # token -> ascending cue indexes within this doc
+            cue_lists: Dict[str, List[int]] = {}
+            for cue_index, cue in enumerate(cues):
+                for token in set(tokenize(cue['text'])):
+                    cue_lists.setdefault(token, []).append(cue_index)
+
+            terms = self.terms.setdefault(language, {})
+            for token, cue_indexes in cue_lists.items():
+                posting = [doc, cue_indexes[0]]
+                posting.extend(b - a for a, b in zip(cue_indexes, cue_indexes[1:]))
+                terms.setdefault(token, []).append(posting)
+                self.posting_count += 1
+
+    def to_dict(self) -> Dict:
+        """Return the index in its serialized structure."""
+        return {
+            'version': INDEX_VERSION,
+            'docs': self.docs,
+            'times': self.times,
+            'terms': self.terms
+        }
+
+    def serialize(self, compress: bool = False) -> bytes:
+        """Serialize the index as compact JSON, optionally gzipped."""
+        data = json.dumps(self.to_dict(), ensure_ascii=False, separators=(',', ':'),
+                          sort_keys=True).encode('utf-8')
+        return gzip.compress(data, mtime=0) if compress else data
+
+    def write(self, path: str, compress: bool = False) -> int:
+        """
+        Write the index atomically.
+
+        Returns:
+            Size of the written file in bytes
+        """
+        data = self.serialize(compress)
+        with open(path + '.tmp', 'wb') as f:
+            f.write(data)
+        os.replace(path + '.tmp', path)
+        return len(data)
+
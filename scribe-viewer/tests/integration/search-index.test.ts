@@ -0,0 +1,146 @@
+/**
+ * @jest-environment node
+ */
+
+/**
+ * Tests for the prebuilt search index reader
+ * Uses hand-built indexes in the format written by scripts/search_index.py
+ */
+
+import fs from 'fs';
+import os from 'os';
+import path from 'path';
+import { gzipSync } from 'zlib';
+import { SearchIndex, tokenize } from '@/lib/search-index';
+
+// Postings are [doc, first cue, gap, gap, ...]
+const INDEX_DATA = {
+  version: 1,
+  docs: [['int-1', 'en'], ['int-1', 'de'], ['int-2', 'en']] as [string, string][],
+  times: [[0, 5, 10, 15], [0, 5], [1, 2, 3]],
+  terms: {
+    en: {
+      hamburg: [[0, 0, 2], [2, 1]],
+      harbour: [[0, 2, 1]],
+      berlin: [[0, 1]],
+      again: [[0, 2]],
+    },
+    de: {
+      hamburg: [[1, 1]],
+      straße: [[1, 0]],
+    },
+  },
+};
+
+describe('Search Index Reader', () => {
+  describe('tokenize', () => {
+    test('should match the Python tokenizer', () => {
+      expect(tokenize('שָׁלוֹם עֲלֵיכֶם')).toEqual(['שלום', 'עליכם']);
+      expect(tokenize('צה״ל')).toEqual(['צהל']);
+      expect(tokenize('בית־ספר')).toEqual(['בית', 'ספר']);
+      expect(tokenize('Müller ÄRGER Straße')).toEqual(['muller', 'arger', 'straße']);
+      expect(tokenize('Hello, WORLD... 1945; e-mail_x!')).toEqual(['hello', 'world', '1945', 'e', 'mail', 'x']);
+      expect(tokenize(' -- ... ')).toEqual([]);
+    });
+  });
+
+  describe('SearchIndex', () => {
+    const index = new SearchIndex(INDEX_DATA);
+
+    test('should decode delta postings to cue times', () => {
+      const hits = index.search('hamburg', { language: 'en', prefix: false });
+
+      expect(hits.map(hit => [hit.interviewId, hit.cueIndex, hit.time])).toEqual([
+        ['int-1', 0, 0],
+        ['int-1', 2, 10],
+        ['int-2', 1, 2],
+      ]);
+    });
+
+    test('should require every query term in the same cue', () => {
+      const hits = index.search('hamburg again', { language: 'en' });
+
+      expect(hits).toEqual([{ interviewId: 'int-1', language: 'en', cueIndex: 2, time: 10 }]);
+    });
+
+    test('should expand the last term as a prefix', () => {
+      expect(index.search('har', { language: 'en' }).map(hit => hit.cueIndex)).toEqual([2, 3]);
+      expect(index.search('har', { language: 'en', prefix: false })).toEqual([]);
+    });
+
+    test('should search all languages unless one is given', () => {
+      const hits = index.search('Hamburg', { prefix: false });
+
+      expect(hits.map(hit => `${hit.interviewId}:${hit.language}:${hit.time}`)).toEqual([
+        'int-1:de:5', 'int-1:en:0', 'int-1:en:10', 'int-2:en:2',
+      ]);
+      expect(index.search('STRASSE')).toEqual([]);
+      expect(index.search('Straße')[0].language).toBe('de');
+    });
+
+    test('should apply the limit and ignore empty queries', () => {
+      expect(index.search('hamburg', { limit: 2 })).toHaveLength(2);
+      expect(index.search(' ... ')).toEqual([]);
+    });
+
+    test('should list languages per interview', () => {
+      expect(index.languages.sort()).toEqual(['de', 'en']);
+      expect(index.languagesFor('int-1')).toEqual(['en', 'de']);
+      expect(index.languagesFor('missing')).toEqual([]);
+    });
+  });
+
+  describe('loadSearchIndex', () => {
+    let tempDir: string;
+
+    beforeEach(() => {
+      tempDir = fs.mkdtempSync(path.join(os.tmpdir(), 'search-index-'));
+      fs.mkdirSync(path.join(tempDir, 'public'));
+      jest.spyOn(process, 'cwd').mockReturnValue(tempDir);
+    });
+
+    afterEach(() => {
+      jest.restoreAllMocks();
+      fs.rmSync(tempDir, { recursive: true, force: true });
+    });
+
+    // A fresh module per test, since the loaded index is cached
+    function freshLoader(): typeof import('@/lib/search-index').loadSearchIndex {
+      let loader: typeof import('@/lib/search-index').loadSearchIndex;
+      jest.isolateModules(() => {
+        loader = require('@/lib/search-index').loadSearchIndex;
+      });
+      return loader!;
+    }
+
+    test('should load the plain index', async () => {
+      fs.writeFileSync(path.join(tempDir, 'public', 'search-index.json'), JSON.stringify(INDEX_DATA));
+
+      const index = await freshLoader()();
+
+      expect(index).not.toBeNull();
+      expect(index!.search('berlin')).toHaveLength(1);
+    });
+
+    test('should load the gzipped index', async () => {
+      fs.writeFileSync(
+        path.join(tempDir, 'public', 'search-index.json.gz'),
+        gzipSync(Buffer.from(JSON.stringify(INDEX_DATA)))
+      );
+
+      const index = await freshLoader()();
+
+      expect(index!.search('straße')[0].interviewId).toBe('int-1');
+    });
+
+    test('should return null without an index', async () => {
+      expect(await freshLoader()()).toBeNull();
+    });
+
+    test('should return null for a corrupt index', async () => {
+      fs.writeFileSync(path.join(tempDir, 'public', 'search-index.json'), '{"docs": ');
+
+      expect(await freshLoader()()).toBeNull();
+    });
+  });
+});
@@ -4,6 +4,7 @@ Provides comprehensive checking of database integrity and file system consistenc
 """
 
 import asyncio
+import codecs
 import json
 import sqlite3
 import hashlib
@@ -16,11 +17,26 @@ from typing import Dict, List, Set, Optional, Tuple
 from dataclasses import dataclass, asdict
 from enum import Enum
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 
 from .database import Database
 
 logger = logging.getLogger(__name__)
 
+# Files are hashed and scanned in chunks of this size rather than read whole
+READ_BUFFER_SIZE = 1024 * 1024
+
+# Persisted (path, size, mtime) -> analysis results; bump the version when
+# analysis rules change so stale results are discarded
+AUDIT_CACHE_NAME = ".audit_cache.json"
+AUDIT_CACHE_VERSION = 1
+
+# Characters carried between chunks so a placeholder split across a chunk
+# boundary is still found (longer than any placeholder pattern)
+PLACEHOLDER_OVERLAP = 64
+
+HEBREW_RE = re.compile('[\u0590-\u05FF]')
+
 
 class FileStatus(Enum):
     """Status of a translation file."""
@@ -62,16 +78,22 @@ class AuditResult:
 class DatabaseAuditor:
     """Audits database integrity and file system consistency."""
     
-    def __init__(self, project_root: Path):
+    def __init__(self, project_root: Path, max_workers: Optional[int] = None,
+                 use_cache: bool = True):
         """
         Initialize auditor.
         
         Args:
             project_root: Path to the scribe project root
+            max_workers: Threads used to analyze files (default: CPU count, max 16)
+            use_cache: Reuse results for files unchanged since the last audit
         """
         self.project_root = Path(project_root).resolve()
         self.db_path = self.project_root / "media_tracking.db"
         self.output_dir = self.project_root / "output"
+        self.cache_path = self.project_root / AUDIT_CACHE_NAME
+        self.max_workers = max_workers or min(16, os.cpu_count() or 1)
+        self.use_cache = use_cache
         self.db = Database()
         
         # Placeholder patterns
@@ -87,7 +109,7 @@ class DatabaseAuditor:
     
     def contains_hebrew(self, text: str) -> bool:
         """Check if text contains Hebrew characters."""
-        return any('\u0590' <= c <= '\u05FF' for c in text)
+        return bool(HEBREW_RE.search(text))
     
     def has_placeholder(self, text: str) -> bool:
         """Check if text contains placeholder patterns."""
@@ -127,21 +149,39 @@ class DatabaseAuditor:
                 metadata.status = FileStatus.EMPTY
                 return metadata
             
-            # Read file content
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Calculate checksum
-            metadata.checksum = hashlib.sha256(content.encode('utf-8')).hexdigest()
+            # Stream the file once: hash the raw bytes and scan the decoded
+            # text chunk by chunk instead of holding the whole file
+            sha256_hash = hashlib.sha256()
+            decoder = codecs.getincrementaldecoder('utf-8')()
+            preview = ''
+            tail = ''
             
-            # Extract preview (first 200 chars)
-            metadata.content_preview = content[:200].replace('\n', ' ')
-            
-            # Check for Hebrew characters
-            metadata.has_hebrew = self.contains_hebrew(content)
+            with open(file_path, 'rb', buffering=0) as f:
+                buffer = bytearray(READ_BUFFER_SIZE)
+                view = memoryview(buffer)
+                final = False
+                while not final:
+                    read = f.readinto(buffer)
+                    final = not read
+                    sha256_hash.update(view[:read])
+                    text = decoder.decode(view[:read], final=final)
+                    
+                    # Extract preview (first 200 chars, newlines as spaces)
+                    if len(preview) < 400:
+                        preview += text[:400 - len(preview)]
+                    
+                    # Check for Hebrew characters
+                    if not metadata.has_hebrew:
+                        metadata.has_hebrew = self.contains_hebrew(text)
+                    
+                    # Check for placeholders
+                    if not metadata.has_placeholder:
+                        window = tail + text
+                        metadata.has_placeholder = self.has_placeholder(window)
+                        tail = window[-PLACEHOLDER_OVERLAP:]
             
-            # Check for placeholders
-            metadata.has_placeholder = self.has_placeholder(content)
+            metadata.checksum = sha256_hash.hexdigest()
+            metadata.content_preview = re.sub(r'\r\n|\r|\n', ' ', preview)[:200]
             
             # Determine status
             if metadata.has_placeholder:
@@ -161,6 +201,84 @@ class DatabaseAuditor:
         
         return metadata
     
+    def _load_cache(self) -> Dict[str, Dict]:
+        """Load persisted analysis results from the previous audit."""
+        if not self.use_cache or not self.cache_path.exists():
+            return {}
+        
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+            if cache.get('version') != AUDIT_CACHE_VERSION:
+                return {}
+            return cache.get('files', {})
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable audit cache {self.cache_path}: {e}")
+            return {}
+    
+    def _save_cache(self, entries: Dict[str, Dict]):
+        """Persist analysis results; only files seen in this audit are kept."""
+        if not self.use_cache:
+            return
+        
+        tmp_path = self.cache_path.with_suffix('.tmp')
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'version': AUDIT_CACHE_VERSION, 'files': entries}, f,
+                          ensure_ascii=False, separators=(',', ':'))
+            os.replace(tmp_path, self.cache_path)
+        except Exception as e:
+            logger.warning(f"Could not save audit cache {self.cache_path}: {e}")
+    
+    def _analyze_cached(self, file_path: Path, file_id: str, expected_language: str,
+                        cache: Dict[str, Dict]) -> Tuple[FileMetadata, Optional[Dict]]:
+        """
+        Analyze a file unless the cache holds a result for the same size and mtime.
+        
+        Runs on worker threads, so it only reads the cache; the returned entry
+        is merged into the new cache by the caller.
+        
+        Returns:
+            Tuple of (metadata, cache entry or None if the result is not cacheable)
+        """
+        try:
+            stat = file_path.stat()
+        except FileNotFoundError:
+            return self.analyze_file(file_path, file_id, expected_language), None
+        
+        entry = cache.get(str(file_path))
+        if entry and entry['size'] == stat.st_size and entry['mtime_ns'] == stat.st_mtime_ns:
+            metadata = FileMetadata(
+                file_id=file_id,
+                language=expected_language,
+                file_path=file_path,
+                exists=True,
+                size=entry['size'],
+                checksum=entry['checksum'],
+                status=FileStatus(entry['status']),
+                has_hebrew=entry['has_hebrew'],
+                has_placeholder=entry['has_placeholder'],
+                content_preview=entry['content_preview']
+            )
+            return metadata, entry
+        
+        metadata = self.analyze_file(file_path, file_id, expected_language)
+        
+        # Read errors may be transient; only content-derived results are cached
+        if metadata.status == FileStatus.CORRUPTED:
+            return metadata, None
+        
+        entry = {
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns,
+            'checksum': metadata.checksum,
+            'status': metadata.status.value,
+            'has_hebrew': metadata.has_hebrew,
+            'has_placeholder': metadata.has_placeholder,
+            'content_preview': metadata.content_preview
+        }
+        return metadata, entry
+    
     def audit_database(self) -> AuditResult:
         """
         Run comprehensive database audit.
@@ -171,9 +289,8 @@ class DatabaseAuditor:
         logger.info("Starting database audit...")
         start_time = datetime.now()
         
-        # Get all files from database
-        all_files = self.db.execute_query("SELECT file_id FROM media_files ORDER BY file_id")
-        total_files = len(all_files)
+        # Stream file records (with their status) instead of loading the archive
+        total_files = self.db.get_summary()['total_files']
         
         logger.info(f"Auditing {total_files} files...")
         
@@ -185,35 +302,50 @@ class DatabaseAuditor:
         }
         
         issues_by_type = defaultdict(list)
-        
-        # Analyze each file
-        for i, file_record in enumerate(all_files):
-            file_id = file_record['file_id']
-            
-            if i % 100 == 0:
-                logger.info(f"Progress: {i}/{total_files}")
+        db_file_ids = set()
+        
+        # Every status comes from one streamed query; collect the file checks
+        # so they can be analyzed in parallel
+        checks = []
+        for status in self.db.iter_files():
+            file_id = status['file_id']
+            db_file_ids.add(file_id)
             
-            # Get status from database
-            status = self.db.get_status(file_id)
-            if not status:
+            # LEFT JOIN: no processing_status row leaves status NULL
+            if status['status'] is None:
                 issues_by_type['no_database_record'].append({
                     'file_id': file_id,
                     'issue': 'No processing status record'
                 })
                 continue
             
-            # Check each language
             for lang in ['en', 'de', 'he']:
-                language_stats[lang]['expected'] += 1
-                
-                # Get database status
-                db_status = status.get(f'translation_{lang}_status')
+                checks.append((
+                    file_id,
+                    lang,
+                    status.get(f'translation_{lang}_status'),
+                    self.output_dir / file_id / f"{file_id}.{lang}.txt"
+                ))
+        
+        cache = self._load_cache()
+        new_cache = {}
+        
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            analyzed = executor.map(
+                lambda check: self._analyze_cached(check[3], check[0], check[1], cache),
+                checks
+            )
+            
+            # Results arrive in submission order, so the report is deterministic
+            for i, (check, (metadata, entry)) in enumerate(zip(checks, analyzed)):
+                file_id, lang, db_status, file_path = check
+                if i % 300 == 0:
+                    logger.info(f"Progress: {i // 3}/{total_files}")
                 
-                # Expected file path
-                file_path = self.output_dir / file_id / f"{file_id}.{lang}.txt"
+                if entry is not None:
+                    new_cache[str(file_path)] = entry
                 
-                # Analyze file
-                metadata = self.analyze_file(file_path, file_id, lang)
+                language_stats[lang]['expected'] += 1
                 
                 # Update stats
                 if metadata.exists:
@@ -263,10 +395,11 @@ class DatabaseAuditor:
                         'issue': 'File exists and is valid but not marked complete'
                     })
         
+        self._save_cache(new_cache)
+        
         # Check for orphaned files
         if self.output_dir.exists():
             logger.info("Checking for orphaned files...")
-            db_file_ids = {record['file_id'] for record in all_files}
             
             for item_dir in self.output_dir.iterdir():
                 if not item_dir.is_dir():
@@ -355,6 +488,7 @@ class DatabaseAuditor:
             "output_directory_exists": False,
             "api_keys_configured": {},
             "disk_space": {},
+            "language_detection": {},
             "recommendations": []
         }
         
@@ -366,6 +500,18 @@ class DatabaseAuditor:
             validation_results["database_accessible"] = False
             validation_results["recommendations"].append(f"Database inaccessible: {e}")
         
+        # Check stored segment language detection (read, never re-detected)
+        try:
+            detection = self.db.get_detection_summary()
+            validation_results["language_detection"] = detection
+            if detection["undetected"]:
+                validation_results["recommendations"].append(
+                    f"{detection['undetected']} subtitle segments have no detected language - "
+                    "they will be detected on their next translation"
+                )
+        except Exception as e:
+            logger.warning(f"Could not read segment language detection: {e}")
+        
         # Check output directory
         validation_results["output_directory_exists"] = self.output_dir.exists()
         if not self.output_dir.exists():
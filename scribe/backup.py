@@ -8,7 +8,9 @@ import hashlib
 import logging
 import os
 import shutil
+import sqlite3
 import sys
+import tempfile
 import time
 from datetime import datetime
 from pathlib import Path
@@ -18,6 +20,19 @@ import subprocess
 
 logger = logging.getLogger(__name__)
 
+# Pages copied per sqlite3 backup step. The source database is only locked
+# during a step, so pipeline workers keep writing while a backup runs.
+BACKUP_PAGES_PER_STEP = 1024
+BACKUP_STEP_SLEEP = 0.005
+
+# Read buffer for checksumming; large reads keep hashing disk-bound.
+CHECKSUM_BUFFER_SIZE = 1024 * 1024
+
+# Incremental backups: files live once in a content-addressed store under
+# backups/blobs/<hash[:2]>/<hash>; each snapshot keeps only a path -> hash index.
+BLOB_STORE_DIRNAME = "blobs"
+SNAPSHOT_INDEX_NAME = "files.json"
+
 
 class BackupManager:
     """Manages backup and restore operations for the Scribe system."""
@@ -33,6 +48,7 @@ class BackupManager:
         self.database_path = self.project_root / "media_tracking.db"
         self.output_dir = self.project_root / "output"
         self.backups_dir = self.project_root / "backups"
+        self.blobs_dir = self.backups_dir / BLOB_STORE_DIRNAME
         self.interrupted = False
         
         # Handle interruption gracefully
@@ -57,17 +73,54 @@ class BackupManager:
             Hexadecimal checksum string
         """
         sha256_hash = hashlib.sha256()
-        with open(file_path, "rb") as f:
-            for byte_block in iter(lambda: f.read(4096), b""):
-                sha256_hash.update(byte_block)
+        with open(file_path, "rb", buffering=0) as f:
+            buffer = bytearray(CHECKSUM_BUFFER_SIZE)
+            view = memoryview(buffer)
+            while True:
+                read = f.readinto(buffer)
+                if not read:
+                    break
+                sha256_hash.update(view[:read])
         return sha256_hash.hexdigest()
     
-    def create_backup(self, quick: bool = False) -> Tuple[Path, Dict]:
+    def _copy_database(self, source_path: Path, target_path: Path) -> int:
+        """
+        Copy a live SQLite database with the online backup API.
+        
+        Copies BACKUP_PAGES_PER_STEP pages at a time and sleeps between steps,
+        so writers on the source are never blocked for the whole copy. If the
+        source changes mid-copy, SQLite restarts the copy, so the result is
+        always a consistent snapshot (WAL included).
+        
+        Returns:
+            Number of pages copied
+        """
+        pages = {'total': 0, 'steps': 0}
+        
+        def progress(status, remaining, total):
+            pages['total'] = total
+            pages['steps'] += 1
+            if pages['steps'] % 100 == 0:
+                logger.info(f"Database copy: {total - remaining:,}/{total:,} pages")
+        
+        source = sqlite3.connect(str(source_path), timeout=30.0)
+        target = sqlite3.connect(str(target_path), timeout=30.0)
+        try:
+            source.backup(target, pages=BACKUP_PAGES_PER_STEP,
+                          progress=progress, sleep=BACKUP_STEP_SLEEP)
+        finally:
+            target.close()
+            source.close()
+        return pages['total']
+    
+    def create_backup(self, quick: bool = False, incremental: bool = False) -> Tuple[Path, Dict]:
         """
         Create a backup of the system.
         
         Args:
             quick: If True, use tar compression for faster backup
+            incremental: If True, store translations in the shared blob store,
+                copying only files not already backed up
             
         Returns:
             Tuple of (backup_dir, manifest_data)
@@ -77,7 +130,13 @@ class BackupManager:
         # Create timestamped directory
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         backup_dir = self.backups_dir / timestamp
-        backup_dir.mkdir(parents=True, exist_ok=True)
+        # Never reuse a directory: a pre-restore backup taken in the same
+        # second as the snapshot being restored would overwrite it
+        suffix = 1
+        while backup_dir.exists():
+            backup_dir = self.backups_dir / f"{timestamp}_{suffix}"
+            suffix += 1
+        backup_dir.mkdir(parents=True)
         logger.info(f"Created backup directory: {backup_dir}")
         
         try:
@@ -87,14 +146,17 @@ class BackupManager:
             
             # Step 2: Backup translation files
             logger.info("Backing up translation files...")
-            if quick:
+            if incremental:
+                translation_info = self._backup_translations_incremental(backup_dir)
+            elif quick:
                 translation_info = self._backup_translations_quick(backup_dir)
             else:
                 translation_info = self._backup_translations_full(backup_dir)
             
             # Step 3: Generate manifest
             logger.info("Generating manifest...")
-            manifest = self._generate_manifest(backup_dir, db_info, translation_info, quick)
+            manifest = self._generate_manifest(backup_dir, db_info, translation_info, quick,
+                                               incremental=incremental)
             
             # Save manifest
             manifest_path = backup_dir / "manifest.json"
@@ -127,26 +189,31 @@ class BackupManager:
         
         db_backup_path = backup_dir / "media_tracking.db"
         
-        # Calculate original checksum
-        original_checksum = self.calculate_file_checksum(self.database_path)
-        
-        # Copy database file
-        shutil.copy2(self.database_path, db_backup_path)
-        logger.info(f"Backed up database: {db_backup_path}")
+        # Online copy; the live file may change underneath us, so it is never
+        # checksummed directly - the snapshot is what gets verified and hashed
+        pages = self._copy_database(self.database_path, db_backup_path)
+        logger.info(f"Backed up database: {db_backup_path} ({pages:,} pages)")
         
-        # Verify backup checksum
-        backup_checksum = self.calculate_file_checksum(db_backup_path)
+        conn = sqlite3.connect(str(db_backup_path))
+        try:
+            integrity = conn.execute("PRAGMA quick_check").fetchone()[0]
+        finally:
+            conn.close()
         
-        if original_checksum != backup_checksum:
-            raise ValueError("Database backup verification failed")
+        if integrity != "ok":
+            raise ValueError(f"Database backup verification failed: {integrity}")
         
+        # Single read of the snapshot for the manifest checksum
+        backup_checksum = self.calculate_file_checksum(db_backup_path)
         logger.info("Database backup verified successfully")
         
         return {
             "original_path": str(self.database_path),
             "backup_path": str(db_backup_path),
-            "size": self.database_path.stat().st_size,
-            "checksum": original_checksum
+            "size": db_backup_path.stat().st_size,
+            "checksum": backup_checksum,
+            "method": "sqlite_backup_api",
+            "pages": pages
         }
     
     def _backup_translations_quick(self, backup_dir: Path) -> Dict[str, any]:
@@ -226,15 +293,201 @@ class BackupManager:
             "total_size": total_size
         }
     
-    def _generate_manifest(self, backup_dir: Path, db_info: Dict, translation_info: Dict, quick: bool) -> Dict:
+    def _blob_path(self, digest: str) -> Path:
+        """Location of a blob in the content-addressed store."""
+        return self.blobs_dir / digest[:2] / digest
+    
+    def _store_blob(self, file_path: Path) -> Tuple[str, bool]:
+        """
+        Hash a file and add it to the blob store in a single read.
+        
+        The file is streamed into a temporary blob while it is hashed, then
+        renamed into place; if the store already has that content the
+        temporary copy is discarded.
+        
+        Args:
+            file_path: File to store
+            
+        Returns:
+            Tuple of (sha256 hex digest, whether a new blob was written)
+        """
+        tmp_dir = self.blobs_dir / "tmp"
+        tmp_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=tmp_dir)
+        
+        try:
+            sha256_hash = hashlib.sha256()
+            with open(file_path, "rb", buffering=0) as src, os.fdopen(fd, "wb") as dst:
+                buffer = bytearray(CHECKSUM_BUFFER_SIZE)
+                view = memoryview(buffer)
+                while True:
+                    read = src.readinto(buffer)
+                    if not read:
+                        break
+                    sha256_hash.update(view[:read])
+                    dst.write(view[:read])
+            
+            digest = sha256_hash.hexdigest()
+            blob_path = self._blob_path(digest)
+            if blob_path.exists():
+                os.unlink(tmp_name)
+                return digest, False
+            
+            blob_path.parent.mkdir(exist_ok=True)
+            os.replace(tmp_name, blob_path)
+            return digest, True
+        except BaseException:
+            if os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+            raise
+    
+    def _iter_output_files(self):
+        """Yield (relative posix path, stat) for every file under output/."""
+        stack = [self.output_dir]
+        while stack:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file():
+                        rel_path = Path(entry.path).relative_to(self.output_dir).as_posix()
+                        yield rel_path, entry.stat()
+    
+    def _load_latest_snapshot(self) -> Dict[str, Dict]:
+        """Load the file index of the newest incremental snapshot, if any."""
+        candidates = sorted(
+            (d for d in self.backups_dir.iterdir()
+             if d.is_dir() and d.name != BLOB_STORE_DIRNAME),
+            key=lambda d: d.name,
+            reverse=True
+        )
+        for backup_dir in candidates:
+            index_path = backup_dir / SNAPSHOT_INDEX_NAME
+            if not index_path.exists():
+                continue
+            try:
+                with open(index_path, 'r', encoding='utf-8') as f:
+                    return json.load(f)["files"]
+            except Exception as e:
+                logger.warning(f"Could not read snapshot index {index_path}: {e}")
+        return {}
+    
+    def _backup_translations_incremental(self, backup_dir: Path) -> Dict[str, any]:
+        """
+        Create an incremental backup in the content-addressed blob store.
+        
+        Files whose size and mtime match the previous snapshot reuse its hash
+        without being read; everything else is hashed and copied only if the
+        store does not already hold that content. The snapshot itself is just
+        a path -> hash index.
+        
+        Args:
+            backup_dir: Directory to store the backup
+            
+        Returns:
+            Dictionary with backup info
+        """
+        if not self.output_dir.exists():
+            logger.warning(f"Output directory not found: {self.output_dir}")
+            return {"method": "incremental", "status": "output_dir_not_found"}
+        
+        previous = self._load_latest_snapshot()
+        files = {}
+        total_size = 0
+        hashed_files = 0
+        new_blobs = 0
+        bytes_copied = 0
+        
+        for rel_path, stat in self._iter_output_files():
+            entry = previous.get(rel_path)
+            if (entry and entry["size"] == stat.st_size
+                    and entry["mtime_ns"] == stat.st_mtime_ns
+                    and self._blob_path(entry["hash"]).exists()):
+                digest = entry["hash"]
+            else:
+                digest, copied = self._store_blob(self.output_dir / rel_path)
+                hashed_files += 1
+                if copied:
+                    new_blobs += 1
+                    bytes_copied += stat.st_size
+            
+            files[rel_path] = {
+                "hash": digest,
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns
+            }
+            total_size += stat.st_size
+        
+        index_path = backup_dir / SNAPSHOT_INDEX_NAME
+        with open(index_path, 'w', encoding='utf-8') as f:
+            json.dump({"files": files}, f, ensure_ascii=False, separators=(',', ':'))
+        
+        logger.info(f"Indexed {len(files)} files ({total_size:,} bytes): "
+                    f"{hashed_files} hashed, {new_blobs} new blobs ({bytes_copied:,} bytes copied)")
+        
+        return {
+            "method": "incremental",
+            "index_path": str(index_path),
+            "blob_store": str(self.blobs_dir),
+            "file_count": len(files),
+            "total_size": total_size,
+            "hashed_files": hashed_files,
+            "new_blobs": new_blobs,
+            "bytes_copied": bytes_copied
+        }
+    
+    def _restore_snapshot(self, index_path: Path) -> int:
+        """
+        Rebuild output/ from an incremental snapshot index.
+        
+        Files are assembled in a staging directory and swapped in only once
+        every blob has been copied, so a missing blob leaves output/ intact.
+        Original mtimes are restored, so the next incremental backup does not
+        need to re-hash the restored files.
+        
+        Returns:
+            Number of files restored
+        """
+        with open(index_path, 'r', encoding='utf-8') as f:
+            files = json.load(f)["files"]
+        
+        missing = [p for p, e in files.items() if not self._blob_path(e["hash"]).exists()]
+        if missing:
+            raise FileNotFoundError(
+                f"Blob store is missing {len(missing)} files for this snapshot (e.g. {missing[0]})"
+            )
+        
+        staging_dir = self.project_root / "output.restoring"
+        if staging_dir.exists():
+            shutil.rmtree(staging_dir)
+        
+        for rel_path, entry in files.items():
+            target = staging_dir / rel_path
+            target.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(self._blob_path(entry["hash"]), target)
+            os.utime(target, ns=(entry["mtime_ns"], entry["mtime_ns"]))
+        
+        staging_dir.mkdir(exist_ok=True)
+        if self.output_dir.exists():
+            shutil.rmtree(self.output_dir)
+        os.replace(staging_dir, self.output_dir)
+        return len(files)
+    
+    def _generate_manifest(self, backup_dir: Path, db_info: Dict, translation_info: Dict, quick: bool,
+                           incremental: bool = False) -> Dict:
         """Generate a manifest file with backup information."""
         # Load validation results if available
         hebrew_issues = self._load_hebrew_issues()
         
+        if incremental:
+            backup_type = "incremental"
+        else:
+            backup_type = "quick" if quick else "full"
+        
         manifest = {
             "backup_timestamp": datetime.now().isoformat(),
             "backup_directory": str(backup_dir),
-            "backup_type": "quick" if quick else "full",
+            "backup_type": backup_type,
             "project_root": str(self.project_root),
             "database": db_info,
             "translations": translation_info,
@@ -300,7 +553,7 @@ class BackupManager:
             return backups
         
         for backup_dir in self.backups_dir.iterdir():
-            if not backup_dir.is_dir():
+            if not backup_dir.is_dir() or backup_dir.name == BLOB_STORE_DIRNAME:
                 continue
             
             manifest_path = backup_dir / "manifest.json"
@@ -371,9 +624,13 @@ class BackupManager:
         
         logger.info(f"Restoring from backup: {backup_id}")
         
-        # Create backup of current state first
+        snapshot_index = backup_dir / SNAPSHOT_INDEX_NAME
+        
+        # Create backup of current state first; restoring an incremental
+        # snapshot keeps the pre-restore backup incremental too
         current_backup_id = f"pre_restore_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-        current_backup_dir, _ = self.create_backup(quick=True)
+        current_backup_dir, _ = self.create_backup(quick=True,
+                                                   incremental=snapshot_index.exists())
         logger.info(f"Current state backed up to: {current_backup_dir}")
         
         try:
@@ -381,7 +638,9 @@ class BackupManager:
             db_backup_path = backup_dir / "media_tracking.db"
             if db_backup_path.exists():
                 logger.info("Restoring database...")
-                shutil.copy2(db_backup_path, self.database_path)
+                # Backup API rather than a file copy: open connections see the
+                # restored contents instead of a file swapped out from under them
+                self._copy_database(db_backup_path, self.database_path)
                 logger.info("Database restored")
             else:
                 logger.warning("No database backup found")
@@ -390,7 +649,13 @@ class BackupManager:
             output_backup_dir = backup_dir / "output"
             output_archive = backup_dir / "output.tar.gz"
             
-            if output_backup_dir.exists():
+            if snapshot_index.exists():
+                # Incremental backup restore
+                logger.info("Restoring translation files (incremental snapshot)...")
+                restored = self._restore_snapshot(snapshot_index)
+                logger.info(f"Translation files restored ({restored} files)")
+                
+            elif output_backup_dir.exists():
                 # Full backup restore
                 logger.info("Restoring translation files (full backup)...")
                 if self.output_dir.exists():
@@ -6,7 +6,9 @@ Batch language detection for efficient processing.
 import logging
 import random
 import time
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
+
+from .instrumentation import timer, timed, increment, record_openai_usage
 
 logger = logging.getLogger(__name__)
 
@@ -21,18 +23,21 @@ def _call_openai_with_retry(openai_client, prompt: str, max_tokens: int, max_ret
     backoff_seconds = 1.0
     for attempt in range(1, max_retries + 1):
         try:
-            response = openai_client.chat.completions.create(
-                model='gpt-4o-mini',
-                messages=[{"role": "user", "content": prompt}],
-                temperature=0,
-                max_tokens=max_tokens
-            )
+            with timer('openai.detect'):
+                response = openai_client.chat.completions.create(
+                    model='gpt-4o-mini',
+                    messages=[{"role": "user", "content": prompt}],
+                    temperature=0,
+                    max_tokens=max_tokens
+                )
+            record_openai_usage('openai.detect', response)
             return response.choices[0].message.content.strip()
         except Exception as e:
             # Backoff on any transient error
             logger.warning(f"OpenAI detect call failed (attempt {attempt}/{max_retries}): {e}")
             if attempt == max_retries:
                 break
+            increment('openai.detect.retries')
             # jitter 0-250ms
             jitter = random.uniform(0, 0.25)
             time.sleep(backoff_seconds + jitter)
@@ -40,19 +45,20 @@ def _call_openai_with_retry(openai_client, prompt: str, max_tokens: int, max_ret
     return None
 
 
-def detect_languages_batch(texts: List[str], openai_client) -> List[Optional[str]]:
+@timed('language_detection.batch')
+def detect_languages_with_confidence(texts: List[str], openai_client) -> List[Tuple[Optional[str], Optional[float]]]:
     """
-    Detect languages for multiple texts in a single API call.
+    Detect languages and detection confidence for multiple texts in a single API call.
     
     Args:
         texts: List of texts to detect
         openai_client: OpenAI client instance
         
     Returns:
-        List of language codes ('en', 'de', 'he', or None) in same order as input
+        List of (language code or None, confidence 0-1 or None) in same order as input
     """
     if not texts or not openai_client:
-        return [None] * len(texts)
+        return [(None, None)] * len(texts)
     
     # Create a numbered list for the prompt
     numbered_texts = []
@@ -61,10 +67,10 @@ def detect_languages_batch(texts: List[str], openai_client) -> List[Optional[str
         display_text = text[:100] + "..." if len(text) > 100 else text
         numbered_texts.append(f"{i}. {display_text}")
     
-    prompt = """For each numbered text below, identify the language. Reply with a list in the exact format:
-1: English
-2: German
-3: English
+    prompt = """For each numbered text below, identify the language and your confidence from 0 to 1. Reply with a list in the exact format:
+1: English 0.98
+2: German 0.90
+3: English 0.75
 etc.
 
 Only use: English, German, or Hebrew
@@ -81,25 +87,49 @@ Texts:
 
     if not result_text:
         logger.error("Batch language detection failed after retries")
-        return [None] * len(texts)
+        return [(None, None)] * len(texts)
 
-    results = [None] * len(texts)
-    # Parse lines like "1: English"
+    results = [(None, None)] * len(texts)
+    lang_map = {'english': 'en', 'german': 'de', 'hebrew': 'he'}
+    # Parse lines like "1: English 0.98" (confidence optional)
     for line in result_text.split('\n'):
         line = line.strip()
         if ':' in line:
             try:
                 num_part, lang_part = line.split(':', 1)
                 num = int(num_part.strip())
-                lang = lang_part.strip().lower()
-                lang_map = {'english': 'en', 'german': 'de', 'hebrew': 'he'}
-                if 1 <= num <= len(texts):
-                    results[num - 1] = lang_map.get(lang)
+                words = lang_part.lower().split()
+                if not 1 <= num <= len(texts) or not words:
+                    continue
+                lang = lang_map.get(words[0])
+                confidence = None
+                if lang and len(words) > 1:
+                    try:
+                        confidence = float(words[1])
+                    except ValueError:
+                        pass
+                    if confidence is not None and not 0 <= confidence <= 1:
+                        confidence = None
+                results[num - 1] = (lang, confidence)
             except Exception:
                 continue
     return results
 
 
+def detect_languages_batch(texts: List[str], openai_client) -> List[Optional[str]]:
+    """
+    Detect languages for multiple texts in a single API call.
+    
+    Args:
+        texts: List of texts to detect
+        openai_client: OpenAI client instance
+        
+    Returns:
+        List of language codes ('en', 'de', 'he', or None) in same order as input
+    """
+    return [lang for lang, _ in detect_languages_with_confidence(texts, openai_client)]
+
+
 def detect_languages_for_segments(segments, openai_client, batch_size=50):
     """
     Detect languages for all segments efficiently using batching.
@@ -120,14 +150,15 @@ def detect_languages_for_segments(segments, openai_client, batch_size=50):
         batch_texts = [seg.text for seg in batch_segments]
         
         # Detect languages for this batch
-        batch_results = detect_languages_batch(batch_texts, openai_client)
+        batch_results = detect_languages_with_confidence(batch_texts, openai_client)
         
         # Store results
-        for j, lang in enumerate(batch_results):
+        for j, (lang, confidence) in enumerate(batch_results):
             segment_idx = i + j
             if lang:
                 results[segment_idx] = lang
                 segments[segment_idx].detected_language = lang
+                segments[segment_idx].detection_confidence = confidence
         
         logger.info(f"Detected languages for segments {i+1}-{min(i+batch_size, len(segments))}")
     
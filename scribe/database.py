@@ -9,16 +9,237 @@ Provides essential functionality for tracking media files and processing status.
 import sqlite3
 import threading
 import logging
+import time
+from collections import namedtuple
 from contextlib import contextmanager
+from functools import lru_cache
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, List, Dict, Any, Tuple, Union
+from typing import Optional, List, Dict, Any, Iterator, Tuple, Union
 import uuid
 import weakref
 import os
 
+from .instrumentation import observe, increment
+
 logger = logging.getLogger(__name__)
 
+# Legacy wide columns on processing_status, keyed by normalized (stage, lang).
+# Language-independent stages use an empty lang so it can be part of the key.
+LEGACY_STAGE_COLUMNS = {
+    ('transcription', ''): 'transcription_status',
+    ('translation', 'en'): 'translation_en_status',
+    ('translation', 'de'): 'translation_de_status',
+    ('translation', 'he'): 'translation_he_status',
+}
+
+# Legacy wide translation columns on subtitle_segments, keyed by language.
+LEGACY_TRANSLATION_COLUMNS = {
+    'en': 'english_text',
+    'de': 'german_text',
+    'he': 'hebrew_text',
+}
+
+STAGE_STATUSES = ('not_started', 'in-progress', 'completed', 'failed')
+
+# subtitle_segments indexes created by the original migration that no query uses
+REDUNDANT_SEGMENT_INDEXES = (
+    'idx_subtitle_segments_interview_id',
+    'idx_subtitle_segments_search',
+    'idx_subtitle_segments_original_text',
+    'idx_subtitle_segments_english_text',
+    'idx_subtitle_segments_german_text',
+)
+
+# Full-text search: one FTS row per (segment, language) with
+# rowid = segment_id * SEARCH_SLOTS + language slot. Slot 0 is the original text.
+SEARCH_SLOTS = 64
+SEARCH_LANGUAGE_SLOTS = {'orig': 0, 'en': 1, 'de': 2, 'he': 3}
+
+# Hebrew vowel points, dagesh/shin dots and geresh/gershayim. unicode61 treats
+# the marks as separators, so pointed words would be split; they are stripped
+# before indexing and querying so pointed and unpointed spellings match.
+# (Cantillation is left alone: each mark costs a nested replace() in the
+# trigger SQL, and SQLite's parser stack tops out well short of the full block.)
+HEBREW_SEARCH_STRIP = (
+    [chr(c) for c in range(0x05B0, 0x05BE)]
+    + ['\u05BF', '\u05C1', '\u05C2', '\u05C7', '\u05F3', '\u05F4']
+)
+_SEARCH_STRIP_TABLE = {ord(ch): None for ch in HEBREW_SEARCH_STRIP}
+
+
+def normalize_search_text(text: str) -> str:
+    """Apply the same Hebrew normalization the FTS triggers use at index time."""
+    return text.translate(_SEARCH_STRIP_TABLE)
+
+
+def _normalize_search_sql(expr: str) -> str:
+    """SQL expression equivalent of normalize_search_text for use in triggers."""
+    for ch in HEBREW_SEARCH_STRIP:
+        expr = f"replace({expr}, char({ord(ch)}), '')"
+    return expr
+
+
+# sqlite3 caches compiled statements per connection, keyed by the exact SQL
+# text. Hot read paths take their SQL from this registry so the text never
+# varies between calls and the cache actually hits.
+STATEMENT_CACHE_SIZE = 256
+
+STATEMENTS = {
+    'file_by_path': "SELECT * FROM media_files WHERE original_path = ?",
+    'file_by_id': "SELECT * FROM media_files WHERE file_id = ?",
+    # m.* last so file_id survives the LEFT JOIN for files without a status row
+    'all_files': """
+        SELECT p.*, m.*
+        FROM media_files m
+        LEFT JOIN processing_status p ON m.file_id = p.file_id
+        ORDER BY m.created_at
+    """,
+    'status_by_id': """
+        SELECT m.*, p.*
+        FROM media_files m
+        JOIN processing_status p ON m.file_id = p.file_id
+        WHERE m.file_id = ?
+    """,
+    # LIMIT -1 means no limit
+    'pending_files': """
+        SELECT m.*, p.*
+        FROM file_stage_status s
+        JOIN media_files m ON m.file_id = s.file_id
+        JOIN processing_status p ON p.file_id = s.file_id
+        WHERE s.stage = ? AND s.lang = ? AND s.status = 'not_started'
+          AND p.status != 'failed'
+        ORDER BY p.last_updated ASC
+        LIMIT ?
+    """,
+    'stuck_files': """
+        SELECT m.*, p.*
+        FROM media_files m
+        JOIN processing_status p ON m.file_id = p.file_id
+        WHERE p.status = 'in-progress'
+          AND p.last_updated < ?
+        ORDER BY p.last_updated ASC
+    """,
+    'transcribed_files': """
+        SELECT m.*, p.*
+        FROM media_files m
+        JOIN processing_status p ON m.file_id = p.file_id
+        WHERE p.transcription_status = 'completed'
+          AND p.status != 'failed'
+        ORDER BY p.last_updated ASC
+    """,
+    'errors_by_file': """
+        SELECT * FROM errors WHERE file_id = ?
+        ORDER BY timestamp DESC, error_id DESC
+    """,
+    'all_errors': "SELECT * FROM errors ORDER BY timestamp DESC, error_id DESC",
+    'segments_by_interview': """
+        SELECT * FROM subtitle_segments
+        WHERE interview_id = ?
+        ORDER BY segment_index
+    """,
+    'all_segments': """
+        SELECT * FROM subtitle_segments
+        ORDER BY interview_id, segment_index
+    """,
+    'segments_for_translation': """
+        SELECT s.* FROM subtitle_segments s
+        WHERE s.interview_id = ?
+          AND NOT EXISTS (
+              SELECT 1 FROM segment_translations t
+              WHERE t.segment_id = s.id AND t.lang = ?
+          )
+        ORDER BY s.segment_index
+    """,
+    'segment_languages': """
+        SELECT id, segment_index, original_text, detected_language, detection_confidence
+        FROM subtitle_segments
+        WHERE interview_id = ?
+        ORDER BY segment_index
+    """,
+    'detection_summary': """
+        SELECT detected_language, COUNT(*) AS segments,
+               SUM(detection_confidence) AS confidence_sum,
+               COUNT(detection_confidence) AS confidence_count
+        FROM subtitle_segments
+        GROUP BY detected_language
+    """,
+    'segments_overlapping': """
+        SELECT * FROM subtitle_segments
+        WHERE interview_id = :interview_id
+          AND start_time < :t1
+          AND start_time > :t0 - (
+              SELECT IFNULL(MAX(duration), 0) FROM subtitle_segments
+              WHERE interview_id = :interview_id
+          )
+          AND end_time > :t0
+        ORDER BY start_time, end_time
+    """,
+    'segment_at': """
+        SELECT * FROM subtitle_segments
+        WHERE interview_id = :interview_id
+          AND start_time <= :t
+          AND start_time > :t - (
+              SELECT IFNULL(MAX(duration), 0) FROM subtitle_segments
+              WHERE interview_id = :interview_id
+          )
+          AND end_time > :t
+        ORDER BY start_time DESC, end_time DESC
+        LIMIT 1
+    """,
+    'segment_translations': """
+        SELECT s.id AS segment_id, s.segment_index, t.text, t.provider
+        FROM subtitle_segments s
+        JOIN segment_translations t ON t.segment_id = s.id AND t.lang = ?
+        WHERE s.interview_id = ?
+        ORDER BY s.segment_index
+    """,
+    'interview_segment_counts': """
+        SELECT lang, segment_count FROM interview_segment_counts
+        WHERE interview_id = ?
+    """,
+}
+
+# Row shapes accepted by the row_mode argument of read methods. 'dict' is the
+# default public shape; 'tuple' and 'namedtuple' skip per-row dict building
+# for hot internal callers.
+ROW_MODES = ('dict', 'tuple', 'namedtuple')
+
+# Rows fetched per fetchmany() call by the iter_* generators
+DEFAULT_ARRAYSIZE = 500
+
+
+@lru_cache(maxsize=64)
+def _row_type(columns: Tuple[str, ...]):
+    """Namedtuple class for a result column set (duplicate names are renamed)."""
+    return namedtuple('Row', columns, rename=True)
+
+
+def _convert_rows(description, rows: List[tuple], row_mode: str) -> list:
+    """Convert plain tuples from a cursor into the requested row shape."""
+    if row_mode == 'tuple':
+        return rows
+    columns = tuple(col[0] for col in description)
+    if row_mode == 'namedtuple':
+        return list(map(_row_type(columns)._make, rows))
+    return [dict(zip(columns, row)) for row in rows]
+
+
+def split_stage(stage: str) -> Tuple[str, str]:
+    """
+    Split a legacy stage name into normalized (stage, lang).
+
+    'translation_en' -> ('translation', 'en'), 'transcription' -> ('transcription', '').
+    """
+    if stage.startswith('translation_'):
+        return 'translation', stage[len('translation_'):]
+    return stage, ''
+
+
+def join_stage(stage: str, lang: str) -> str:
+    """Inverse of split_stage: ('translation', 'en') -> 'translation_en'."""
+    return f"{stage}_{lang}" if lang else stage
+
 
 class Database:
     """Thread-safe database interface with connection pooling."""
@@ -46,6 +267,36 @@ class Database:
         except Exception as migration_error:
             logger.error(f"Chat support migration failed: {migration_error}")
 
+        try:
+            self._migrate_to_normalized_status()
+        except Exception as migration_error:
+            logger.error(f"Normalized status migration failed: {migration_error}")
+
+        try:
+            self._migrate_to_status_counters()
+        except Exception as migration_error:
+            logger.error(f"Status counters migration failed: {migration_error}")
+
+        try:
+            self._migrate_to_segment_search()
+        except Exception as migration_error:
+            logger.error(f"Segment search migration failed: {migration_error}")
+
+        try:
+            self._migrate_to_segment_intervals()
+        except Exception as migration_error:
+            logger.error(f"Segment interval index migration failed: {migration_error}")
+
+        try:
+            self._drop_redundant_segment_indexes()
+        except Exception as migration_error:
+            logger.error(f"Segment index cleanup failed: {migration_error}")
+
+        try:
+            self._migrate_to_segment_language_detection()
+        except Exception as migration_error:
+            logger.error(f"Segment language detection migration failed: {migration_error}")
+
         # Ensure connections are closed when the instance is garbage-collected
         # or at interpreter shutdown in tests.
         weakref.finalize(self, self.close)
@@ -69,7 +320,8 @@ class Database:
             self._local.conn = sqlite3.connect(
                 str(self.db_path),
                 check_same_thread=False,
-                timeout=30.0
+                timeout=30.0,
+                cached_statements=STATEMENT_CACHE_SIZE
             )
             self._local.conn.row_factory = sqlite3.Row
             # Enable foreign keys
@@ -78,16 +330,76 @@ class Database:
             sqlite3.register_adapter(datetime, lambda dt: dt.isoformat())
         return self._local.conn
     
+    def _tuple_cursor(self, sql: str, params: Union[tuple, dict],
+                      row_mode: str) -> sqlite3.Cursor:
+        """Execute sql on a fresh cursor that returns plain tuples."""
+        if row_mode not in ROW_MODES:
+            raise ValueError(f"Unsupported row_mode: {row_mode}")
+        cursor = self._get_connection().cursor()
+        cursor.row_factory = None
+        return cursor.execute(sql, params)
+
+    def _fetch_all(self, statement: str, params: Union[tuple, dict] = (),
+                   row_mode: str = 'dict') -> list:
+        """Run a registered statement and return all rows in the given row mode."""
+        cursor = self._tuple_cursor(STATEMENTS[statement], params, row_mode)
+        return _convert_rows(cursor.description, cursor.fetchall(), row_mode)
+
+    def _fetch_one(self, statement: str, params: Union[tuple, dict] = (),
+                   row_mode: str = 'dict') -> Optional[Any]:
+        """Run a registered statement and return the first row, or None."""
+        cursor = self._tuple_cursor(STATEMENTS[statement], params, row_mode)
+        row = cursor.fetchone()
+        if row is None:
+            return None
+        return _convert_rows(cursor.description, [row], row_mode)[0]
+
+    def _iter_rows(self, sql: str, params: Union[tuple, dict], row_mode: str,
+                   arraysize: int) -> Iterator[Any]:
+        """
+        Stream rows with fetchmany so at most arraysize rows are held at once.
+
+        The statement is executed (and row_mode validated) immediately; the
+        returned generator keeps its cursor open until exhausted or closed.
+        """
+        cursor = self._tuple_cursor(sql, params, row_mode)
+        cursor.arraysize = arraysize
+
+        def rows() -> Iterator[Any]:
+            try:
+                while True:
+                    batch = cursor.fetchmany()
+                    if not batch:
+                        return
+                    yield from _convert_rows(cursor.description, batch, row_mode)
+            finally:
+                cursor.close()
+
+        return rows()
+
     @contextmanager
     def transaction(self):
-        """Context manager for database transactions."""
+        """
+        Context manager for database transactions.
+        
+        Records the time each transaction holds the connection (db.transaction)
+        and spends committing (db.commit, mostly waiting for the write lock),
+        and counts lock timeouts (db.lock_errors).
+        """
         conn = self._get_connection()
+        start = time.perf_counter()
         try:
             yield conn
+            commit_start = time.perf_counter()
             conn.commit()
-        except Exception:
+            observe('db.commit', time.perf_counter() - commit_start)
+        except Exception as e:
+            if isinstance(e, sqlite3.OperationalError) and 'locked' in str(e):
+                increment('db.lock_errors')
             conn.rollback()
             raise
+        finally:
+            observe('db.transaction', time.perf_counter() - start)
     
     def _initialize_schema(self):
         """Create database tables if they don't exist."""
@@ -142,6 +454,20 @@ class Database:
                 )
             """)
             
+            # Translation quality evaluations
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS quality_evaluations (
+                    eval_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    file_id TEXT NOT NULL,
+                    language TEXT NOT NULL,
+                    model TEXT,
+                    score REAL,
+                    issues TEXT,
+                    comment TEXT,
+                    evaluated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+            
             # Create indexes for common queries
             conn.execute("""
                 CREATE INDEX IF NOT EXISTS idx_status 
@@ -159,6 +485,10 @@ class Database:
                 CREATE INDEX IF NOT EXISTS idx_last_updated 
                 ON processing_status(last_updated)
             """)
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_quality_evaluations_file
+                ON quality_evaluations(file_id, language)
+            """)
 
             # Create migrations tracking table (idempotent)
             conn.execute(
@@ -199,6 +529,8 @@ class Database:
                     english_text TEXT,
                     hebrew_text TEXT,
                     confidence_score REAL,
+                    detected_language TEXT,
+                    detection_confidence REAL,
                     processing_timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
                     
                     -- Constraints
@@ -210,13 +542,9 @@ class Database:
                 )
             """)
             
-            # Create indexes for performance
-            conn.execute("CREATE INDEX idx_subtitle_segments_interview_id ON subtitle_segments(interview_id)")
-            conn.execute("CREATE INDEX idx_subtitle_segments_timing ON subtitle_segments(interview_id, start_time)")
-            conn.execute("CREATE INDEX idx_subtitle_segments_search ON subtitle_segments(interview_id, segment_index)")
-            conn.execute("CREATE INDEX idx_subtitle_segments_original_text ON subtitle_segments(original_text)")
-            conn.execute("CREATE INDEX idx_subtitle_segments_english_text ON subtitle_segments(english_text)")
-            conn.execute("CREATE INDEX idx_subtitle_segments_german_text ON subtitle_segments(german_text)")
+            # Ordered per-interview reads use the UNIQUE(interview_id, segment_index)
+            # autoindex; only the timing lookups need indexes of their own
+            self._create_segment_interval_indexes(conn)
             
             # Create backward compatibility views
             conn.execute("""
@@ -252,7 +580,12 @@ class Database:
                 FROM subtitle_segments
                 GROUP BY interview_id
             """)
-            
+
+            # Normalized per-language translations mirror the wide columns
+            self._create_segment_translations(conn)
+            self._create_segment_counters(conn)
+            self._create_segment_search(conn)
+
             logger.info("Subtitle segments migration completed successfully")
 
     def _migrate_to_chat_support(self):
@@ -311,7 +644,714 @@ class Database:
                 "INSERT OR IGNORE INTO schema_migrations(name) VALUES (?)",
                 ("2025-08-08_add_chat_support",),
             )
-    
+
+    def _migrate_to_normalized_status(self):
+        """
+        Add normalized file_stage_status and segment_translations tables.
+
+        The wide processing_status / subtitle_segments columns stay in place for
+        existing writers; triggers mirror them into the normalized tables so that
+        queries can filter by (stage, lang) with bound parameters and new
+        languages need no table rebuild. Idempotent and safe to call repeatedly.
+        """
+        with self.transaction() as conn:
+            tables = {
+                row[0] for row in
+                conn.execute("SELECT name FROM sqlite_master WHERE type='table'")
+            }
+            if 'file_stage_status' not in tables:
+                self._create_file_stage_status(conn)
+            if 'subtitle_segments' in tables and 'segment_translations' not in tables:
+                self._create_segment_translations(conn)
+
+    def _create_file_stage_status(self, conn: sqlite3.Connection):
+        """Create, backfill and wire up file_stage_status inside an open transaction."""
+        logger.info("Creating file_stage_status table...")
+
+        status_list = ', '.join(f"'{s}'" for s in STAGE_STATUSES)
+        conn.execute(f"""
+            CREATE TABLE IF NOT EXISTS file_stage_status (
+                file_id TEXT NOT NULL,
+                stage TEXT NOT NULL,
+                lang TEXT NOT NULL DEFAULT '',
+                status TEXT NOT NULL DEFAULT 'not_started'
+                    CHECK(status IN ({status_list})),
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                PRIMARY KEY (file_id, stage, lang),
+                FOREIGN KEY (file_id) REFERENCES media_files(file_id) ON DELETE CASCADE
+            ) WITHOUT ROWID
+        """)
+        # Secondary indexes on WITHOUT ROWID tables carry the primary key, so
+        # (stage, lang, status) covers both counts and file_id lookups.
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_file_stage_status_lookup
+            ON file_stage_status(stage, lang, status)
+        """)
+
+        for (stage, lang), column in LEGACY_STAGE_COLUMNS.items():
+            conn.execute(f"""
+                INSERT OR IGNORE INTO file_stage_status (file_id, stage, lang, status)
+                SELECT file_id, '{stage}', '{lang}', COALESCE({column}, 'not_started')
+                FROM processing_status
+            """)
+        self._create_stage_status_triggers(conn)
+
+        # Compatibility view exposing the old column names
+        pivot = ',\n'.join(
+            f"MAX(CASE WHEN stage = '{stage}' AND lang = '{lang}' THEN status END) AS {column}"
+            for (stage, lang), column in LEGACY_STAGE_COLUMNS.items()
+        )
+        conn.execute(f"""
+            CREATE VIEW IF NOT EXISTS processing_stage_columns AS
+            SELECT file_id, {pivot}
+            FROM file_stage_status
+            GROUP BY file_id
+        """)
+
+        conn.execute(
+            "INSERT OR IGNORE INTO schema_migrations(name) VALUES (?)",
+            ("2026-10-18_normalized_stage_status",),
+        )
+
+    def _create_stage_status_triggers(self, conn: sqlite3.Connection):
+        """
+        (Re)create the triggers mirroring processing_status into file_stage_status.
+
+        Writes use UPSERT rather than INSERT OR REPLACE: REPLACE deletes the old
+        row without firing delete triggers, which would skew the counter tables.
+        """
+        upsert = """
+            ON CONFLICT(file_id, stage, lang)
+            DO UPDATE SET status = excluded.status, updated_at = CURRENT_TIMESTAMP
+        """
+        for (stage, lang), column in LEGACY_STAGE_COLUMNS.items():
+            conn.execute(f"DROP TRIGGER IF EXISTS trg_file_stage_status_{column}")
+            conn.execute(f"""
+                CREATE TRIGGER trg_file_stage_status_{column}
+                AFTER UPDATE OF {column} ON processing_status
+                WHEN NEW.{column} IS NOT OLD.{column}
+                BEGIN
+                    INSERT INTO file_stage_status (file_id, stage, lang, status)
+                    VALUES (NEW.file_id, '{stage}', '{lang}', COALESCE(NEW.{column}, 'not_started'))
+                    {upsert};
+                END
+            """)
+
+        insert_rows = ',\n'.join(
+            f"(NEW.file_id, '{stage}', '{lang}', COALESCE(NEW.{column}, 'not_started'))"
+            for (stage, lang), column in LEGACY_STAGE_COLUMNS.items()
+        )
+        conn.execute("DROP TRIGGER IF EXISTS trg_file_stage_status_insert")
+        conn.execute(f"""
+            CREATE TRIGGER trg_file_stage_status_insert
+            AFTER INSERT ON processing_status
+            BEGIN
+                INSERT INTO file_stage_status (file_id, stage, lang, status)
+                VALUES {insert_rows}
+                {upsert};
+            END
+        """)
+        conn.execute("DROP TRIGGER IF EXISTS trg_file_stage_status_delete")
+        conn.execute("""
+            CREATE TRIGGER trg_file_stage_status_delete
+            AFTER DELETE ON processing_status
+            BEGIN
+                DELETE FROM file_stage_status WHERE file_id = OLD.file_id;
+            END
+        """)
+
+    def _create_segment_translations(self, conn: sqlite3.Connection):
+        """Create, backfill and wire up segment_translations inside an open transaction."""
+        logger.info("Creating segment_translations table...")
+
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS segment_translations (
+                segment_id INTEGER NOT NULL,
+                lang TEXT NOT NULL,
+                text TEXT NOT NULL,
+                provider TEXT,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                PRIMARY KEY (segment_id, lang),
+                FOREIGN KEY (segment_id) REFERENCES subtitle_segments(id) ON DELETE CASCADE
+            ) WITHOUT ROWID
+        """)
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_segment_translations_lang
+            ON segment_translations(lang)
+        """)
+
+        for lang, column in LEGACY_TRANSLATION_COLUMNS.items():
+            conn.execute(f"""
+                INSERT OR IGNORE INTO segment_translations (segment_id, lang, text)
+                SELECT id, '{lang}', {column}
+                FROM subtitle_segments
+                WHERE {column} IS NOT NULL
+            """)
+        self._create_segment_translation_triggers(conn)
+
+        # Compatibility view exposing the old column names
+        columns = ',\n'.join(
+            f"(SELECT text FROM segment_translations t "
+            f"WHERE t.segment_id = s.id AND t.lang = '{lang}') AS {column}"
+            for lang, column in LEGACY_TRANSLATION_COLUMNS.items()
+        )
+        conn.execute(f"""
+            CREATE VIEW IF NOT EXISTS segment_translation_columns AS
+            SELECT s.id AS segment_id, s.interview_id, s.segment_index, {columns}
+            FROM subtitle_segments s
+        """)
+
+        conn.execute(
+            "INSERT OR IGNORE INTO schema_migrations(name) VALUES (?)",
+            ("2026-10-18_segment_translations",),
+        )
+
+    def _create_segment_translation_triggers(self, conn: sqlite3.Connection):
+        """(Re)create the triggers mirroring subtitle_segments text columns."""
+        insert_statements = []
+        for lang, column in LEGACY_TRANSLATION_COLUMNS.items():
+            mirror = (
+                f"INSERT INTO segment_translations (segment_id, lang, text) "
+                f"SELECT NEW.id, '{lang}', NEW.{column} WHERE NEW.{column} IS NOT NULL"
+            )
+            # A legacy write resets provider; set_segment_translation records it afterwards
+            conn.execute(f"DROP TRIGGER IF EXISTS trg_segment_translations_{column}")
+            conn.execute(f"""
+                CREATE TRIGGER trg_segment_translations_{column}
+                AFTER UPDATE OF {column} ON subtitle_segments
+                WHEN NEW.{column} IS NOT OLD.{column}
+                BEGIN
+                    DELETE FROM segment_translations
+                    WHERE segment_id = NEW.id AND lang = '{lang}' AND NEW.{column} IS NULL;
+                    {mirror}
+                    ON CONFLICT(segment_id, lang) DO UPDATE SET
+                        text = excluded.text, provider = NULL, updated_at = CURRENT_TIMESTAMP;
+                END
+            """)
+            insert_statements.append(mirror + ";")
+
+        conn.execute("DROP TRIGGER IF EXISTS trg_segment_translations_insert")
+        conn.execute(f"""
+            CREATE TRIGGER trg_segment_translations_insert
+            AFTER INSERT ON subtitle_segments
+            BEGIN
+                {' '.join(insert_statements)}
+            END
+        """)
+        conn.execute("DROP TRIGGER IF EXISTS trg_segment_translations_delete")
+        conn.execute("""
+            CREATE TRIGGER trg_segment_translations_delete
+            AFTER DELETE ON subtitle_segments
+            BEGIN
+                DELETE FROM segment_translations WHERE segment_id = OLD.id;
+            END
+        """)
+
+    def _migrate_to_status_counters(self):
+        """
+        Add trigger-maintained counter tables for O(1) status reads.
+
+        summary_counters holds archive-wide totals, stage_status_counts the
+        per (stage, lang, status) file counts and interview_segment_counts the
+        per-interview segment and per-language translation counts.
+        Idempotent and safe to call repeatedly.
+        """
+        with self.transaction() as conn:
+            tables = {
+                row[0] for row in
+                conn.execute("SELECT name FROM sqlite_master WHERE type='table'")
+            }
+            if 'summary_counters' not in tables:
+                self._create_status_counters(conn)
+            elif not conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type='trigger' AND name='trg_counters_blocked_status_update'"
+            ).fetchone():
+                self._create_blocked_stage_counters(conn)
+            if 'segment_translations' in tables and 'interview_segment_counts' not in tables:
+                self._create_segment_counters(conn)
+
+    def _create_status_counters(self, conn: sqlite3.Connection):
+        """Create, backfill and wire up file-level counters inside an open transaction."""
+        logger.info("Creating status counter tables...")
+
+        # Mirror triggers from before the counters existed may still use REPLACE
+        self._create_stage_status_triggers(conn)
+
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS summary_counters (
+                name TEXT PRIMARY KEY,
+                value REAL NOT NULL DEFAULT 0
+            ) WITHOUT ROWID
+        """)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS stage_status_counts (
+                stage TEXT NOT NULL,
+                lang TEXT NOT NULL,
+                status TEXT NOT NULL,
+                file_count INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (stage, lang, status)
+            ) WITHOUT ROWID
+        """)
+
+        conn.execute("DELETE FROM summary_counters")
+        conn.execute("""
+            INSERT INTO summary_counters (name, value)
+            SELECT 'files', COUNT(*) FROM media_files
+            UNION ALL SELECT 'errors', COUNT(*) FROM errors
+            UNION ALL SELECT 'status:' || status, COUNT(*) FROM processing_status GROUP BY status
+        """)
+        conn.execute("DELETE FROM stage_status_counts")
+        conn.execute("""
+            INSERT INTO stage_status_counts (stage, lang, status, file_count)
+            SELECT stage, lang, status, COUNT(*) FROM file_stage_status
+            GROUP BY stage, lang, status
+        """)
+
+        def bump(name_expr: str, delta: str) -> str:
+            return (
+                f"INSERT INTO summary_counters (name, value) VALUES ({name_expr}, {delta}) "
+                f"ON CONFLICT(name) DO UPDATE SET value = value + excluded.value;"
+            )
+
+        def bump_stage(row: str, delta: int) -> str:
+            return (
+                f"INSERT INTO stage_status_counts (stage, lang, status, file_count) "
+                f"VALUES ({row}.stage, {row}.lang, {row}.status, {delta}) "
+                f"ON CONFLICT(stage, lang, status) "
+                f"DO UPDATE SET file_count = file_count + excluded.file_count;"
+            )
+
+        triggers = {
+            'trg_counters_files_insert': (
+                "AFTER INSERT ON media_files", bump("'files'", "1")),
+            'trg_counters_files_delete': (
+                "AFTER DELETE ON media_files", bump("'files'", "-1")),
+            'trg_counters_errors_insert': (
+                "AFTER INSERT ON errors", bump("'errors'", "1")),
+            'trg_counters_errors_delete': (
+                "AFTER DELETE ON errors", bump("'errors'", "-1")),
+            'trg_counters_status_insert': (
+                "AFTER INSERT ON processing_status",
+                bump("'status:' || NEW.status", "1")),
+            'trg_counters_status_delete': (
+                "AFTER DELETE ON processing_status",
+                bump("'status:' || OLD.status", "-1")),
+            'trg_counters_status_update': (
+                "AFTER UPDATE OF status ON processing_status WHEN NEW.status IS NOT OLD.status",
+                bump("'status:' || OLD.status", "-1") + bump("'status:' || NEW.status", "1")),
+            'trg_counters_stage_insert': (
+                "AFTER INSERT ON file_stage_status", bump_stage("NEW", 1)),
+            'trg_counters_stage_delete': (
+                "AFTER DELETE ON file_stage_status", bump_stage("OLD", -1)),
+            'trg_counters_stage_update': (
+                "AFTER UPDATE OF status ON file_stage_status WHEN NEW.status IS NOT OLD.status",
+                bump_stage("OLD", -1) + bump_stage("NEW", 1)),
+        }
+        for name, (event, body) in triggers.items():
+            conn.execute(f"DROP TRIGGER IF EXISTS {name}")
+            conn.execute(f"CREATE TRIGGER {name} {event} BEGIN {body} END")
+
+        conn.execute(
+            "INSERT OR IGNORE INTO schema_migrations(name) VALUES (?)",
+            ("2026-10-18_status_counters",),
+        )
+        self._create_blocked_stage_counters(conn)
+
+    def _create_blocked_stage_counters(self, conn: sqlite3.Connection):
+        """
+        Count not_started stages of files whose overall status is failed.
+
+        get_pending_files() skips failed files, so these counters
+        ('blocked:<stage>:<lang>' in summary_counters) are subtracted from the
+        not_started counts to get the work a run will actually pick up.
+
+        The processing_status triggers run BEFORE the row changes, while the
+        file_stage_status mirror triggers run after it, so an UPDATE that
+        changes both the overall status and a stage column is counted once
+        whichever order SQLite fires them in.
+        """
+        conn.execute("DELETE FROM summary_counters WHERE name LIKE 'blocked:%'")
+        conn.execute("""
+            INSERT INTO summary_counters (name, value)
+            SELECT 'blocked:' || s.stage || ':' || s.lang, COUNT(*)
+            FROM processing_status p
+            JOIN file_stage_status s ON s.file_id = p.file_id
+            WHERE p.status = 'failed' AND s.status = 'not_started'
+            GROUP BY s.stage, s.lang
+        """)
+
+        def bump(row: str, delta: str) -> str:
+            return (
+                f"INSERT INTO summary_counters (name, value) "
+                f"VALUES ('blocked:' || {row}.stage || ':' || {row}.lang, {delta}) "
+                f"ON CONFLICT(name) DO UPDATE SET value = value + excluded.value;"
+            )
+
+        def bump_file(file_id: str, delta: int) -> str:
+            return (
+                f"INSERT INTO summary_counters (name, value) "
+                f"SELECT 'blocked:' || stage || ':' || lang, {delta} FROM file_stage_status "
+                f"WHERE file_id = {file_id} AND status = 'not_started' "
+                f"ON CONFLICT(name) DO UPDATE SET value = value + excluded.value;"
+            )
+
+        def failed(row: str) -> str:
+            return (
+                f"EXISTS (SELECT 1 FROM processing_status "
+                f"WHERE file_id = {row}.file_id AND status = 'failed')"
+            )
+
+        triggers = {
+            'trg_counters_blocked_stage_insert': (
+                f"AFTER INSERT ON file_stage_status "
+                f"WHEN NEW.status = 'not_started' AND {failed('NEW')}",
+                bump("NEW", "1")),
+            'trg_counters_blocked_stage_delete': (
+                f"AFTER DELETE ON file_stage_status "
+                f"WHEN OLD.status = 'not_started' AND {failed('OLD')}",
+                bump("OLD", "-1")),
+            'trg_counters_blocked_stage_update': (
+                f"AFTER UPDATE OF status ON file_stage_status "
+                f"WHEN (NEW.status = 'not_started') != (OLD.status = 'not_started') AND {failed('NEW')}",
+                bump("NEW", "(NEW.status = 'not_started') - (OLD.status = 'not_started')")),
+            'trg_counters_blocked_status_update': (
+                "BEFORE UPDATE OF status ON processing_status "
+                "WHEN (NEW.status = 'failed') != (OLD.status = 'failed')",
+                bump_file("OLD.file_id", "CASE WHEN NEW.status = 'failed' THEN 1 ELSE -1 END")),
+            'trg_counters_blocked_status_delete': (
+                "BEFORE DELETE ON processing_status WHEN OLD.status = 'failed'",
+                bump_file("OLD.file_id", "-1")),
+        }
+        for name, (event, body) in triggers.items():
+            conn.execute(f"DROP TRIGGER IF EXISTS {name}")
+            conn.execute(f"CREATE TRIGGER {name} {event} BEGIN {body} END")
+
+        conn.execute(
+            "INSERT OR IGNORE INTO schema_migrations(name) VALUES (?)",
+            ("2026-10-18_blocked_stage_counters",),
+        )
+
+    def _create_segment_counters(self, conn: sqlite3.Connection):
+        """Create, backfill and wire up per-interview segment counters inside an open transaction."""
+        logger.info("Creating interview_segment_counts table...")
+
+        # Mirror triggers from before the counters existed may still use REPLACE
+        self._create_segment_translation_triggers(conn)
+
+        # lang '' holds the interview's total segment count
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS interview_segment_counts (
+                interview_id TEXT NOT NULL,
+                lang TEXT NOT NULL,
+                segment_count INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (interview_id, lang)
+            ) WITHOUT ROWID
+        """)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS summary_counters (
+                name TEXT PRIMARY KEY,
+                value REAL NOT NULL DEFAULT 0
+            ) WITHOUT ROWID
+        """)
+
+        conn.execute("DELETE FROM interview_segment_counts")
+        conn.execute("""
+            INSERT INTO interview_segment_counts (interview_id, lang, segment_count)
+            SELECT interview_id, '', COUNT(*) FROM subtitle_segments GROUP BY interview_id
+            UNION ALL
+            SELECT s.interview_id, t.lang, COUNT(*)
+            FROM segment_translations t
+            JOIN subtitle_segments s ON s.id = t.segment_id
+            GROUP BY s.interview_id, t.lang
+        """)
+        conn.execute("""
+            DELETE FROM summary_counters
+            WHERE name IN ('segments', 'confidence_sum', 'confidence_count')
+        """)
+        conn.execute("""
+            INSERT INTO summary_counters (name, value)
+            SELECT 'segments', COUNT(*) FROM subtitle_segments
+            UNION ALL SELECT 'confidence_sum', COALESCE(SUM(confidence_score), 0) FROM subtitle_segments
+            UNION ALL SELECT 'confidence_count', COUNT(confidence_score) FROM subtitle_segments
+        """)
+
+        def bump(interview: str, lang: str, delta: int) -> str:
+            return (
+                f"INSERT INTO interview_segment_counts (interview_id, lang, segment_count) "
+                f"SELECT {interview}, {lang}, {delta} WHERE {interview} IS NOT NULL "
+                f"ON CONFLICT(interview_id, lang) "
+                f"DO UPDATE SET segment_count = segment_count + excluded.segment_count;"
+            )
+
+        def bump_total(name: str, delta: str) -> str:
+            return (
+                f"INSERT INTO summary_counters (name, value) VALUES ('{name}', {delta}) "
+                f"ON CONFLICT(name) DO UPDATE SET value = value + excluded.value;"
+            )
+
+        parent = "(SELECT interview_id FROM subtitle_segments WHERE id = {row}.segment_id)"
+        triggers = {
+            'trg_counters_segments_insert': (
+                "AFTER INSERT ON subtitle_segments",
+                bump("NEW.interview_id", "''", 1)
+                + bump_total('segments', '1')
+                + bump_total('confidence_sum', 'COALESCE(NEW.confidence_score, 0)')
+                + bump_total('confidence_count', '(NEW.confidence_score IS NOT NULL)')),
+            # BEFORE DELETE: by the time cascaded translation deletes fire, the
+            # parent row is gone, so its translations are uncounted here instead.
+            'trg_counters_segments_delete': (
+                "BEFORE DELETE ON subtitle_segments",
+                bump("OLD.interview_id", "''", -1)
+                + "UPDATE interview_segment_counts SET segment_count = segment_count - 1 "
+                  "WHERE interview_id = OLD.interview_id AND lang IN "
+                  "(SELECT lang FROM segment_translations WHERE segment_id = OLD.id);"
+                + bump_total('segments', '-1')
+                + bump_total('confidence_sum', '-COALESCE(OLD.confidence_score, 0)')
+                + bump_total('confidence_count', '-(OLD.confidence_score IS NOT NULL)')),
+            'trg_counters_segments_confidence': (
+                "AFTER UPDATE OF confidence_score ON subtitle_segments "
+                "WHEN NEW.confidence_score IS NOT OLD.confidence_score",
+                bump_total('confidence_sum',
+                           'COALESCE(NEW.confidence_score, 0) - COALESCE(OLD.confidence_score, 0)')
+                + bump_total('confidence_count',
+                             '(NEW.confidence_score IS NOT NULL) - (OLD.confidence_score IS NOT NULL)')),
+            'trg_counters_translations_insert': (
+                "AFTER INSERT ON segment_translations",
+                bump(parent.format(row='NEW'), "NEW.lang", 1)),
+            'trg_counters_translations_delete': (
+                "AFTER DELETE ON segment_translations",
+                bump(parent.format(row='OLD'), "OLD.lang", -1)),
+        }
+        for name, (event, body) in triggers.items():
+            conn.execute(f"DROP TRIGGER IF EXISTS {name}")
+            conn.execute(f"CREATE TRIGGER {name} {event} BEGIN {body} END")
+
+        conn.execute(
+            "INSERT OR IGNORE INTO schema_migrations(name) VALUES (?)",
+            ("2026-10-18_segment_counters",),
+        )
+
+    def _migrate_to_segment_search(self):
+        """
+        Add the segment_fts full-text index over all segment languages.
+        Idempotent and safe to call repeatedly.
+        """
+        with self.transaction() as conn:
+            tables = {
+                row[0] for row in
+                conn.execute("SELECT name FROM sqlite_master WHERE type='table'")
+            }
+            if 'segment_translations' in tables and 'segment_fts' not in tables:
+                self._create_segment_search(conn)
+            elif 'segment_fts' in tables and not conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type='trigger' AND name='trg_segment_fts_language_limit'"
+            ).fetchone():
+                self._create_search_language_limit(conn)
+
+    def _migrate_to_segment_intervals(self):
+        """
+        Make the timing index covering and add the per-interview duration index
+        used to bound overlap scans. Idempotent and safe to call repeatedly.
+        """
+        with self.transaction() as conn:
+            indexes = {
+                row[0] for row in
+                conn.execute("SELECT name FROM sqlite_master WHERE type='index'")
+            }
+            tables = {
+                row[0] for row in
+                conn.execute("SELECT name FROM sqlite_master WHERE type='table'")
+            }
+            if 'subtitle_segments' in tables and 'idx_subtitle_segments_duration' not in indexes:
+                conn.execute("DROP INDEX IF EXISTS idx_subtitle_segments_timing")
+                self._create_segment_interval_indexes(conn)
+
+    def _drop_redundant_segment_indexes(self):
+        """
+        Drop subtitle_segments indexes that no query uses. Idempotent.
+
+        No query filters or sorts on segment text (search goes through
+        segment_fts), and (interview_id) / (interview_id, segment_index) are
+        covered by the UNIQUE(interview_id, segment_index) autoindex. Every
+        translation write had to maintain the text indexes for nothing.
+        """
+        with self.transaction() as conn:
+            existing = {
+                row[0] for row in conn.execute(
+                    "SELECT name FROM sqlite_master WHERE type='index' AND tbl_name='subtitle_segments'"
+                )
+            }
+            redundant = [name for name in REDUNDANT_SEGMENT_INDEXES if name in existing]
+            for name in redundant:
+                conn.execute(f"DROP INDEX {name}")
+            if redundant:
+                logger.info(f"Dropped redundant subtitle_segments indexes: {', '.join(redundant)}")
+                conn.execute(
+                    "INSERT OR IGNORE INTO schema_migrations(name) VALUES (?)",
+                    ("2026-10-18_drop_redundant_segment_indexes",),
+                )
+
+    def _migrate_to_segment_language_detection(self):
+        """
+        Add subtitle_segments.detected_language and detection_confidence so
+        source language detection runs once per segment, whichever path
+        (database or SRT translation) gets to it first.
+        Idempotent and safe to call repeatedly.
+        """
+        with self.transaction() as conn:
+            columns = {
+                row[1] for row in conn.execute("PRAGMA table_info(subtitle_segments)")
+            }
+            if not columns:
+                return
+            for column, column_type in (('detected_language', 'TEXT'), ('detection_confidence', 'REAL')):
+                if column not in columns:
+                    conn.execute(f"ALTER TABLE subtitle_segments ADD COLUMN {column} {column_type}")
+
+    def _create_segment_interval_indexes(self, conn: sqlite3.Connection):
+        """Create the indexes behind get_segments_overlapping and segment_at."""
+        # Covering (interview_id, start_time, end_time) lets overlap checks run
+        # index-only; MAX(duration) per interview is a single seek and bounds
+        # how far before t0 an overlapping cue can start.
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_subtitle_segments_timing
+            ON subtitle_segments(interview_id, start_time, end_time)
+        """)
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_subtitle_segments_duration
+            ON subtitle_segments(interview_id, duration)
+        """)
+        conn.execute(
+            "INSERT OR IGNORE INTO schema_migrations(name) VALUES (?)",
+            ("2026-10-18_segment_intervals",),
+        )
+
+    def _create_segment_search(self, conn: sqlite3.Connection):
+        """Create, backfill and wire up segment_fts inside an open transaction."""
+        logger.info("Creating segment_fts full-text index...")
+
+        # Contentless: the text already lives in subtitle_segments and
+        # segment_translations, so the index stores only tokens. Deletes go
+        # through the FTS5 'delete' command with the old (normalized) text.
+        try:
+            conn.execute("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS segment_fts USING fts5(
+                    text,
+                    content = '',
+                    tokenize = 'unicode61 remove_diacritics 2'
+                )
+            """)
+        except sqlite3.OperationalError as e:
+            logger.warning(f"FTS5 unavailable, segment search disabled: {e}")
+            return
+
+        conn.execute(f"""
+            CREATE TABLE IF NOT EXISTS search_languages (
+                lang TEXT PRIMARY KEY,
+                slot INTEGER NOT NULL UNIQUE CHECK(slot >= 0 AND slot < {SEARCH_SLOTS})
+            ) WITHOUT ROWID
+        """)
+        conn.executemany(
+            "INSERT OR IGNORE INTO search_languages (lang, slot) VALUES (?, ?)",
+            SEARCH_LANGUAGE_SLOTS.items()
+        )
+        conn.execute("""
+            INSERT OR IGNORE INTO search_languages (lang, slot)
+            SELECT lang, (SELECT MAX(slot) FROM search_languages) + ROW_NUMBER() OVER (ORDER BY lang)
+            FROM (SELECT DISTINCT lang FROM segment_translations)
+            WHERE lang NOT IN (SELECT lang FROM search_languages)
+        """)
+
+        norm = _normalize_search_sql
+        conn.execute(f"""
+            INSERT INTO segment_fts (rowid, text)
+            SELECT id * {SEARCH_SLOTS}, {norm('original_text')} FROM subtitle_segments
+        """)
+        conn.execute(f"""
+            INSERT INTO segment_fts (rowid, text)
+            SELECT t.segment_id * {SEARCH_SLOTS} + l.slot, {norm('t.text')}
+            FROM segment_translations t
+            JOIN search_languages l ON l.lang = t.lang
+        """)
+        unindexed = [row[0] for row in conn.execute(
+            "SELECT DISTINCT lang FROM segment_translations "
+            "WHERE lang NOT IN (SELECT lang FROM search_languages) ORDER BY lang"
+        )]
+        if unindexed:
+            logger.warning(f"No search slot left for languages {unindexed}; "
+                           f"their translations are not searchable")
+
+        def original(row: str, delete: bool = False) -> str:
+            if delete:
+                return (f"INSERT INTO segment_fts (segment_fts, rowid, text) VALUES "
+                        f"('delete', {row}.id * {SEARCH_SLOTS}, {norm(f'{row}.original_text')});")
+            return (f"INSERT INTO segment_fts (rowid, text) VALUES "
+                    f"({row}.id * {SEARCH_SLOTS}, {norm(f'{row}.original_text')});")
+
+        def translation(row: str, delete: bool = False) -> str:
+            columns, values = "rowid, text", ""
+            if delete:
+                columns, values = "segment_fts, rowid, text", "'delete', "
+            return (f"INSERT INTO segment_fts ({columns}) "
+                    f"SELECT {values}{row}.segment_id * {SEARCH_SLOTS} + slot, {norm(f'{row}.text')} "
+                    f"FROM search_languages WHERE lang = {row}.lang;")
+
+        register_language = (
+            "INSERT OR IGNORE INTO search_languages (lang, slot) "
+            "SELECT NEW.lang, MAX(slot) + 1 FROM search_languages;"
+        )
+
+        triggers = {
+            'trg_segment_fts_original_insert': (
+                "AFTER INSERT ON subtitle_segments",
+                original('NEW')),
+            'trg_segment_fts_original_update': (
+                "AFTER UPDATE OF original_text ON subtitle_segments "
+                "WHEN NEW.original_text IS NOT OLD.original_text",
+                original('OLD', delete=True) + original('NEW')),
+            'trg_segment_fts_original_delete': (
+                "AFTER DELETE ON subtitle_segments",
+                original('OLD', delete=True)),
+            'trg_segment_fts_translation_insert': (
+                "AFTER INSERT ON segment_translations",
+                register_language + translation('NEW')),
+            'trg_segment_fts_translation_update': (
+                "AFTER UPDATE OF text ON segment_translations WHEN NEW.text IS NOT OLD.text",
+                translation('OLD', delete=True) + translation('NEW')),
+            'trg_segment_fts_translation_delete': (
+                "AFTER DELETE ON segment_translations",
+                translation('OLD', delete=True)),
+        }
+        for name, (event, body) in triggers.items():
+            conn.execute(f"DROP TRIGGER IF EXISTS {name}")
+            conn.execute(f"CREATE TRIGGER {name} {event} BEGIN {body} END")
+
+        conn.execute(
+            "INSERT OR IGNORE INTO schema_migrations(name) VALUES (?)",
+            ("2026-10-18_segment_fts",),
+        )
+        self._create_search_language_limit(conn)
+
+    def _create_search_language_limit(self, conn: sqlite3.Connection):
+        """Reject translations in a new language once all search slots are taken."""
+        # Registration in the insert trigger is INSERT OR IGNORE, so without
+        # this guard a language past the last slot would be stored but never
+        # indexed.
+        conn.execute("DROP TRIGGER IF EXISTS trg_segment_fts_language_limit")
+        conn.execute(f"""
+            CREATE TRIGGER trg_segment_fts_language_limit
+            BEFORE INSERT ON segment_translations
+            WHEN NEW.lang NOT IN (SELECT lang FROM search_languages)
+                AND (SELECT MAX(slot) FROM search_languages) + 1 >= {SEARCH_SLOTS}
+            BEGIN
+                SELECT RAISE(ABORT, 'segment search supports at most {SEARCH_SLOTS} languages');
+            END
+        """)
+        conn.execute(
+            "INSERT OR IGNORE INTO schema_migrations(name) VALUES (?)",
+            ("2026-10-18_search_language_limit",),
+        )
+
     # File tracking methods
     
     def add_file_simple(self, file_path: Union[str, Path]) -> Optional[str]:
@@ -397,79 +1437,31 @@ class Database:
     def get_file_by_path(self, file_path: Union[str, Path]) -> Optional[Dict[str, Any]]:
         """Get file record by original path."""
         file_path = str(Path(file_path).resolve())
-        conn = self._get_connection()
-        
-        cursor = conn.execute("""
-            SELECT * FROM media_files WHERE original_path = ?
-        """, (file_path,))
-        
-        row = cursor.fetchone()
-        if row:
-            try:
-                return dict(row)
-            except (TypeError, ValueError):
-                # Fallback if row is not a proper Row object
-                return None
-        return None
+        return self._fetch_one('file_by_path', (file_path,))
     
     def get_file_by_id(self, file_id: str) -> Optional[Dict[str, Any]]:
         """Get file record by ID."""
-        conn = self._get_connection()
-        
-        cursor = conn.execute("""
-            SELECT * FROM media_files WHERE file_id = ?
-        """, (file_id,))
-        
-        row = cursor.fetchone()
-        if row:
-            try:
-                return dict(row)
-            except (TypeError, ValueError):
-                # Fallback if row is not a proper Row object
-                return None
-        return None
+        return self._fetch_one('file_by_id', (file_id,))
     
     def get_all_files(self) -> List[Dict[str, Any]]:
         """Get all file records from the database."""
-        conn = self._get_connection()
-        
-        cursor = conn.execute("""
-            SELECT m.*, p.*
-            FROM media_files m
-            LEFT JOIN processing_status p ON m.file_id = p.file_id
-            ORDER BY m.created_at
-        """)
+        return self._fetch_all('all_files')
+    
+    def iter_files(self, row_mode: str = 'dict',
+                   arraysize: int = DEFAULT_ARRAYSIZE) -> Iterator[Any]:
+        """
+        Stream all file records (media_files joined with processing_status).
         
-        results = []
-        for row in cursor.fetchall():
-            try:
-                results.append(dict(row))
-            except (TypeError, ValueError):
-                # Skip malformed rows
-                continue
-        return results
+        Same rows as get_all_files, fetched arraysize at a time. Files without
+        a processing_status row have None in the status columns.
+        """
+        return self._iter_rows(STATEMENTS['all_files'], (), row_mode, arraysize)
     
     # Status management methods
     
     def get_status(self, file_id: str) -> Optional[Dict[str, Any]]:
         """Get processing status for a file."""
-        conn = self._get_connection()
-        
-        cursor = conn.execute("""
-            SELECT m.*, p.*
-            FROM media_files m
-            JOIN processing_status p ON m.file_id = p.file_id
-            WHERE m.file_id = ?
-        """, (file_id,))
-        
-        row = cursor.fetchone()
-        if row:
-            try:
-                return dict(row)
-            except (TypeError, ValueError):
-                # Fallback if row is not a proper Row object
-                return None
-        return None
+        return self._fetch_one('status_by_id', (file_id,))
     
     def update_status(self,
                      file_id: str,
@@ -501,13 +1493,22 @@ class Database:
                 updates.append("completed_at = ?")
                 values.append(datetime.now())
         
-        # Add stage-specific status updates
+        # Add stage-specific status updates. Legacy stages live in wide columns
+        # (mirrored by trigger); any other stage/language goes straight to
+        # file_stage_status.
+        legacy_columns = set(LEGACY_STAGE_COLUMNS.values())
+        normalized_updates = []
         for key, value in stage_statuses.items():
-            if key.endswith('_status'):
+            if not key.endswith('_status'):
+                continue
+            if key in legacy_columns:
                 updates.append(f"{key} = ?")
                 values.append(value)
-        
-        if not updates:
+            else:
+                stage, lang = split_stage(key[:-len('_status')])
+                normalized_updates.append((file_id, stage, lang, value))
+
+        if not updates and not normalized_updates:
             return False
         
         # Always update last_updated
@@ -525,8 +1526,49 @@ class Database:
         
         with self.transaction() as conn:
             cursor = conn.execute(query, values)
-            return cursor.rowcount > 0
-    
+            if cursor.rowcount == 0:
+                return False
+            if normalized_updates:
+                conn.executemany("""
+                    INSERT INTO file_stage_status (file_id, stage, lang, status)
+                    VALUES (?, ?, ?, ?)
+                    ON CONFLICT(file_id, stage, lang)
+                    DO UPDATE SET status = excluded.status, updated_at = CURRENT_TIMESTAMP
+                """, normalized_updates)
+            return True
+
+    def set_stage_status(self,
+                         file_id: str,
+                         stage: str,
+                         status: str,
+                         lang: str = '') -> bool:
+        """
+        Set the status of one (stage, lang) pair for a file.
+
+        Args:
+            file_id: File ID to update
+            stage: Normalized stage name (e.g. 'transcription', 'translation')
+            status: Stage status ('not_started', 'in-progress', 'completed', 'failed')
+            lang: Language code for per-language stages, '' otherwise
+
+        Returns:
+            True if update was successful
+        """
+        return self.update_status(file_id, **{f"{join_stage(stage, lang)}_status": status})
+
+    def get_stage_statuses(self, file_id: str) -> Dict[str, str]:
+        """
+        Get all stage statuses for a file, keyed by legacy stage name.
+
+        Returns:
+            Dictionary like {'transcription': 'completed', 'translation_en': 'not_started'}
+        """
+        conn = self._get_connection()
+        cursor = conn.execute("""
+            SELECT stage, lang, status FROM file_stage_status WHERE file_id = ?
+        """, (file_id,))
+        return {join_stage(stage, lang): status for stage, lang, status in cursor}
+
     def increment_attempts(self, file_id: str) -> bool:
         """Increment attempt counter for a file."""
         with self.transaction() as conn:
@@ -553,29 +1595,10 @@ class Database:
         Returns:
             List of file records pending for the stage
         """
-        status_field = f"{stage}_status"
-        query = f"""
-            SELECT m.*, p.*
-            FROM media_files m
-            JOIN processing_status p ON m.file_id = p.file_id
-            WHERE p.{status_field} IN ('not_started')
-              AND p.status != 'failed'
-            ORDER BY p.last_updated ASC
-        """
-        
-        if limit:
-            query += f" LIMIT {int(limit)}"
-        
-        conn = self._get_connection()
-        cursor = conn.execute(query)
-        results = []
-        for row in cursor.fetchall():
-            try:
-                results.append(dict(row))
-            except (TypeError, ValueError):
-                # Skip malformed rows
-                continue
-        return results
+        stage_name, lang = split_stage(stage)
+        return self._fetch_all(
+            'pending_files', (stage_name, lang, int(limit) if limit else -1)
+        )
     
     def get_files_by_status(self,
                            status: Union[str, List[str]],
@@ -617,25 +1640,7 @@ class Database:
         cutoff_time = datetime.now() - timedelta(minutes=timeout_minutes)
         cutoff_iso = cutoff_time.isoformat()
         
-        query = """
-            SELECT m.*, p.*
-            FROM media_files m
-            JOIN processing_status p ON m.file_id = p.file_id
-            WHERE p.status = 'in-progress'
-              AND p.last_updated < ?
-            ORDER BY p.last_updated ASC
-        """
-        
-        conn = self._get_connection()
-        cursor = conn.execute(query, (cutoff_iso,))
-        results = []
-        for row in cursor.fetchall():
-            try:
-                results.append(dict(row))
-            except (TypeError, ValueError):
-                # Skip malformed rows
-                continue
-        return results
+        return self._fetch_all('stuck_files', (cutoff_iso,))
     
     def get_files_for_srt_translation(self, language: str) -> List[Dict[str, Any]]:
         """
@@ -673,25 +1678,7 @@ class Database:
         # Note: This query needs to be enhanced to check actual file existence
         # For now, we'll return all files with completed transcription
         # The pipeline will check for actual SRT file existence
-        simple_query = """
-            SELECT m.*, p.*
-            FROM media_files m
-            JOIN processing_status p ON m.file_id = p.file_id
-            WHERE p.transcription_status = 'completed'
-              AND p.status != 'failed'
-            ORDER BY p.last_updated ASC
-        """
-        
-        conn = self._get_connection()
-        cursor = conn.execute(simple_query)
-        results = []
-        for row in cursor.fetchall():
-            try:
-                results.append(dict(row))
-            except (TypeError, ValueError):
-                # Skip malformed rows
-                continue
-        return results
+        return self._fetch_all('transcribed_files')
     
     # Error logging
     
@@ -710,61 +1697,55 @@ class Database:
     
     def get_errors(self, file_id: Optional[str] = None) -> List[Dict[str, Any]]:
         """Get errors, optionally filtered by file_id."""
-        query = "SELECT * FROM errors"
-        params = []
-        
         if file_id:
-            query += " WHERE file_id = ?"
-            params.append(file_id)
-        
-        query += " ORDER BY timestamp DESC, error_id DESC"
-        
-        conn = self._get_connection()
-        cursor = conn.execute(query, params)
-        results = []
-        for row in cursor.fetchall():
-            try:
-                results.append(dict(row))
-            except (TypeError, ValueError):
-                # Skip malformed rows
-                continue
-        return results
+            return self._fetch_all('errors_by_file', (file_id,))
+        return self._fetch_all('all_errors')
     
     def get_all_errors(self) -> List[Dict[str, Any]]:
         """Get all errors - alias for get_errors()."""
         return self.get_errors()
-    
+
+    def add_quality_evaluations(self, evaluations: List[Tuple]) -> int:
+        """
+        Insert translation quality evaluations in a single transaction.
+
+        Args:
+            evaluations: Tuples of (file_id, language, model, score, issues,
+                comment, evaluated_at)
+
+        Returns:
+            Number of evaluations inserted
+        """
+        if not evaluations:
+            return 0
+        with self.transaction() as conn:
+            conn.executemany("""
+                INSERT INTO quality_evaluations
+                (file_id, language, model, score, issues, comment, evaluated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            """, evaluations)
+        return len(evaluations)
+
     # Summary statistics
     
     def get_summary(self) -> Dict[str, Any]:
-        """Get summary statistics about processing state."""
-        conn = self._get_connection()
+        """
+        Get summary statistics about processing state.
         
-        # Total files
-        total = conn.execute("SELECT COUNT(*) FROM media_files").fetchone()[0]
+        Reads the trigger-maintained counter tables, so the cost does not grow
+        with the number of files.
+        """
+        counters = self._get_summary_counters()
         
-        # Status counts
-        status_counts = {}
-        cursor = conn.execute("""
-            SELECT status, COUNT(*) as count
-            FROM processing_status
-            GROUP BY status
-        """)
-        for row in cursor:
-            status_counts[row['status']] = row['count']
+        # Overall status counts
+        status_counts = {
+            name[len('status:'):]: int(value)
+            for name, value in counters.items()
+            if name.startswith('status:') and value
+        }
         
         # Stage completion counts
-        stage_counts = {}
-        for stage in ['transcription', 'translation_en', 'translation_de', 'translation_he']:
-            cursor = conn.execute(f"""
-                SELECT {stage}_status as status, COUNT(*) as count
-                FROM processing_status
-                GROUP BY {stage}_status
-            """)
-            stage_counts[stage] = {row['status']: row['count'] for row in cursor}
-        
-        # Error count
-        error_count = conn.execute("SELECT COUNT(*) FROM errors").fetchone()[0]
+        stage_counts = self.get_stage_counts()
         
         # Calculate summary stats for CLI compatibility
         transcribed = stage_counts.get('transcription', {}).get('completed', 0)
@@ -772,17 +1753,74 @@ class Database:
         de_translated = stage_counts.get('translation_de', {}).get('completed', 0)
         he_translated = stage_counts.get('translation_he', {}).get('completed', 0)
         
+        # Work get_pending_files() will pick up: not_started stages, minus
+        # those of files whose overall status is failed
+        pending_counts = {
+            stage: counts.get('not_started', 0)
+                   - int(counters.get(f"blocked:{split_stage(stage)[0]}:{split_stage(stage)[1]}", 0))
+            for stage, counts in stage_counts.items()
+        }
+        
         return {
-            'total_files': total,
+            'total_files': int(counters.get('files', 0)),
             'status_counts': status_counts,
             'stage_counts': stage_counts,
-            'error_count': error_count,
+            'pending_counts': pending_counts,
+            'error_count': int(counters.get('errors', 0)),
             # Added for CLI compatibility
             'transcribed': transcribed,
             'en_translated': en_translated,
             'de_translated': de_translated,
             'he_translated': he_translated
         }
+
+    def _get_summary_counters(self) -> Dict[str, float]:
+        """Read all archive-wide counters from summary_counters."""
+        conn = self._get_connection()
+        return {name: value for name, value in conn.execute(
+            "SELECT name, value FROM summary_counters"
+        )}
+
+    def get_stage_counts(self) -> Dict[str, Dict[str, int]]:
+        """
+        Get per-stage status counts from stage_status_counts.
+
+        Returns:
+            Dictionary like {'translation_en': {'completed': 10, 'not_started': 2}, ...};
+            legacy stages are always present, even when empty.
+        """
+        conn = self._get_connection()
+        stage_counts = {join_stage(*key): {} for key in LEGACY_STAGE_COLUMNS}
+        cursor = conn.execute("""
+            SELECT stage, lang, status, file_count
+            FROM stage_status_counts
+            WHERE file_count > 0
+        """)
+        for stage, lang, status, count in cursor:
+            stage_counts.setdefault(join_stage(stage, lang), {})[status] = count
+        return stage_counts
+
+    def get_segment_totals(self) -> Dict[str, Any]:
+        """
+        Get archive-wide subtitle segment totals from the counter tables.
+
+        Returns:
+            Dictionary with interviews_with_segments, total_segments and average_confidence
+        """
+        counters = self._get_summary_counters()
+        conn = self._get_connection()
+        interviews = conn.execute("""
+            SELECT COUNT(*) FROM interview_segment_counts
+            WHERE lang = '' AND segment_count > 0
+        """).fetchone()[0] if 'segments' in counters else 0
+        confidence_count = counters.get('confidence_count', 0)
+        return {
+            'interviews_with_segments': interviews,
+            'total_segments': int(counters.get('segments', 0)),
+            'average_confidence': (
+                counters.get('confidence_sum', 0) / confidence_count if confidence_count else 0.0
+            )
+        }
     
     def execute_query(self, query: str, params: tuple = None) -> List[Dict[str, Any]]:
         """
@@ -811,6 +1849,23 @@ class Database:
         
         return rows
     
+    def iter_query(self, query: str, params: Union[tuple, dict, None] = None,
+                   row_mode: str = 'dict',
+                   arraysize: int = DEFAULT_ARRAYSIZE) -> Iterator[Any]:
+        """
+        Streaming variant of execute_query.
+        
+        Args:
+            query: SQL SELECT query
+            params: Query parameters (optional)
+            row_mode: 'dict' (default), 'tuple' or 'namedtuple'
+            arraysize: Rows per fetchmany() call
+            
+        Returns:
+            Iterator over rows; only arraysize rows are in memory at a time
+        """
+        return self._iter_rows(query, params or (), row_mode, arraysize)
+    
     # Subtitle segments methods for subtitle-first architecture
     
     def add_subtitle_segment(self,
@@ -854,22 +1909,34 @@ class Database:
             ))
             return cursor.lastrowid
     
-    def get_subtitle_segments(self, interview_id: str) -> List[Dict[str, Any]]:
-        """Get all subtitle segments for an interview, ordered by segment_index."""
-        conn = self._get_connection()
-        cursor = conn.execute("""
-            SELECT * FROM subtitle_segments 
-            WHERE interview_id = ?
-            ORDER BY segment_index
-        """, (interview_id,))
+    def get_subtitle_segments(self, interview_id: str,
+                              row_mode: str = 'dict') -> List[Any]:
+        """
+        Get all subtitle segments for an interview, ordered by segment_index.
         
-        results = []
-        for row in cursor.fetchall():
-            try:
-                results.append(dict(row))
-            except (TypeError, ValueError):
-                continue
-        return results
+        Args:
+            interview_id: ID of the interview
+            row_mode: 'dict' (default), or 'tuple' / 'namedtuple' for hot
+                      callers that do not need per-row dicts
+        """
+        return self._fetch_all('segments_by_interview', (interview_id,), row_mode)
+
+    def iter_segments(self, interview_id: Optional[str] = None, row_mode: str = 'dict',
+                      arraysize: int = DEFAULT_ARRAYSIZE) -> Iterator[Any]:
+        """
+        Stream subtitle segments, fetched arraysize at a time.
+        
+        Args:
+            interview_id: Restrict to one interview; None streams the whole
+                          archive ordered by (interview_id, segment_index)
+            row_mode: 'dict' (default), 'tuple' or 'namedtuple'
+            arraysize: Rows per fetchmany() call
+        """
+        if interview_id is None:
+            return self._iter_rows(STATEMENTS['all_segments'], (), row_mode, arraysize)
+        return self._iter_rows(
+            STATEMENTS['segments_by_interview'], (interview_id,), row_mode, arraysize
+        )
     
     def get_subtitle_segments_by_time_range(self,
                                           interview_id: str,
@@ -911,6 +1978,43 @@ class Database:
                 continue
         return results
     
+    def get_segments_overlapping(self, interview_id: str,
+                                 t0: float, t1: float) -> List[Dict[str, Any]]:
+        """
+        Get the segments that overlap the interval [t0, t1).
+
+        Unlike get_subtitle_segments_by_time_range, segments that only partly
+        fall inside the interval are included. The scan is bounded by the
+        interview's longest segment, so cost depends on the interval size,
+        not the transcript length.
+
+        Args:
+            interview_id: ID of the interview
+            t0: Interval start in seconds
+            t1: Interval end in seconds
+
+        Returns:
+            List of segment records ordered by start_time
+        """
+        return self._fetch_all(
+            'segments_overlapping', {'interview_id': interview_id, 't0': t0, 't1': t1}
+        )
+
+    def segment_at(self, interview_id: str, t: float) -> Optional[Dict[str, Any]]:
+        """
+        Get the segment showing at time t (start_time <= t < end_time).
+
+        When cues overlap, the one that started most recently wins.
+
+        Args:
+            interview_id: ID of the interview
+            t: Playback position in seconds
+
+        Returns:
+            Segment record, or None if no cue covers t
+        """
+        return self._fetch_one('segment_at', {'interview_id': interview_id, 't': t})
+
     def update_subtitle_segment_translations(self,
                                            segment_id: int,
                                            german_text: Optional[str] = None,
@@ -1051,44 +2155,25 @@ class Database:
             'overlaps': overlaps
         }
     
-    def get_segments_for_translation(self, interview_id: str, target_language: str) -> List[Dict[str, Any]]:
+    def get_segments_for_translation(self, interview_id: str, target_language: str,
+                                     row_mode: str = 'dict') -> List[Any]:
         """
         Get segments that need translation for a specific language.
         
         Args:
             interview_id: ID of the interview
-            target_language: Target language code ('en', 'de', 'he')
+            target_language: Target language code (e.g. 'en', 'de', 'he')
+            row_mode: 'dict' (default), 'tuple' or 'namedtuple'
             
         Returns:
-            List of segment dictionaries that need translation
+            List of segment rows that need translation
         """
-        language_column_map = {
-            'en': 'english_text',
-            'de': 'german_text',
-            'he': 'hebrew_text'
-        }
-        
-        if target_language not in language_column_map:
+        if not target_language or not target_language.isalpha():
             raise ValueError(f"Unsupported target language: {target_language}")
         
-        column = language_column_map[target_language]
-        
-        conn = self._get_connection()
-        query = f"""
-            SELECT * FROM subtitle_segments
-            WHERE interview_id = ? AND {column} IS NULL
-            ORDER BY segment_index
-        """
-        
-        cursor = conn.execute(query, (interview_id,))
-        results = []
-        for row in cursor.fetchall():
-            try:
-                results.append(dict(row))
-            except (TypeError, ValueError):
-                continue
-        
-        return results
+        return self._fetch_all(
+            'segments_for_translation', (interview_id, target_language), row_mode
+        )
     
     def batch_update_segment_translations(self, updates: List[Dict[str, Any]]) -> bool:
         """
@@ -1097,6 +2182,7 @@ class Database:
         Args:
             updates: List of update dictionaries with format:
                     [{'segment_id': 1, 'language': 'en', 'text': 'translation'}, ...]
+                    An optional 'provider' key records which service produced the text.
                     
         Returns:
             True if all updates successful, False otherwise
@@ -1108,30 +2194,36 @@ class Database:
         
         # Group updates by language for efficiency
         language_updates = {}
+        provider_updates = []
         for update in updates:
             lang = update['language']
             if lang not in language_updates:
                 language_updates[lang] = []
             language_updates[lang].append((update['text'], update['segment_id']))
-        
-        language_column_map = {
-            'en': 'english_text',
-            'de': 'german_text',
-            'he': 'hebrew_text'
-        }
+            if update.get('provider'):
+                provider_updates.append((update['provider'], update['segment_id'], lang))
         
         try:
             # Execute batch updates for each language
             for lang, update_list in language_updates.items():
-                if lang not in language_column_map:
-                    logger.warning(f"Skipping unsupported language: {lang}")
-                    continue
-                
-                column = language_column_map[lang]
-                query = f"UPDATE subtitle_segments SET {column} = ?, processing_timestamp = CURRENT_TIMESTAMP WHERE id = ?"
-                
-                # Execute all updates for this language
-                conn.executemany(query, update_list)
+                column = LEGACY_TRANSLATION_COLUMNS.get(lang)
+                if column:
+                    # Wide column write; trigger mirrors it into segment_translations
+                    query = f"UPDATE subtitle_segments SET {column} = ?, processing_timestamp = CURRENT_TIMESTAMP WHERE id = ?"
+                    conn.executemany(query, update_list)
+                else:
+                    conn.executemany("""
+                        INSERT INTO segment_translations (segment_id, lang, text)
+                        VALUES (?, ?, ?)
+                        ON CONFLICT(segment_id, lang)
+                        DO UPDATE SET text = excluded.text, updated_at = CURRENT_TIMESTAMP
+                    """, [(segment_id, lang, text) for text, segment_id in update_list])
+            
+            if provider_updates:
+                conn.executemany("""
+                    UPDATE segment_translations SET provider = ?
+                    WHERE segment_id = ? AND lang = ?
+                """, provider_updates)
             
             conn.commit()
             logger.info(f"Successfully updated {len(updates)} segment translations")
@@ -1142,6 +2234,103 @@ class Database:
             conn.rollback()
             return False
     
+    def set_segment_translation(self,
+                                segment_id: int,
+                                language: str,
+                                text: str,
+                                provider: Optional[str] = None) -> bool:
+        """
+        Store the translation of one segment in any language.
+        
+        Args:
+            segment_id: ID of the segment
+            language: Language code
+            text: Translated text
+            provider: Translation service that produced the text (optional)
+            
+        Returns:
+            True if update was successful
+        """
+        return self.batch_update_segment_translations([{
+            'segment_id': segment_id, 'language': language,
+            'text': text, 'provider': provider
+        }])
+    
+    def set_segment_detected_languages(self, detections: Dict[int, str],
+                                       confidences: Optional[Dict[int, float]] = None) -> bool:
+        """
+        Store detected source languages for many segments in one statement.
+        
+        Args:
+            detections: Mapping of segment ID to detected language code
+            confidences: Mapping of segment ID to detection confidence (0-1, optional)
+            
+        Returns:
+            True if update was successful
+        """
+        if not detections:
+            return True
+        
+        confidences = confidences or {}
+        try:
+            with self.transaction() as conn:
+                conn.executemany(
+                    "UPDATE subtitle_segments SET detected_language = ?, detection_confidence = ? WHERE id = ?",
+                    [(language, confidences.get(segment_id), segment_id)
+                     for segment_id, language in detections.items()]
+                )
+            return True
+        except Exception as e:
+            logger.error(f"Detected language update failed: {e}")
+            return False
+    
+    def get_segment_languages(self, interview_id: str) -> List[Dict[str, Any]]:
+        """
+        Get the stored source language detection of an interview's segments.
+        
+        Args:
+            interview_id: ID of the interview
+            
+        Returns:
+            List of dicts with id, segment_index, original_text, detected_language
+            and detection_confidence, ordered by segment_index
+        """
+        return self._fetch_all('segment_languages', (interview_id,))
+    
+    def get_detection_summary(self) -> Dict[str, Any]:
+        """
+        Summarize stored source language detection across all segments.
+        
+        Returns:
+            Dict with segment counts per detected language, the number of
+            undetected segments and the average detection confidence
+        """
+        rows = self._fetch_all('detection_summary')
+        languages = {row['detected_language']: row['segments'] for row in rows if row['detected_language']}
+        confidence = [row for row in rows if row['confidence_count']]
+        return {
+            'languages': languages,
+            'undetected': sum(row['segments'] for row in rows if not row['detected_language']),
+            'avg_confidence': (
+                sum(row['confidence_sum'] for row in confidence) /
+                sum(row['confidence_count'] for row in confidence)
+            ) if confidence else None
+        }
+    
+    def get_segment_translations(self, interview_id: str, language: str) -> List[Dict[str, Any]]:
+        """
+        Get the stored translations of an interview's segments for one language.
+        
+        Args:
+            interview_id: ID of the interview
+            language: Language code
+            
+        Returns:
+            List of dicts with segment_id, segment_index, text and provider,
+            ordered by segment_index; untranslated segments are omitted
+        """
+        return self._fetch_all('segment_translations', (language, interview_id))
+    
     def get_segment_translation_status(self, interview_id: str) -> Dict[str, Dict[str, int]]:
         """
         Get translation status counts by language.
@@ -1157,39 +2346,92 @@ class Database:
                 'en': {'translated': 85, 'pending': 15},
                 'he': {'translated': 80, 'pending': 20}
             }
+            Languages beyond the legacy three appear once they have translations.
         """
-        conn = self._get_connection()
-        
-        # Get total segments
-        total_query = """
-            SELECT COUNT(*) as total FROM subtitle_segments
-            WHERE interview_id = ?
-        """
-        total = conn.execute(total_query, (interview_id,)).fetchone()['total']
-        
-        # Get translation counts for each language
+        # Single primary-key range read of the trigger-maintained counters
+        counts = {lang: 0 for lang in ('', 'de', 'en', 'he')}
+        for lang, count in self._fetch_all(
+            'interview_segment_counts', (interview_id,), row_mode='tuple'
+        ):
+            counts[lang] = count
+        
+        total = counts.pop('')
         status = {'total': total}
-        
-        language_queries = {
-            'de': 'german_text',
-            'en': 'english_text',
-            'he': 'hebrew_text'
-        }
-        
-        for lang, column in language_queries.items():
-            translated_query = f"""
-                SELECT COUNT(*) as count FROM subtitle_segments
-                WHERE interview_id = ? AND {column} IS NOT NULL
-            """
-            translated = conn.execute(translated_query, (interview_id,)).fetchone()['count']
-            
+        for lang, translated in counts.items():
             status[lang] = {
                 'translated': translated,
                 'pending': total - translated
             }
         
         return status
-    
+
+    def search_segments(self, query: str, lang: Optional[str] = None,
+                        limit: int = 20, match_all: bool = True) -> List[Dict[str, Any]]:
+        """
+        Full-text search over segment text in every language, ranked by bm25.
+
+        Each whitespace-separated term must match (implicit AND) unless
+        match_all is False; a trailing ``*`` makes a term a prefix query.
+        Hebrew points are ignored. The index holds at most SEARCH_SLOTS (64)
+        languages including 'orig'; translations in a further language are
+        rejected (the insert aborts, set_segment_translation returns False).
+
+        Args:
+            query: Search terms
+            lang: Restrict to one language ('orig' for the original transcript,
+                  otherwise a translation code); None searches all languages
+            limit: Maximum number of hits
+            match_all: False to match segments containing any of the terms
+                       (bm25 still ranks segments with more terms first)
+
+        Returns:
+            List of dicts with interview_id, segment_index, start_time,
+            end_time, lang, text and score (lower is more relevant)
+        """
+        terms = []
+        for term in normalize_search_text(query).split():
+            prefix = term.endswith('*')
+            term = term.rstrip('*').replace('"', '""')
+            if term:
+                terms.append(f'"{term}"' + ('*' if prefix else ''))
+        if not terms:
+            return []
+
+        conn = self._get_connection()
+        params: List[Any] = [(' ' if match_all else ' OR ').join(terms)]
+        lang_filter = ""
+        if lang is not None:
+            slot = conn.execute(
+                "SELECT slot FROM search_languages WHERE lang = ?", (lang,)
+            ).fetchone()
+            if slot is None:
+                return []
+            lang_filter = f"AND segment_fts.rowid % {SEARCH_SLOTS} = ?"
+            params.append(slot[0])
+        params.append(limit)
+
+        try:
+            cursor = conn.execute(f"""
+                WITH hits AS (
+                    SELECT rowid, bm25(segment_fts) AS score
+                    FROM segment_fts
+                    WHERE segment_fts MATCH ? {lang_filter}
+                    ORDER BY score
+                    LIMIT ?
+                )
+                SELECT s.interview_id, s.segment_index, s.start_time, s.end_time,
+                       l.lang, COALESCE(t.text, s.original_text) AS text, hits.score
+                FROM hits
+                JOIN subtitle_segments s ON s.id = hits.rowid / {SEARCH_SLOTS}
+                JOIN search_languages l ON l.slot = hits.rowid % {SEARCH_SLOTS}
+                LEFT JOIN segment_translations t ON t.segment_id = s.id AND t.lang = l.lang
+                ORDER BY hits.score
+            """, params)
+        except sqlite3.OperationalError as e:
+            logger.error(f"Segment search failed: {e}")
+            return []
+        return [dict(row) for row in cursor.fetchall()]
+
     def close(self):
         """Close database connection for current thread."""
         if hasattr(self._local, 'conn'):
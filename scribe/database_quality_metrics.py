@@ -8,14 +8,189 @@ building upon the existing SRTTranslator quality validation mechanisms.
 
 This is part of the subtitle-first architecture that ensures quality metrics are
 persisted and trackable across the entire subtitle translation workflow.
+
+All writers upsert with executemany in a single transaction, and trends for
+any number of interviews are computed by one set-based query. The writers also
+refresh the pre-aggregated interview_quality_summary rows they affect, so
+reports read one row per interview and language.
+
+subtitle_quality_metrics keeps only the latest value of each metric; every
+stored value is also appended to subtitle_quality_metric_history, which is
+what the trend calculation reads.
 """
 
 import logging
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterable, List, Optional, Tuple
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# Upserts keep row ids stable, unlike INSERT OR REPLACE
+QUALITY_METRIC_UPSERT = """
+    INSERT INTO subtitle_quality_metrics
+    (interview_id, language, metric_type, metric_value, evaluation_method)
+    VALUES (?, ?, ?, ?, ?)
+    ON CONFLICT(interview_id, language, metric_type) DO UPDATE SET
+        metric_value = excluded.metric_value,
+        evaluation_method = excluded.evaluation_method,
+        evaluation_timestamp = CURRENT_TIMESTAMP
+"""
+
+QUALITY_HISTORY_INSERT = """
+    INSERT INTO subtitle_quality_metric_history
+    (interview_id, language, metric_type, metric_value, evaluation_method)
+    VALUES (?, ?, ?, ?, ?)
+"""
+
+SEGMENT_SCORE_UPSERT = """
+    INSERT INTO segment_quality_scores
+    (interview_id, segment_index, language,
+     timing_accuracy_score, translation_quality_score,
+     synchronization_score, boundary_preservation_score,
+     overall_score, evaluation_details)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(interview_id, segment_index, language) DO UPDATE SET
+        timing_accuracy_score = excluded.timing_accuracy_score,
+        translation_quality_score = excluded.translation_quality_score,
+        synchronization_score = excluded.synchronization_score,
+        boundary_preservation_score = excluded.boundary_preservation_score,
+        overall_score = excluded.overall_score,
+        evaluation_details = excluded.evaluation_details,
+        evaluated_at = CURRENT_TIMESTAMP
+"""
+
+TIMING_METRICS_UPSERT = """
+    INSERT INTO timing_coordination_metrics
+    (interview_id, language, total_segments, perfect_boundaries,
+     timing_gaps, timing_overlaps, max_gap_duration, max_overlap_duration,
+     avg_segment_duration, timing_drift_ms, srt_compatibility_score)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(interview_id, language) DO UPDATE SET
+        total_segments = excluded.total_segments,
+        perfect_boundaries = excluded.perfect_boundaries,
+        timing_gaps = excluded.timing_gaps,
+        timing_overlaps = excluded.timing_overlaps,
+        max_gap_duration = excluded.max_gap_duration,
+        max_overlap_duration = excluded.max_overlap_duration,
+        avg_segment_duration = excluded.avg_segment_duration,
+        timing_drift_ms = excluded.timing_drift_ms,
+        srt_compatibility_score = excluded.srt_compatibility_score,
+        evaluated_at = CURRENT_TIMESTAMP
+"""
+
+# Append-only: one row per stored metric value
+QUALITY_HISTORY_TABLE = """
+    CREATE TABLE subtitle_quality_metric_history (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        interview_id TEXT NOT NULL,
+        language TEXT NOT NULL,
+        metric_type TEXT NOT NULL,
+        metric_value REAL NOT NULL,
+        evaluation_method TEXT,
+        evaluation_timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (interview_id) REFERENCES media_files(file_id)
+    )
+"""
+
+QUALITY_HISTORY_INDEX = """
+    CREATE INDEX idx_quality_history_metric
+    ON subtitle_quality_metric_history(interview_id, language, metric_type)
+"""
+
+QUALITY_SUMMARY_TABLE = """
+    CREATE TABLE interview_quality_summary (
+        interview_id TEXT NOT NULL,
+        language TEXT NOT NULL,
+        overall_quality_score REAL,
+        translation_accuracy REAL,
+        timing_precision REAL,
+        boundary_validation REAL,
+        evaluated_segments INTEGER DEFAULT 0,
+        avg_segment_score REAL,
+        srt_compatibility_score REAL,
+        perfect_boundaries INTEGER,
+        timing_gaps INTEGER,
+        timing_overlaps INTEGER,
+        last_evaluated TIMESTAMP,
+        PRIMARY KEY (interview_id, language)
+    )
+"""
+
+# Aggregates each source table on its own before joining, so segment scores
+# are never multiplied by metric rows. {where} restricts both aggregates to
+# one (interview_id, language) for incremental refreshes.
+QUALITY_SUMMARY_REFRESH = """
+    INSERT INTO interview_quality_summary
+    SELECT
+        sqm.interview_id,
+        sqm.language,
+        sqm.overall_quality_score,
+        sqm.translation_accuracy,
+        sqm.timing_precision,
+        sqm.boundary_validation,
+        COALESCE(sqs.evaluated_segments, 0),
+        sqs.avg_segment_score,
+        tcm.srt_compatibility_score,
+        tcm.perfect_boundaries,
+        tcm.timing_gaps,
+        tcm.timing_overlaps,
+        sqm.last_evaluated
+    FROM (
+        SELECT
+            interview_id,
+            language,
+            AVG(CASE WHEN metric_type = 'overall_quality' THEN metric_value END) AS overall_quality_score,
+            AVG(CASE WHEN metric_type = 'translation_accuracy' THEN metric_value END) AS translation_accuracy,
+            AVG(CASE WHEN metric_type = 'timing_precision' THEN metric_value END) AS timing_precision,
+            AVG(CASE WHEN metric_type = 'boundary_validation' THEN metric_value END) AS boundary_validation,
+            MAX(evaluation_timestamp) AS last_evaluated
+        FROM subtitle_quality_metrics
+        {where}
+        GROUP BY interview_id, language
+    ) sqm
+    LEFT JOIN (
+        SELECT
+            interview_id,
+            language,
+            COUNT(DISTINCT segment_index) AS evaluated_segments,
+            AVG(overall_score) AS avg_segment_score
+        FROM segment_quality_scores
+        {where}
+        GROUP BY interview_id, language
+    ) sqs ON sqm.interview_id = sqs.interview_id AND sqm.language = sqs.language
+    LEFT JOIN timing_coordination_metrics tcm
+        ON sqm.interview_id = tcm.interview_id AND sqm.language = tcm.language
+"""
+
+# First and latest reading of every metric in the history, per interview and
+# language
+QUALITY_TRENDS_QUERY = """
+    SELECT
+        interview_id,
+        language,
+        metric_type,
+        COUNT(*) AS samples,
+        MAX(CASE WHEN first_rank = 1 THEN metric_value END) AS first_value,
+        MAX(CASE WHEN last_rank = 1 THEN metric_value END) AS latest_value,
+        MAX(evaluation_timestamp) AS last_evaluated
+    FROM (
+        SELECT
+            interview_id, language, metric_type, metric_value, evaluation_timestamp,
+            ROW_NUMBER() OVER (
+                PARTITION BY interview_id, language, metric_type
+                ORDER BY evaluation_timestamp, id
+            ) AS first_rank,
+            ROW_NUMBER() OVER (
+                PARTITION BY interview_id, language, metric_type
+                ORDER BY evaluation_timestamp DESC, id DESC
+            ) AS last_rank
+        FROM subtitle_quality_metric_history
+        {where}
+    )
+    GROUP BY interview_id, language, metric_type
+    ORDER BY interview_id, language, metric_type
+"""
+
 
 def add_quality_metrics_schema(db):
     """
@@ -28,11 +203,36 @@ def add_quality_metrics_schema(db):
         db: Database instance to extend
     """
     with db.transaction() as conn:
+        cursor = conn.execute("""
+            SELECT name, type FROM sqlite_master
+            WHERE name IN ('subtitle_quality_metrics', 'interview_quality_summary',
+                           'subtitle_quality_metric_history')
+        """)
+        existing = {row[0]: row[1] for row in cursor.fetchall()}
+        
         # Check if quality metrics table already exists
-        cursor = conn.execute(
-            "SELECT name FROM sqlite_master WHERE type='table' AND name='subtitle_quality_metrics'"
-        )
-        if cursor.fetchone() is not None:
+        if 'subtitle_quality_metrics' in existing:
+            # Earlier schemas computed interview_quality_summary as a view that
+            # aggregated a join of metrics and segment scores on every read
+            if existing.get('interview_quality_summary') != 'table':
+                logger.info("Replacing interview_quality_summary view with a summary table...")
+                conn.execute("DROP VIEW IF EXISTS interview_quality_summary")
+                conn.execute(QUALITY_SUMMARY_TABLE)
+                conn.execute(QUALITY_SUMMARY_REFRESH.format(where=''))
+            # Earlier schemas kept no history; it starts from the stored values
+            if 'subtitle_quality_metric_history' not in existing:
+                logger.info("Adding subtitle_quality_metric_history table...")
+                conn.execute(QUALITY_HISTORY_TABLE)
+                conn.execute(QUALITY_HISTORY_INDEX)
+                conn.execute("""
+                    INSERT INTO subtitle_quality_metric_history
+                    (interview_id, language, metric_type, metric_value,
+                     evaluation_method, evaluation_timestamp)
+                    SELECT interview_id, language, metric_type, metric_value,
+                           evaluation_method, evaluation_timestamp
+                    FROM subtitle_quality_metrics
+                    ORDER BY evaluation_timestamp, id
+                """)
             logger.debug("subtitle_quality_metrics table already exists")
             return
         
@@ -100,32 +300,42 @@ def add_quality_metrics_schema(db):
         conn.execute("CREATE INDEX idx_segment_scores_interview ON segment_quality_scores(interview_id)")
         conn.execute("CREATE INDEX idx_timing_metrics_interview ON timing_coordination_metrics(interview_id)")
         
-        # Create aggregate quality view
-        conn.execute("""
-            CREATE VIEW interview_quality_summary AS
-            SELECT 
-                sqm.interview_id,
-                sqm.language,
-                AVG(CASE WHEN sqm.metric_type = 'overall_quality' THEN sqm.metric_value END) as overall_quality_score,
-                AVG(CASE WHEN sqm.metric_type = 'translation_accuracy' THEN sqm.metric_value END) as translation_accuracy,
-                AVG(CASE WHEN sqm.metric_type = 'timing_precision' THEN sqm.metric_value END) as timing_precision,
-                AVG(CASE WHEN sqm.metric_type = 'boundary_validation' THEN sqm.metric_value END) as boundary_validation,
-                COUNT(DISTINCT sqs.segment_index) as evaluated_segments,
-                AVG(sqs.overall_score) as avg_segment_score,
-                tcm.srt_compatibility_score,
-                tcm.perfect_boundaries,
-                tcm.timing_gaps,
-                tcm.timing_overlaps,
-                MAX(sqm.evaluation_timestamp) as last_evaluated
-            FROM subtitle_quality_metrics sqm
-            LEFT JOIN segment_quality_scores sqs ON sqm.interview_id = sqs.interview_id AND sqm.language = sqs.language
-            LEFT JOIN timing_coordination_metrics tcm ON sqm.interview_id = tcm.interview_id AND sqm.language = tcm.language
-            GROUP BY sqm.interview_id, sqm.language
-        """)
+        # Create the metric history read by the trend calculation
+        conn.execute(QUALITY_HISTORY_TABLE)
+        conn.execute(QUALITY_HISTORY_INDEX)
+        
+        # Create aggregate quality table, maintained by the metric writers
+        conn.execute(QUALITY_SUMMARY_TABLE)
         
         logger.info("Enhanced quality metrics schema created successfully")
 
 
+def refresh_quality_summary(conn, keys: Iterable[Tuple[str, str]]):
+    """
+    Recompute interview_quality_summary rows for the given keys.
+    
+    Called by the metric writers inside their transaction.
+    
+    Args:
+        conn: Connection with an open transaction
+        keys: (interview_id, language) pairs whose metrics changed
+    """
+    params = [{'interview_id': interview_id, 'language': language}
+              for interview_id, language in set(keys)]
+    if not params:
+        return
+    conn.executemany("""
+        DELETE FROM interview_quality_summary
+        WHERE interview_id = :interview_id AND language = :language
+    """, params)
+    conn.executemany(
+        QUALITY_SUMMARY_REFRESH.format(
+            where="WHERE interview_id = :interview_id AND language = :language"
+        ),
+        params
+    )
+
+
 def store_quality_metrics(db, interview_id: str, language: str, metrics: Dict[str, Any]) -> bool:
     """
     Store quality metrics in database for persistent tracking.
@@ -142,25 +352,43 @@ def store_quality_metrics(db, interview_id: str, language: str, metrics: Dict[st
     Returns:
         True if metrics stored successfully
     """
+    if batch_store_quality_metrics(db, [(interview_id, language, metrics)]):
+        logger.info(f"Stored {len(metrics)} quality metrics for {interview_id} in {language}")
+        return True
+    return False
+
+
+def _metric_rows(interview_id: str, language: str, metrics: Dict[str, Any]) -> List[Tuple]:
+    """Rows for QUALITY_METRIC_UPSERT from one metrics dictionary."""
+    method = metrics.get('evaluation_method', 'enhanced_database_validation')
+    return [
+        (interview_id, language, metric_type, metric_value, method)
+        for metric_type, metric_value in metrics.items()
+        if isinstance(metric_value, (int, float))
+    ]
+
+
+def batch_store_quality_metrics(db, entries: Iterable[Tuple[str, str, Dict[str, Any]]]) -> bool:
+    """
+    Store quality metrics for many interviews in one transaction.
+    
+    Args:
+        db: Database instance
+        entries: (interview_id, language, metrics) tuples; see store_quality_metrics
+        
+    Returns:
+        True if metrics stored successfully
+    """
+    rows = []
+    for interview_id, language, metrics in entries:
+        rows.extend(_metric_rows(interview_id, language, metrics))
+    
     try:
         with db.transaction() as conn:
-            # Store overall metrics
-            for metric_type, metric_value in metrics.items():
-                if isinstance(metric_value, (int, float)):
-                    conn.execute("""
-                        INSERT OR REPLACE INTO subtitle_quality_metrics
-                        (interview_id, language, metric_type, metric_value, evaluation_method)
-                        VALUES (?, ?, ?, ?, ?)
-                    """, (
-                        interview_id,
-                        language,
-                        metric_type,
-                        metric_value,
-                        metrics.get('evaluation_method', 'enhanced_database_validation')
-                    ))
-            
-            logger.info(f"Stored {len(metrics)} quality metrics for {interview_id} in {language}")
-            return True
+            conn.executemany(QUALITY_METRIC_UPSERT, rows)
+            conn.executemany(QUALITY_HISTORY_INSERT, rows)
+            refresh_quality_summary(conn, ((row[0], row[1]) for row in rows))
+        return True
             
     except Exception as e:
         logger.error(f"Failed to store quality metrics: {e}")
@@ -182,26 +410,24 @@ def store_segment_quality_scores(db, interview_id: str, language: str,
         True if scores stored successfully
     """
     try:
+        rows = [
+            (
+                interview_id,
+                score['segment_index'],
+                language,
+                score.get('timing_accuracy_score'),
+                score.get('translation_quality_score'),
+                score.get('synchronization_score'),
+                score.get('boundary_preservation_score'),
+                score.get('overall_score'),
+                score.get('evaluation_details')
+            )
+            for score in segment_scores
+        ]
+        
         with db.transaction() as conn:
-            for score in segment_scores:
-                conn.execute("""
-                    INSERT OR REPLACE INTO segment_quality_scores
-                    (interview_id, segment_index, language, 
-                     timing_accuracy_score, translation_quality_score,
-                     synchronization_score, boundary_preservation_score,
-                     overall_score, evaluation_details)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    interview_id,
-                    score['segment_index'],
-                    language,
-                    score.get('timing_accuracy_score'),
-                    score.get('translation_quality_score'),
-                    score.get('synchronization_score'),
-                    score.get('boundary_preservation_score'),
-                    score.get('overall_score'),
-                    score.get('evaluation_details')
-                ))
+            conn.executemany(SEGMENT_SCORE_UPSERT, rows)
+            refresh_quality_summary(conn, [(interview_id, language)])
             
             logger.info(f"Stored quality scores for {len(segment_scores)} segments")
             return True
@@ -230,13 +456,7 @@ def store_timing_coordination_metrics(db, interview_id: str, language: str,
     """
     try:
         with db.transaction() as conn:
-            conn.execute("""
-                INSERT OR REPLACE INTO timing_coordination_metrics
-                (interview_id, language, total_segments, perfect_boundaries,
-                 timing_gaps, timing_overlaps, max_gap_duration, max_overlap_duration,
-                 avg_segment_duration, timing_drift_ms, srt_compatibility_score)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
+            conn.execute(TIMING_METRICS_UPSERT, (
                 interview_id,
                 language,
                 timing_metrics.get('total_segments', 0),
@@ -249,6 +469,7 @@ def store_timing_coordination_metrics(db, interview_id: str, language: str,
                 timing_metrics.get('timing_drift_ms', 0),
                 timing_metrics.get('srt_compatibility_score', 0)
             ))
+            refresh_quality_summary(conn, [(interview_id, language)])
             
             logger.info(f"Stored timing coordination metrics for {interview_id} in {language}")
             return True
@@ -341,79 +562,94 @@ def calculate_quality_trends(db, interview_id: str) -> Dict[str, Any]:
         interview_id: ID of the interview
         
     Returns:
-        Dictionary with quality trend analysis
+        Dictionary with quality trend analysis (see calculate_archive_quality_trends)
     """
-    conn = db._get_connection()
-    
-    # Get quality metrics over time
-    cursor = conn.execute("""
-        SELECT 
-            language,
-            metric_type,
-            metric_value,
-            evaluation_timestamp
-        FROM subtitle_quality_metrics
-        WHERE interview_id = ?
-        ORDER BY evaluation_timestamp
-    """, (interview_id,))
-    
-    trends = {
+    return calculate_archive_quality_trends(db, [interview_id]).get(interview_id, _empty_trends())
+
+
+def _empty_trends() -> Dict[str, Any]:
+    return {
         'languages': {},
         'overall_trend': 'stable',
         'quality_improvements': [],
         'quality_degradations': []
     }
+
+
+def calculate_archive_quality_trends(db, interview_ids: Optional[List[str]] = None) -> Dict[str, Dict[str, Any]]:
+    """
+    Calculate quality trends for many interviews with a single query.
+    
+    Trends compare the first and latest values in
+    subtitle_quality_metric_history, so a metric needs at least two stored
+    values before it can count as an improvement or degradation.
+    
+    Args:
+        db: Database instance
+        interview_ids: Interviews to analyze (default: every interview with metrics)
+        
+    Returns:
+        Trend analysis by interview ID. Each has per-language 'metrics'
+        (first_value, latest_value, number of stored samples and last_evaluated
+        per metric type)
+        and 'latest_score', plus 'quality_improvements', 'quality_degradations'
+        and 'overall_trend'
+    """
+    if interview_ids is not None and not interview_ids:
+        return {}
+    
+    where = ''
+    params: Tuple = ()
+    if interview_ids is not None:
+        where = f"WHERE interview_id IN ({','.join('?' * len(interview_ids))})"
+        params = tuple(interview_ids)
     
+    conn = db._get_connection()
+    cursor = conn.execute(QUALITY_TRENDS_QUERY.format(where=where), params)
+    
+    archive: Dict[str, Dict[str, Any]] = {}
     for row in cursor.fetchall():
+        trends = archive.setdefault(row['interview_id'], _empty_trends())
         lang = row['language']
-        if lang not in trends['languages']:
-            trends['languages'][lang] = {
-                'metrics': {},
-                'trend': 'stable',
-                'latest_score': 0
-            }
+        data = trends['languages'].setdefault(lang, {
+            'metrics': {},
+            'trend': 'stable',
+            'latest_score': 0
+        })
         
         metric_type = row['metric_type']
-        if metric_type not in trends['languages'][lang]['metrics']:
-            trends['languages'][lang]['metrics'][metric_type] = []
-        
-        trends['languages'][lang]['metrics'][metric_type].append({
-            'value': row['metric_value'],
-            'timestamp': row['evaluation_timestamp']
-        })
-    
-    # Analyze trends
-    for lang, data in trends['languages'].items():
-        for metric_type, values in data['metrics'].items():
-            if len(values) > 1:
-                first_value = values[0]['value']
-                last_value = values[-1]['value']
-                change = last_value - first_value
-                
-                if change > 0.1:  # Significant improvement
-                    trends['quality_improvements'].append({
-                        'language': lang,
-                        'metric': metric_type,
-                        'improvement': change
-                    })
-                elif change < -0.1:  # Significant degradation
-                    trends['quality_degradations'].append({
-                        'language': lang,
-                        'metric': metric_type,
-                        'degradation': abs(change)
-                    })
+        data['metrics'][metric_type] = {
+            'first_value': row['first_value'],
+            'latest_value': row['latest_value'],
+            'samples': row['samples'],
+            'last_evaluated': row['last_evaluated']
+        }
+        if metric_type == 'overall_quality':
+            data['latest_score'] = row['latest_value']
         
-        # Set latest score
-        if 'overall_quality' in data['metrics'] and data['metrics']['overall_quality']:
-            data['latest_score'] = data['metrics']['overall_quality'][-1]['value']
+        if row['samples'] > 1:
+            change = row['latest_value'] - row['first_value']
+            if change > 0.1:  # Significant improvement
+                trends['quality_improvements'].append({
+                    'language': lang,
+                    'metric': metric_type,
+                    'improvement': change
+                })
+            elif change < -0.1:  # Significant degradation
+                trends['quality_degradations'].append({
+                    'language': lang,
+                    'metric': metric_type,
+                    'degradation': abs(change)
+                })
     
     # Determine overall trend
-    if len(trends['quality_improvements']) > len(trends['quality_degradations']):
-        trends['overall_trend'] = 'improving'
-    elif len(trends['quality_degradations']) > len(trends['quality_improvements']):
-        trends['overall_trend'] = 'degrading'
+    for trends in archive.values():
+        if len(trends['quality_improvements']) > len(trends['quality_degradations']):
+            trends['overall_trend'] = 'improving'
+        elif len(trends['quality_degradations']) > len(trends['quality_improvements']):
+            trends['overall_trend'] = 'degrading'
     
-    return trends
+    return archive
 
 
 # Integration with DatabaseTranslator enhanced methods
@@ -500,7 +736,7 @@ def enhance_database_translator_with_metrics(DatabaseTranslator):
                 'max_gap_duration': max(gaps) if gaps else 0,
                 'max_overlap_duration': max(overlaps) if overlaps else 0,
                 'avg_segment_duration': timing_validation.get('total_duration', 0) / max(timing_validation.get('segment_count', 1), 1),
-                'timing_drift_ms': 0,  # Calculate if segments drift from expected timing
+                'timing_drift_ms': 0,  # Translations share the original segments' timing
                 'srt_compatibility_score': 1.0 if timing_validation.get('srt_compatibility', False) else 0.0
             }
             
@@ -530,11 +766,10 @@ def enhance_database_translator_with_metrics(DatabaseTranslator):
         }
         
         try:
-            # Get metrics for all languages
-            for lang in ['en', 'de', 'he']:
-                lang_metrics = get_quality_metrics(self.db, interview_id, lang)
-                if lang_metrics:
-                    report['languages'][lang] = lang_metrics
+            # Get metrics for all languages in one query
+            for lang_metrics in get_quality_metrics(self.db, interview_id):
+                if lang_metrics['language'] in ('en', 'de', 'he'):
+                    report['languages'][lang_metrics['language']] = lang_metrics
             
             # Calculate overall quality
             quality_scores = []
@@ -11,12 +11,13 @@ It coordinates existing translation timing mechanisms with database segments.
 """
 
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import List, Dict, Any, Optional, Tuple
 from pathlib import Path
 
-from .database import Database
+from .database import Database, LEGACY_TRANSLATION_COLUMNS
 from .translate import HistoricalTranslator
-from .batch_language_detection import detect_languages_batch
+from .batch_language_detection import detect_languages_with_confidence
 from .srt_translator import SRTSegment, SRTTranslator
 from .evaluate import HistoricalEvaluator, validate_hebrew_translation
 from .database_quality_metrics import (
@@ -30,6 +31,22 @@ from .database_quality_metrics import (
 
 logger = logging.getLogger(__name__)
 
+# Concurrent batch translations in translate_interview_multi()
+DEFAULT_TRANSLATION_WORKERS = 4
+
+# Segment timing for validation, with each segment's successor start
+TIMING_VALIDATION_QUERY = """
+    SELECT
+        segment_index,
+        start_time,
+        end_time,
+        LEAD(start_time) OVER (ORDER BY segment_index) AS next_start,
+        NULLIF({target_column}, '') AS target_text
+    FROM subtitle_segments
+    WHERE interview_id = ?
+    ORDER BY segment_index
+"""
+
 
 class DatabaseTranslator:
     """
@@ -109,10 +126,7 @@ class DatabaseTranslator:
                 )
                 
                 # Update results
-                results['translated'] += batch_results['translated']
-                results['skipped'] += batch_results['skipped']
-                results['failed'] += batch_results['failed']
-                results['errors'].extend(batch_results['errors'])
+                self._merge_batch_results(results, batch_results)
                 
                 logger.info(f"Processed batch {i//batch_size + 1}: "
                           f"{batch_results['translated']} translated, "
@@ -125,6 +139,131 @@ class DatabaseTranslator:
             
         return results
         
+    def translate_interview_multi(self,
+                                  interview_id: str,
+                                  target_languages: List[str],
+                                  batch_size: int = 50,
+                                  detect_source_language: bool = True,
+                                  max_workers: int = DEFAULT_TRANSLATION_WORKERS) -> Dict[str, Dict[str, Any]]:
+        """
+        Translate all segments for an interview to several languages at once.
+        
+        Source language is detected once per segment and stored on the segment
+        row, then every (language, batch) pair is translated on one shared pool
+        of max_workers threads. Each batch is saved with a single bulk update
+        from the calling thread as it completes.
+        
+        Args:
+            interview_id: ID of the interview to translate
+            target_languages: Target language codes ('en', 'de', 'he')
+            batch_size: Number of segments to process in each batch
+            detect_source_language: Whether to detect source language first
+            max_workers: Concurrent translation requests across all languages
+            
+        Returns:
+            Dictionary mapping each language to translate_interview() results
+        """
+        results = {
+            language: {'total_segments': 0, 'translated': 0, 'skipped': 0, 'failed': 0, 'errors': []}
+            for language in target_languages
+        }
+        
+        try:
+            pending = {
+                language: self.db.get_segments_for_translation(interview_id, language)
+                for language in target_languages
+            }
+            for language, segments in pending.items():
+                results[language]['total_segments'] = len(segments)
+            
+            if not any(pending.values()):
+                logger.info(f"No segments need translation for {', '.join(target_languages)}")
+                return results
+            
+            with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+                if detect_source_language:
+                    self._detect_pending_languages(pending, batch_size, executor)
+                
+                futures = {}
+                for language, segments in pending.items():
+                    for i in range(0, len(segments), batch_size):
+                        batch = segments[i:i + batch_size]
+                        detected_languages = [
+                            seg.get('detected_language') if detect_source_language else None
+                            for seg in batch
+                        ]
+                        future = executor.submit(
+                            self._translate_segments, batch, language, detected_languages
+                        )
+                        futures[future] = language
+                
+                for future in as_completed(futures):
+                    language = futures[future]
+                    try:
+                        batch_results, updates = future.result()
+                        self._save_translations(updates, batch_results)
+                    except Exception as e:
+                        logger.error(f"Batch translation failed for {language}: {e}")
+                        batch_results = {'translated': 0, 'skipped': 0, 'failed': 0, 'errors': [str(e)]}
+                    self._merge_batch_results(results[language], batch_results)
+            
+            for language, language_results in results.items():
+                logger.info(f"Translated {interview_id} to {language}: "
+                          f"{language_results['translated']} translated, "
+                          f"{language_results['skipped']} skipped, "
+                          f"{language_results['failed']} failed")
+                
+        except Exception as e:
+            logger.error(f"Translation failed for interview {interview_id}: {e}")
+            for language_results in results.values():
+                language_results['errors'].append(str(e))
+            
+        return results
+        
+    def _detect_pending_languages(self,
+                                  pending: Dict[str, List[Dict[str, Any]]],
+                                  batch_size: int,
+                                  executor: ThreadPoolExecutor):
+        """
+        Detect the source language of segments that have none stored yet.
+        
+        Each segment is detected once however many languages it is pending
+        for; results are stored on the segment rows and on the segment dicts.
+        """
+        undetected = {}
+        for segments in pending.values():
+            for segment in segments:
+                if not segment.get('detected_language'):
+                    undetected.setdefault(segment['id'], []).append(segment)
+        
+        if not undetected or not self.translator.openai_client:
+            return
+        
+        segment_ids = list(undetected)
+        batches = [segment_ids[i:i + batch_size] for i in range(0, len(segment_ids), batch_size)]
+        texts = [[undetected[segment_id][0]['original_text'] for segment_id in batch] for batch in batches]
+        
+        detections = {}
+        confidences = {}
+        for batch, languages in zip(batches, executor.map(self._detect_languages, texts)):
+            for segment_id, (language, confidence) in zip(batch, languages):
+                if language:
+                    detections[segment_id] = language
+                    confidences[segment_id] = confidence
+                    for segment in undetected[segment_id]:
+                        segment['detected_language'] = language
+                        segment['detection_confidence'] = confidence
+        
+        self.db.set_segment_detected_languages(detections, confidences)
+        
+    def _detect_languages(self, texts: List[str]) -> List[Tuple[Optional[str], Optional[float]]]:
+        """Detect (language, confidence) for texts, returning (None, None) for each on failure."""
+        try:
+            return detect_languages_with_confidence(texts, self.translator.openai_client)
+        except Exception as e:
+            logger.warning(f"Language detection failed: {e}")
+            return [(None, None)] * len(texts)
+        
     def _translate_batch(self,
                         segments: List[Dict[str, Any]],
                         target_language: str,
@@ -140,25 +279,49 @@ class DatabaseTranslator:
         Returns:
             Batch translation results
         """
+        # Reuse stored detections; detect and store the rest
+        if detect_source_language:
+            detected_languages = [seg.get('detected_language') for seg in segments]
+            undetected = [i for i, lang in enumerate(detected_languages) if not lang]
+            if undetected and self.translator.openai_client:
+                languages = self._detect_languages([segments[i]['original_text'] for i in undetected])
+                detections = {}
+                confidences = {}
+                for i, (lang, confidence) in zip(undetected, languages):
+                    detected_languages[i] = lang
+                    if lang:
+                        detections[segments[i]['id']] = lang
+                        confidences[segments[i]['id']] = confidence
+                self.db.set_segment_detected_languages(detections, confidences)
+        else:
+            detected_languages = [None] * len(segments)
+            
+        batch_results, updates = self._translate_segments(segments, target_language, detected_languages)
+        self._save_translations(updates, batch_results)
+        return batch_results
+        
+    def _translate_segments(self,
+                            segments: List[Dict[str, Any]],
+                            target_language: str,
+                            detected_languages: List[Optional[str]]) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+        """
+        Translate a batch of segments without writing to the database.
+        
+        Args:
+            segments: List of segment dictionaries
+            target_language: Target language code
+            detected_languages: Source language per segment (None if unknown)
+            
+        Returns:
+            Tuple of (batch results, translation updates to save)
+        """
         batch_results = {
             'translated': 0,
             'skipped': 0,
             'failed': 0,
             'errors': []
         }
-        
-        # Extract texts for processing
-        texts = [seg['original_text'] for seg in segments]
-        
-        # Detect languages if needed
-        if detect_source_language and self.translator.openai_client:
-            try:
-                detected_languages = detect_languages_batch(texts, self.translator.openai_client)
-            except Exception as e:
-                logger.warning(f"Language detection failed: {e}")
-                detected_languages = [None] * len(texts)
-        else:
-            detected_languages = [None] * len(texts)
+        updates = []
             
         # Group segments by detected language for efficient translation
         language_groups = {}
@@ -192,7 +355,6 @@ class DatabaseTranslator:
                 )
                 
                 # Prepare updates
-                updates = []
                 for (idx, segment), translation in zip(segment_group, translations):
                     if translation:
                         updates.append({
@@ -207,20 +369,26 @@ class DatabaseTranslator:
                             f"Failed to translate segment {segment['id']}"
                         )
                         
-                # Batch update database
-                if updates:
-                    success = self.db.batch_update_segment_translations(updates)
-                    if not success:
-                        batch_results['errors'].append(
-                            f"Failed to save {len(updates)} translations to database"
-                        )
-                        
             except Exception as e:
                 logger.error(f"Batch translation failed for {source_lang}: {e}")
                 batch_results['failed'] += len(segment_group)
                 batch_results['errors'].append(str(e))
                 
-        return batch_results
+        return batch_results, updates
+        
+    def _save_translations(self, updates: List[Dict[str, Any]], batch_results: Dict[str, Any]):
+        """Save a batch's translations with one bulk update, recording failure in batch_results."""
+        if updates and not self.db.batch_update_segment_translations(updates):
+            batch_results['errors'].append(
+                f"Failed to save {len(updates)} translations to database"
+            )
+        
+    def _merge_batch_results(self, results: Dict[str, Any], batch_results: Dict[str, Any]):
+        """Add batch counts and errors to interview results."""
+        results['translated'] += batch_results['translated']
+        results['skipped'] += batch_results['skipped']
+        results['failed'] += batch_results['failed']
+        results['errors'].extend(batch_results['errors'])
         
     def _is_non_verbal(self, text: str) -> bool:
         """
@@ -578,7 +746,7 @@ class DatabaseTranslator:
         Returns:
             List of SRTSegment objects with exact timing from database
         """
-        segments = self.db.get_subtitle_segments(interview_id)
+        segments = self.db.get_subtitle_segments(interview_id, row_mode='namedtuple')
         srt_segments = []
         
         # Language column mapping
@@ -596,14 +764,14 @@ class DatabaseTranslator:
         
         for segment in segments:
             # Convert database timestamp (float seconds) to SRT format (HH:MM:SS,mmm)
-            start_srt = self._seconds_to_srt_time(segment['start_time'])
-            end_srt = self._seconds_to_srt_time(segment['end_time'])
+            start_srt = self._seconds_to_srt_time(segment.start_time)
+            end_srt = self._seconds_to_srt_time(segment.end_time)
             
             # Get text for specified language
-            text = segment.get(text_column) or segment['original_text']
+            text = getattr(segment, text_column) or segment.original_text
             
             srt_segment = SRTSegment(
-                index=segment['segment_index'] + 1,  # SRT indices are 1-based
+                index=segment.segment_index + 1,  # SRT indices are 1-based
                 start_time=start_srt,
                 end_time=end_srt,
                 text=text
@@ -650,11 +818,16 @@ class DatabaseTranslator:
         
     def validate_timing_coordination(self, interview_id: str, target_language: str) -> Dict[str, Any]:
         """
-        Enhanced timing coordination validation that builds upon SRTTranslator's proven validation.
+        Enhanced timing coordination validation against the database segments.
         
-        This validation adds database-specific checks while preserving all existing
-        SRTTranslator boundary validation mechanisms. It extends rather than replaces
-        the proven timing validation framework.
+        Segment timing is fetched once, with each segment's successor via LEAD(),
+        and sequence integrity, translation alignment, gaps and overlaps are
+        all checked in a single pass over those rows.
+        
+        Translations are stored on the original segment rows, so they cannot
+        have timing of their own: SRT boundaries are preserved by construction
+        rather than checked. The result says so with boundary_validation_method
+        'shared_segment_timing', and boundary_validation is always True.
         
         Args:
             interview_id: ID of the interview to validate
@@ -668,6 +841,7 @@ class DatabaseTranslator:
             'segment_count': 0,
             'timing_issues': [],
             'boundary_validation': True,
+            'boundary_validation_method': 'shared_segment_timing',
             'database_consistency': True,
             'srt_compatibility': True,
             'total_duration': 0.0,
@@ -675,66 +849,40 @@ class DatabaseTranslator:
         }
         
         try:
-            # Get original segments from database
-            original_segments = self.convert_segments_to_srt_format(interview_id, 'original')
-            
-            # Get translated segments
-            translated_segments = self.convert_segments_to_srt_format(interview_id, target_language)
-            
-            validation_results['segment_count'] = len(original_segments)
-            
-            # 1. FOUNDATION: Use SRTTranslator's proven boundary validation
-            srt_translator = SRTTranslator(self.translator)
-            boundary_valid = srt_translator._validate_segment_boundaries(
-                original_segments, 
-                translated_segments
-            )
+            if target_language == 'original':
+                target_column = 'original_text'
+            elif target_language in LEGACY_TRANSLATION_COLUMNS:
+                target_column = LEGACY_TRANSLATION_COLUMNS[target_language]
+            else:
+                raise ValueError(f"Unsupported language: {target_language}")
             
-            validation_results['boundary_validation'] = boundary_valid
-            validation_results['srt_compatibility'] = boundary_valid
+            conn = self.db._get_connection()
+            rows = conn.execute(
+                TIMING_VALIDATION_QUERY.format(target_column=target_column), (interview_id,)
+            ).fetchall()
+            validation_results['segment_count'] = len(rows)
             
-            if not boundary_valid:
-                validation_results['timing_valid'] = False
-                validation_results['timing_issues'].append("SRTTranslator boundary validation failed")
-                
-            # 2. ENHANCEMENT: Database-specific segment boundary validation
-            db_validation = self._validate_database_segment_boundaries(interview_id, target_language)
+            # Database-specific segment boundary validation
+            db_validation = self._validate_timing_rows(rows, target_language)
             validation_results['database_validation_details'] = db_validation
             validation_results['database_consistency'] = db_validation['valid']
             
             if not db_validation['valid']:
                 validation_results['timing_valid'] = False
                 validation_results['timing_issues'].extend(db_validation['issues'])
-                
-            # 3. ENHANCEMENT: Cross-validation between database and SRT format
-            srt_db_consistency = self._validate_srt_database_consistency(
-                original_segments, translated_segments, interview_id, target_language
-            )
             
-            if not srt_db_consistency['consistent']:
-                validation_results['timing_valid'] = False
-                validation_results['timing_issues'].extend(srt_db_consistency['issues'])
-                validation_results['srt_compatibility'] = False
-                
-            # 4. EXISTING: Enhanced timing gap analysis (preserved from original)
-            if original_segments:
-                first_segment_start = self._srt_time_to_seconds(original_segments[0].start_time)
-                last_segment_end = self._srt_time_to_seconds(original_segments[-1].end_time)
-                validation_results['total_duration'] = last_segment_end - first_segment_start
+            # Timing gap analysis (at SRT millisecond precision)
+            if rows:
+                validation_results['total_duration'] = round(rows[-1][2], 3) - round(rows[0][1], 3)
                 
-                # Enhanced gap detection with database coordination
-                gap_analysis = self._analyze_timing_gaps_with_database(
-                    original_segments, interview_id
-                )
+                gap_analysis = self._analyze_timing_gaps(rows)
                 validation_results['timing_issues'].extend(gap_analysis['issues'])
                 
                 if gap_analysis['critical_overlaps']:
                     validation_results['timing_valid'] = False
                     
             logger.info(f"Enhanced timing coordination validation: {'✅ PASSED' if validation_results['timing_valid'] else '❌ FAILED'}")
-            logger.info(f"  SRT Boundary Validation: {'✅' if boundary_valid else '❌'}")
             logger.info(f"  Database Consistency: {'✅' if db_validation['valid'] else '❌'}")
-            logger.info(f"  Cross-validation: {'✅' if srt_db_consistency['consistent'] else '❌'}")
             
             # Task 4.5: Store timing coordination metrics
             timing_metrics = self.calculate_timing_accuracy_metrics(interview_id, target_language, validation_results)
@@ -746,11 +894,16 @@ class DatabaseTranslator:
             
         return validation_results
         
-    def _validate_database_segment_boundaries(self, interview_id: str, target_language: str) -> Dict[str, Any]:
+    def _validate_timing_rows(self, rows: List[Tuple], target_language: str) -> Dict[str, Any]:
         """
-        Database-specific segment boundary validation that complements SRTTranslator validation.
+        Database-specific segment boundary validation.
         
-        This method validates database integrity while building upon existing patterns.
+        Args:
+            rows: TIMING_VALIDATION_QUERY rows, ordered by segment_index
+            target_language: Language being validated
+            
+        Returns:
+            Validation details
         """
         validation = {
             'valid': True,
@@ -760,172 +913,53 @@ class DatabaseTranslator:
             'translation_alignment': True
         }
         
-        try:
-            # Check database segment integrity
-            conn = self.db._get_connection()
-            
-            # Validate segment sequence continuity
-            cursor = conn.execute("""
-                SELECT segment_index, start_time, end_time, original_text
-                FROM subtitle_segments 
-                WHERE interview_id = ?
-                ORDER BY segment_index
-            """, (interview_id,))
-            
-            segments = cursor.fetchall()
-            
-            # Check for missing segments in sequence
-            expected_indices = set(range(len(segments)))
-            actual_indices = set(seg[0] for seg in segments)
-            
-            if expected_indices != actual_indices:
-                missing = expected_indices - actual_indices
-                validation['issues'].append(f"Missing segment indices: {sorted(missing)}")
-                validation['segment_integrity'] = False
-                validation['valid'] = False
-                
-            # Check for timestamp consistency
-            for i, segment in enumerate(segments):
-                start_time, end_time = segment[1], segment[2]
-                
-                if start_time >= end_time:
-                    validation['issues'].append(
-                        f"Invalid timing in segment {segment[0]}: start ({start_time}) >= end ({end_time})"
-                    )
-                    validation['timestamp_consistency'] = False
-                    validation['valid'] = False
-                    
-                # Check for negative timestamps
-                if start_time < 0 or end_time < 0:
-                    validation['issues'].append(
-                        f"Negative timestamp in segment {segment[0]}: start={start_time}, end={end_time}"
-                    )
-                    validation['timestamp_consistency'] = False
-                    validation['valid'] = False
-                    
-            # Validate translation alignment if target language segments exist
-            if target_language != 'original':
-                # Check if target language column exists and has data
-                language_column_map = {
-                    'de': 'german_text',
-                    'en': 'english_text', 
-                    'he': 'hebrew_text'
-                }
-                
-                target_column = language_column_map.get(target_language)
-                if target_column:
-                    # Check for non-null translated text in target language
-                    translation_cursor = conn.execute(f"""
-                        SELECT segment_index, start_time, end_time, {target_column}
-                        FROM subtitle_segments 
-                        WHERE interview_id = ? AND {target_column} IS NOT NULL AND {target_column} != ''
-                        ORDER BY segment_index
-                    """, (interview_id,))
-                    
-                    translated_segments = translation_cursor.fetchall()
-                    
-                    if translated_segments:
-                        # Check alignment with original segments  
-                        if len(segments) != len(translated_segments):
-                            validation['issues'].append(
-                                f"Segment count mismatch: original={len(segments)}, {target_language}={len(translated_segments)}"
-                            )
-                            validation['translation_alignment'] = False
-                            validation['valid'] = False
-                            
-                        # Check timing preservation
-                        for orig, trans in zip(segments, translated_segments):
-                            if orig[1] != trans[1] or orig[2] != trans[2]:  # start_time, end_time
-                                validation['issues'].append(
-                                    f"Timing mismatch in segment {orig[0]}: "
-                                    f"original=({orig[1]}, {orig[2]}), {target_language}=({trans[1]}, {trans[2]})"
-                                )
-                                validation['translation_alignment'] = False
-                                validation['valid'] = False
-                            
-        except Exception as e:
-            validation['issues'].append(f"Database validation error: {str(e)}")
+        # Check for missing segments in sequence
+        missing = set(range(len(rows))) - set(row[0] for row in rows)
+        if missing:
+            validation['issues'].append(f"Missing segment indices: {sorted(missing)}")
+            validation['segment_integrity'] = False
             validation['valid'] = False
-            
-        return validation
         
-    def _validate_srt_database_consistency(self, original_segments: List[SRTSegment], 
-                                         translated_segments: List[SRTSegment],
-                                         interview_id: str, target_language: str) -> Dict[str, Any]:
-        """
-        Cross-validate consistency between SRT format and database storage.
-        
-        This ensures the database segments exactly match what SRTTranslator expects.
-        """
-        consistency = {
-            'consistent': True,
-            'issues': [],
-            'format_alignment': True,
-            'content_alignment': True
-        }
-        
-        try:
-            # Get database segments for comparison
-            conn = self.db._get_connection()
-            cursor = conn.execute("""
-                SELECT segment_index, start_time, end_time, original_text
-                FROM subtitle_segments 
-                WHERE interview_id = ?
-                ORDER BY segment_index
-            """, (interview_id,))
-            
-            db_original_segments = cursor.fetchall()
-            
-            # Validate format alignment
-            if len(original_segments) != len(db_original_segments):
-                consistency['issues'].append(
-                    f"Format mismatch: SRT has {len(original_segments)} segments, "
-                    f"database has {len(db_original_segments)}"
+        # Check for timestamp consistency
+        for segment_index, start_time, end_time, _, _ in rows:
+            if start_time >= end_time:
+                validation['issues'].append(
+                    f"Invalid timing in segment {segment_index}: start ({start_time}) >= end ({end_time})"
                 )
-                consistency['format_alignment'] = False
-                consistency['consistent'] = False
-                
-            # Validate content alignment
-            for i, (srt_seg, db_seg) in enumerate(zip(original_segments, db_original_segments)):
-                # Convert database timestamps to SRT format for comparison
-                db_start_srt = self._seconds_to_srt_time(db_seg[1])
-                db_end_srt = self._seconds_to_srt_time(db_seg[2])
-                
-                if srt_seg.start_time != db_start_srt:
-                    consistency['issues'].append(
-                        f"Start time mismatch in segment {i}: "
-                        f"SRT={srt_seg.start_time}, DB={db_start_srt}"
-                    )
-                    consistency['content_alignment'] = False
-                    consistency['consistent'] = False
-                    
-                if srt_seg.end_time != db_end_srt:
-                    consistency['issues'].append(
-                        f"End time mismatch in segment {i}: "
-                        f"SRT={srt_seg.end_time}, DB={db_end_srt}"
-                    )
-                    consistency['content_alignment'] = False
-                    consistency['consistent'] = False
-                    
-                if srt_seg.text.strip() != db_seg[3].strip():
-                    consistency['issues'].append(
-                        f"Text mismatch in segment {i}: content differs between SRT and database"
-                    )
-                    consistency['content_alignment'] = False
-                    consistency['consistent'] = False
-                    
-        except Exception as e:
-            consistency['issues'].append(f"Cross-validation error: {str(e)}")
-            consistency['consistent'] = False
+                validation['timestamp_consistency'] = False
+                validation['valid'] = False
+            
+            # Check for negative timestamps
+            if start_time < 0 or end_time < 0:
+                validation['issues'].append(
+                    f"Negative timestamp in segment {segment_index}: start={start_time}, end={end_time}"
+                )
+                validation['timestamp_consistency'] = False
+                validation['valid'] = False
+        
+        # Validate translation alignment if target language segments exist.
+        # Translations share their row's timing, so alignment only depends on
+        # which rows are still untranslated.
+        if target_language != 'original':
+            untranslated = [row[0] for row in rows if not row[4]]
             
-        return consistency
+            if untranslated and len(untranslated) < len(rows):
+                validation['issues'].append(
+                    f"Segment count mismatch: original={len(rows)}, "
+                    f"{target_language}={len(rows) - len(untranslated)}"
+                )
+                validation['issues'].append(f"Untranslated segment indices: {untranslated}")
+                validation['translation_alignment'] = False
+                validation['valid'] = False
+        
+        return validation
         
-    def _analyze_timing_gaps_with_database(self, segments: List[SRTSegment], 
-                                         interview_id: str) -> Dict[str, Any]:
+    def _analyze_timing_gaps(self, rows: List[Tuple]) -> Dict[str, Any]:
         """
-        Enhanced timing gap analysis that leverages database segment information.
+        Find gaps and overlaps between consecutive segments.
         
-        Builds upon existing gap detection with database-backed insights.
+        Gaps are measured at SRT millisecond precision (ignoring differences of
+        1ms or less) and cross-checked against exact database timing.
         """
         analysis = {
             'issues': [],
@@ -934,49 +968,44 @@ class DatabaseTranslator:
             'overlap_count': 0,
             'database_insights': {}
         }
-        
-        try:
-            # Existing gap detection logic (preserved)
-            for i in range(len(segments) - 1):
-                current_end = self._srt_time_to_seconds(segments[i].end_time)
-                next_start = self._srt_time_to_seconds(segments[i + 1].start_time)
-                
-                gap = next_start - current_end
-                if abs(gap) > 0.001:  # More than 1ms difference
-                    if gap > 0:
-                        analysis['issues'].append(
-                            f"Gap of {gap:.3f}s between segments {i+1} and {i+2}"
-                        )
-                        analysis['gap_count'] += 1
-                    else:
-                        analysis['issues'].append(
-                            f"Overlap of {abs(gap):.3f}s between segments {i+1} and {i+2}"
-                        )
-                        analysis['overlap_count'] += 1
-                        
-                        # Critical overlaps compromise subtitle readability
-                        if abs(gap) > 0.1:  # More than 100ms overlap
-                            analysis['critical_overlaps'] = True
-                            
-            # Database-enhanced insights
-            if self.db:
-                db_timing_validation = self.db.validate_subtitle_timing(interview_id)
-                analysis['database_insights'] = {
-                    'database_gaps': len(db_timing_validation.get('gaps', [])),
-                    'database_overlaps': len(db_timing_validation.get('overlaps', [])),
-                    'cross_validation': True
-                }
-                
-                # Cross-validate findings
-                db_gap_count = len(db_timing_validation.get('gaps', []))
-                if db_gap_count != analysis['gap_count']:
+        database_gaps = 0
+        database_overlaps = 0
+        
+        for position, (_, _, end_time, next_start, _) in enumerate(rows[:-1], start=1):
+            if end_time < next_start:
+                database_gaps += 1
+            elif end_time > next_start:
+                database_overlaps += 1
+            
+            gap = round(next_start, 3) - round(end_time, 3)
+            if abs(gap) > 0.001:  # More than 1ms difference
+                if gap > 0:
                     analysis['issues'].append(
-                        f"Gap count mismatch: SRT analysis found {analysis['gap_count']}, "
-                        f"database found {db_gap_count}"
+                        f"Gap of {gap:.3f}s between segments {position} and {position + 1}"
                     )
+                    analysis['gap_count'] += 1
+                else:
+                    analysis['issues'].append(
+                        f"Overlap of {abs(gap):.3f}s between segments {position} and {position + 1}"
+                    )
+                    analysis['overlap_count'] += 1
                     
-        except Exception as e:
-            analysis['issues'].append(f"Gap analysis error: {str(e)}")
+                    # Critical overlaps compromise subtitle readability
+                    if abs(gap) > 0.1:  # More than 100ms overlap
+                        analysis['critical_overlaps'] = True
+        
+        analysis['database_insights'] = {
+            'database_gaps': database_gaps,
+            'database_overlaps': database_overlaps,
+            'cross_validation': True
+        }
+        
+        # Cross-validate findings
+        if database_gaps != analysis['gap_count']:
+            analysis['issues'].append(
+                f"Gap count mismatch: SRT analysis found {analysis['gap_count']}, "
+                f"database found {database_gaps}"
+            )
             
         return analysis
         
@@ -1460,25 +1489,14 @@ def translate_interview_from_database(db: Database,
         target_languages = ['en', 'de', 'he']
         
     db_translator = DatabaseTranslator(db, translator)
-    results = {}
     
-    for lang in target_languages:
-        logger.info(f"Translating interview {interview_id} to {lang}")
-        results[lang] = db_translator.translate_interview(
-            interview_id,
-            lang,
-            batch_size=50,
-            detect_source_language=True
-        )
-        
-        # Log summary
-        lang_result = results[lang]
-        logger.info(f"Translation to {lang} complete: "
-                   f"{lang_result['translated']} translated, "
-                   f"{lang_result['skipped']} skipped, "
-                   f"{lang_result['failed']} failed")
-                   
-    return results
+    logger.info(f"Translating interview {interview_id} to {', '.join(target_languages)}")
+    return db_translator.translate_interview_multi(
+        interview_id,
+        target_languages,
+        batch_size=50,
+        detect_source_language=True
+    )
 
 
 def coordinate_translation_timing(db: Database,
@@ -9,16 +9,83 @@ This module provides a clean API for evaluating translation quality with a focus
 - Overall reliability for historical research
 
 The evaluation uses OpenAI's GPT-4 to score translations on a 0-10 scale.
+Batches are evaluated concurrently, and results can be cached on disk keyed by
+the texts, model and prompt so unchanged translations are never re-evaluated.
+
+Long interviews can be evaluated in chunked mode: the original and translation
+are aligned through their subtitle segments, a sample of chunks spread across
+the whole interview is scored with small prompts, and the scores are
+aggregated with a confidence interval.
+
+Before any LLM call, screen_translations() runs cheap local checks (length
+ratio, script, untranslated copies, repeated lines, placeholders) over a whole
+batch; clearly broken translations fail locally and clean ones pass, so only
+borderline items need GPT-4.
 """
 
+import copy
+import hashlib
 import json
 import logging
+import math
+import os
 import re
+import statistics
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from typing import Dict, Optional, Tuple, List
 from pathlib import Path
 
+from .instrumentation import timer, record_openai_usage, increment
+
 logger = logging.getLogger(__name__)
 
+# Concurrent evaluation requests per batch
+DEFAULT_EVALUATION_WORKERS = 4
+
+# Persistent evaluation cache (bump the version when the result format changes)
+EVALUATION_CACHE_NAME = ".evaluation_cache.json"
+EVALUATION_CACHE_VERSION = 1
+
+# Chunked evaluation: original characters per chunk and chunks sampled per interview
+CHUNK_CHARS = 2000
+DEFAULT_SAMPLE_CHUNKS = 8
+
+# Two-sided 95% Student t critical values by degrees of freedom (1.96 beyond 30)
+T_CRITICAL_95 = {
+    1: 12.706, 2: 4.303, 3: 3.182, 4: 2.776, 5: 2.571, 6: 2.447, 7: 2.365,
+    8: 2.306, 9: 2.262, 10: 2.228, 11: 2.201, 12: 2.179, 13: 2.160, 14: 2.145,
+    15: 2.131, 16: 2.120, 17: 2.110, 18: 2.101, 19: 2.093, 20: 2.086, 21: 2.080,
+    22: 2.074, 23: 2.069, 24: 2.064, 25: 2.060, 26: 2.056, 27: 2.052, 28: 2.048,
+    29: 2.045, 30: 2.042,
+}
+
+# Common translation placeholder patterns
+PLACEHOLDER_PATTERNS = re.compile('|'.join([
+    r'\[.*translation.*\]',
+    r'\[.*hebrew.*\]',
+    r'\[.*not.*available.*\]',
+    r'translation not available',
+    r'hebrew translation',
+]), re.IGNORECASE)
+
+# Local screening thresholds: (fail, borderline) bounds
+SCREEN_LENGTH_RATIO = ((0.25, 4.0), (0.5, 2.0))   # translation/original characters
+SCREEN_REPEAT_EXCESS = (0.5, 0.2)                 # duplicated-line share above the original's
+SCREEN_HEBREW_MIN = (0.3, 0.5)                    # Hebrew ratio for 'he' targets
+SCREEN_HEBREW_MAX = (0.5, 0.1)                    # Hebrew ratio for Latin-script targets
+
+# Stored as the prescreen_verdict metric in subtitle_quality_metrics
+SCREEN_VERDICTS = {'fail': 0.0, 'borderline': 0.5, 'pass': 1.0}
+
+# Function words used to tell whether an untranslated copy is already in the target language
+_FUNCTION_WORDS = {
+    'en': {'the', 'and', 'was', 'that', 'with', 'were', 'have', 'this', 'they', 'what'},
+    'de': {'der', 'die', 'und', 'das', 'ich', 'nicht', 'war', 'wir', 'mit', 'auch'},
+}
+_WORD_RE = re.compile(r'\w+')
+
 # Try to import OpenAI
 try:
     import openai
@@ -92,18 +159,8 @@ def validate_hebrew_translation(text: str) -> Dict[str, any]:
         warnings.append(f"MODERATE_HEBREW_RATIO_{hebrew_ratio:.1%}")
     
     # Check for common translation placeholder patterns
-    placeholder_patterns = [
-        r'\[.*translation.*\]',
-        r'\[.*hebrew.*\]',
-        r'\[.*not.*available.*\]',
-        r'translation not available',
-        r'hebrew translation',
-    ]
-    
-    for pattern in placeholder_patterns:
-        if re.search(pattern, text, re.IGNORECASE):
-            issues.append("TRANSLATION_PLACEHOLDER_DETECTED")
-            break
+    if PLACEHOLDER_PATTERNS.search(text):
+        issues.append("TRANSLATION_PLACEHOLDER_DETECTED")
     
     # Check for suspiciously short translations
     word_count = len(text.split())
@@ -123,6 +180,213 @@ def validate_hebrew_translation(text: str) -> Dict[str, any]:
     }
 
 
+@dataclass
+class ScreeningResult:
+    """Outcome of the local checks for one original/translation pair."""
+    verdict: str
+    flags: List[str]
+    length_ratio: float
+    script_ratio: float
+    repeat_excess: float
+    
+    def metrics(self) -> Dict[str, float]:
+        """Numeric metrics for store_quality_metrics()."""
+        return {
+            'prescreen_verdict': SCREEN_VERDICTS[self.verdict],
+            'prescreen_length_ratio': round(self.length_ratio, 3),
+            'prescreen_script_ratio': round(self.script_ratio, 3),
+            'prescreen_repeat_excess': round(self.repeat_excess, 3),
+            'prescreen_flags': len(self.flags),
+            'evaluation_method': 'local_prescreen',
+        }
+
+
+def _duplicate_line_share(text: str) -> float:
+    """Share of non-empty lines that repeat an earlier line."""
+    lines = [line.strip().lower() for line in text.splitlines() if line.strip()]
+    if len(lines) < 4:
+        return 0.0
+    return 1 - len(set(lines)) / len(lines)
+
+
+def _looks_like(text: str, language: str) -> bool:
+    """Whether Latin-script text reads as language (by function words)."""
+    if language not in _FUNCTION_WORDS:
+        return False
+    words = [word.lower() for word in _WORD_RE.findall(text[:5000])]
+    counts = {lang: sum(word in vocab for word in words) for lang, vocab in _FUNCTION_WORDS.items()}
+    return counts[language] > 0 and counts[language] == max(counts.values())
+
+
+def screen_translations(pairs: List[Tuple[str, str]], language: str) -> List[ScreeningResult]:
+    """
+    Run cheap local quality checks over a batch of translations.
+    
+    Works on whole files or subtitle segments alike. Each pair gets one of:
+    - 'fail': clearly broken (empty, untranslated copy, placeholder, wrong
+      script, runaway repetition or absurd length); no LLM call is needed
+    - 'borderline': suspicious; worth an LLM evaluation
+    - 'pass': no local issues
+    
+    Args:
+        pairs: (original, translation) pairs
+        language: Target language code ('en', 'de', 'he')
+        
+    Returns:
+        ScreeningResult per pair, in input order
+    """
+    results = []
+    for original, translation in pairs:
+        original = original or ''
+        translation = translation or ''
+        failures = []
+        warnings = []
+        
+        source = original.strip()
+        target = translation.strip()
+        length_ratio = len(target) / len(source) if source else 0.0
+        script_ratio = detect_language_ratio(target)
+        repeat_excess = max(0.0, _duplicate_line_share(translation) - _duplicate_line_share(original))
+        
+        if not target:
+            failures.append("EMPTY_TRANSLATION")
+        else:
+            if target == source and not (language != 'he' and _looks_like(source, language)):
+                failures.append("UNTRANSLATED_COPY")
+            if PLACEHOLDER_PATTERNS.search(target):
+                failures.append("TRANSLATION_PLACEHOLDER_DETECTED")
+            
+            (fail_low, fail_high), (warn_low, warn_high) = SCREEN_LENGTH_RATIO
+            if source and not fail_low <= length_ratio <= fail_high:
+                failures.append(f"LENGTH_RATIO_{length_ratio:.2f}")
+            elif source and not warn_low <= length_ratio <= warn_high:
+                warnings.append(f"LENGTH_RATIO_{length_ratio:.2f}")
+            
+            if language == 'he':
+                fail_at, warn_at = SCREEN_HEBREW_MIN
+                if script_ratio < fail_at:
+                    failures.append(f"WRONG_SCRIPT_{script_ratio:.0%}")
+                elif script_ratio < warn_at:
+                    warnings.append(f"LOW_HEBREW_RATIO_{script_ratio:.0%}")
+            else:
+                fail_at, warn_at = SCREEN_HEBREW_MAX
+                if script_ratio > fail_at:
+                    failures.append(f"WRONG_SCRIPT_{script_ratio:.0%}")
+                elif script_ratio > warn_at:
+                    warnings.append(f"MIXED_SCRIPT_{script_ratio:.0%}")
+            
+            fail_at, warn_at = SCREEN_REPEAT_EXCESS
+            if repeat_excess >= fail_at:
+                failures.append(f"REPEATED_LINES_{repeat_excess:.0%}")
+            elif repeat_excess >= warn_at:
+                warnings.append(f"REPEATED_LINES_{repeat_excess:.0%}")
+        
+        verdict = 'fail' if failures else 'borderline' if warnings else 'pass'
+        results.append(ScreeningResult(verdict, failures + warnings, length_ratio,
+                                       script_ratio, repeat_excess))
+    
+    pass_count = sum(result.verdict == 'pass' for result in results)
+    fail_count = sum(result.verdict == 'fail' for result in results)
+    increment('prescreen.pass', pass_count)
+    increment('prescreen.fail', fail_count)
+    increment('prescreen.borderline', len(results) - pass_count - fail_count)
+    return results
+
+
+@dataclass
+class AlignedChunk:
+    """A run of consecutive subtitle segments with their translations."""
+    first_segment: int
+    last_segment: int
+    start_time: float
+    end_time: float
+    original: str
+    translation: str
+
+
+def align_chunks(segments: List[Dict], translations: Dict[int, str],
+                 chunk_chars: int = CHUNK_CHARS) -> List[AlignedChunk]:
+    """
+    Group translated subtitle segments into chunks of about chunk_chars.
+    
+    Segments without a translation, or whose translation is identical to the
+    original (preserved segments already in the target language), are skipped.
+    
+    Args:
+        segments: Segment dicts with segment_index, start_time, end_time and
+                  original_text, ordered by segment_index
+        translations: Translated text by segment_index
+        chunk_chars: Target original-text length per chunk
+        
+    Returns:
+        Chunks in interview order
+    """
+    chunks = []
+    current = []
+    size = 0
+    
+    def flush():
+        chunks.append(AlignedChunk(
+            first_segment=current[0][0]['segment_index'],
+            last_segment=current[-1][0]['segment_index'],
+            start_time=current[0][0]['start_time'],
+            end_time=current[-1][0]['end_time'],
+            original=' '.join(seg['original_text'].strip() for seg, _ in current),
+            translation=' '.join(text.strip() for _, text in current)
+        ))
+    
+    for segment in segments:
+        original = segment.get('original_text') or ''
+        translation = translations.get(segment['segment_index'])
+        if not original.strip() or not translation or translation.strip() == original.strip():
+            continue
+        current.append((segment, translation))
+        size += len(original)
+        if size >= chunk_chars:
+            flush()
+            current, size = [], 0
+    
+    if current:
+        flush()
+    return chunks
+
+
+def sample_chunks(chunks: List[AlignedChunk], sample_size: int) -> List[AlignedChunk]:
+    """
+    Pick sample_size chunks spread evenly across the interview.
+    
+    Takes the middle chunk of each of sample_size equal strata, so the sample
+    is deterministic (and therefore cacheable) and covers beginning to end.
+    """
+    if sample_size >= len(chunks):
+        return list(chunks)
+    stride = len(chunks) / sample_size
+    return [chunks[int(stride * i + stride / 2)] for i in range(sample_size)]
+
+
+def confidence_interval(scores: List[float], population: int) -> Optional[Tuple[float, float]]:
+    """
+    95% confidence interval for the mean of a sample of chunk scores.
+    
+    Uses the t distribution with a finite population correction, since
+    chunks are sampled without replacement from the interview.
+    
+    Args:
+        scores: Sampled chunk scores
+        population: Total number of chunks in the interview
+        
+    Returns:
+        (low, high) clamped to 0-10, or None with fewer than two scores
+    """
+    n = len(scores)
+    if n < 2:
+        return None
+    mean = statistics.mean(scores)
+    fpc = math.sqrt((population - n) / (population - 1)) if population > n else 0.0
+    margin = T_CRITICAL_95.get(n - 1, 1.96) * statistics.stdev(scores) / math.sqrt(n) * fpc
+    return (round(max(0.0, mean - margin), 2), round(min(10.0, mean + margin), 2))
+
+
 class HistoricalEvaluator:
     """Evaluates translations for historical accuracy and speech pattern preservation."""
     
@@ -221,15 +485,23 @@ Be sure to format your response as a strict JSON object with the exact structure
         "historical_authenticity": 0.1
     }
     
-    def __init__(self, model: str = "gpt-4"):
+    def __init__(self, model: str = "gpt-4", cache_path: Optional[Path] = None,
+                 max_workers: int = DEFAULT_EVALUATION_WORKERS):
         """
         Initialize the evaluator.
         
         Args:
             model: OpenAI model to use for evaluation (default: gpt-4)
+            cache_path: JSON file for cached results (default: in-memory only)
+            max_workers: Concurrent API requests in evaluate_batch()
         """
         self.model = model
         self.client = None
+        self.cache_path = Path(cache_path) if cache_path else None
+        self.max_workers = max(1, max_workers)
+        self._cache_lock = threading.Lock()
+        self._cache_dirty = False
+        self._cache = self._load_cache()
         
         if openai:
             self.client = openai.OpenAI()
@@ -291,44 +563,48 @@ Be sure to format your response as a strict JSON object with the exact structure
         
         # Choose prompt based on language and enhanced mode
         if enhanced and language == "he":
-            prompt = self.HEBREW_EVALUATION_PROMPT.format(
-                original=original,
-                translation=translation
-            )
+            template = self.HEBREW_EVALUATION_PROMPT
             score_weights = self.HEBREW_SCORE_WEIGHTS
         else:
-            prompt = self.EVALUATION_PROMPT.format(
-                original=original,
-                translation=translation
-            )
+            template = self.EVALUATION_PROMPT
             score_weights = self.SCORE_WEIGHTS
+        prompt = template.format(original=original, translation=translation)
+        
+        cache_key = self._cache_key(original, translation, template, language)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            increment('evaluate.cache_hits')
+            return cached
         
         try:
             # Try with JSON response format for compatible models
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[{"role": "user", "content": prompt}],
-                temperature=0,
-                response_format={"type": "json_object"}
-            )
+            with timer('openai.evaluate'):
+                response = self.client.chat.completions.create(
+                    model=self.model,
+                    messages=[{"role": "user", "content": prompt}],
+                    temperature=0,
+                    response_format={"type": "json_object"}
+                )
         except Exception as e:
             if "response_format" in str(e):
                 # Fallback for models that don't support JSON response format
                 try:
-                    response = self.client.chat.completions.create(
-                        model=self.model,
-                        messages=[
-                            {"role": "system", "content": "You must respond with valid JSON only, no other text."},
-                            {"role": "user", "content": prompt}
-                        ],
-                        temperature=0
-                    )
+                    with timer('openai.evaluate'):
+                        response = self.client.chat.completions.create(
+                            model=self.model,
+                            messages=[
+                                {"role": "system", "content": "You must respond with valid JSON only, no other text."},
+                                {"role": "user", "content": prompt}
+                            ],
+                            temperature=0
+                        )
                 except Exception as e:
                     logger.error(f"Error calling OpenAI API: {e}")
                     return None
             else:
                 logger.error(f"Error calling OpenAI API: {e}")
                 return None
+        record_openai_usage('openai.evaluate', response)
         
         # Parse the response
         try:
@@ -354,12 +630,189 @@ Be sure to format your response as a strict JSON object with the exact structure
             # Add language detection info
             result["detected_language"] = language
             
+            self._cache_put(cache_key, result)
             return result
             
         except json.JSONDecodeError:
             logger.error(f"Failed to parse response as JSON: {response.choices[0].message.content[:200]}...")
             return None
     
+    def evaluate_batch(self, pairs: List[Tuple[str, str]], language: str = "auto",
+                       enhanced: bool = False) -> List[Optional[Dict]]:
+        """
+        Evaluate many translations concurrently.
+        
+        Requests run on a pool of max_workers threads; cached pairs return
+        without an API call. The cache file (if any) is saved afterwards.
+        
+        Args:
+            pairs: List of (original, translation) texts
+            language: Target language code ('he' for Hebrew, 'auto' for auto-detection)
+            enhanced: Use enhanced evaluation with sanity checks and language-specific prompts
+            
+        Returns:
+            Evaluation results in input order (None where evaluation failed)
+        """
+        def work(pair: Tuple[str, str]) -> Optional[Dict]:
+            try:
+                return self.evaluate(pair[0], pair[1], language=language, enhanced=enhanced)
+            except Exception as e:
+                logger.error(f"Evaluation failed: {e}")
+                return None
+        
+        try:
+            if len(pairs) <= 1 or self.max_workers == 1:
+                return [work(pair) for pair in pairs]
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(pairs))) as executor:
+                return list(executor.map(work, pairs))
+        finally:
+            self.save_cache()
+    
+    def evaluate_chunks(self, chunks: List[AlignedChunk], language: str = "auto",
+                        enhanced: bool = False,
+                        sample_size: int = DEFAULT_SAMPLE_CHUNKS) -> Optional[Dict]:
+        """
+        Evaluate a sample of aligned chunks concurrently and aggregate the scores.
+        
+        Args:
+            chunks: Aligned chunks covering the interview (see align_chunks)
+            language: Target language code ('he' for Hebrew, 'auto' for auto-detection)
+            enhanced: Use enhanced evaluation with sanity checks and language-specific prompts
+            sample_size: Number of chunks to evaluate
+            
+        Returns:
+            Aggregated result with the mean composite_score, its 95%
+            confidence_interval, mean per-criterion scores, issues prefixed with
+            their timestamps and per-chunk scores; None if no chunk could be
+            evaluated
+        """
+        sample = sample_chunks(chunks, sample_size)
+        results = self.evaluate_batch(
+            [(chunk.original, chunk.translation) for chunk in sample],
+            language=language, enhanced=enhanced
+        )
+        
+        evaluated = [(chunk, result) for chunk, result in zip(sample, results) if result]
+        if not evaluated:
+            return None
+        
+        composite = [float(self.get_score(result)) for _, result in evaluated]
+        criteria: Dict[str, List[float]] = {}
+        issues = []
+        for chunk, result in evaluated:
+            for key, value in result.get("scores", {}).items():
+                if isinstance(value, (int, float)):
+                    criteria.setdefault(key, []).append(value)
+            minutes, seconds = divmod(int(chunk.start_time), 60)
+            issues.extend(f"[{minutes}:{seconds:02d}] {issue}" for issue in result.get("issues", []))
+        
+        interval = confidence_interval(composite, len(chunks))
+        return {
+            "evaluation_mode": "chunked",
+            "composite_score": round(statistics.mean(composite), 1),
+            "confidence_interval": list(interval) if interval else None,
+            "scores": {key: round(statistics.mean(values), 1) for key, values in criteria.items()},
+            "issues": issues,
+            "chunks_evaluated": len(evaluated),
+            "total_chunks": len(chunks),
+            "chunks": [
+                {
+                    "first_segment": chunk.first_segment,
+                    "last_segment": chunk.last_segment,
+                    "start_time": chunk.start_time,
+                    "end_time": chunk.end_time,
+                    "score": score,
+                }
+                for (chunk, _), score in zip(evaluated, composite)
+            ],
+            "detected_language": evaluated[0][1].get("detected_language", language),
+        }
+    
+    def evaluate_interview(self, db, interview_id: str, language: str, enhanced: bool = False,
+                           sample_size: int = DEFAULT_SAMPLE_CHUNKS,
+                           chunk_chars: int = CHUNK_CHARS) -> Optional[Dict]:
+        """
+        Evaluate an interview's translation in chunked mode from its subtitle segments.
+        
+        Args:
+            db: Database holding the interview's subtitle segments
+            interview_id: ID of the interview
+            language: Translation language code
+            enhanced: Use enhanced evaluation with sanity checks and language-specific prompts
+            sample_size: Number of chunks to evaluate
+            chunk_chars: Target original-text length per chunk
+            
+        Returns:
+            Aggregated result (see evaluate_chunks), or None if the interview
+            has no translated segments or no chunk could be evaluated
+        """
+        segments = db.get_subtitle_segments(interview_id)
+        translations = {
+            row['segment_index']: row['text']
+            for row in db.get_segment_translations(interview_id, language)
+        }
+        chunks = align_chunks(segments, translations, chunk_chars)
+        if not chunks:
+            logger.warning(f"No translated {language} segments to evaluate for {interview_id}")
+            return None
+        return self.evaluate_chunks(chunks, language=language, enhanced=enhanced,
+                                    sample_size=sample_size)
+    
+    def _cache_key(self, original: str, translation: str, template: str, language: str) -> str:
+        """Cache key from hashes of both texts, the model and the prompt template."""
+        parts = [
+            hashlib.sha256(original.encode('utf-8')).hexdigest(),
+            hashlib.sha256(translation.encode('utf-8')).hexdigest(),
+            self.model,
+            hashlib.sha256(template.encode('utf-8')).hexdigest()[:16],
+            language,
+        ]
+        return ':'.join(parts)
+    
+    def _cache_get(self, key: str) -> Optional[Dict]:
+        """Copy of a cached result, or None."""
+        with self._cache_lock:
+            result = self._cache.get(key)
+        return copy.deepcopy(result) if result is not None else None
+    
+    def _cache_put(self, key: str, result: Dict):
+        """Store a successful result."""
+        with self._cache_lock:
+            self._cache[key] = copy.deepcopy(result)
+            self._cache_dirty = True
+    
+    def _load_cache(self) -> Dict[str, Dict]:
+        """Load cached results, ignoring a missing or stale cache file."""
+        if not self.cache_path or not self.cache_path.exists():
+            return {}
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+            if cache.get('version') != EVALUATION_CACHE_VERSION:
+                return {}
+            return cache.get('results', {})
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable evaluation cache {self.cache_path}: {e}")
+            return {}
+    
+    def save_cache(self):
+        """Write the cache file if results were added since it was loaded."""
+        if not self.cache_path:
+            return
+        with self._cache_lock:
+            if not self._cache_dirty:
+                return
+            data = {'version': EVALUATION_CACHE_VERSION, 'results': self._cache}
+            tmp_path = self.cache_path.with_suffix('.tmp')
+            try:
+                self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, ensure_ascii=False)
+                os.replace(tmp_path, self.cache_path)
+                self._cache_dirty = False
+            except OSError as e:
+                logger.warning(f"Could not save evaluation cache {self.cache_path}: {e}")
+    
     def evaluate_file(self, original_path: Path, translation_path: Path, max_chars: int = 2500, language: str = "auto", enhanced: bool = False) -> Optional[Dict]:
         """
         Evaluate translation quality by reading from files.
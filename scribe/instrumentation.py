@@ -0,0 +1,361 @@
+#!/usr/bin/env python3
+"""
+Hot-Path Instrumentation for Scribe
+-----------------------------------
+Lightweight timers, latency histograms and counters for the pipeline stages
+that dominate a run: ffmpeg, ElevenLabs, DeepL, Microsoft, OpenAI and SQLite.
+
+Usage:
+    from scribe.instrumentation import timer, timed, increment
+
+    with timer('ffmpeg.extract_audio'):
+        ...
+
+    @timed('srt.translate_srt')
+    def translate_srt(...):
+        ...
+
+    increment('deepl.characters', len(text))
+
+Histograms use HDR-style log-linear buckets (32 sub-buckets per power of two,
+so percentiles are within ~3% of the true value) and merge exactly, which lets
+metrics from many runs accumulate in one file. The CLI saves the metrics of
+each run to SCRIBE_PERF_FILE (default perf_metrics.json) on exit, under an
+advisory lock so concurrent runs do not overwrite each other, and
+`scribe_cli.py perf-report` prints p50/p95/p99 per stage.
+"""
+
+import atexit
+import functools
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Union
+
+try:
+    import fcntl
+except ImportError:  # Windows: saves are not serialized between processes
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+PERF_FILE_ENV = 'SCRIBE_PERF_FILE'
+DEFAULT_PERF_FILE = 'perf_metrics.json'
+
+# Sub-bucket resolution: values keep their top SUB_BUCKET_BITS + 1 bits
+SUB_BUCKET_BITS = 5
+
+# Report percentiles
+PERCENTILES = (50, 95, 99)
+
+
+def _bucket(value: int) -> int:
+    """Lower bound of the histogram bucket holding value."""
+    shift = max(0, value.bit_length() - SUB_BUCKET_BITS - 1)
+    return (value >> shift) << shift
+
+
+def _bucket_width(lower: int) -> int:
+    """Width of the bucket starting at lower."""
+    return 1 << max(0, lower.bit_length() - SUB_BUCKET_BITS - 1)
+
+
+class Histogram:
+    """
+    Latency histogram with log-linear buckets, recorded in microseconds.
+    """
+
+    def __init__(self):
+        self.counts: Dict[int, int] = {}
+        self.count = 0
+        self.total = 0
+        self.min: Optional[int] = None
+        self.max: Optional[int] = None
+
+    def record(self, seconds: float):
+        """Record a duration in seconds."""
+        micros = max(0, int(seconds * 1_000_000))
+        key = _bucket(micros)
+        self.counts[key] = self.counts.get(key, 0) + 1
+        self.count += 1
+        self.total += micros
+        self.min = micros if self.min is None else min(self.min, micros)
+        self.max = micros if self.max is None else max(self.max, micros)
+
+    def percentile(self, percent: float) -> float:
+        """
+        Value at the given percentile, in seconds.
+
+        Args:
+            percent: Percentile between 0 and 100
+
+        Returns:
+            Midpoint of the bucket holding the percentile, clamped to the
+            observed min/max (0.0 if empty)
+        """
+        if not self.count:
+            return 0.0
+        rank = max(1, int(round(percent / 100 * self.count)))
+        seen = 0
+        for lower in sorted(self.counts):
+            seen += self.counts[lower]
+            if seen >= rank:
+                value = lower + (_bucket_width(lower) - 1) / 2
+                return min(max(value, self.min), self.max) / 1_000_000
+        return self.max / 1_000_000
+
+    def merge(self, other: 'Histogram'):
+        """Add the observations of another histogram."""
+        for lower, count in other.counts.items():
+            self.counts[lower] = self.counts.get(lower, 0) + count
+        self.count += other.count
+        self.total += other.total
+        if other.count:
+            self.min = other.min if self.min is None else min(self.min, other.min)
+            self.max = other.max if self.max is None else max(self.max, other.max)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize for JSON."""
+        return {
+            'counts': {str(lower): count for lower, count in sorted(self.counts.items())},
+            'count': self.count,
+            'total': self.total,
+            'min': self.min,
+            'max': self.max,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Histogram':
+        """Deserialize from to_dict() output."""
+        histogram = cls()
+        histogram.counts = {int(lower): count for lower, count in data['counts'].items()}
+        histogram.count = data['count']
+        histogram.total = data['total']
+        histogram.min = data['min']
+        histogram.max = data['max']
+        return histogram
+
+
+class _Timer:
+    """Context manager that records its duration (and errors) in a registry."""
+
+    __slots__ = ('registry', 'name', 'start')
+
+    def __init__(self, registry: 'MetricsRegistry', name: str):
+        self.registry = registry
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.registry.observe(self.name, time.perf_counter() - self.start)
+        if exc_type is not None:
+            self.registry.increment(f"{self.name}.errors")
+        return False
+
+
+class MetricsRegistry:
+    """
+    Thread-safe collection of named histograms and counters.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.histograms: Dict[str, Histogram] = {}
+        self.counters: Dict[str, float] = {}
+
+    def observe(self, name: str, seconds: float):
+        """Record a duration for a stage."""
+        with self._lock:
+            histogram = self.histograms.get(name)
+            if histogram is None:
+                histogram = self.histograms[name] = Histogram()
+            histogram.record(seconds)
+
+    def increment(self, name: str, amount: float = 1):
+        """Add to a counter."""
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def timer(self, name: str) -> _Timer:
+        """Context manager timing the enclosed block as stage name."""
+        return _Timer(self, name)
+
+    def timed(self, name: Optional[str] = None) -> Callable:
+        """Decorator timing each call (default name: module.function)."""
+        def decorator(func):
+            stage = name or f"{func.__module__.rsplit('.', 1)[-1]}.{func.__name__}"
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                with _Timer(self, stage):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def is_empty(self) -> bool:
+        """Whether nothing has been recorded."""
+        with self._lock:
+            return not self.histograms and not self.counters
+
+    def reset(self):
+        """Discard all recorded metrics."""
+        with self._lock:
+            self.histograms.clear()
+            self.counters.clear()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Serializable copy of all metrics."""
+        with self._lock:
+            return {
+                'histograms': {name: h.to_dict() for name, h in self.histograms.items()},
+                'counters': dict(self.counters),
+            }
+
+    def merge(self, snapshot: Dict[str, Any]):
+        """Add metrics from a snapshot()."""
+        with self._lock:
+            for name, data in snapshot.get('histograms', {}).items():
+                other = Histogram.from_dict(data)
+                if name in self.histograms:
+                    self.histograms[name].merge(other)
+                else:
+                    self.histograms[name] = other
+            for name, value in snapshot.get('counters', {}).items():
+                self.counters[name] = self.counters.get(name, 0) + value
+
+    def report(self) -> List[Dict[str, Any]]:
+        """
+        Per-stage latency summary, slowest total first.
+
+        Returns:
+            List of dicts with stage, count, p50/p95/p99, max and total (seconds)
+        """
+        with self._lock:
+            rows = []
+            for name, histogram in self.histograms.items():
+                row = {'stage': name, 'count': histogram.count}
+                for percent in PERCENTILES:
+                    row[f"p{percent}"] = histogram.percentile(percent)
+                row['max'] = (histogram.max or 0) / 1_000_000
+                row['total'] = histogram.total / 1_000_000
+                rows.append(row)
+        return sorted(rows, key=lambda row: row['total'], reverse=True)
+
+
+# Process-wide registry used by the pipeline modules
+registry = MetricsRegistry()
+timer = registry.timer
+timed = registry.timed
+observe = registry.observe
+increment = registry.increment
+
+
+def record_openai_usage(prefix: str, response: Any):
+    """Count an OpenAI call and its token usage, if the response reports it."""
+    increment(f"{prefix}.calls")
+    usage = getattr(response, 'usage', None)
+    for field in ('prompt_tokens', 'completion_tokens', 'total_tokens'):
+        tokens = getattr(usage, field, None)
+        if isinstance(tokens, int):
+            increment(f"{prefix}.{field}", tokens)
+
+
+def perf_file_path(path: Optional[Union[str, Path]] = None) -> Path:
+    """Metrics file: path, else SCRIBE_PERF_FILE, else perf_metrics.json."""
+    return Path(path or os.getenv(PERF_FILE_ENV) or DEFAULT_PERF_FILE)
+
+
+def load_metrics(path: Optional[Union[str, Path]] = None) -> MetricsRegistry:
+    """
+    Load saved metrics into a new registry.
+
+    Args:
+        path: Metrics file (see perf_file_path)
+
+    Returns:
+        MetricsRegistry, empty if the file does not exist
+    """
+    loaded = MetricsRegistry()
+    path = perf_file_path(path)
+    if path.exists():
+        with open(path, 'r', encoding='utf-8') as f:
+            loaded.merge(json.load(f))
+    return loaded
+
+
+@contextmanager
+def _file_lock(path: Path):
+    """Exclusive advisory lock on path's .lock sidecar, held across processes."""
+    if fcntl is None:
+        yield
+        return
+    with open(path.with_name(path.name + '.lock'), 'a') as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def save_metrics(path: Optional[Union[str, Path]] = None,
+                 source: Optional[MetricsRegistry] = None) -> Optional[Path]:
+    """
+    Merge recorded metrics into the metrics file.
+
+    Args:
+        path: Metrics file (see perf_file_path)
+        source: Registry to save (default: the process-wide registry)
+
+    Returns:
+        Path written, or None if there was nothing to save
+    """
+    source = source or registry
+    if source.is_empty():
+        return None
+
+    path = perf_file_path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    # Concurrent runs would otherwise each merge into the same old file and
+    # the last replace would drop the others' metrics
+    with _file_lock(path):
+        try:
+            merged = load_metrics(path)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Discarding unreadable metrics file {path}: {e}")
+            merged = MetricsRegistry()
+        merged.merge(source.snapshot())
+
+        tmp_path = path.with_name(path.name + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(merged.snapshot(), f)
+        os.replace(tmp_path, path)
+    return path
+
+
+_persist_lock = threading.Lock()
+_persist_path: Optional[Path] = None
+
+
+def persist_at_exit(path: Optional[Union[str, Path]] = None):
+    """Save this process's metrics to the metrics file when it exits."""
+    global _persist_path
+    with _persist_lock:
+        first = _persist_path is None
+        _persist_path = perf_file_path(path)
+    if first:
+        atexit.register(_save_at_exit)
+
+
+def _save_at_exit():
+    try:
+        save_metrics(_persist_path)
+    except Exception as e:
+        logger.warning(f"Could not save performance metrics: {e}")
@@ -14,9 +14,13 @@ from datetime import datetime
 from .database import Database
 from .transcribe import transcribe_file
 from .translate import translate_text, validate_hebrew
-from .evaluate import evaluate_translation
+from .evaluate import (
+    evaluate_translation, screen_translations, HistoricalEvaluator,
+    EVALUATION_CACHE_NAME, DEFAULT_EVALUATION_WORKERS, DEFAULT_SAMPLE_CHUNKS
+)
+from .database_quality_metrics import add_quality_metrics_schema, batch_store_quality_metrics
 from .utils import ensure_directory, ProgressTracker, SimpleWorkerPool, generate_file_id
-from .srt_translator import translate_srt_file
+from .srt_translator import translate_srt_file, DETECT_CACHE_DIRNAME
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +34,7 @@ class PipelineConfig:
     transcription_workers: int = 10
     translation_workers: int = 8
     evaluation_sample_size: int = 100
+    evaluation_workers: int = DEFAULT_EVALUATION_WORKERS
     batch_size: int = 50
     openai_model: Optional[str] = None
 
@@ -273,7 +278,9 @@ class Pipeline:
         logger.info(f"Translation batch complete: {batch_results['completed']} succeeded, {batch_results['failed']} failed")
         return results
     
-    def evaluate_translations(self, language: str, sample_size: Optional[int] = None, enhanced: bool = False, model: str = "gpt-4") -> List[Tuple[str, float, Dict]]:
+    def evaluate_translations(self, language: str, sample_size: Optional[int] = None, enhanced: bool = False, model: str = "gpt-4",
+                              chunked: bool = False, chunks: int = DEFAULT_SAMPLE_CHUNKS,
+                              prescreen: bool = False) -> List[Tuple[str, float, Dict]]:
         """
         Evaluate translation quality for a language
         
@@ -282,6 +289,12 @@ class Pipeline:
             sample_size: Number of files to evaluate (optional)
             enhanced: Use enhanced evaluation with sanity checks (especially for Hebrew)
             model: OpenAI model to use for evaluation
+            chunked: Score a sample of segment-aligned chunks across each whole
+                     interview instead of the start of the text files
+            chunks: Number of chunks to sample per interview in chunked mode
+            prescreen: Run local checks first; failing translations are scored
+                       0 by 'sanity-check' and passing ones are only recorded in
+                       subtitle_quality_metrics, so just borderline ones reach the LLM
             
         Returns:
             List of tuples (file_id, score, full_results)
@@ -294,72 +307,144 @@ class Pipeline:
                 ON p.file_id = q.file_id AND q.language = ?
             WHERE p.translation_{}_status = 'completed'
             AND q.eval_id IS NULL
-            LIMIT ?
         """.format(language)
+        params = [language]
+        
+        if prescreen:
+            # Translations that passed screening earlier have no evaluation row
+            add_quality_metrics_schema(self.db)
+            query += """
+            AND NOT EXISTS (
+                SELECT 1 FROM subtitle_quality_metrics m
+                WHERE m.interview_id = p.file_id AND m.language = ?
+                AND m.metric_type = 'prescreen_verdict' AND m.metric_value = 1.0
+            )
+            """
+            params.append(language)
         
-        to_evaluate = self.db.execute_query(query, (language, sample_size or self.config.evaluation_sample_size))
+        query += "LIMIT ?"
+        params.append(sample_size or self.config.evaluation_sample_size)
+        to_evaluate = self.db.execute_query(query, tuple(params))
         
         if not to_evaluate:
             logger.info(f"No {language} translations to evaluate")
             return []
             
         logger.info(f"Evaluating {len(to_evaluate)} {language} translations")
+        
+        # Results are cached by text, model and prompt, so re-running an
+        # evaluation over unchanged translations makes no API calls
+        evaluator = HistoricalEvaluator(
+            model=model,
+            cache_path=self.config.output_dir / EVALUATION_CACHE_NAME,
+            max_workers=self.config.evaluation_workers
+        )
+        
+        file_ids = [file_info['file_id'] for file_info in to_evaluate]
+        texts = {}
+        results = []
+        
+        if prescreen:
+            texts = self._read_evaluation_texts(file_ids, language)
+            screening = dict(zip(texts, screen_translations(list(texts.values()), language)))
+            batch_store_quality_metrics(self.db, [
+                (file_id, language, screen.metrics()) for file_id, screen in screening.items()
+            ])
+            for file_id, screen in screening.items():
+                if screen.verdict == 'fail':
+                    results.append((file_id, {
+                        'evaluation_mode': 'prescreen',
+                        'composite_score': 0.0,
+                        'issues': screen.flags,
+                        'feedback': 'Failed local screening'
+                    }))
+            file_ids = [file_id for file_id in texts if screening[file_id].verdict == 'borderline']
+            logger.info(f"Screening: {len(results)} failed, {len(file_ids)} borderline, "
+                        f"{len(screening) - len(results) - len(file_ids)} passed")
+        
+        # Chunked mode covers the whole interview; files without subtitle
+        # segments fall back to whole-text evaluation below
+        if chunked:
+            remaining = []
+            for file_id in file_ids:
+                result = evaluator.evaluate_interview(self.db, file_id, language,
+                                                      enhanced=enhanced, sample_size=chunks)
+                if result:
+                    results.append((file_id, result))
+                else:
+                    remaining.append(file_id)
+            file_ids = remaining
+        
+        # Read all remaining pairs up front; evaluation then runs concurrently
+        texts.update(self._read_evaluation_texts([f for f in file_ids if f not in texts], language))
+        file_ids = [file_id for file_id in file_ids if file_id in texts]
+        if file_ids:
+            pairs = [texts[file_id] for file_id in file_ids]
+            results.extend(zip(file_ids, evaluator.evaluate_batch(pairs, language=language, enhanced=enhanced)))
+        
         scores = []
+        evaluations = []
+        evaluated_at = datetime.now()
+        for file_id, evaluation_results in results:
+            evaluation_results = evaluation_results or {}
+            score = evaluation_results.get('composite_score', 0.0)
+            
+            issues = evaluation_results.get('issues', [])
+            comment = evaluation_results.get('feedback', '')
+            
+            if evaluation_results.get('evaluation_mode') == 'chunked':
+                comment = (f"Chunked: {evaluation_results['chunks_evaluated']}/"
+                           f"{evaluation_results['total_chunks']} chunks")
+                if evaluation_results['confidence_interval']:
+                    low, high = evaluation_results['confidence_interval']
+                    comment += f", 95% CI {low:.1f}-{high:.1f}"
+            
+            # For enhanced Hebrew evaluation, also capture suitability and validation info
+            if enhanced and language == 'he' and evaluation_results:
+                if 'suitability' in evaluation_results:
+                    comment += f" | {evaluation_results['suitability']}"
+                if 'hebrew_validation' in evaluation_results:
+                    validation = evaluation_results['hebrew_validation']
+                    comment += f" | Hebrew ratio: {validation.get('hebrew_ratio', 0):.1%}"
+            
+            # Local screening failures are recorded like other sanity checks
+            prescreened = evaluation_results.get('evaluation_mode') == 'prescreen'
+            
+            evaluations.append((
+                file_id,
+                language,
+                'sanity-check' if prescreened else model,  # Use the specified model instead of hardcoded 'gpt-4'
+                score,
+                json.dumps(issues, ensure_ascii=False),  # Proper JSON encoding for issues
+                comment,
+                evaluated_at
+            ))
+            scores.append((file_id, score, evaluation_results))
+            logger.info(f"Evaluated {file_id}: {score:.1f}/10")
+        
+        # Save all evaluations in one transaction
+        if evaluations:
+            try:
+                self.db.add_quality_evaluations(evaluations)
+            except Exception as e:
+                logger.error(f"Failed to save {len(evaluations)} {language} evaluations: {e}")
         
-        for file_info in to_evaluate:
+        return scores
+    
+    def _read_evaluation_texts(self, file_ids: List[str], language: str) -> Dict[str, Tuple[str, str]]:
+        """Read (transcript, translation) texts by file ID, skipping unreadable files."""
+        texts = {}
+        for file_id in file_ids:
+            transcript_path = self.config.output_dir / file_id / f"{file_id}.txt"
+            translation_path = self.config.output_dir / file_id / f"{file_id}.{language}.txt"
             try:
-                # Get file paths
-                transcript_path = self.config.output_dir / file_info['file_id'] / f"{file_info['file_id']}.txt"
-                translation_path = self.config.output_dir / file_info['file_id'] / f"{file_info['file_id']}.{language}.txt"
-                
-                # Evaluate
-                score, evaluation_results = evaluate_translation(
+                texts[file_id] = (
                     transcript_path.read_text(encoding='utf-8'),
-                    translation_path.read_text(encoding='utf-8'),
-                    model=model,
-                    language=language,
-                    enhanced=enhanced
+                    translation_path.read_text(encoding='utf-8')
                 )
-                
-                # Save evaluation to database
-                insert_query = """
-                    INSERT INTO quality_evaluations 
-                    (file_id, language, model, score, issues, comment, evaluated_at)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                """
-                
-                issues = evaluation_results.get('issues', []) if evaluation_results else []
-                comment = evaluation_results.get('feedback', '') if evaluation_results else ''
-                
-                # For enhanced Hebrew evaluation, also capture suitability and validation info
-                if enhanced and language == 'he' and evaluation_results:
-                    if 'suitability' in evaluation_results:
-                        comment += f" | {evaluation_results['suitability']}"
-                    if 'hebrew_validation' in evaluation_results:
-                        validation = evaluation_results['hebrew_validation']
-                        comment += f" | Hebrew ratio: {validation.get('hebrew_ratio', 0):.1%}"
-                
-                # Note: execute_query is for SELECT only, we need a different approach for INSERT
-                # For now, we'll use the connection directly
-                conn = self.db._get_connection()
-                conn.execute(insert_query, (
-                    file_info['file_id'],
-                    language,
-                    model,  # Use the specified model instead of hardcoded 'gpt-4'
-                    score,
-                    json.dumps(issues, ensure_ascii=False),  # Proper JSON encoding for issues
-                    comment,
-                    datetime.now()
-                ))
-                conn.commit()
-                
-                scores.append((file_info['file_id'], score, evaluation_results))
-                logger.info(f"Evaluated {file_info['file_id']}: {score:.1f}/10")
-                
             except Exception as e:
-                logger.error(f"Evaluation failed for {file_info['file_id']}: {e}")
-                
-        return scores
+                logger.error(f"Evaluation failed for {file_id}: {e}")
+        return texts
     
     def translate_srt_files(self, language: str, preserve_original: bool = True) -> List[PipelineResult]:
         """
@@ -417,7 +502,10 @@ class Pipeline:
                     str(output_srt_path),
                     target_language=language,
                     preserve_original_when_matching=preserve_original,
-                    config=config
+                    config=config,
+                    db=self.db,
+                    interview_id=file_info['file_id'],
+                    detect_cache_dir=self.config.output_dir / DETECT_CACHE_DIRNAME
                 )
                 
                 if success:
@@ -407,21 +407,13 @@ class EnhancedPipeline(Pipeline):
         enhanced_status = base_status.copy()
         
         try:
-            # Count interviews with segments
-            conn = self.db._get_connection()
-            cursor = conn.execute("""
-                SELECT COUNT(DISTINCT interview_id) as interviews_with_segments,
-                       COUNT(*) as total_segments,
-                       AVG(confidence_score) as avg_confidence
-                FROM subtitle_segments
-            """)
-            
-            segment_stats = cursor.fetchone()
+            # Segment totals come from the trigger-maintained counters
+            segment_stats = self.db.get_segment_totals()
             
             enhanced_status['segment_storage'] = {
-                'interviews_with_segments': segment_stats['interviews_with_segments'] or 0,
-                'total_segments': segment_stats['total_segments'] or 0,
-                'average_confidence': round(segment_stats['avg_confidence'] or 0, 3)
+                'interviews_with_segments': segment_stats['interviews_with_segments'],
+                'total_segments': segment_stats['total_segments'],
+                'average_confidence': round(segment_stats['average_confidence'], 3)
             }
             
             # Add quality metrics if available
@@ -588,19 +580,29 @@ class EnhancedPipeline(Pipeline):
         }
         
         try:
+            # Get quality metrics for all languages from the summary table
+            conn = self.db._get_connection()
+            cursor = conn.execute("""
+                SELECT language,
+                       COUNT(*) as total,
+                       AVG(overall_quality_score) as avg_quality,
+                       MIN(overall_quality_score) as min_quality,
+                       MAX(overall_quality_score) as max_quality
+                FROM interview_quality_summary
+                GROUP BY language
+            """)
+            by_language = {row['language']: row for row in cursor.fetchall()}
+            
             for language in self.config.languages:
-                # Get quality metrics from database
-                conn = self.db._get_connection()
-                cursor = conn.execute("""
-                    SELECT COUNT(*) as total,
-                           AVG(overall_quality_score) as avg_quality,
-                           MIN(overall_quality_score) as min_quality,
-                           MAX(overall_quality_score) as max_quality
-                    FROM interview_quality_summary
-                    WHERE language = ?
-                """, (language,))
-                
-                metrics = cursor.fetchone()
+                metrics = by_language.get(language)
+                if metrics is None:
+                    report['languages'][language] = {
+                        'evaluated_count': 0,
+                        'average_quality': None,
+                        'min_quality': None,
+                        'max_quality': None
+                    }
+                    continue
                 
                 report['languages'][language] = {
                     'evaluated_count': metrics['total'] or 0,
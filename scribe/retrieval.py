@@ -0,0 +1,566 @@
+"""
+Passage retrieval over interview segments for the Scribe chat assistant.
+
+Keyword retrieval is bm25 over the segment_fts full-text index. Optional dense
+retrieval embeds every (segment, language) text into vectors stored as NumPy
+arrays and searched by brute force or an inverted-file (IVF) index. Rankings
+are merged with reciprocal rank fusion and each hit is expanded to a
+time-coded passage of neighbouring segments.
+
+The viewer's chat route reaches this through `scribe_cli.py retrieval serve`
+(HTTP) or `scribe_cli.py retrieval search --json` (one-shot).
+"""
+
+import json
+import logging
+import re
+import shutil
+import sqlite3
+import time
+import zlib
+from dataclasses import dataclass, field, asdict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple, Union
+from urllib.parse import parse_qs, urlparse
+
+from .database import Database, SEARCH_SLOTS, SEARCH_LANGUAGE_SLOTS, normalize_search_text
+
+logger = logging.getLogger(__name__)
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+RETRIEVAL_MODES = ('bm25', 'vector', 'hybrid')
+
+DEFAULT_LIMIT = 8
+
+# Neighbouring segments included on each side of a hit; subtitle segments
+# are a few seconds long, too short on their own to answer a question
+DEFAULT_CONTEXT = 2
+
+# Each ranking contributes this many candidates per requested passage
+CANDIDATE_FACTOR = 4
+
+# Reciprocal rank fusion constant (Cormack et al.)
+RRF_K = 60
+
+# Vector index layout (see VectorIndex)
+DEFAULT_INDEX_DIR = "retrieval_index"
+VECTOR_INDEX_META = "meta.json"
+HASHING_DIM = 512
+EMBED_BATCH_SIZE = 1024
+
+# IVF is used above this many vectors; below it brute force is as fast
+IVF_MIN_VECTORS = 200_000
+IVF_TRAIN_PER_LIST = 64
+IVF_ITERATIONS = 10
+DEFAULT_NPROBE = 16
+ASSIGN_CHUNK = 65536
+
+TOKEN_RE = re.compile(r'\w+')
+
+# Chat questions are phrased in full sentences; with any-term matching these
+# words would pull in most of the archive
+STOPWORDS = frozenset("""
+a an and are as at be but by did do does for from had has have he her his how i
+in into is it its me my of on or our she so than that the their them then there
+they this to was we were what when where which who why will with would you your
+tell about know said say
+aber als am an auch auf aus bei bin bis das dass dem den der des die doch du ein
+eine einem einen einer er es für hat hatte ich ihr im in ist ja mit nach nicht
+noch nur oder sie sind so über um und uns von vor war waren was wenn wie wir zu
+""".split())
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError("NumPy required for vector retrieval. Install with: pip install numpy")
+
+
+class HashingEmbedder:
+    """
+    Dependency-free embedder: signed feature hashing of word unigrams and
+    bigrams, L2-normalized.
+
+    Any embedder can replace it: a callable mapping a list of texts to an
+    (n, dim) float array, with `dim` and `name` attributes. The name is stored
+    with the vector index so queries are embedded by the same model.
+    """
+
+    def __init__(self, dim: int = HASHING_DIM):
+        _require_numpy()
+        self.dim = dim
+        self.name = f"hashing-{dim}"
+
+    def __call__(self, texts: List[str]) -> 'np.ndarray':
+        vectors = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            tokens = TOKEN_RE.findall(normalize_search_text(text).lower())
+            features = tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+            for feature in features:
+                h = zlib.crc32(feature.encode('utf-8'))
+                vectors[row, h % self.dim] += 1.0 if (h >> 31) & 1 else -1.0
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        np.divide(vectors, norms, out=vectors, where=norms > 0)
+        return vectors
+
+
+def _assign(vectors: 'np.ndarray', centroids: 'np.ndarray') -> 'np.ndarray':
+    """Nearest centroid (by inner product) for each vector, in chunks."""
+    assignments = np.empty(len(vectors), dtype=np.int32)
+    for start in range(0, len(vectors), ASSIGN_CHUNK):
+        chunk = np.asarray(vectors[start:start + ASSIGN_CHUNK])
+        assignments[start:start + len(chunk)] = np.argmax(chunk @ centroids.T, axis=1)
+    return assignments
+
+
+def _train_centroids(vectors: 'np.ndarray', nlist: int, seed: int = 0) -> 'np.ndarray':
+    """Spherical k-means on a sample of the vectors."""
+    rng = np.random.default_rng(seed)
+    sample_size = min(len(vectors), nlist * IVF_TRAIN_PER_LIST)
+    sample = np.asarray(vectors[np.sort(rng.choice(len(vectors), sample_size, replace=False))])
+    centroids = sample[rng.choice(sample_size, nlist, replace=False)].copy()
+
+    for _ in range(IVF_ITERATIONS):
+        assignments = _assign(sample, centroids)
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, assignments, sample)
+        norms = np.linalg.norm(sums, axis=1, keepdims=True)
+        # Empty lists keep their previous centroid
+        centroids = np.where(norms > 0, sums / np.maximum(norms, 1e-12), centroids)
+    return centroids.astype(np.float32)
+
+
+class VectorIndex:
+    """
+    Normalized vectors keyed by segment_fts rowid (segment_id * SEARCH_SLOTS +
+    language slot), so a hit identifies both segment and language.
+
+    Files in the index directory: vectors.npy (float32), ids.npy (int64),
+    meta.json, and for IVF centroids.npy plus offsets.npy, with vectors
+    stored grouped by list so list i is rows offsets[i]:offsets[i + 1].
+    Arrays are memory-mapped on load.
+    """
+
+    def __init__(self, vectors: 'np.ndarray', ids: 'np.ndarray', meta: Dict,
+                 centroids: Optional['np.ndarray'] = None,
+                 offsets: Optional['np.ndarray'] = None):
+        self.vectors = vectors
+        self.ids = ids
+        self.meta = meta
+        self.centroids = centroids
+        self.offsets = offsets
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @classmethod
+    def load(cls, index_dir: Union[str, Path]) -> 'VectorIndex':
+        _require_numpy()
+        index_dir = Path(index_dir)
+        with open(index_dir / VECTOR_INDEX_META, 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+        centroids = offsets = None
+        if meta.get('nlist'):
+            centroids = np.load(index_dir / 'centroids.npy')
+            offsets = np.load(index_dir / 'offsets.npy')
+        return cls(
+            np.load(index_dir / 'vectors.npy', mmap_mode='r'),
+            np.load(index_dir / 'ids.npy', mmap_mode='r'),
+            meta, centroids, offsets
+        )
+
+    def search(self, query: 'np.ndarray', k: int, slot: Optional[int] = None,
+               nprobe: int = DEFAULT_NPROBE) -> List[Tuple[int, float]]:
+        """
+        Top-k vectors by inner product with the query.
+
+        Args:
+            query: Normalized query vector
+            k: Number of results
+            slot: Restrict to one language slot
+            nprobe: IVF lists scanned (ignored for brute force)
+
+        Returns:
+            List of (rowid, score), best first
+        """
+        if self.centroids is None:
+            vectors, ids = self.vectors, self.ids
+        else:
+            probe = np.argsort(self.centroids @ query)[::-1][:nprobe]
+            rows = np.concatenate([
+                np.arange(self.offsets[c], self.offsets[c + 1]) for c in probe
+            ])
+            vectors, ids = self.vectors[rows], self.ids[rows]
+
+        scores = np.asarray(vectors @ query)
+        if slot is not None:
+            scores = np.where(np.asarray(ids) % SEARCH_SLOTS == slot, scores, -np.inf)
+
+        k = min(k, len(scores))
+        if k == 0:
+            return []
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [(int(ids[i]), float(scores[i])) for i in top if scores[i] > -np.inf]
+
+
+def _search_language_slots(db: Database) -> Optional[Dict[str, int]]:
+    """Language slots of segment_fts rowids, or None without FTS5 (no search_languages table)."""
+    try:
+        return {row['lang']: row['slot'] for row in
+                db.execute_query("SELECT lang, slot FROM search_languages")}
+    except sqlite3.OperationalError:
+        return None
+
+
+def build_vector_index(db: Database, index_dir: Union[str, Path],
+                       embedder: Optional[Callable] = None,
+                       nlist: Optional[int] = None) -> Dict:
+    """
+    Embed the original text and every translation of all segments.
+
+    The index is built in a sibling temporary directory and swapped in, so a
+    running service never sees a half-written index.
+
+    Args:
+        db: Database with subtitle segments
+        index_dir: Directory for the index files
+        embedder: Embedder (default: HashingEmbedder)
+        nlist: IVF lists; None chooses automatically, 0 forces brute force
+
+    Returns:
+        Index metadata (count, dim, nlist, embedder, build time)
+    """
+    _require_numpy()
+    from numpy.lib.format import open_memmap
+
+    embedder = embedder or HashingEmbedder()
+    index_dir = Path(index_dir)
+    tmp_dir = index_dir.with_name(index_dir.name + '.tmp')
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    tmp_dir.mkdir(parents=True)
+    started = time.perf_counter()
+
+    # Same rowids as segment_fts; without FTS5 the default slots are used
+    slots = _search_language_slots(db) or SEARCH_LANGUAGE_SLOTS
+    source = f"""
+        WITH l(lang, slot) AS (VALUES {', '.join('(?, ?)' for _ in slots)})
+        SELECT s.id * {SEARCH_SLOTS} AS rowid, s.original_text AS text
+        FROM subtitle_segments s WHERE s.original_text != ''
+        UNION ALL
+        SELECT t.segment_id * {SEARCH_SLOTS} + l.slot, t.text
+        FROM segment_translations t JOIN l ON l.lang = t.lang
+        WHERE t.text != ''
+    """
+    params = tuple(value for item in slots.items() for value in item)
+    count = db.execute_query(f"SELECT COUNT(*) AS n FROM ({source})", params)[0]['n']
+
+    raw_path = tmp_dir / 'vectors.raw.npy'
+    vectors = open_memmap(raw_path, mode='w+', dtype=np.float32, shape=(count, embedder.dim))
+    ids = np.empty(count, dtype=np.int64)
+    filled = 0
+    batch_ids: List[int] = []
+    batch_texts: List[str] = []
+
+    def flush():
+        nonlocal filled
+        end = filled + len(batch_ids)
+        vectors[filled:end] = embedder(batch_texts)
+        ids[filled:end] = batch_ids
+        filled = end
+        batch_ids.clear()
+        batch_texts.clear()
+
+    for rowid, text in db.iter_query(source, params, row_mode='tuple'):
+        if filled + len(batch_ids) == count:
+            break  # rows added since the count; picked up by the next build
+        batch_ids.append(rowid)
+        batch_texts.append(text)
+        if len(batch_ids) == EMBED_BATCH_SIZE:
+            flush()
+    if batch_ids:
+        flush()
+    vectors.flush()
+
+    if nlist is None:
+        nlist = int(4 * filled ** 0.5) if filled >= IVF_MIN_VECTORS else 0
+    nlist = min(nlist, filled)
+
+    if nlist:
+        centroids = _train_centroids(vectors[:filled], nlist)
+        assignments = _assign(vectors[:filled], centroids)
+        order = np.argsort(assignments, kind='stable')
+        offsets = np.concatenate([[0], np.cumsum(np.bincount(assignments, minlength=nlist))])
+        grouped = open_memmap(tmp_dir / 'vectors.npy', mode='w+', dtype=np.float32,
+                              shape=(filled, embedder.dim))
+        for start in range(0, filled, ASSIGN_CHUNK):
+            grouped[start:start + ASSIGN_CHUNK] = vectors[order[start:start + ASSIGN_CHUNK]]
+        grouped.flush()
+        del grouped, vectors
+        raw_path.unlink()
+        np.save(tmp_dir / 'ids.npy', ids[:filled][order])
+        np.save(tmp_dir / 'centroids.npy', centroids)
+        np.save(tmp_dir / 'offsets.npy', offsets.astype(np.int64))
+    else:
+        del vectors
+        if filled < count:
+            np.save(tmp_dir / 'vectors.npy', np.load(raw_path, mmap_mode='r')[:filled])
+            raw_path.unlink()
+        else:
+            raw_path.rename(tmp_dir / 'vectors.npy')
+        np.save(tmp_dir / 'ids.npy', ids[:filled])
+
+    meta = {
+        'embedder': embedder.name,
+        'dim': embedder.dim,
+        'count': filled,
+        'nlist': nlist,
+        'built_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'build_seconds': round(time.perf_counter() - started, 2)
+    }
+    with open(tmp_dir / VECTOR_INDEX_META, 'w', encoding='utf-8') as f:
+        json.dump(meta, f, indent=2)
+
+    old_dir = index_dir.with_name(index_dir.name + '.old')
+    if index_dir.exists():
+        index_dir.rename(old_dir)
+    tmp_dir.rename(index_dir)
+    shutil.rmtree(old_dir, ignore_errors=True)
+
+    logger.info(f"Vector index built: {filled} vectors, dim {embedder.dim}, "
+                f"{nlist or 'no'} IVF lists in {meta['build_seconds']}s")
+    return meta
+
+
+@dataclass
+class Passage:
+    """A time-coded run of consecutive segments from one transcript."""
+    interview_id: str
+    lang: str
+    first_segment: int
+    last_segment: int
+    start_time: float = 0.0
+    end_time: float = 0.0
+    text: str = ""
+    score: float = 0.0
+    matched_segments: List[int] = field(default_factory=list)
+
+    def to_dict(self) -> Dict:
+        return asdict(self)
+
+
+def reciprocal_rank_fusion(rankings: List[List[Tuple]], k: int = RRF_K) -> List[Tuple[Tuple, float]]:
+    """
+    Merge rankings of hashable keys.
+
+    Returns:
+        List of (key, fused score), best first
+    """
+    scores: Dict[Tuple, float] = {}
+    for ranking in rankings:
+        for rank, key in enumerate(ranking):
+            scores[key] = scores.get(key, 0.0) + 1.0 / (k + rank + 1)
+    return sorted(scores.items(), key=lambda item: item[1], reverse=True)
+
+
+class RetrievalService:
+    """Retrieves time-coded passages for a query."""
+
+    def __init__(self, db: Optional[Database] = None,
+                 index_dir: Optional[Union[str, Path]] = None,
+                 embedder: Optional[Callable] = None):
+        """
+        Args:
+            db: Database to search (default: media_tracking.db)
+            index_dir: Vector index built by build_vector_index; without one
+                       only bm25 retrieval is available
+            embedder: Embedder used to build the index (default: recreated
+                      from the index metadata for the hashing embedder)
+        """
+        self.db = db or Database()
+        self.vector_index: Optional[VectorIndex] = None
+        self.embedder = embedder
+
+        if index_dir and (Path(index_dir) / VECTOR_INDEX_META).exists():
+            self.vector_index = VectorIndex.load(index_dir)
+            name = self.vector_index.meta['embedder']
+            if self.embedder is None and name.startswith('hashing-'):
+                self.embedder = HashingEmbedder(self.vector_index.meta['dim'])
+            if self.embedder is None or self.embedder.name != name:
+                raise ValueError(f"Vector index was built with embedder '{name}'")
+
+        # Without FTS5 there is no keyword index; vector retrieval still works
+        slots = _search_language_slots(self.db)
+        self.keyword_search = slots is not None
+        if not self.keyword_search:
+            logger.warning("Full-text search unavailable (no FTS5); only vector retrieval is available")
+        self._slots = slots if self.keyword_search else dict(SEARCH_LANGUAGE_SLOTS)
+        self._langs = {slot: lang for lang, slot in self._slots.items()}
+
+    def search(self, query: str, lang: Optional[str] = None, limit: int = DEFAULT_LIMIT,
+               mode: str = 'hybrid', context: int = DEFAULT_CONTEXT) -> List[Passage]:
+        """
+        Find passages relevant to a query.
+
+        Args:
+            query: Natural-language question or keywords
+            lang: Restrict to one language ('orig' or a translation code)
+            limit: Maximum number of segment hits expanded into passages
+            mode: 'bm25', 'vector' or 'hybrid' (hybrid falls back to bm25
+                  without a vector index, and to vectors without FTS5)
+            context: Neighbouring segments included on each side of a hit
+
+        Returns:
+            Passages ordered by relevance; overlapping hits are merged
+        """
+        if mode not in RETRIEVAL_MODES:
+            raise ValueError(f"Unknown retrieval mode: {mode}")
+        if mode == 'vector' and self.vector_index is None:
+            raise ValueError("Vector retrieval requires an index; run 'retrieval build-vectors'")
+        if mode == 'bm25' and not self.keyword_search:
+            raise ValueError("Keyword retrieval requires SQLite with FTS5")
+        if lang is not None and lang not in self._slots:
+            return []
+
+        candidates = limit * CANDIDATE_FACTOR
+        rankings = []
+        if mode in ('bm25', 'hybrid') and self.keyword_search:
+            rankings.append(self._keyword_hits(query, lang, candidates))
+        if mode in ('vector', 'hybrid') and self.vector_index is not None:
+            rankings.append(self._vector_hits(query, lang, candidates))
+
+        hits = reciprocal_rank_fusion(rankings)[:limit]
+        return self._expand(hits, context)
+
+    def _keyword_hits(self, query: str, lang: Optional[str], limit: int) -> List[Tuple]:
+        """bm25 ranking; any term may match, stopwords are dropped."""
+        terms = [t for t in TOKEN_RE.findall(query) if t.lower() not in STOPWORDS]
+        if not terms:
+            return []
+        hits = self.db.search_segments(' '.join(terms), lang=lang, limit=limit, match_all=False)
+        return [(hit['interview_id'], hit['segment_index'], hit['lang']) for hit in hits]
+
+    def _vector_hits(self, query: str, lang: Optional[str], limit: int) -> List[Tuple]:
+        """Nearest (segment, language) vectors to the embedded query."""
+        slot = self._slots[lang] if lang is not None else None
+        hits = self.vector_index.search(self.embedder([query])[0], limit, slot)
+        if not hits:
+            return []
+
+        segment_ids = sorted({rowid // SEARCH_SLOTS for rowid, _ in hits})
+        placeholders = ','.join('?' * len(segment_ids))
+        segments = {row['id']: (row['interview_id'], row['segment_index'])
+                    for row in self.db.execute_query(
+                        f"SELECT id, interview_id, segment_index FROM subtitle_segments "
+                        f"WHERE id IN ({placeholders})", tuple(segment_ids))}
+
+        # Segments deleted since the index was built are skipped
+        return [segments[rowid // SEARCH_SLOTS] + (self._langs[rowid % SEARCH_SLOTS],)
+                for rowid, _ in hits if rowid // SEARCH_SLOTS in segments]
+
+    def _expand(self, hits: List[Tuple[Tuple, float]], context: int) -> List[Passage]:
+        """Grow hits into passages of neighbouring segments, merging overlaps."""
+        passages: List[Passage] = []
+        for (interview_id, segment_index, lang), score in hits:
+            first, last = max(segment_index - context, 0), segment_index + context
+            for passage in passages:
+                if (passage.interview_id == interview_id and passage.lang == lang
+                        and first <= passage.last_segment + 1 and last >= passage.first_segment - 1):
+                    passage.first_segment = min(passage.first_segment, first)
+                    passage.last_segment = max(passage.last_segment, last)
+                    passage.score += score
+                    passage.matched_segments.append(segment_index)
+                    break
+            else:
+                passages.append(Passage(interview_id, lang, first, last, score=score,
+                                        matched_segments=[segment_index]))
+
+        for passage in passages:
+            rows = self.db.execute_query("""
+                SELECT s.segment_index, s.start_time, s.end_time,
+                       COALESCE(t.text, s.original_text) AS text
+                FROM subtitle_segments s
+                LEFT JOIN segment_translations t ON t.segment_id = s.id AND t.lang = ?
+                WHERE s.interview_id = ? AND s.segment_index BETWEEN ? AND ?
+                ORDER BY s.segment_index
+            """, (passage.lang, passage.interview_id, passage.first_segment, passage.last_segment))
+            if rows:
+                passage.first_segment = rows[0]['segment_index']
+                passage.last_segment = rows[-1]['segment_index']
+                passage.start_time = rows[0]['start_time']
+                passage.end_time = rows[-1]['end_time']
+                passage.text = ' '.join(row['text'].strip() for row in rows if row['text'])
+            passage.matched_segments.sort()
+
+        passages.sort(key=lambda p: p.score, reverse=True)
+        return passages
+
+
+def make_server(service: RetrievalService, host: str = '127.0.0.1',
+                port: int = 8765) -> ThreadingHTTPServer:
+    """
+    HTTP server for GET /search?q=...&lang=&limit=&mode=&context=.
+
+    Response: {"passages": [...], "took_ms": float}; GET /health reports
+    whether vector retrieval is available.
+    """
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            url = urlparse(self.path)
+            if url.path == '/health':
+                return self._send(200, {'status': 'ok', 'vectors': service.vector_index is not None})
+            if url.path != '/search':
+                return self._send(404, {'error': 'Not found'})
+
+            params = {k: v[0] for k, v in parse_qs(url.query).items()}
+            query = params.get('q', '').strip()
+            if not query:
+                return self._send(400, {'error': 'Missing query parameter q'})
+            try:
+                started = time.perf_counter()
+                passages = service.search(
+                    query,
+                    lang=params.get('lang') or None,
+                    limit=int(params.get('limit', DEFAULT_LIMIT)),
+                    mode=params.get('mode', 'hybrid'),
+                    context=int(params.get('context', DEFAULT_CONTEXT))
+                )
+            except ValueError as e:
+                return self._send(400, {'error': str(e)})
+            except Exception as e:
+                logger.error(f"Retrieval failed for {query!r}: {e}")
+                return self._send(500, {'error': 'Retrieval failed'})
+            self._send(200, {
+                'passages': [p.to_dict() for p in passages],
+                'took_ms': round((time.perf_counter() - started) * 1000, 1)
+            })
+
+        def _send(self, status: int, payload: Dict):
+            body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            logger.debug(format % args)
+
+    return ThreadingHTTPServer((host, port), Handler)
+
+
+def serve(service: RetrievalService, host: str = '127.0.0.1', port: int = 8765):
+    """Serve retrieval over HTTP until interrupted."""
+    server = make_server(service, host, port)
+    logger.info(f"Retrieval service listening on http://{host}:{port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
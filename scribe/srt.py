@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+SRT Parsing for Scribe
+----------------------
+Single-pass SRT parser shared by the SRT translator, the transcript extractor
+and the viewer's manifest builder. One read of an SRT file yields both the cue
+list and, when needed, the equivalent WebVTT text, so callers no longer
+convert to VTT on disk and parse the VTT back.
+
+Parsing is lenient in the ways real subtitle files require: UTF-8 BOMs, CRLF
+line endings, '.' or ',' millisecond separators, missing blank lines between
+cues and missing index lines. Cues with empty text or no index line are kept
+(with index None) so callers decide what to drop.
+"""
+
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional, Union
+
+# HH:MM:SS,mmm --> HH:MM:SS,mmm (any hour width, ',' or '.' before milliseconds).
+# Anything after the end timestamp (position settings) is ignored.
+RE_TIMING = re.compile(
+    r'\s*(\d+):(\d{2}):(\d{2})[,.](\d{3})\s*-->\s*(\d+):(\d{2}):(\d{2})[,.](\d{3})'
+)
+
+
+@dataclass
+class SubtitleCue:
+    """A single subtitle cue."""
+    index: Optional[int]  # None if the cue had no numeric index line
+    start: float          # Start time in seconds
+    end: float            # End time in seconds
+    start_time: str       # Start timestamp exactly as written in the file
+    end_time: str         # End timestamp exactly as written in the file
+    text: str             # Cue text, lines joined with '\n'
+
+
+def format_timestamp(seconds: float, separator: str = ',') -> str:
+    """
+    Format seconds as a subtitle timestamp.
+
+    Args:
+        seconds: Time in seconds
+        separator: ',' for SRT, '.' for WebVTT
+
+    Returns:
+        Timestamp as HH:MM:SS,mmm (or HH:MM:SS.mmm)
+    """
+    total_ms = int(round(seconds * 1000))
+    hours, rest = divmod(total_ms, 3_600_000)
+    minutes, rest = divmod(rest, 60_000)
+    secs, millis = divmod(rest, 1000)
+    return f"{hours:02d}:{minutes:02d}:{secs:02d}{separator}{millis:03d}"
+
+
+def parse_srt(content: str) -> List[SubtitleCue]:
+    """
+    Parse SRT content into cues in a single pass over its lines.
+
+    Args:
+        content: SRT file content
+
+    Returns:
+        List of SubtitleCue objects in file order
+    """
+    cues: List[SubtitleCue] = []
+    index: Optional[int] = None
+    timing = None
+    text_lines: List[str] = []
+
+    def flush():
+        h1, m1, s1, ms1, h2, m2, s2, ms2 = map(int, timing.groups())
+        cues.append(SubtitleCue(
+            index=index,
+            start=h1 * 3600 + m1 * 60 + s1 + ms1 / 1000,
+            end=h2 * 3600 + m2 * 60 + s2 + ms2 / 1000,
+            start_time=timing_line[timing.start(1):timing.end(4)],
+            end_time=timing_line[timing.start(5):timing.end(8)],
+            text='\n'.join(text_lines)
+        ))
+
+    for line in content.lstrip('\ufeff').splitlines():
+        if timing is None:
+            # Between cues: expecting an index line or a timing line
+            match = RE_TIMING.match(line)
+            if match:
+                timing, timing_line = match, line
+            elif line.strip().isdigit():
+                index = int(line)
+            continue
+
+        if not line:
+            flush()
+            index, timing, text_lines = None, None, []
+            continue
+
+        match = RE_TIMING.match(line)
+        if match:
+            # Next cue started without a blank line; its index (if any) was
+            # read as text
+            next_index = None
+            if text_lines and text_lines[-1].strip().isdigit():
+                next_index = int(text_lines.pop())
+            while text_lines and not text_lines[-1].strip():
+                text_lines.pop()
+            flush()
+            index, timing, timing_line, text_lines = next_index, match, line, []
+            continue
+
+        text_lines.append(line)
+
+    if timing is not None:
+        flush()
+
+    return cues
+
+
+def read_srt(srt_path: Union[str, Path]) -> str:
+    """Read an SRT file as text, falling back to Latin-1 for legacy files."""
+    with open(srt_path, 'rb') as f:
+        data = f.read()
+    try:
+        return data.decode('utf-8-sig')
+    except UnicodeDecodeError:
+        return data.decode('latin-1')
+
+
+def parse_srt_file(srt_path: Union[str, Path]) -> List[SubtitleCue]:
+    """
+    Parse an SRT file into cues.
+
+    Args:
+        srt_path: Path to the SRT file
+
+    Returns:
+        List of SubtitleCue objects
+
+    Raises:
+        OSError: If the file cannot be read
+    """
+    return parse_srt(read_srt(srt_path))
+
+
+def cues_to_vtt(cues: List[SubtitleCue]) -> str:
+    """
+    Render cues as WebVTT text.
+
+    Args:
+        cues: Parsed cues
+
+    Returns:
+        WebVTT document
+    """
+    parts = ["WEBVTT\n"]
+    for cue in cues:
+        parts.append(
+            f"\n{format_timestamp(cue.start, '.')} --> {format_timestamp(cue.end, '.')}\n{cue.text}\n"
+        )
+    return ''.join(parts)
+
+
+def srt_to_vtt(srt_path: Union[str, Path], vtt_path: Union[str, Path]) -> List[SubtitleCue]:
+    """
+    Convert an SRT file to WebVTT and return its cues, reading the SRT once.
+
+    Args:
+        srt_path: Path to the source SRT file
+        vtt_path: Path where the VTT file should be written
+
+    Returns:
+        Cues parsed from the SRT file
+
+    Raises:
+        OSError: If the SRT cannot be read or the VTT cannot be written
+    """
+    cues = parse_srt_file(srt_path)
+    with open(vtt_path, 'w', encoding='utf-8') as f:
+        f.write(cues_to_vtt(cues))
+    return cues
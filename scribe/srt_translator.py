@@ -23,7 +23,13 @@ from pathlib import Path
 from datetime import datetime, timedelta
 
 from .translate import HistoricalTranslator
+from .database import Database
+from .srt import parse_srt, parse_srt_file
 from .batch_language_detection import detect_languages_for_segments
+from .instrumentation import timed
+
+# Language detection cache of the pipeline, under its output directory
+DETECT_CACHE_DIRNAME = '.detect_cache'
 
 # Note: langdetect has been removed in favor of GPT-4o-mini batch detection
 # The flawed pattern-based detection was removed per issue #72
@@ -39,6 +45,7 @@ class SRTSegment:
     end_time: str
     text: str
     detected_language: Optional[str] = None
+    detection_confidence: Optional[float] = None
 
 
 class SRTTranslator:
@@ -46,19 +53,27 @@ class SRTTranslator:
     
     # Regular expressions for parsing SRT
     RE_TIMING = re.compile(r'(\d{2}:\d{2}:\d{2},\d{3})\s*-->\s*(\d{2}:\d{2}:\d{2},\d{3})')
-    RE_INDEX = re.compile(r'^\d+$')
     
     # Non-verbal sounds that should not be translated
     NON_VERBAL_SOUNDS = {'♪', '♪♪', '[Music]', '[Applause]', '[Laughter]', '[Silence]', '...', '***', '--'}
     
-    def __init__(self, translator: Optional[HistoricalTranslator] = None):
+    def __init__(self, translator: Optional[HistoricalTranslator] = None,
+                 db: Optional[Database] = None,
+                 detect_cache_dir: Optional[Path] = None):
         """
         Initialize SRT translator.
         
         Args:
             translator: HistoricalTranslator instance (creates new if not provided)
+            db: Database holding the interviews' segments, used to reuse and
+                store language detection (optional)
+            detect_cache_dir: Directory caching language detection for SRT
+                files without database segments (optional; no file cache
+                without it)
         """
         self.translator = translator or HistoricalTranslator()
+        self.db = db
+        self.detect_cache_dir = Path(detect_cache_dir) if detect_cache_dir else None
     
     def parse_srt(self, srt_path: str) -> List[SRTSegment]:
         """
@@ -70,49 +85,23 @@ class SRTTranslator:
         Returns:
             List of SRTSegment objects
         """
-        segments = []
-        
         try:
-            with open(srt_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            cues = parse_srt_file(srt_path)
         except Exception as e:
             logger.error(f"Failed to read SRT file {srt_path}: {e}")
-            return segments
-        
-        # Split by double newline to get subtitle blocks
-        blocks = content.strip().split('\n\n')
+            return []
         
-        for block in blocks:
-            lines = block.strip().split('\n')
-            if len(lines) < 3:
-                continue
-            
-            # Parse index
-            if not self.RE_INDEX.match(lines[0]):
-                continue
-            index = int(lines[0])
-            
-            # Parse timing
-            timing_match = self.RE_TIMING.match(lines[1])
-            if not timing_match:
-                logger.warning(f"Invalid timing in segment {index}: {lines[1]}")
-                continue
-            
-            start_time = timing_match.group(1)
-            end_time = timing_match.group(2)
-            
-            # Join remaining lines as text
-            text = '\n'.join(lines[2:])
-            
-            # Create segment
-            segment = SRTSegment(
-                index=index,
-                start_time=start_time,
-                end_time=end_time,
-                text=text
+        # Only numbered cues with text become segments
+        segments = [
+            SRTSegment(
+                index=cue.index,
+                start_time=cue.start_time,
+                end_time=cue.end_time,
+                text=cue.text
             )
-            
-            segments.append(segment)
+            for cue in cues
+            if cue.index is not None and cue.text.strip()
+        ]
         
         logger.info(f"Parsed {len(segments)} segments from {srt_path}")
         return segments
@@ -278,13 +267,128 @@ class SRTTranslator:
         normalized = ' '.join(text.split())
         return normalized
     
+    def _apply_stored_languages(self, segments: List[SRTSegment],
+                                interview_id: Optional[str]) -> Dict[int, int]:
+        """
+        Apply language detection stored on an interview's database segments.
+        
+        SRT segments are paired with database segments by position and only
+        matched where their text agrees.
+        
+        Args:
+            segments: Parsed SRT segments
+            interview_id: Interview to read (nothing is applied without db)
+            
+        Returns:
+            Mapping of SRT segment position to subtitle_segments row ID
+        """
+        if self.db is None or not interview_id:
+            return {}
+        
+        try:
+            rows = self.db.get_segment_languages(interview_id)
+        except Exception as e:
+            logger.warning(f"Could not read stored languages for {interview_id}: {e}")
+            return {}
+        
+        row_ids = {}
+        for i, (segment, row) in enumerate(zip(segments, rows)):
+            if self._normalize_spacing(segment.text) != self._normalize_spacing(row['original_text']):
+                continue
+            row_ids[i] = row['id']
+            if row['detected_language']:
+                segment.detected_language = row['detected_language']
+                segment.detection_confidence = row['detection_confidence']
+        return row_ids
+    
+    def _detect_languages(self, segments: List[SRTSegment], srt_path: str,
+                          row_ids: Dict[int, int], detect_batch_size: int):
+        """
+        Detect languages for segments without a stored result.
+        
+        Segments matched to database rows already carry their stored language.
+        When some segments have no row, the rest are looked up in the file
+        cache (keyed by the SRT checksum, if detect_cache_dir is set). Only
+        segments still without a language are sent for detection, and new
+        results for matched rows are stored in the database.
+        """
+        pending = [i for i, segment in enumerate(segments) if not segment.detected_language]
+        logger.info(f"Stored language detection for {len(segments) - len(pending)}/{len(segments)} segments")
+        if not pending:
+            return
+        
+        cache_file = None
+        cache_used = False
+        if len(row_ids) < len(segments):
+            cache_file = self._detect_cache_file(srt_path)
+            if cache_file and cache_file.exists():
+                try:
+                    cached = json.loads(cache_file.read_text())
+                    # Apply cached languages by segment index
+                    for idx, lang in cached.get('languages', {}).items():
+                        i = int(idx)
+                        if 0 <= i < len(segments) and not segments[i].detected_language:
+                            segments[i].detected_language = lang
+                    cache_used = True
+                    logger.info(f"Language detection cache hit for {srt_path}")
+                except Exception:
+                    cache_used = False
+        
+        if not cache_used:
+            logger.info("Running batch language detection with GPT-4o-mini...")
+            language_map = detect_languages_for_segments(
+                [segments[i] for i in pending],
+                self.translator.openai_client,
+                batch_size=detect_batch_size
+            )
+            logger.info(f"Detected languages for {len(language_map)} segments")
+            # Save cache
+            if cache_file:
+                try:
+                    languages = {str(i): seg.detected_language for i, seg in enumerate(segments) if seg.detected_language}
+                    cache_file.write_text(
+                        json.dumps({'source': str(srt_path), 'sha256': cache_file.stem, 'languages': languages}, indent=2)
+                    )
+                except Exception:
+                    pass
+        
+        detected = [i for i in pending if i in row_ids and segments[i].detected_language]
+        if detected:
+            self.db.set_segment_detected_languages(
+                {row_ids[i]: segments[i].detected_language for i in detected},
+                {row_ids[i]: segments[i].detection_confidence for i in detected}
+            )
+    
+    def _detect_cache_file(self, srt_path: str) -> Optional[Path]:
+        """Cache file for an SRT file's language detection, named by its checksum."""
+        if self.detect_cache_dir is None:
+            return None
+        
+        # Compute checksum of the source file for caching
+        try:
+            sha256 = hashlib.sha256()
+            with open(srt_path, 'rb') as sf:
+                for chunk in iter(lambda: sf.read(1024 * 1024), b''):
+                    sha256.update(chunk)
+            source_hash = sha256.hexdigest()
+        except Exception:
+            return None
+        
+        try:
+            self.detect_cache_dir.mkdir(parents=True, exist_ok=True)
+        except Exception:
+            pass
+        return self.detect_cache_dir / f"{source_hash}.json"
+    
+    @timed('srt.translate_srt')
     def translate_srt(self, 
                       srt_path: str, 
                       target_language: str,
                       source_language: Optional[str] = None,
                       preserve_original_when_matching: bool = True,
                        batch_size: int = 200,
-                       detect_batch_size: int = 200) -> List[SRTSegment]:
+                       detect_batch_size: int = 200,
+                       interview_id: Optional[str] = None) -> List[SRTSegment]:
         """
         Translate an SRT file using batch optimization for 50-100x efficiency.
         
@@ -301,6 +405,10 @@ class SRTTranslator:
             source_language: Source language code (optional, will auto-detect)
             preserve_original_when_matching: If True, preserve segments already in target language
             batch_size: Number of unique texts to translate per API call (default: 200)
+            detect_batch_size: Number of segments per language detection call
+            interview_id: Interview whose database segments hold stored language
+                detection (requires db; unmatched segments fall back to the
+                file cache)
             
         Returns:
             List of translated SRTSegment objects
@@ -316,56 +424,10 @@ class SRTTranslator:
         total_segments = len(segments)
         logger.info(f"Parsed {total_segments} segments from {srt_path}")
         
-        # Batch language detection with checksum-based cache (if OpenAI client available)
+        # Batch language detection, reusing stored results (if OpenAI client available)
+        row_ids = self._apply_stored_languages(segments, interview_id)
         if self.translator and hasattr(self.translator, 'openai_client') and self.translator.openai_client:
-            # Compute checksum of the source file for caching
-            try:
-                sha256 = hashlib.sha256()
-                with open(srt_path, 'rb') as sf:
-                    for chunk in iter(lambda: sf.read(1024 * 1024), b''):
-                        sha256.update(chunk)
-                source_hash = sha256.hexdigest()
-            except Exception:
-                source_hash = None
-
-            cache_used = False
-            if source_hash:
-                cache_dir = Path('reprocessing_backups') / 'cache' / 'detect'
-                try:
-                    cache_dir.mkdir(parents=True, exist_ok=True)
-                except Exception:
-                    pass
-                cache_file = cache_dir / f"{source_hash}.json"
-                if cache_file.exists():
-                    try:
-                        cached = json.loads(cache_file.read_text())
-                        # Apply cached languages by segment index
-                        for idx, lang in cached.get('languages', {}).items():
-                            i = int(idx)
-                            if 0 <= i < len(segments):
-                                segments[i].detected_language = lang
-                        cache_used = True
-                        logger.info(f"Language detection cache hit for {srt_path}")
-                    except Exception:
-                        cache_used = False
-
-            if not cache_used:
-                logger.info("Running batch language detection with GPT-4o-mini...")
-                language_map = detect_languages_for_segments(
-                    segments, 
-                    self.translator.openai_client,
-                    batch_size=detect_batch_size
-                )
-                logger.info(f"Detected languages for {len(language_map)} segments")
-                # Save cache
-                if source_hash:
-                    try:
-                        languages = {str(i): seg.detected_language for i, seg in enumerate(segments) if seg.detected_language}
-                        (Path('reprocessing_backups') / 'cache' / 'detect' / f"{source_hash}.json").write_text(
-                            json.dumps({'source': str(srt_path), 'sha256': source_hash, 'languages': languages}, indent=2)
-                        )
-                    except Exception:
-                        pass
+            self._detect_languages(segments, srt_path, row_ids, detect_batch_size)
         
         # Build translation map - only unique texts that need translation
         texts_to_translate = {}  # {original_text: translated_text}
@@ -511,25 +573,11 @@ class SRTTranslator:
         """
         Parse SRT content and return list of dicts with 'start', 'end', 'text' in seconds.
         """
-        results: List[Dict[str, float]] = []
-        blocks = content.strip().split("\n\n")
-        for block in blocks:
-            lines = block.strip().splitlines()
-            if len(lines) < 3:
-                continue
-            # Ignore index line (lines[0])
-            timing_line = lines[1]
-            match = self.RE_TIMING.match(timing_line)
-            if not match:
-                continue
-            start_ts, end_ts = match.group(1), match.group(2)
-            text = "\n".join(lines[2:])
-            results.append({
-                "start": self._timestamp_to_seconds(start_ts),
-                "end": self._timestamp_to_seconds(end_ts),
-                "text": text,
-            })
-        return results
+        return [
+            {"start": cue.start, "end": cue.end, "text": cue.text}
+            for cue in parse_srt(content)
+            if cue.text.strip()
+        ]
 
     def _translate_segment(self, text: str, source_lang: Optional[str], target_lang: str, segment: Dict) -> Dict:
         """
@@ -627,7 +675,10 @@ def translate_srt_file(srt_path: str,
                        batch_size: int = 200,
                        detect_batch_size: int = 200,
                        estimate_only: bool = False,
-                       config: Optional[Dict] = None) -> bool:
+                       config: Optional[Dict] = None,
+                       db: Optional[Database] = None,
+                       interview_id: Optional[str] = None,
+                       detect_cache_dir: Optional[Path] = None) -> bool:
     """
     Convenience function to translate an SRT file with batch optimization.
     
@@ -640,6 +691,9 @@ def translate_srt_file(srt_path: str,
         batch_size: Number of unique texts to translate per API call (default: 200)
         estimate_only: If True, only estimate cost without translating
         config: Translation configuration with API keys
+        db: Database with the interview's segments, to reuse stored language detection
+        interview_id: Interview the SRT file belongs to
+        detect_cache_dir: Directory caching language detection by SRT checksum
         
     Returns:
         True if successful, False otherwise
@@ -647,7 +701,7 @@ def translate_srt_file(srt_path: str,
     try:
         # Create translator instances
         translator = HistoricalTranslator(config)
-        srt_translator = SRTTranslator(translator)
+        srt_translator = SRTTranslator(translator, db, detect_cache_dir)
         
         # If only estimating cost
         if estimate_only:
@@ -668,7 +722,8 @@ def translate_srt_file(srt_path: str,
             source_language,
             preserve_original_when_matching,
             batch_size,
-            detect_batch_size
+            detect_batch_size,
+            interview_id=interview_id
         )
         
         if not translated_segments:
@@ -29,6 +29,8 @@ try:
 except ImportError:
     raise ImportError("ElevenLabs SDK required. Install with: pip install elevenlabs")
 
+from .instrumentation import timer, timed, increment
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -67,6 +69,7 @@ class AudioExtractor:
     """Extract audio from video files using ffmpeg."""
     
     @staticmethod
+    @timed('ffmpeg.extract_audio')
     def extract_audio(video_path: Path, output_format: str = "mp3", 
                      bitrate: str = "192k") -> Path:
         """
@@ -105,6 +108,7 @@ class AudioExtractor:
             raise RuntimeError(f"Audio extraction failed: {e.stderr}")
     
     @staticmethod
+    @timed('ffprobe.duration')
     def get_duration(media_path: Path) -> float:
         """Get duration of media file in seconds."""
         cmd = [
@@ -185,7 +189,8 @@ class AudioSegmenter:
             ])
             
             try:
-                subprocess.run(cmd, check=True, capture_output=True)
+                with timer('ffmpeg.split_segment'):
+                    subprocess.run(cmd, check=True, capture_output=True)
                 segments.append((segment_path, start))
             except subprocess.CalledProcessError as e:
                 logger.error(f"Error creating segment {i}: {e}")
@@ -205,6 +210,7 @@ class Transcriber:
         self.client = ElevenLabs(api_key=config.api_key)
         self._temp_dirs: List[str] = []
     
+    @timed('transcribe.file')
     def transcribe_file(self, file_path: Path) -> TranscriptionResult:
         """
         Transcribe an audio or video file.
@@ -274,7 +280,8 @@ class Transcriber:
         # Retry logic for API calls
         for attempt in range(self.config.max_retries):
             try:
-                with open(audio_path, 'rb') as audio_file:
+                increment('elevenlabs.calls')
+                with open(audio_path, 'rb') as audio_file, timer('elevenlabs.speech_to_text'):
                     response = self.client.speech_to_text.convert(
                         file=audio_file,
                         **api_params,
@@ -287,6 +294,7 @@ class Transcriber:
             except ApiError as e:
                 if attempt < self.config.max_retries - 1:
                     backoff = min(2 ** attempt, 60)
+                    increment('elevenlabs.retries')
                     logger.warning(f"API error (attempt {attempt + 1}): {e}. Retrying in {backoff}s...")
                     time.sleep(backoff)
                 else:
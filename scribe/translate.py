@@ -42,6 +42,8 @@ try:
 except ImportError:
     httpx = None
 
+from .instrumentation import timer, timed, increment, record_openai_usage
+
 logger = logging.getLogger(__name__)
 
 
@@ -144,6 +146,7 @@ class HistoricalTranslator:
         else:
             self.openai_client = None
     
+    @timed('translate.text')
     def translate(self, 
                   text: str, 
                   target_language: str,
@@ -201,6 +204,7 @@ class HistoricalTranslator:
             logger.error(f"Translation error with {provider}: {e}")
             return None
     
+    @timed('translate.batch')
     def batch_translate(self,
                        texts: List[str],
                        target_language: str,
@@ -300,11 +304,14 @@ class HistoricalTranslator:
     def _batch_translate_deepl(self, texts: List[str], target_lang: str, source_lang: Optional[str]) -> List[str]:
         """Batch translate using DeepL."""
         # DeepL accepts multiple texts in a single request
-        results = self.providers['deepl'].translate_text(
-            text=texts,
-            target_lang=target_lang,
-            source_lang=source_lang
-        )
+        increment('deepl.calls')
+        increment('deepl.characters', sum(len(text) for text in texts))
+        with timer('deepl.translate'):
+            results = self.providers['deepl'].translate_text(
+                text=texts,
+                target_lang=target_lang,
+                source_lang=source_lang
+            )
         return [result.text for result in results]
     
     def _batch_translate_microsoft(self, texts: List[str], target_lang: str, source_lang: Optional[str]) -> List[str]:
@@ -329,8 +336,11 @@ class HistoricalTranslator:
         # Microsoft accepts array of texts
         body = [{'text': text} for text in texts]
         
-        response = requests.post(endpoint, headers=headers, params=params, json=body)
-        response.raise_for_status()
+        increment('microsoft.calls')
+        increment('microsoft.characters', sum(len(text) for text in texts))
+        with timer('microsoft.translate'):
+            response = requests.post(endpoint, headers=headers, params=params, json=body)
+            response.raise_for_status()
         
         results = response.json()
         translations = []
@@ -393,11 +403,14 @@ class HistoricalTranslator:
     
     def _translate_deepl(self, text: str, target_lang: str, source_lang: Optional[str]) -> str:
         """Translate using DeepL."""
-        result = self.providers['deepl'].translate_text(
-            text=text,
-            target_lang=target_lang,
-            source_lang=source_lang
-        )
+        increment('deepl.calls')
+        increment('deepl.characters', len(text))
+        with timer('deepl.translate'):
+            result = self.providers['deepl'].translate_text(
+                text=text,
+                target_lang=target_lang,
+                source_lang=source_lang
+            )
         return result.text
     
     def _translate_microsoft(self, text: str, target_lang: str, source_lang: Optional[str]) -> Optional[str]:
@@ -437,8 +450,11 @@ class HistoricalTranslator:
         
         body = [{'text': text}]
         
-        response = requests.post(endpoint, headers=headers, params=params, json=body)
-        response.raise_for_status()
+        increment('microsoft.calls')
+        increment('microsoft.characters', len(text))
+        with timer('microsoft.translate'):
+            response = requests.post(endpoint, headers=headers, params=params, json=body)
+            response.raise_for_status()
         
         result = response.json()
         if result and len(result) > 0 and 'translations' in result[0]:
@@ -505,7 +521,9 @@ class HistoricalTranslator:
         if not str(self.openai_model).lower().startswith("gpt-5"):
             create_kwargs["temperature"] = 0.3
 
-        response = self.openai_client.chat.completions.create(**create_kwargs)
+        with timer('openai.translate'):
+            response = self.openai_client.chat.completions.create(**create_kwargs)
+        record_openai_usage('openai.translate', response)
         
         content = response.choices[0].message.content.strip()
         return content
@@ -6,11 +6,15 @@ Provides common utilities for path handling, file ID generation, and parallel pr
 
 import os
 import re
+import json
+import time
 import uuid
 import hashlib
 import logging
 import unicodedata
+import threading
 import multiprocessing
+from collections import deque
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Callable, Tuple
 from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError
@@ -404,12 +408,116 @@ class SimpleWorkerPool:
 
 
 # Progress Tracking
+PROGRESS_SINK_ENV = 'SCRIBE_PROGRESS_SINK'
+
+
+def _format_duration(seconds: float) -> str:
+    """Format seconds as a short duration (45s, 3m 12s, 1h 04m)."""
+    seconds = int(seconds)
+    if seconds < 60:
+        return f"{seconds}s"
+    if seconds < 3600:
+        return f"{seconds // 60}m {seconds % 60:02d}s"
+    return f"{seconds // 3600}h {seconds % 3600 // 60:02d}m"
+
+
+class JSONLMetricsSink:
+    """
+    Append progress snapshots to a JSON Lines file, one object per line.
+    """
+    
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+    
+    def emit(self, stats: Dict[str, Any]):
+        """Append a snapshot."""
+        line = json.dumps(stats, ensure_ascii=False)
+        with self._lock:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(line + '\n')
+
+
+class PrometheusTextfileSink:
+    """
+    Write progress gauges in the Prometheus text format, for the node
+    exporter's textfile collector. The file is replaced atomically on each
+    emit so the collector never reads a partial file.
+    """
+    
+    GAUGES = {
+        'processed': 'Items processed so far',
+        'completed': 'Items processed successfully',
+        'failed': 'Items that failed',
+        'total': 'Total items, if known',
+        'rate': 'Items per second over the sliding window',
+        'eta_seconds': 'Estimated seconds remaining',
+        'elapsed_seconds': 'Seconds since the tracker started',
+    }
+    
+    def __init__(self, path: str, prefix: str = 'scribe_progress'):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.prefix = prefix
+        self._lock = threading.Lock()
+    
+    def emit(self, stats: Dict[str, Any]):
+        """Replace the textfile with the current gauges."""
+        task = stats['description'].replace('\\', '\\\\').replace('"', '\\"')
+        lines = []
+        for key, help_text in self.GAUGES.items():
+            value = stats.get(key)
+            if value is None:
+                continue
+            name = f"{self.prefix}_{key}"
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} gauge")
+            lines.append(f'{name}{{task="{task}"}} {value}')
+        
+        with self._lock:
+            tmp_path = self.path.with_name(self.path.name + '.tmp')
+            tmp_path.write_text('\n'.join(lines) + '\n', encoding='utf-8')
+            os.replace(tmp_path, self.path)
+
+
+def metrics_sink_from_env():
+    """
+    Create a metrics sink from SCRIBE_PROGRESS_SINK.
+    
+    The variable takes 'jsonl:<path>' or 'prometheus:<path>'.
+    
+    Returns:
+        Sink instance, or None if the variable is unset or invalid
+    """
+    spec = os.getenv(PROGRESS_SINK_ENV)
+    if not spec:
+        return None
+    kind, _, path = spec.partition(':')
+    if kind == 'jsonl' and path:
+        return JSONLMetricsSink(path)
+    if kind == 'prometheus' and path:
+        return PrometheusTextfileSink(path)
+    logger.warning(f"Ignoring invalid {PROGRESS_SINK_ENV}={spec!r}; "
+                   f"expected jsonl:<path> or prometheus:<path>")
+    return None
+
+
 class ProgressTracker:
     """
-    Simple progress tracker for batch operations.
+    Thread-safe progress tracker for batch operations.
+    
+    Counters are updated under a lock so pool workers can call update()
+    concurrently. Output is throttled to one line per refresh_interval (plus
+    the first and the final update), and throughput and ETA come from a
+    sliding window of recent updates rather than the whole run.
+    
+    If a metrics sink is given (or configured through SCRIBE_PROGRESS_SINK),
+    snapshots go to the sink instead of stdout.
     """
     
-    def __init__(self, total: int = None, description: str = "Processing", show_eta: bool = True):
+    def __init__(self, total: int = None, description: str = "Processing", show_eta: bool = True,
+                 refresh_interval: float = 1.0, window: float = 60.0, sink=None):
         """
         Initialize progress tracker.
         
@@ -417,53 +525,113 @@ class ProgressTracker:
             total: Total number of items
             description: Description for progress display
             show_eta: Whether to show estimated time of arrival
+            refresh_interval: Minimum seconds between progress lines
+            window: Seconds of history used for throughput and ETA
+            sink: Optional metrics sink with an emit(stats) method
         """
         self.total = total
         self.description = description
         self.show_eta = show_eta
+        self.refresh_interval = refresh_interval
+        self.window = window
+        self.sink = sink if sink is not None else metrics_sink_from_env()
         self.current = 0
         self.completed = 0
         self.failed = 0
         self.start_time = None
+        self._lock = threading.Lock()
+        self._samples = deque()  # (timestamp, current)
+        self._last_render = None
+        self._last_logged = 0
     
     def start(self):
         """Start the progress tracker."""
-        import time
-        self.start_time = time.time()
-        # Print initial state
-        if self.total:
-            print(f"{self.description}: 0% (0/{self.total}) - Success: 0, Failed: 0")
-        else:
-            print(f"{self.description}: 0 processed - Success: 0, Failed: 0")
+        with self._lock:
+            self.start_time = time.monotonic()
+            self._samples.append((self.start_time, self.current))
+            stats = self._snapshot(self.start_time)
+        self._render(stats)
     
     def update(self, amount: int = 1, success: bool = True):
         """Update progress with amount and success/failure status."""
-        self.current += amount
-        if success:
-            self.completed += amount
-        else:
-            self.failed += amount
-        
-        # Print progress for testing
-        if self.total:
-            percentage = (self.current / self.total) * 100
-            print(f"{self.description}: {percentage:.0f}% ({self.current}/{self.total}) - Success: {self.completed}, Failed: {self.failed}")
+        now = time.monotonic()
+        with self._lock:
+            if self.start_time is None:
+                self.start_time = now
+                self._samples.append((now, 0))
+            previous = self.current
+            self.current += amount
+            if success:
+                self.completed += amount
+            else:
+                self.failed += amount
             
-            # Also log at certain intervals
-            if percentage % 10 == 0 or self.current == self.total:
-                logger.info(
-                    f"{self.description}: {percentage:.0f}% "
-                    f"({self.current}/{self.total}) - "
-                    f"Success: {self.completed}, Failed: {self.failed}"
-                )
-        else:
-            # For unknown total, log every 10 items
-            print(f"{self.description}: {self.current} processed - Success: {self.completed}, Failed: {self.failed}")
-            if self.current % 10 == 0:
-                logger.info(
-                    f"{self.description}: {self.current} processed - "
-                    f"Success: {self.completed}, Failed: {self.failed}"
-                )
+            self._samples.append((now, self.current))
+            while len(self._samples) > 2 and now - self._samples[0][0] > self.window:
+                self._samples.popleft()
+            
+            done = self.total is not None and self.current >= self.total
+            due = self._last_render is None or now - self._last_render >= self.refresh_interval
+            if not (due or done):
+                return
+            self._last_render = now
+            stats = self._snapshot(now)
+            
+            # Log every 10% (or every 10 items without a total)
+            step = self.total / 10 if self.total else 10
+            log = done or int(self.current // step) > int(self._last_logged // step)
+            if log:
+                self._last_logged = self.current
+        
+        self._render(stats)
+        if log:
+            logger.info(self._format(stats))
+    
+    def _rate(self, now: float) -> float:
+        """Items per second over the sliding window (call with the lock held)."""
+        if not self._samples:
+            return 0.0
+        first_time, first_count = self._samples[0]
+        elapsed = now - first_time
+        return (self.current - first_count) / elapsed if elapsed > 0 else 0.0
+    
+    def _snapshot(self, now: float) -> Dict[str, Any]:
+        """Current statistics plus rate and ETA (call with the lock held)."""
+        stats = self.get_stats()
+        rate = self._rate(now)
+        remaining = stats['remaining']
+        stats.update({
+            'description': self.description,
+            'timestamp': time.time(),
+            'elapsed_seconds': round(now - self.start_time, 3) if self.start_time else 0.0,
+            'rate': round(rate, 3),
+            'eta_seconds': round(remaining / rate, 1) if self.total and rate > 0 else None,
+        })
+        return stats
+    
+    def _format(self, stats: Dict[str, Any]) -> str:
+        """Format a snapshot as a progress line."""
+        counts = f"Success: {stats['completed']}, Failed: {stats['failed']}"
+        if not self.total:
+            return f"{self.description}: {stats['processed']} processed - {counts}"
+        
+        percentage = stats['processed'] / self.total * 100
+        line = f"{self.description}: {percentage:.0f}% ({stats['processed']}/{self.total}) - {counts}"
+        if self.show_eta and stats['processed']:
+            line += f" - {stats['rate']:.2f}/s"
+            if stats['eta_seconds'] is not None and stats['remaining']:
+                line += f", ETA {_format_duration(stats['eta_seconds'])}"
+        return line
+    
+    def _render(self, stats: Dict[str, Any]):
+        """Send a snapshot to the sink, or print it."""
+        if self.sink is None:
+            print(self._format(stats), flush=True)
+            return
+        try:
+            self.sink.emit(stats)
+        except Exception as e:
+            logger.warning(f"Progress sink failed: {e}")
     
     def get_stats(self) -> Dict[str, int]:
         """Get current statistics."""
@@ -477,11 +645,17 @@ class ProgressTracker:
     
     def finish(self):
         """Finish the progress tracker."""
-        if self.total:
+        with self._lock:
+            stats = self._snapshot(time.monotonic())
+        stats['finished'] = True
+        if self.sink is None:
             print(f"{self.description}: completed - Success: {self.completed}, Failed: {self.failed}")
         else:
-            print(f"{self.description}: completed - Success: {self.completed}, Failed: {self.failed}")
-        logger.info(f"{self.description} completed - Success: {self.completed}, Failed: {self.failed}")
+            self._render(stats)
+        logger.info(
+            f"{self.description} completed - Success: {self.completed}, Failed: {self.failed} "
+            f"in {_format_duration(stats['elapsed_seconds'])}"
+        )
     
     def __enter__(self):
         """Enter context manager."""
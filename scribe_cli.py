@@ -16,6 +16,13 @@ from scribe.pipeline import Pipeline, PipelineConfig
 from scribe.evaluate import evaluate_file
 from scribe.backup import BackupManager
 from scribe.audit import DatabaseAuditor
+from scribe.retrieval import (
+    RetrievalService, build_vector_index, serve as serve_retrieval,
+    RETRIEVAL_MODES, DEFAULT_LIMIT, DEFAULT_CONTEXT, DEFAULT_INDEX_DIR
+)
+from scribe.instrumentation import (
+    load_metrics, perf_file_path, persist_at_exit, PERCENTILES, PERF_FILE_ENV
+)
 
 # Set up logging
 logging.basicConfig(
@@ -33,7 +40,8 @@ def cli():
     This tool processes audio/video recordings to create research-ready transcripts
     and translations while maintaining the authentic voice of speakers.
     """
-    pass
+    # Accumulate per-stage timings across runs for perf-report
+    persist_at_exit()
 
 
 @cli.command()
@@ -226,7 +234,12 @@ def estimate_srt_cost(srt_file: str, language: str):
 @click.option('--sample', '-s', default=20, help='Number of files to evaluate')
 @click.option('--enhanced', is_flag=True, help='Use enhanced evaluation with sanity checks (especially for Hebrew)')
 @click.option('--model', '-m', default='gpt-4.1', help='OpenAI model to use (default: gpt-4.1)')
-def evaluate(language: str, sample: int, enhanced: bool, model: str):
+@click.option('--workers', '-w', default=4, help='Concurrent evaluation requests')
+@click.option('--chunked', is_flag=True, help='Score sampled chunks across each whole interview')
+@click.option('--chunks', default=8, help='Chunks to sample per interview with --chunked')
+@click.option('--prescreen', is_flag=True, help='Screen locally first; only borderline translations go to the LLM')
+def evaluate(language: str, sample: int, enhanced: bool, model: str, workers: int, chunked: bool, chunks: int,
+             prescreen: bool):
     """Evaluate translation quality for historical accuracy.
     
     LANGUAGE can be: en (English), de (German), or he (Hebrew).
@@ -235,13 +248,25 @@ def evaluate(language: str, sample: int, enhanced: bool, model: str):
     
     Use --enhanced for Hebrew translations to enable sanity checks and
     Hebrew-specific evaluation criteria.
+    
+    Results are cached in the output directory, so unchanged translations
+    are not re-evaluated with the same model.
+    
+    Use --chunked to score a sample of subtitle-aligned chunks spread across
+    each interview, reported with a 95% confidence interval, instead of only
+    the start of the transcript.
+    
+    Use --prescreen to run cheap local checks first: clearly broken
+    translations are scored 0 without an API call and clean ones are
+    skipped, so only borderline translations are sent to the model.
     """
-    pipeline = Pipeline()
+    pipeline = Pipeline(PipelineConfig(evaluation_workers=workers))
     
     enhanced_str = " (Enhanced)" if enhanced else ""
     click.echo(f"Evaluating {sample} {language.upper()} translations{enhanced_str} using {model}...")
     
-    scores = pipeline.evaluate_translations(language, sample_size=sample, enhanced=enhanced, model=model)
+    scores = pipeline.evaluate_translations(language, sample_size=sample, enhanced=enhanced, model=model,
+                                            chunked=chunked, chunks=chunks, prescreen=prescreen)
     
     if not scores:
         click.echo("No translations to evaluate")
@@ -337,32 +362,23 @@ def status(detailed: bool):
         percentage = translated / summary['total_files'] * 100 if summary['total_files'] > 0 else 0
         click.echo(f"  {lang.upper()}: {translated} ({percentage:.1f}%)")
     
-    # Pending work
+    # Pending work (read from the trigger-maintained stage counters; files
+    # that failed overall are not picked up, so they are not counted)
+    stage_counts = summary['stage_counts']
+    pending_counts = summary['pending_counts']
     click.echo("\nPending:")
-    pending_transcription = db.get_pending_files('transcription')
-    click.echo(f"  Transcription: {len(pending_transcription)}")
+    click.echo(f"  Transcription: {pending_counts['transcription']}")
     
     for lang in ['en', 'de', 'he']:
-        pending = db.get_pending_files(f'translation_{lang}')
-        click.echo(f"  {lang.upper()} translation: {len(pending)}")
+        click.echo(f"  {lang.upper()} translation: {pending_counts[f'translation_{lang}']}")
     
     if detailed:
         # Failed files
         click.echo("\nFailed:")
-        failed_query = """
-            SELECT 
-                SUM(CASE WHEN transcription_status = 'failed' THEN 1 ELSE 0 END) as trans_failed,
-                SUM(CASE WHEN translation_en_status = 'failed' THEN 1 ELSE 0 END) as en_failed,
-                SUM(CASE WHEN translation_de_status = 'failed' THEN 1 ELSE 0 END) as de_failed,
-                SUM(CASE WHEN translation_he_status = 'failed' THEN 1 ELSE 0 END) as he_failed
-            FROM processing_status
-        """
-        failed = db.execute_query(failed_query)[0]
-        
-        click.echo(f"  Transcription: {failed['trans_failed'] or 0}")
-        click.echo(f"  EN translation: {failed['en_failed'] or 0}")
-        click.echo(f"  DE translation: {failed['de_failed'] or 0}")
-        click.echo(f"  HE translation: {failed['he_failed'] or 0}")
+        click.echo(f"  Transcription: {stage_counts['transcription'].get('failed', 0)}")
+        for lang in ['en', 'de', 'he']:
+            failed = stage_counts[f'translation_{lang}'].get('failed', 0)
+            click.echo(f"  {lang.upper()} translation: {failed}")
         
         # Quality scores
         click.echo("\nAverage Quality Scores:")
@@ -533,6 +549,58 @@ def version():
             click.echo(f"  {name}: ✗ Not configured")
 
 
+@cli.command('perf-report')
+@click.option('--file', '-f', 'metrics_file', type=click.Path(),
+              help=f'Metrics file (default: ${PERF_FILE_ENV} or perf_metrics.json)')
+@click.option('--json', 'as_json', is_flag=True, help='Output JSON instead of a table')
+@click.option('--reset', is_flag=True, help='Delete the collected metrics after reporting')
+def perf_report(metrics_file: Optional[str], as_json: bool, reset: bool):
+    """Show latency percentiles per pipeline stage and API/DB counters.
+    
+    Metrics from every scribe_cli.py run are accumulated in the metrics file.
+    """
+    path = perf_file_path(metrics_file)
+    metrics = load_metrics(path)
+    rows = metrics.report()
+    
+    if as_json:
+        click.echo(json.dumps({'stages': rows, 'counters': metrics.counters}, indent=2))
+    elif not rows and not metrics.counters:
+        click.echo(f"No performance metrics recorded in {path}")
+    else:
+        click.echo("\n" + "="*86)
+        click.echo("SCRIBE PERFORMANCE REPORT")
+        click.echo("="*86)
+        
+        percentile_headers = ''.join(f"{f'p{p}':>10}" for p in PERCENTILES)
+        click.echo(f"\n{'Stage':<32}{'Count':>8}{percentile_headers}{'Max':>10}{'Total':>12}")
+        click.echo("-"*86)
+        for row in rows:
+            percentiles = ''.join(f"{_format_seconds(row[f'p{p}']):>10}" for p in PERCENTILES)
+            click.echo(
+                f"{row['stage']:<32}{row['count']:>8}{percentiles}"
+                f"{_format_seconds(row['max']):>10}{_format_seconds(row['total']):>12}"
+            )
+        
+        if metrics.counters:
+            click.echo("\nCounters:")
+            for name, value in sorted(metrics.counters.items()):
+                click.echo(f"  {name:<38}{value:>14,.0f}")
+    
+    if reset and path.exists():
+        path.unlink()
+        click.echo(f"\n✓ Reset {path}")
+
+
+def _format_seconds(seconds: float) -> str:
+    """Format a duration for perf-report."""
+    if seconds < 1:
+        return f"{seconds * 1000:.1f}ms"
+    if seconds < 120:
+        return f"{seconds:.2f}s"
+    return f"{seconds / 60:.1f}m"
+
+
 # ============================================================================
 # BACKUP COMMANDS
 # ============================================================================
@@ -548,17 +616,26 @@ def backup():
 
 @backup.command('create')
 @click.option('--quick', '-q', is_flag=True, help='Use quick tar compression for faster backup')
-def backup_create(quick: bool):
+@click.option('--incremental', '-i', is_flag=True,
+              help='Store only new or changed translation files in the shared blob store')
+def backup_create(quick: bool, incremental: bool):
     """Create a backup of the system.
     
     Creates a timestamped backup including database and all translation files.
     Quick mode uses tar compression for faster operation.
+    Incremental mode copies only files whose content is not already backed up;
+    any incremental backup can be restored on its own.
     """
     backup_manager = BackupManager(Path.cwd())
     
+    if incremental:
+        mode = 'incremental'
+    else:
+        mode = 'quick' if quick else 'full'
+    
     try:
-        click.echo(f"Creating {'quick' if quick else 'full'} backup...")
-        backup_dir, manifest = backup_manager.create_backup(quick=quick)
+        click.echo(f"Creating {mode} backup...")
+        backup_dir, manifest = backup_manager.create_backup(quick=quick, incremental=incremental)
         
         # Display results
         click.echo(f"\n✓ Backup completed successfully!")
@@ -573,6 +650,9 @@ def backup_create(quick: bool):
             trans_info = manifest['translations']
             if 'file_count' in trans_info:
                 click.echo(f"Translation files: {trans_info['file_count']}")
+            if 'new_blobs' in trans_info:
+                click.echo(f"New files stored: {trans_info['new_blobs']} "
+                           f"({trans_info['bytes_copied']:,} bytes)")
             if 'archive_size' in trans_info:
                 click.echo(f"Archive size: {trans_info['archive_size']:,} bytes")
             elif 'total_size' in trans_info:
@@ -878,5 +958,83 @@ def db_validate():
         auditor.close()
 
 
+
+@cli.group()
+def retrieval():
+    """Passage retrieval for the viewer's chat assistant.
+    
+    Keyword (bm25) search over subtitle segments, optionally combined with a
+    local vector index.
+    """
+    pass
+
+
+@retrieval.command('search')
+@click.argument('query')
+@click.option('--lang', '-l', help="Restrict to one language ('orig', 'en', 'de', 'he', ...)")
+@click.option('--limit', '-n', default=DEFAULT_LIMIT, help='Maximum number of hits')
+@click.option('--mode', '-m', type=click.Choice(RETRIEVAL_MODES), default='hybrid',
+              help='Ranking to use (default: hybrid)')
+@click.option('--context', '-c', default=DEFAULT_CONTEXT,
+              help='Neighbouring segments included on each side of a hit')
+@click.option('--index-dir', default=DEFAULT_INDEX_DIR, help='Vector index directory')
+@click.option('--json', 'as_json', is_flag=True, help='Print passages as JSON')
+def retrieval_search(query: str, lang: Optional[str], limit: int, mode: str,
+                     context: int, index_dir: str, as_json: bool):
+    """Find time-coded passages for QUERY."""
+    try:
+        service = RetrievalService(index_dir=index_dir)
+        passages = service.search(query, lang=lang, limit=limit, mode=mode, context=context)
+    except (ValueError, ImportError) as e:
+        click.echo(f"✗ {e}", err=True)
+        raise click.Abort()
+    
+    if as_json:
+        click.echo(json.dumps([p.to_dict() for p in passages], ensure_ascii=False))
+        return
+    
+    if not passages:
+        click.echo("No passages found")
+        return
+    
+    for i, passage in enumerate(passages, 1):
+        minutes, seconds = divmod(int(passage.start_time), 60)
+        click.echo(f"\n{i}. {passage.interview_id} [{passage.lang}] {minutes}:{seconds:02d} "
+                   f"(score {passage.score:.4f})")
+        click.echo(f"   {passage.text[:300]}")
+
+
+@retrieval.command('build-vectors')
+@click.option('--index-dir', default=DEFAULT_INDEX_DIR, help='Vector index directory')
+@click.option('--nlist', type=int, help='IVF lists (default: automatic, 0 for brute force)')
+def retrieval_build_vectors(index_dir: str, nlist: Optional[int]):
+    """Embed all segments into a local vector index (requires NumPy)."""
+    try:
+        meta = build_vector_index(Database(), index_dir, nlist=nlist)
+    except ImportError as e:
+        click.echo(f"✗ {e}", err=True)
+        raise click.Abort()
+    
+    click.echo(f"✓ Indexed {meta['count']:,} segment texts in {meta['build_seconds']}s")
+    click.echo(f"  Embedder: {meta['embedder']}")
+    click.echo(f"  Search: {'IVF, ' + str(meta['nlist']) + ' lists' if meta['nlist'] else 'brute force'}")
+    click.echo(f"  Location: {index_dir}")
+
+
+@retrieval.command('serve')
+@click.option('--host', default='127.0.0.1', help='Interface to bind (default: 127.0.0.1)')
+@click.option('--port', '-p', default=8765, help='Port (default: 8765)')
+@click.option('--index-dir', default=DEFAULT_INDEX_DIR, help='Vector index directory')
+def retrieval_serve(host: str, port: int, index_dir: str):
+    """Serve retrieval over HTTP for the viewer (GET /search?q=...).
+    
+    Point the viewer at it with SCRIBE_RETRIEVAL_URL=http://HOST:PORT.
+    """
+    service = RetrievalService(index_dir=index_dir)
+    click.echo(f"Serving on http://{host}:{port} "
+               f"({'hybrid' if service.vector_index else 'bm25 only'})")
+    serve_retrieval(service, host, port)
+
+
 if __name__ == '__main__':
     cli()
@@ -261,7 +261,8 @@ class SubtitleReprocessor:
                     target_language=target_lang,
                     preserve_original_when_matching=True,  # This is the key fix!
                     batch_size=100,
-                    estimate_only=False
+                    estimate_only=False,
+                    detect_cache_dir=self.backup_dir / 'cache' / 'detect'
                 )
                 
                 if success:
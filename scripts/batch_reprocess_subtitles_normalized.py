@@ -333,7 +333,8 @@ class SubtitleReprocessor:
                     preserve_original_when_matching=True,  # This is the key fix!
                     batch_size=100,
                     detect_batch_size=self.detect_batch_size,
-                    estimate_only=False
+                    estimate_only=False,
+                    detect_cache_dir=self.backup_dir / 'cache' / 'detect'
                 )
                 
                 if success:
@@ -8,12 +8,19 @@ clean transcript text with timestamp information for use in the chat system.
 
 import os
 import re
+import sys
 import json
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 import argparse
 from dataclasses import dataclass
 
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from scribe.srt import parse_srt_file
+
 
 @dataclass
 class TranscriptCue:
@@ -56,29 +63,6 @@ class SRTProcessor:
         self.error_count = 0
         self.errors = []
 
-    def parse_timestamp(self, timestamp: str) -> float:
-        """Convert SRT timestamp to seconds.
-        
-        Args:
-            timestamp: SRT timestamp format (HH:MM:SS,mmm)
-            
-        Returns:
-            Time in seconds as float
-        """
-        try:
-            # Replace comma with dot for milliseconds
-            timestamp = timestamp.replace(',', '.')
-            
-            # Parse HH:MM:SS.mmm
-            time_parts = timestamp.split(':')
-            hours = int(time_parts[0])
-            minutes = int(time_parts[1])
-            seconds = float(time_parts[2])
-            
-            return hours * 3600 + minutes * 60 + seconds
-        except (ValueError, IndexError) as e:
-            raise ValueError(f"Invalid timestamp format: {timestamp}") from e
-
     def clean_text(self, text: str) -> str:
         """Clean SRT text content.
         
@@ -109,7 +93,6 @@ class SRTProcessor:
             InterviewTranscript object
             
         Raises:
-            ValueError: If file format is invalid
             FileNotFoundError: If file doesn't exist
         """
         if not srt_path.exists():
@@ -118,56 +101,16 @@ class SRTProcessor:
         cues = []
         full_text_parts = []
         
-        try:
-            with open(srt_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-        except UnicodeDecodeError:
-            # Try with different encoding
-            with open(srt_path, 'r', encoding='latin-1') as f:
-                content = f.read()
-
-        # Split into subtitle blocks
-        blocks = re.split(r'\n\s*\n', content.strip())
-        
-        for block in blocks:
-            if not block.strip():
-                continue
-                
-            lines = block.strip().split('\n')
-            if len(lines) < 3:
-                continue  # Skip malformed blocks
+        for cue in parse_srt_file(srt_path):
+            clean_text = self.clean_text(cue.text)
             
-            try:
-                # Parse subtitle number (line 0)
-                subtitle_num = int(lines[0].strip())
-                
-                # Parse timestamp (line 1)
-                timestamp_line = lines[1].strip()
-                timestamp_match = re.match(r'(\d{2}:\d{2}:\d{2},\d{3})\s*-->\s*(\d{2}:\d{2}:\d{2},\d{3})', timestamp_line)
-                
-                if not timestamp_match:
-                    continue  # Skip malformed timestamp
-                
-                start_time = self.parse_timestamp(timestamp_match.group(1))
-                end_time = self.parse_timestamp(timestamp_match.group(2))
-                
-                # Extract text (lines 2+)
-                text_lines = lines[2:]
-                raw_text = ' '.join(text_lines)
-                clean_text = self.clean_text(raw_text)
-                
-                if clean_text:  # Only add non-empty cues
-                    cues.append(TranscriptCue(
-                        start=start_time,
-                        end=end_time,
-                        text=clean_text
-                    ))
-                    full_text_parts.append(clean_text)
-                    
-            except (ValueError, IndexError) as e:
-                # Log error but continue processing
-                self.errors.append(f"Error parsing block in {srt_path}: {e}")
-                continue
+            if clean_text:  # Only add non-empty cues
+                cues.append(TranscriptCue(
+                    start=cue.start,
+                    end=cue.end,
+                    text=clean_text
+                ))
+                full_text_parts.append(clean_text)
 
         # Create full text
         full_text = ' '.join(full_text_parts)
@@ -297,6 +297,55 @@ class TestDatabaseAuditor(unittest.TestCase):
         
         self.assertEqual(metadata.status, FileStatus.PLACEHOLDER)
         self.assertFalse(metadata.has_hebrew)
+
+    @patch('scribe.audit.READ_BUFFER_SIZE', 16)
+    def test_analyze_file_streams_in_chunks(self):
+        """Test placeholder and Hebrew detection across read chunk boundaries."""
+        import hashlib
+        
+        file_path = self.output_dir / "test-chunked.txt"
+        content = "Some English text [HEBREW TRANSLATION] and then עברי at the end"
+        file_path.write_text(content, encoding='utf-8')
+        
+        metadata = self.auditor.analyze_file(file_path, "test-chunked", "he")
+        
+        self.assertTrue(metadata.has_placeholder)
+        self.assertTrue(metadata.has_hebrew)
+        self.assertEqual(metadata.status, FileStatus.PLACEHOLDER)
+        self.assertEqual(metadata.checksum, hashlib.sha256(content.encode('utf-8')).hexdigest())
+        self.assertEqual(metadata.content_preview, content)
+        
+    def test_audit_uses_cache_for_unchanged_files(self):
+        """Test that a repeated audit only re-analyzes changed files."""
+        from scribe.database import Database
+        
+        self.auditor.db.close()
+        self.auditor.db = Database(self.test_path / "audit.db")
+        file_ids = []
+        for i in range(3):
+            file_id = self.auditor.db.add_file(f"/media/audit{i}.mp4", f"audit{i}.mp4")
+            self.auditor.db.update_status(file_id, translation_he_status='completed')
+            file_dir = self.output_dir / file_id
+            file_dir.mkdir()
+            (file_dir / f"{file_id}.he.txt").write_text(f"תרגום {i}", encoding='utf-8')
+            file_ids.append(file_id)
+        
+        first = self.auditor.audit_database()
+        self.assertEqual(first.language_stats['he']['valid'], 3)
+        self.assertTrue(self.auditor.cache_path.exists())
+        
+        # Replace one translation with a placeholder
+        (self.output_dir / file_ids[0] / f"{file_ids[0]}.he.txt").write_text("[HEBREW TRANSLATION]")
+        
+        with patch.object(self.auditor, 'analyze_file', wraps=self.auditor.analyze_file) as analyze:
+            second = self.auditor.audit_database()
+        
+        # Only the edited file and the missing en/de files are analyzed again
+        analyzed = [c.args[0].name for c in analyze.call_args_list if c.args[0].exists()]
+        self.assertEqual(analyzed, [f"{file_ids[0]}.he.txt"])
+        self.assertEqual(second.language_stats['he']['valid'], 2)
+        self.assertEqual(second.language_stats['he']['placeholder'], 1)
+        self.assertEqual(second.issues_by_type['placeholder_file'][0]['file_id'], file_ids[0])
     
     @patch('scribe.audit.Database')
     def test_get_all_files(self, mock_db_class):
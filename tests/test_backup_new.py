@@ -148,6 +148,97 @@ class TestBackupManager(unittest.TestCase):
             self.assertEqual(result, expected_db_info)
             mock_backup_db.assert_called_once_with(backup_dir)
     
+    @patch('scribe.backup.BACKUP_PAGES_PER_STEP', 1)
+    def test_backup_database_while_writing(self):
+        """Test online database backup while another connection writes."""
+        import threading
+        
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.executemany(
+            "INSERT INTO media_files (id, filename) VALUES (?, ?)",
+            [(f"bulk-{i}", "x" * 500) for i in range(500)]
+        )
+        conn.commit()
+        conn.close()
+        
+        backup_dir = self.test_root / "test_backup"
+        backup_dir.mkdir()
+        stop = threading.Event()
+        
+        def writer():
+            writer_conn = sqlite3.connect(self.db_path, timeout=30.0)
+            i = 0
+            while not stop.is_set() and i < 200:
+                writer_conn.execute(
+                    "INSERT INTO media_files (id, filename) VALUES (?, ?)",
+                    (f"live-{i}", "live.mp4")
+                )
+                writer_conn.commit()
+                i += 1
+            writer_conn.close()
+        
+        thread = threading.Thread(target=writer)
+        thread.start()
+        try:
+            result = self.backup_manager._backup_database(backup_dir)
+        finally:
+            stop.set()
+            thread.join()
+        
+        backup_path = Path(result["backup_path"])
+        self.assertEqual(result["method"], "sqlite_backup_api")
+        self.assertGreater(result["pages"], 0)
+        self.assertEqual(result["checksum"],
+                         self.backup_manager.calculate_file_checksum(backup_path))
+        
+        backup_conn = sqlite3.connect(backup_path)
+        try:
+            self.assertEqual(backup_conn.execute("PRAGMA integrity_check").fetchone()[0], "ok")
+            count = backup_conn.execute("SELECT COUNT(*) FROM media_files").fetchone()[0]
+        finally:
+            backup_conn.close()
+        self.assertGreaterEqual(count, 502)
+    
+    @patch('scribe.backup.logger')
+    def test_incremental_backup_and_restore(self, mock_logger):
+        """Test incremental backups copy only new content and restore any snapshot."""
+        first_dir, first_manifest = self.backup_manager.create_backup(incremental=True)
+        first_info = first_manifest["translations"]
+        
+        self.assertEqual(first_manifest["backup_type"], "incremental")
+        self.assertEqual(first_info["file_count"], 12)
+        self.assertEqual(first_info["new_blobs"], 12)
+        self.assertTrue((first_dir / "files.json").exists())
+        
+        # One edited file and one copy of existing content
+        (self.output_dir / "item_0" / "transcription_en.txt").write_text("Edited English text")
+        (self.output_dir / "item_3").mkdir()
+        (self.output_dir / "item_3" / "transcription_original.txt").write_text("Original text 1")
+        
+        second_dir, second_manifest = self.backup_manager.create_backup(incremental=True)
+        second_info = second_manifest["translations"]
+        
+        self.assertNotEqual(first_dir, second_dir)
+        self.assertEqual(second_info["file_count"], 13)
+        self.assertEqual(second_info["hashed_files"], 2)
+        self.assertEqual(second_info["new_blobs"], 1)
+        self.assertEqual(len(list(self.backup_manager.blobs_dir.glob("??/*"))), 13)
+        
+        # The blob store is not reported as a backup
+        backup_ids = [b["id"] for b in self.backup_manager.list_backups()]
+        self.assertNotIn("blobs", backup_ids)
+        
+        result = self.backup_manager.restore_backup(first_dir.name)
+        
+        self.assertTrue(result["success"])
+        self.assertEqual(
+            (self.output_dir / "item_0" / "transcription_en.txt").read_text(),
+            "English text 0"
+        )
+        self.assertFalse((self.output_dir / "item_3").exists())
+        self.assertEqual(sum(1 for p in self.output_dir.rglob("*") if p.is_file()), 12)
+    
     @patch('scribe.backup.logger')
     def test_backup_translations_full_success(self, mock_logger):
         """Test successful full translation backup."""
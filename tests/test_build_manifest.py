@@ -0,0 +1,198 @@
+"""
+Tests for the incremental manifest build of the viewer.
+
+Tests cover:
+- Source fingerprints and the reuse of unchanged interviews
+- Rebuilds on changed sources or media paths
+- Loading the previous build
+- State written by a full run of main()
+"""
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scribe-viewer" / "scripts"))
+
+import build_manifest
+from build_manifest import (
+    STATE_FILENAME, load_previous_build, refresh_interview, source_fingerprints
+)
+
+
+@pytest.fixture
+def project(temp_dir, monkeypatch):
+    """Project tree with one interview and process_interview stubbed out."""
+    interview_dir = temp_dir / "output" / "int-1"
+    interview_dir.mkdir(parents=True)
+    (interview_dir / "int-1.orig.srt").write_text("1\n00:00:00,000 --> 00:00:01,000\nHallo\n")
+    (interview_dir / "int-1.en.txt").write_text("Hello")
+    
+    calls = []
+    
+    def fake_process(file_record, project_root, reuse_vtt=True):
+        calls.append(file_record['file_id'])
+        return {'id': file_record['file_id']}
+    
+    monkeypatch.setattr(build_manifest, 'process_interview', fake_process)
+    return temp_dir, interview_dir, calls
+
+
+@pytest.mark.unit
+class TestSourceFingerprints:
+    """Test fingerprinting of interview sources."""
+    
+    def test_fingerprints_existing_sources(self, project):
+        """Only SRT/TXT files that exist are fingerprinted."""
+        _, interview_dir, _ = project
+        
+        fingerprints = source_fingerprints(interview_dir, "int-1", {})
+        
+        assert set(fingerprints) == {"int-1.orig.srt", "int-1.en.txt"}
+        assert fingerprints["int-1.en.txt"]['sha256'] == build_manifest.file_sha256(interview_dir / "int-1.en.txt")
+    
+    def test_unchanged_stat_keeps_previous_hash(self, project):
+        """A file with the same size and mtime is not rehashed."""
+        _, interview_dir, _ = project
+        previous = source_fingerprints(interview_dir, "int-1", {})
+        previous["int-1.en.txt"]['sha256'] = "cached"
+        
+        fingerprints = source_fingerprints(interview_dir, "int-1", previous)
+        
+        assert fingerprints["int-1.en.txt"]['sha256'] == "cached"
+
+
+@pytest.mark.unit
+class TestRefreshInterview:
+    """Test the rebuild decision for one interview."""
+    
+    def test_unchanged_sources_are_reused(self, project):
+        """An interview whose sources and media path match is not rebuilt."""
+        root, _, calls = project
+        record = {'file_id': "int-1", 'original_path': "/media/int-1.mp4"}
+        state, entry, rebuilt = refresh_interview(record, root, None)
+        
+        state, entry, rebuilt = refresh_interview(record, root, state)
+        
+        assert (entry, rebuilt) == (None, False)
+        assert calls == ["int-1"]
+    
+    def test_changed_hash_triggers_rebuild(self, project):
+        """Edited sources are reconverted."""
+        root, interview_dir, calls = project
+        record = {'file_id': "int-1", 'original_path': "/media/int-1.mp4"}
+        state, _, _ = refresh_interview(record, root, None)
+        srt_path = interview_dir / "int-1.orig.srt"
+        srt_path.write_text("1\n00:00:00,000 --> 00:00:01,000\nHello\n")
+        # Same size, older mtime: only the hash tells the files apart
+        state['sources']["int-1.orig.srt"]['mtime_ns'] -= 1
+        
+        _, entry, rebuilt = refresh_interview(record, root, state)
+        
+        assert rebuilt
+        assert entry == {'id': "int-1"}
+        assert len(calls) == 2
+    
+    def test_new_source_triggers_rebuild(self, project):
+        """A newly added translation is picked up."""
+        root, interview_dir, calls = project
+        record = {'file_id': "int-1", 'original_path': "/media/int-1.mp4"}
+        state, _, _ = refresh_interview(record, root, None)
+        (interview_dir / "int-1.de.srt").write_text("1\n00:00:00,000 --> 00:00:01,000\nHallo\n")
+        
+        _, _, rebuilt = refresh_interview(record, root, state)
+        
+        assert rebuilt
+    
+    def test_changed_original_path_triggers_rebuild(self, project):
+        """Moving the media file rebuilds the entry and its symlinks."""
+        root, _, calls = project
+        record = {'file_id': "int-1", 'original_path': "/media/int-1.mp4"}
+        state, _, _ = refresh_interview(record, root, None)
+        
+        moved = dict(record, original_path="/archive/int-1.mp4")
+        new_state, _, rebuilt = refresh_interview(moved, root, state)
+        
+        assert rebuilt
+        assert new_state['original_path'] == "/archive/int-1.mp4"
+        assert len(calls) == 2
+
+
+@pytest.mark.unit
+class TestLoadPreviousBuild:
+    """Test loading the manifest and state of the last run."""
+    
+    def test_loads_entries_and_state(self, temp_dir):
+        """Entries are keyed by id and state is returned as written."""
+        manifest_path = temp_dir / "manifest.json"
+        state_path = temp_dir / STATE_FILENAME
+        manifest_path.write_text(json.dumps([{'id': "int-1"}]))
+        state_path.write_text(json.dumps({"int-1": {'original_path': "x", 'sources': {}}}))
+        
+        entries, state = load_previous_build(str(manifest_path), str(state_path))
+        
+        assert entries == {"int-1": {'id': "int-1"}}
+        assert state["int-1"]['original_path'] == "x"
+    
+    def test_missing_files_force_full_rebuild(self, temp_dir):
+        """Without a previous build everything is rebuilt."""
+        assert load_previous_build(str(temp_dir / "manifest.json"),
+                                   str(temp_dir / STATE_FILENAME)) == ({}, {})
+    
+    def test_unreadable_state_forces_full_rebuild(self, temp_dir):
+        """A corrupt state file discards the previous manifest too."""
+        manifest_path = temp_dir / "manifest.json"
+        state_path = temp_dir / STATE_FILENAME
+        manifest_path.write_text(json.dumps([{'id': "int-1"}]))
+        state_path.write_text('{"int-1": ')
+        
+        assert load_previous_build(str(manifest_path), str(state_path)) == ({}, {})
+
+
+class FakeDatabase:
+    """Stands in for Database with a fixed list of file records."""
+    
+    def __init__(self, records):
+        self.records = records
+    
+    def get_summary(self):
+        return {'total_files': len(self.records)}
+    
+    def iter_files(self):
+        yield from self.records
+    
+    def close(self):
+        pass
+
+
+@pytest.mark.unit
+class TestMainState:
+    """Test the state file written by main()."""
+    
+    def test_failed_interview_gets_no_state(self, temp_dir, monkeypatch):
+        """Interviews that fail are left out of the state so the next run retries them."""
+        records = [
+            {'file_id': "ok", 'original_path': "/media/ok.mp4"},
+            {'file_id': "failed", 'original_path': "/media/failed.mp4"},
+        ]
+        
+        def fake_refresh(file_record, project_root, previous_state, reuse_vtt=True):
+            state = {'original_path': file_record['original_path'], 'sources': {}}
+            if file_record['file_id'] == "failed":
+                return state, None, True
+            return state, {'id': "ok", 'metadata': {'interviewee': "A"}, 'assets': {}}, True
+        
+        monkeypatch.chdir(temp_dir)
+        monkeypatch.setattr(build_manifest, 'Database', lambda: FakeDatabase(records))
+        monkeypatch.setattr(build_manifest, 'refresh_interview', fake_refresh)
+        
+        build_manifest.main(['--incremental', '--workers', '1',
+                             '--shard-format', 'none', '--search-index', 'none'])
+        
+        state_path = temp_dir / "scribe-viewer" / STATE_FILENAME
+        state = json.loads(state_path.read_text())
+        assert set(state) == {"ok"}
+        assert not Path(str(state_path) + '.tmp').exists()
+        manifest = json.loads((temp_dir / "scribe-viewer" / "public" / "manifest.json").read_text())
+        assert [entry['id'] for entry in manifest] == ["ok"]
@@ -20,7 +20,7 @@ from unittest.mock import Mock, patch, MagicMock
 import tempfile
 import shutil
 
-from scribe.database import Database
+from scribe.database import Database, SEARCH_SLOTS
 
 
 class TestDatabaseInitialization:
@@ -108,14 +108,11 @@ class TestDatabaseInitialization:
         cursor.execute("SELECT name FROM sqlite_master WHERE type='index' AND tbl_name='subtitle_segments'")
         segment_indexes = {row[0] for row in cursor.fetchall()}
         expected_segment_indexes = {
-            'idx_subtitle_segments_interview_id',
+            'sqlite_autoindex_subtitle_segments_1',
             'idx_subtitle_segments_timing',
-            'idx_subtitle_segments_search',
-            'idx_subtitle_segments_original_text',
-            'idx_subtitle_segments_english_text',
-            'idx_subtitle_segments_german_text'
+            'idx_subtitle_segments_duration'
         }
-        assert expected_segment_indexes.issubset(segment_indexes)
+        assert segment_indexes == expected_segment_indexes
         
         # Check views exist
         cursor.execute("SELECT name FROM sqlite_master WHERE type='view'")
@@ -126,6 +123,32 @@ class TestDatabaseInitialization:
         conn.close()
         db.close()
     
+    @pytest.mark.unit
+    @pytest.mark.database
+    def test_redundant_segment_indexes_dropped_on_open(self, temp_dir):
+        """Test that databases created with the original index set are cleaned up."""
+        db_path = temp_dir / "test.db"
+        db = Database(db_path)
+        db._migrate_to_subtitle_segments()
+        db.close()
+        
+        conn = sqlite3.connect(str(db_path))
+        conn.execute("CREATE INDEX idx_subtitle_segments_interview_id ON subtitle_segments(interview_id)")
+        conn.execute("CREATE INDEX idx_subtitle_segments_english_text ON subtitle_segments(english_text)")
+        conn.commit()
+        conn.close()
+        
+        db = Database(db_path)
+        indexes = {
+            row['name'] for row in db.execute_query(
+                "SELECT name FROM sqlite_master WHERE type='index' AND tbl_name='subtitle_segments'"
+            )
+        }
+        assert 'idx_subtitle_segments_interview_id' not in indexes
+        assert 'idx_subtitle_segments_english_text' not in indexes
+        assert 'idx_subtitle_segments_timing' in indexes
+        db.close()
+    
     @pytest.mark.unit
     @pytest.mark.database
     def test_subtitle_segments_constraints(self, temp_dir):
@@ -716,6 +739,28 @@ class TestErrorLogging:
         assert all_errors[2]['error_message'] == "Error 0"
         
         db.close()
+    
+    @pytest.mark.unit
+    @pytest.mark.database
+    def test_add_quality_evaluations(self, temp_dir):
+        """Test bulk insertion of quality evaluations."""
+        db = Database(temp_dir / "test.db")
+        
+        inserted = db.add_quality_evaluations([
+            (f"file-{i}", "en", "gpt-4", 8.0 + i, "[]", "", datetime.now())
+            for i in range(3)
+        ])
+        
+        assert inserted == 3
+        assert db.add_quality_evaluations([]) == 0
+        rows = db.execute_query(
+            "SELECT file_id, score FROM quality_evaluations WHERE language = 'en' ORDER BY eval_id"
+        )
+        assert [(r['file_id'], r['score']) for r in rows] == [
+            ("file-0", 8.0), ("file-1", 9.0), ("file-2", 10.0)
+        ]
+        
+        db.close()
 
 
 class TestSummaryStatistics:
@@ -1046,6 +1091,36 @@ class TestSubtitleSegments:
         
         db.close()
     
+    @pytest.mark.unit
+    @pytest.mark.database
+    def test_segment_overlap_and_seek(self, temp_dir):
+        """Test overlap queries and point lookups, including overlapping cues."""
+        db = Database(temp_dir / "test.db")
+        db._migrate_to_subtitle_segments()
+        interview_id = db.add_file("/test/a.mp4", "a_mp4", media_type="video")
+        
+        db.add_subtitle_segment(interview_id, 1, 0.0, 2.0, "First")
+        db.add_subtitle_segment(interview_id, 2, 2.5, 4.0, "Second")
+        db.add_subtitle_segment(interview_id, 3, 4.0, 20.0, "Long")
+        db.add_subtitle_segment(interview_id, 4, 6.0, 8.0, "Inside long")
+        
+        overlapping = db.get_segments_overlapping(interview_id, 1.5, 6.5)
+        assert [s['original_text'] for s in overlapping] == [
+            "First", "Second", "Long", "Inside long"
+        ]
+        # Partly overlapping cues are included, touching ones are not
+        assert [s['segment_index'] for s in db.get_segments_overlapping(interview_id, 9.0, 10.0)] == [3]
+        assert db.get_segments_overlapping(interview_id, 2.0, 2.5) == []
+        
+        assert db.segment_at(interview_id, 0.0)['segment_index'] == 1
+        assert db.segment_at(interview_id, 2.2) is None
+        assert db.segment_at(interview_id, 4.0)['segment_index'] == 3
+        assert db.segment_at(interview_id, 7.0)['segment_index'] == 4
+        assert db.segment_at(interview_id, 19.9)['segment_index'] == 3
+        assert db.segment_at("missing", 1.0) is None
+        
+        db.close()
+
     @pytest.mark.unit
     @pytest.mark.database
     def test_update_subtitle_segment_translations(self, temp_dir):
@@ -1459,4 +1534,483 @@ class TestEdgeCases:
         assert summary['total_files'] == 0
         assert summary['error_count'] == 0
         
-        db.close()
\ No newline at end of file
+        db.close()
+
+class TestNormalizedStatus:
+    """Test normalized file_stage_status and segment_translations tables."""
+    
+    @pytest.mark.unit
+    @pytest.mark.database
+    def test_stage_status_mirrors_wide_columns(self, temp_dir):
+        """Test that processing_status writes are mirrored by trigger."""
+        db = Database(temp_dir / "test.db")
+        file_id = db.add_file("/test/a.mp4", "a_mp4", media_type="video")
+        
+        assert db.get_stage_statuses(file_id) == {
+            'transcription': 'not_started',
+            'translation_en': 'not_started',
+            'translation_de': 'not_started',
+            'translation_he': 'not_started',
+        }
+        
+        db.update_status(file_id, transcription_status='completed')
+        db.set_stage_status(file_id, 'translation', 'failed', lang='he')
+        
+        statuses = db.get_stage_statuses(file_id)
+        assert statuses['transcription'] == 'completed'
+        assert statuses['translation_he'] == 'failed'
+        
+        # Compatibility view exposes the old column names
+        row = db.execute_query(
+            "SELECT * FROM processing_stage_columns WHERE file_id = ?", (file_id,)
+        )[0]
+        assert row['transcription_status'] == 'completed'
+        assert row['translation_he_status'] == 'failed'
+        
+        db.close()
+    
+    @pytest.mark.unit
+    @pytest.mark.database
+    def test_new_language_without_schema_change(self, temp_dir):
+        """Test that a language without a wide column can be tracked."""
+        db = Database(temp_dir / "test.db")
+        db._migrate_to_subtitle_segments()
+        file_id = db.add_file("/test/a.mp4", "a_mp4", media_type="video")
+        
+        assert db.set_stage_status(file_id, 'translation', 'in-progress', lang='fr')
+        assert db.get_stage_statuses(file_id)['translation_fr'] == 'in-progress'
+        assert db.get_stage_counts()['translation_fr'] == {'in-progress': 1}
+        assert db.get_pending_files('translation_fr') == []
+        
+        segment_id = db.add_subtitle_segment(file_id, 1, 0.0, 2.0, "Hallo")
+        assert [s['id'] for s in db.get_segments_for_translation(file_id, 'fr')] == [segment_id]
+        
+        assert db.set_segment_translation(segment_id, 'fr', "Bonjour", provider='deepl')
+        assert db.get_segments_for_translation(file_id, 'fr') == []
+        assert db.get_segment_translations(file_id, 'fr') == [{
+            'segment_id': segment_id, 'segment_index': 1,
+            'text': "Bonjour", 'provider': 'deepl'
+        }]
+        
+        status = db.get_segment_translation_status(file_id)
+        assert status['fr'] == {'translated': 1, 'pending': 0}
+        assert status['en'] == {'translated': 0, 'pending': 1}
+        
+        db.close()
+    
+    @pytest.mark.unit
+    @pytest.mark.database
+    def test_segment_translations_mirror_wide_columns(self, temp_dir):
+        """Test that wide text columns are mirrored into segment_translations."""
+        db = Database(temp_dir / "test.db")
+        db._migrate_to_subtitle_segments()
+        file_id = db.add_file("/test/a.mp4", "a_mp4", media_type="video")
+        
+        segment_id = db.add_subtitle_segment(
+            file_id, 1, 0.0, 2.0, "Hallo", english_text="Hello"
+        )
+        db.update_subtitle_segment_translations(segment_id, hebrew_text="שלום")
+        
+        translations = db.execute_query(
+            "SELECT lang, text FROM segment_translations WHERE segment_id = ? ORDER BY lang",
+            (segment_id,)
+        )
+        assert translations == [
+            {'lang': 'en', 'text': "Hello"},
+            {'lang': 'he', 'text': "שלום"},
+        ]
+        
+        # Clearing a wide column removes the normalized row
+        conn = db._get_connection()
+        conn.execute("UPDATE subtitle_segments SET english_text = NULL WHERE id = ?", (segment_id,))
+        conn.commit()
+        assert db.get_segment_translation_status(file_id)['en']['translated'] == 0
+        
+        row = db.execute_query(
+            "SELECT * FROM segment_translation_columns WHERE segment_id = ?", (segment_id,)
+        )[0]
+        assert row['hebrew_text'] == "שלום"
+        assert row['english_text'] is None
+        
+        db.close()
+    
+    @pytest.mark.unit
+    @pytest.mark.database
+    def test_migration_backfills_existing_rows(self, temp_dir):
+        """Test that the migration backfills databases created before it existed."""
+        db_path = temp_dir / "test.db"
+        db = Database(db_path)
+        db._migrate_to_subtitle_segments()
+        file_id = db.add_file("/test/a.mp4", "a_mp4", media_type="video")
+        db.add_subtitle_segment(file_id, 1, 0.0, 2.0, "Hallo", german_text="Hallo")
+        db.update_status(file_id, translation_de_status='completed')
+        db.close()
+        
+        # Simulate a pre-migration database
+        conn = sqlite3.connect(str(db_path))
+        conn.execute("DROP VIEW processing_stage_columns")
+        conn.execute("DROP VIEW segment_translation_columns")
+        conn.execute("DROP TABLE file_stage_status")
+        conn.execute("DROP TABLE segment_translations")
+        conn.commit()
+        conn.close()
+        
+        db = Database(db_path)
+        assert db.get_stage_statuses(file_id)['translation_de'] == 'completed'
+        assert db.get_segment_translation_status(file_id)['de']['translated'] == 1
+        db.close()
+
+
+class TestStatusCounters:
+    """Test trigger-maintained counter tables against full-table aggregates."""
+    
+    @staticmethod
+    def _expected_stage_counts(db):
+        expected = {}
+        for row in db.execute_query("""
+            SELECT stage, lang, status, COUNT(*) as count
+            FROM file_stage_status GROUP BY stage, lang, status
+        """):
+            stage = f"{row['stage']}_{row['lang']}" if row['lang'] else row['stage']
+            expected.setdefault(stage, {})[row['status']] = row['count']
+        return expected
+    
+    @pytest.mark.unit
+    @pytest.mark.database
+    def test_summary_counters_track_writes(self, temp_dir):
+        """Test that get_summary matches GROUP BY results after mixed writes."""
+        db = Database(temp_dir / "test.db")
+        file_ids = [
+            db.add_file(f"/test/{i}.mp4", f"{i}_mp4", media_type="video")
+            for i in range(6)
+        ]
+        db.update_status(file_ids[0], status='completed', transcription_status='completed')
+        db.update_status(file_ids[1], status='failed', translation_en_status='failed')
+        db.update_status(file_ids[2], status='in-progress', translation_de_status='in-progress')
+        db.update_status(file_ids[2], translation_de_status='completed')
+        db.set_stage_status(file_ids[3], 'translation', 'completed', lang='fr')
+        db.log_error(file_ids[1], 'translation_en', 'boom')
+        
+        conn = db._get_connection()
+        conn.execute("DELETE FROM processing_status WHERE file_id = ?", (file_ids[5],))
+        conn.execute("DELETE FROM media_files WHERE file_id = ?", (file_ids[5],))
+        conn.commit()
+        
+        summary = db.get_summary()
+        assert summary['total_files'] == 5
+        assert summary['error_count'] == 1
+        assert summary['status_counts'] == {
+            'pending': 2, 'completed': 1, 'failed': 1, 'in-progress': 1
+        }
+        assert summary['transcribed'] == 1
+        assert summary['de_translated'] == 1
+        
+        expected = self._expected_stage_counts(db)
+        for stage, counts in db.get_stage_counts().items():
+            assert counts == expected.get(stage, {})
+        
+        db.close()
+    
+    @pytest.mark.unit
+    @pytest.mark.database
+    def test_pending_counts_skip_failed_files(self, temp_dir):
+        """Test that pending counts match get_pending_files as files fail and recover."""
+        db = Database(temp_dir / "test.db")
+        file_ids = [
+            db.add_file(f"/test/{i}.mp4", f"{i}_mp4", media_type="video")
+            for i in range(5)
+        ]
+        stages = ['transcription', 'translation_en', 'translation_de', 'translation_he']
+        
+        def assert_matches_pending_files():
+            pending_counts = db.get_summary()['pending_counts']
+            for stage in stages:
+                assert pending_counts[stage] == len(db.get_pending_files(stage)), stage
+        
+        db.update_status(file_ids[0], status='failed')
+        assert db.get_summary()['pending_counts']['translation_en'] == 4
+        assert_matches_pending_files()
+        
+        # Overall and stage status changed in one UPDATE
+        db.update_status(file_ids[1], status='failed', translation_en_status='failed')
+        db.update_status(file_ids[2], status='completed', transcription_status='completed')
+        assert_matches_pending_files()
+        
+        # Stage changes on a failed file, then recovery
+        db.update_status(file_ids[0], translation_de_status='completed')
+        db.update_status(file_ids[1], status='pending', translation_en_status='not_started')
+        assert_matches_pending_files()
+        
+        conn = db._get_connection()
+        conn.execute("DELETE FROM processing_status WHERE file_id = ?", (file_ids[0],))
+        conn.execute("DELETE FROM media_files WHERE file_id = ?", (file_ids[0],))
+        conn.commit()
+        assert_matches_pending_files()
+        
+        counters = db._get_summary_counters()
+        assert all(value == 0 for name, value in counters.items() if name.startswith('blocked:'))
+        
+        db.close()
+    
+    @pytest.mark.unit
+    @pytest.mark.database
+    def test_blocked_counters_are_backfilled(self, temp_dir):
+        """Test that databases with counters but no blocked counts are migrated."""
+        db = Database(temp_dir / "test.db")
+        file_ids = [
+            db.add_file(f"/test/{i}.mp4", f"{i}_mp4", media_type="video")
+            for i in range(3)
+        ]
+        db.update_status(file_ids[0], status='failed')
+        with db.transaction() as conn:
+            for (name,) in conn.execute(
+                "SELECT name FROM sqlite_master WHERE type='trigger' AND name LIKE 'trg_counters_blocked_%'"
+            ).fetchall():
+                conn.execute(f"DROP TRIGGER {name}")
+            conn.execute("DELETE FROM summary_counters WHERE name LIKE 'blocked:%'")
+        db.close()
+        
+        db = Database(temp_dir / "test.db")
+        assert db.get_summary()['pending_counts']['translation_he'] == 2
+        db.update_status(file_ids[1], status='failed')
+        assert db.get_summary()['pending_counts']['translation_he'] == 1
+        
+        db.close()
+    
+    @pytest.mark.unit
+    @pytest.mark.database
+    def test_interview_segment_counters(self, temp_dir):
+        """Test per-interview counters through inserts, updates and cascades."""
+        db = Database(temp_dir / "test.db")
+        db._migrate_to_subtitle_segments()
+        file_id = db.add_file("/test/a.mp4", "a_mp4", media_type="video")
+        
+        segment_ids = [
+            db.add_subtitle_segment(
+                file_id, i, i * 2.0, i * 2.0 + 1.0, f"Text {i}",
+                german_text=f"Text {i}" if i % 2 == 0 else None,
+                confidence_score=0.5 + i * 0.1
+            )
+            for i in range(4)
+        ]
+        db.batch_update_segment_translations([
+            {'segment_id': segment_ids[0], 'language': 'en', 'text': "One"},
+            {'segment_id': segment_ids[1], 'language': 'en', 'text': "Two"},
+            {'segment_id': segment_ids[1], 'language': 'fr', 'text': "Deux"},
+        ])
+        # Re-writing an existing translation must not double count
+        db.set_segment_translation(segment_ids[0], 'en', "One again", provider='deepl')
+        
+        status = db.get_segment_translation_status(file_id)
+        assert status['total'] == 4
+        assert status['de']['translated'] == 2
+        assert status['en']['translated'] == 2
+        assert status['fr']['translated'] == 1
+        
+        conn = db._get_connection()
+        conn.execute("DELETE FROM subtitle_segments WHERE id = ?", (segment_ids[1],))
+        conn.commit()
+        
+        status = db.get_segment_translation_status(file_id)
+        assert status['total'] == 3
+        assert status['en']['translated'] == 1
+        assert status['fr']['translated'] == 0
+        
+        totals = db.get_segment_totals()
+        assert totals['interviews_with_segments'] == 1
+        assert totals['total_segments'] == 3
+        assert abs(totals['average_confidence'] - (0.5 + 0.7 + 0.8) / 3) < 1e-9
+        
+        db.close()
+
+
+class TestSegmentSearch:
+    """Test the FTS5 segment search index."""
+    
+    @pytest.mark.unit
+    @pytest.mark.database
+    def test_search_segments_across_languages(self, temp_dir):
+        """Test bm25 search over original text and translations with a language filter."""
+        db = Database(temp_dir / "test.db")
+        db._migrate_to_subtitle_segments()
+        file_id = db.add_file("/test/a.mp4", "a_mp4", media_type="video")
+        segment_ids = [
+            db.add_subtitle_segment(file_id, 0, 0.0, 2.5, "Wir wohnten in der Müllerstraße"),
+            db.add_subtitle_segment(file_id, 1, 2.5, 5.0, "Dann kamen wir nach Auschwitz",
+                                    english_text="Then we came to Auschwitz"),
+            db.add_subtitle_segment(file_id, 2, 5.0, 7.0, "שָׁלוֹם, אני מצה״ל"),
+        ]
+        db.set_segment_translation(segment_ids[0], 'fr', "Nous habitions rue Müller")
+        
+        hits = db.search_segments("auschwitz")
+        assert {hit['lang'] for hit in hits} == {'orig', 'en'}
+        assert all(hit['segment_index'] == 1 for hit in hits)
+        assert hits[0]['interview_id'] == file_id
+        assert (hits[0]['start_time'], hits[0]['end_time']) == (2.5, 5.0)
+        
+        hits = db.search_segments("auschwitz", lang='en')
+        assert [hit['text'] for hit in hits] == ["Then we came to Auschwitz"]
+        
+        # Diacritics are folded, prefix queries work, new languages are indexed
+        assert db.search_segments("muller", lang='fr')[0]['segment_index'] == 0
+        assert db.search_segments("müller*", lang='orig')[0]['segment_index'] == 0
+        
+        # Unpointed Hebrew and acronyms without gershayim match
+        assert db.search_segments("שלום")[0]['segment_index'] == 2
+        assert db.search_segments("מצהל")[0]['segment_index'] == 2
+        
+        assert db.search_segments("auschwitz", lang='xx') == []
+        assert db.search_segments('" *') == []
+        db.close()
+    
+    @pytest.mark.unit
+    @pytest.mark.database
+    def test_search_index_follows_writes(self, temp_dir):
+        """Test that updates and deletes keep the contentless index consistent."""
+        db = Database(temp_dir / "test.db")
+        db._migrate_to_subtitle_segments()
+        file_id = db.add_file("/test/a.mp4", "a_mp4", media_type="video")
+        segment_id = db.add_subtitle_segment(file_id, 0, 0.0, 2.0, "Berlin",
+                                             english_text="Berlin")
+        
+        db.set_segment_translation(segment_id, 'en', "Hamburg")
+        assert [hit['lang'] for hit in db.search_segments("berlin")] == ['orig']
+        assert [hit['lang'] for hit in db.search_segments("hamburg")] == ['en']
+        
+        conn = db._get_connection()
+        conn.execute("UPDATE subtitle_segments SET original_text = 'Köln' WHERE id = ?",
+                     (segment_id,))
+        conn.commit()
+        assert db.search_segments("berlin") == []
+        assert db.search_segments("koln")[0]['lang'] == 'orig'
+        
+        conn.execute("DELETE FROM subtitle_segments WHERE id = ?", (segment_id,))
+        conn.commit()
+        assert db.search_segments("hamburg") == []
+        assert conn.execute(
+            "INSERT INTO segment_fts(segment_fts) VALUES('integrity-check')"
+        ).fetchall() == []
+        db.close()
+    
+    @pytest.mark.unit
+    @pytest.mark.database
+    def test_language_past_last_slot_is_rejected(self, temp_dir):
+        """Test that a language without a free search slot is refused, not dropped."""
+        db = Database(temp_dir / "test.db")
+        db._migrate_to_subtitle_segments()
+        file_id = db.add_file("/test/a.mp4", "a_mp4", media_type="video")
+        segment_id = db.add_subtitle_segment(file_id, 0, 0.0, 2.0, "Berlin")
+        
+        # orig, en, de and he hold slots 0-3; l4..l63 fill the rest
+        for i in range(4, SEARCH_SLOTS):
+            db.set_segment_translation(segment_id, f'l{i}', f"word{i}")
+        assert db.search_segments(f"word{SEARCH_SLOTS - 1}", lang=f'l{SEARCH_SLOTS - 1}')
+        
+        assert db.set_segment_translation(segment_id, 'overflow', "overflow") is False
+        conn = db._get_connection()
+        with pytest.raises(sqlite3.IntegrityError, match="at most 64 languages"):
+            conn.execute("INSERT INTO segment_translations (segment_id, lang, text) "
+                         "VALUES (?, 'overflow', 'overflow')", (segment_id,))
+        conn.rollback()
+        
+        assert conn.execute(
+            "SELECT COUNT(*) FROM segment_translations WHERE lang = 'overflow'"
+        ).fetchone()[0] == 0
+        # Known languages are still accepted
+        db.set_segment_translation(segment_id, 'l4', "updated")
+        assert db.search_segments("updated")[0]['lang'] == 'l4'
+        db.close()
+    
+    @pytest.mark.unit
+    @pytest.mark.database
+    def test_language_limit_added_to_existing_index(self, temp_dir):
+        """Test that databases indexed before the limit get the guard trigger."""
+        db = Database(temp_dir / "test.db")
+        db._migrate_to_subtitle_segments()
+        conn = db._get_connection()
+        conn.execute("DROP TRIGGER trg_segment_fts_language_limit")
+        conn.commit()
+        
+        db._migrate_to_segment_search()
+        
+        assert conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type='trigger' AND name='trg_segment_fts_language_limit'"
+        ).fetchone()
+        db.close()
+
+
+class TestStatementRegistry:
+    """Test registered statements and row modes."""
+    
+    @pytest.mark.unit
+    @pytest.mark.database
+    def test_row_modes_return_same_data(self, temp_dir):
+        """Test that dict, tuple and namedtuple rows carry the same values."""
+        db = Database(temp_dir / "test.db")
+        db._migrate_to_subtitle_segments()
+        file_id = db.add_file("/test/a.mp4", "a_mp4", media_type="video")
+        for i in range(3):
+            db.add_subtitle_segment(file_id, i, i * 2.0, i * 2.0 + 1.0, f"Text {i}",
+                                    german_text=f"Text {i}")
+        
+        as_dicts = db.get_subtitle_segments(file_id)
+        as_tuples = db.get_subtitle_segments(file_id, row_mode='tuple')
+        as_named = db.get_subtitle_segments(file_id, row_mode='namedtuple')
+        
+        assert [tuple(row.values()) for row in as_dicts] == as_tuples
+        assert [row._asdict() for row in as_named] == as_dicts
+        assert as_named[2].original_text == "Text 2"
+        assert db.get_segments_for_translation(file_id, 'en', row_mode='namedtuple')[0].segment_index == 0
+        
+        with pytest.raises(ValueError):
+            db.get_subtitle_segments(file_id, row_mode='row')
+        db.close()
+
+
+class TestStreamingIterators:
+    """Test fetchmany-based iter_* generators."""
+    
+    @pytest.mark.unit
+    @pytest.mark.database
+    def test_iterators_match_list_methods(self, temp_dir):
+        """Test that iterators yield the same rows as the list-returning methods."""
+        db = Database(temp_dir / "test.db")
+        db._migrate_to_subtitle_segments()
+        file_ids = [
+            db.add_file(f"/test/{i}.mp4", f"{i}_mp4", media_type="video")
+            for i in range(3)
+        ]
+        for file_id in file_ids:
+            for j in range(7):
+                db.add_subtitle_segment(file_id, j, j * 2.0, j * 2.0 + 1.0, f"Text {j}")
+        
+        assert list(db.iter_files(arraysize=2)) == db.get_all_files()
+        assert list(db.iter_segments(file_ids[1], arraysize=3)) == db.get_subtitle_segments(file_ids[1])
+        
+        all_segments = list(db.iter_segments(row_mode='namedtuple', arraysize=4))
+        assert len(all_segments) == 21
+        assert [(s.interview_id, s.segment_index) for s in all_segments] == sorted(
+            (s.interview_id, s.segment_index) for s in all_segments
+        )
+        
+        query = "SELECT file_id FROM media_files WHERE media_type = ? ORDER BY file_id"
+        assert list(db.iter_query(query, ('video',), arraysize=1)) == db.execute_query(query, ('video',))
+        
+        with pytest.raises(ValueError):
+            db.iter_files(row_mode='row')
+        db.close()
+    
+    @pytest.mark.unit
+    @pytest.mark.database
+    def test_iter_files_keeps_file_id_without_status(self, temp_dir):
+        """Test that files lacking a processing_status row keep their file_id."""
+        db = Database(temp_dir / "test.db")
+        file_id = db.add_file("/test/a.mp4", "a_mp4", media_type="video")
+        conn = db._get_connection()
+        conn.execute("DELETE FROM processing_status WHERE file_id = ?", (file_id,))
+        conn.commit()
+        
+        records = list(db.iter_files())
+        assert records[0]['file_id'] == file_id
+        assert records[0]['status'] is None
+        db.close()
@@ -0,0 +1,369 @@
+"""
+Performance tests for database query paths at archive scale.
+
+These tests build synthetic databases with 100k+ subtitle segments and check
+both wall-clock timings and, more importantly, that the query planner keeps
+hot status queries on covering indexes instead of scanning tables.
+"""
+import sqlite3
+import time
+import uuid
+
+import pytest
+
+from scribe.database import Database
+
+
+def _query_plan(db: Database, query: str, params: tuple = ()) -> str:
+    """Return the EXPLAIN QUERY PLAN details joined into one string."""
+    conn = db._get_connection()
+    rows = conn.execute(f"EXPLAIN QUERY PLAN {query}", params).fetchall()
+    return " | ".join(row[3] for row in rows)
+
+
+def _populate(db: Database, interviews: int, segments_per_interview: int) -> list:
+    """Bulk-insert interviews with translated segments; returns interview ids."""
+    conn = db._get_connection()
+    interview_ids = []
+    for i in range(interviews):
+        file_id = str(uuid.uuid4())
+        interview_ids.append(file_id)
+        conn.execute(
+            "INSERT INTO media_files (file_id, original_path, safe_filename, media_type) "
+            "VALUES (?, ?, ?, 'video')",
+            (file_id, f"/archive/{i}.mp4", f"{i}_mp4")
+        )
+        conn.execute("INSERT INTO processing_status (file_id) VALUES (?)", (file_id,))
+        conn.executemany(
+            "INSERT INTO subtitle_segments (interview_id, segment_index, start_time, end_time, "
+            "original_text, german_text, english_text) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [
+                (file_id, j, j * 2.0, j * 2.0 + 1.5, f"Segment {j}", f"Segment {j}",
+                 f"Segment {j}" if j % 2 else None)
+                for j in range(segments_per_interview)
+            ]
+        )
+    conn.execute(
+        "UPDATE processing_status SET translation_en_status = 'completed' "
+        "WHERE rowid % 3 = 0"
+    )
+    conn.commit()
+    return interview_ids
+
+
+@pytest.fixture(scope="module")
+def large_db(tmp_path_factory):
+    """Database with 200 interviews x 500 segments (100k segments)."""
+    db = Database(tmp_path_factory.mktemp("perf") / "large.db")
+    db._migrate_to_subtitle_segments()
+    interview_ids = _populate(db, interviews=200, segments_per_interview=500)
+    db._get_connection().execute("ANALYZE")
+    yield db, interview_ids
+    db.close()
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+@pytest.mark.database
+class TestNormalizedStatusPerformance:
+    """Status queries on the normalized tables stay index-only."""
+    
+    def test_stage_counts_use_covering_index(self, large_db):
+        """Per-stage counts are answered from idx_file_stage_status_lookup."""
+        db, _ = large_db
+        plan = _query_plan(db, """
+            SELECT stage, lang, status, COUNT(*) FROM file_stage_status
+            GROUP BY stage, lang, status
+        """)
+        assert "COVERING INDEX idx_file_stage_status_lookup" in plan
+        
+        start = time.perf_counter()
+        counts = db.get_stage_counts()
+        elapsed = time.perf_counter() - start
+        
+        assert sum(counts['translation_en'].values()) == 200
+        assert elapsed < 0.5
+    
+    def test_pending_lookup_uses_index(self, large_db):
+        """Pending-file lookup seeks by (stage, lang, status)."""
+        db, _ = large_db
+        plan = _query_plan(db, """
+            SELECT file_id FROM file_stage_status
+            WHERE stage = ? AND lang = ? AND status = 'not_started'
+        """, ('translation', 'en'))
+        assert "COVERING INDEX idx_file_stage_status_lookup" in plan
+        assert len(db.get_pending_files('translation_en')) == 134
+    
+    def test_segment_translation_status_at_scale(self, large_db):
+        """Per-interview translation counts stay on primary-key lookups."""
+        db, interview_ids = large_db
+        plan = _query_plan(db, """
+            SELECT t.lang, COUNT(*) FROM subtitle_segments s
+            JOIN segment_translations t ON t.segment_id = s.id
+            WHERE s.interview_id = ? GROUP BY t.lang
+        """, (interview_ids[0],))
+        assert "SCAN s" not in plan and "SCAN subtitle_segments" not in plan
+        assert "SEARCH t USING PRIMARY KEY" in plan
+        
+        total_segments = db._get_connection().execute(
+            "SELECT COUNT(*) FROM subtitle_segments"
+        ).fetchone()[0]
+        assert total_segments >= 100_000
+        
+        start = time.perf_counter()
+        for interview_id in interview_ids[:50]:
+            status = db.get_segment_translation_status(interview_id)
+        elapsed = time.perf_counter() - start
+        
+        assert status['de'] == {'translated': 500, 'pending': 0}
+        assert status['en'] == {'translated': 250, 'pending': 250}
+        assert elapsed / 50 < 0.05
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+@pytest.mark.database
+class TestStatusCounterPerformance:
+    """Status reads come from counter tables instead of full-table aggregates."""
+    
+    def test_summary_reads_counters_only(self, large_db):
+        """get_summary cost is independent of archive size."""
+        db, _ = large_db
+        
+        start = time.perf_counter()
+        for _ in range(100):
+            summary = db.get_summary()
+        elapsed = time.perf_counter() - start
+        
+        assert summary['total_files'] == 200
+        assert summary['en_translated'] == 66
+        assert elapsed / 100 < 0.005
+    
+    def test_counters_match_aggregates(self, large_db):
+        """Counters agree with the aggregates they replace."""
+        db, interview_ids = large_db
+        totals = db.get_segment_totals()
+        assert totals['total_segments'] == 100_000
+        assert totals['interviews_with_segments'] == 200
+        
+        for interview_id in interview_ids[:5]:
+            status = db.get_segment_translation_status(interview_id)
+            expected = db.execute_query("""
+                SELECT COUNT(*) as total, COUNT(english_text) as en
+                FROM subtitle_segments WHERE interview_id = ?
+            """, (interview_id,))[0]
+            assert status['total'] == expected['total']
+            assert status['en']['translated'] == expected['en']
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+@pytest.mark.database
+class TestSegmentSearchPerformance:
+    """Full-text search is served by the FTS5 index, not LIKE scans."""
+    
+    def test_search_uses_fts_index(self, large_db):
+        """search_segments answers from segment_fts within interactive latency."""
+        db, _ = large_db
+        plan = _query_plan(db, """
+            SELECT rowid, bm25(segment_fts) FROM segment_fts
+            WHERE segment_fts MATCH ? ORDER BY 2 LIMIT 20
+        """, ('"499"',))
+        assert "VIRTUAL TABLE INDEX" in plan
+        
+        start = time.perf_counter()
+        hits = db.search_segments("segment 499", lang='en', limit=10)
+        elapsed = time.perf_counter() - start
+        
+        assert len(hits) == 10
+        assert all(hit['segment_index'] == 499 and hit['lang'] == 'en' for hit in hits)
+        assert elapsed < 0.5
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+@pytest.mark.database
+class TestSegmentIntervalPerformance:
+    """Playback seeks are bounded range scans on the timing index."""
+    
+    def test_seek_uses_timing_index(self, large_db):
+        """segment_at and overlap queries never scan a whole transcript."""
+        db, interview_ids = large_db
+        plan = _query_plan(db, """
+            SELECT * FROM subtitle_segments
+            WHERE interview_id = :interview_id AND start_time < :t1
+              AND start_time > :t0 - (SELECT IFNULL(MAX(duration), 0) FROM subtitle_segments
+                                      WHERE interview_id = :interview_id)
+              AND end_time > :t0
+            ORDER BY start_time, end_time
+        """, {'interview_id': interview_ids[0], 't0': 100.0, 't1': 110.0})
+        assert "idx_subtitle_segments_timing (interview_id=? AND start_time>? AND start_time<?)" in plan
+        assert "idx_subtitle_segments_duration" in plan
+        assert "TEMP B-TREE" not in plan
+        
+        start = time.perf_counter()
+        for interview_id in interview_ids[:100]:
+            for t in (0.5, 250.0, 998.5):
+                segment = db.segment_at(interview_id, t)
+        elapsed = time.perf_counter() - start
+        
+        assert segment['segment_index'] == 499
+        assert elapsed / 300 < 0.002
+        assert len(db.get_segments_overlapping(interview_ids[0], 100.0, 110.0)) == 5
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+@pytest.mark.database
+class TestSegmentIndexSet:
+    """subtitle_segments carries only the indexes its queries use."""
+    
+    HOT_QUERIES = {
+        'get_subtitle_segments': (
+            "SELECT * FROM subtitle_segments WHERE interview_id = ? ORDER BY segment_index",
+            "USING INDEX sqlite_autoindex_subtitle_segments_1 (interview_id=?)"),
+        'get_segments_for_translation': (
+            "SELECT s.* FROM subtitle_segments s WHERE s.interview_id = ? AND NOT EXISTS ("
+            "SELECT 1 FROM segment_translations t WHERE t.segment_id = s.id AND t.lang = 'en') "
+            "ORDER BY s.segment_index",
+            "USING INDEX sqlite_autoindex_subtitle_segments_1 (interview_id=?)"),
+        'delete_interview_segments': (
+            "SELECT id FROM subtitle_segments WHERE interview_id = ?",
+            "(interview_id=?)"),
+    }
+    
+    def test_redundant_indexes_dropped(self, large_db):
+        """Only the unique autoindex and the timing indexes remain."""
+        db, _ = large_db
+        indexes = {
+            row['name'] for row in db.execute_query(
+                "SELECT name FROM sqlite_master WHERE type='index' AND tbl_name='subtitle_segments'"
+            )
+        }
+        assert indexes == {
+            'sqlite_autoindex_subtitle_segments_1',
+            'idx_subtitle_segments_timing',
+            'idx_subtitle_segments_duration',
+        }
+    
+    @pytest.mark.parametrize("name", sorted(HOT_QUERIES))
+    def test_hot_queries_stay_indexed(self, large_db, name):
+        """Every per-interview read is still a SEARCH, never a table scan."""
+        db, interview_ids = large_db
+        query, expected = self.HOT_QUERIES[name]
+        plan = _query_plan(db, query, (interview_ids[0],))
+        assert expected in plan
+        assert "SCAN subtitle_segments" not in plan and "SCAN s " not in f"{plan} "
+
+
+@pytest.fixture(scope="module")
+def write_db(tmp_path_factory):
+    """Database with 500 interviews x 1000 untranslated segments (500k segments)."""
+    db = Database(tmp_path_factory.mktemp("writes") / "writes.db")
+    db._migrate_to_subtitle_segments()
+    conn = db._get_connection()
+    for i in range(500):
+        file_id = str(uuid.uuid4())
+        conn.execute(
+            "INSERT INTO media_files (file_id, original_path, safe_filename, media_type) "
+            "VALUES (?, ?, ?, 'video')",
+            (file_id, f"/archive/{i}.mp4", f"{i}_mp4")
+        )
+        conn.executemany(
+            "INSERT INTO subtitle_segments (interview_id, segment_index, start_time, end_time, "
+            "original_text) VALUES (?, ?, ?, ?, ?)",
+            [(file_id, j, j * 2.0, j * 2.0 + 1.5, f"Original segment {i}-{j}") for j in range(1000)]
+        )
+    conn.commit()
+    yield db
+    db.close()
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+@pytest.mark.database
+class TestTranslationWriteThroughput:
+    """Bulk translation writes on a 500k-segment database."""
+    
+    BATCH = 500
+    ROWS = 10_000
+    
+    def _write_rate(self, db, segment_ids, tag):
+        start = time.perf_counter()
+        for k in range(0, len(segment_ids), self.BATCH):
+            assert db.batch_update_segment_translations([
+                {'segment_id': segment_id, 'language': 'en',
+                 'text': f"{tag} translation of segment {segment_id}"}
+                for segment_id in segment_ids[k:k + self.BATCH]
+            ])
+        return len(segment_ids) / (time.perf_counter() - start)
+    
+    def test_bulk_translation_writes(self, write_db):
+        """Measure batch_update_segment_translations with the lean and legacy index sets."""
+        db = write_db
+        conn = db._get_connection()
+        assert conn.execute("SELECT COUNT(*) FROM subtitle_segments").fetchone()[0] == 500_000
+        
+        # Spread writes across the archive like a real translation run
+        segment_ids = [row[0] for row in conn.execute(
+            "SELECT id FROM subtitle_segments WHERE id % 25 = 0 ORDER BY id"
+        )][:2 * self.ROWS]
+        lean_rate = self._write_rate(db, segment_ids[:self.ROWS], "lean")
+        
+        # Recreate the indexes the original migration built and repeat
+        for name, columns in (
+            ('idx_subtitle_segments_interview_id', 'interview_id'),
+            ('idx_subtitle_segments_search', 'interview_id, segment_index'),
+            ('idx_subtitle_segments_original_text', 'original_text'),
+            ('idx_subtitle_segments_english_text', 'english_text'),
+            ('idx_subtitle_segments_german_text', 'german_text'),
+        ):
+            conn.execute(f"CREATE INDEX {name} ON subtitle_segments({columns})")
+        conn.commit()
+        legacy_rate = self._write_rate(db, segment_ids[self.ROWS:], "legacy")
+        
+        print(f"\nbatch_update_segment_translations on 500k segments: "
+              f"{lean_rate:,.0f} rows/s lean, {legacy_rate:,.0f} rows/s with legacy indexes")
+        # Only the english_text index is touched per write, so the gap is modest
+        # and noisy; report it and guard against gross regressions only
+        assert lean_rate > 2_000
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+@pytest.mark.database
+class TestRowModePerformance:
+    """get_subtitle_segments on a 10k-segment interview in each row mode."""
+    
+    def test_get_subtitle_segments_row_modes(self, tmp_path):
+        """Tuple rows beat per-row sqlite3.Row -> dict conversion."""
+        db = Database(tmp_path / "rows.db")
+        db._migrate_to_subtitle_segments()
+        interview_id = _populate(db, interviews=1, segments_per_interview=10_000)[0]
+        
+        timings = {}
+        for row_mode in ('dict', 'namedtuple', 'tuple'):
+            db.get_subtitle_segments(interview_id, row_mode=row_mode)
+            start = time.perf_counter()
+            for _ in range(10):
+                rows = db.get_subtitle_segments(interview_id, row_mode=row_mode)
+            timings[row_mode] = (time.perf_counter() - start) / 10
+            assert len(rows) == 10_000
+        
+        # Baseline: dict(sqlite3.Row) per row, the pre-registry implementation
+        conn = db._get_connection()
+        start = time.perf_counter()
+        for _ in range(10):
+            rows = [dict(row) for row in conn.execute(
+                "SELECT * FROM subtitle_segments WHERE interview_id = ? ORDER BY segment_index",
+                (interview_id,)
+            ).fetchall()]
+        legacy = (time.perf_counter() - start) / 10
+        
+        print("\nget_subtitle_segments, 10k segments: " + ", ".join(
+            f"{mode} {seconds * 1000:.1f} ms" for mode, seconds in
+            [('Row->dict', legacy)] + list(timings.items())
+        ))
+        assert timings['tuple'] < legacy
+        assert timings['dict'] < 0.5
+        db.close()
@@ -0,0 +1,202 @@
+"""
+Tests for database-backed quality metrics.
+
+Tests cover:
+- Bulk upserts of interview metrics and segment scores
+- Set-based trend calculation across interviews from the metric history
+- The writer-maintained interview_quality_summary table
+"""
+import pytest
+
+from scribe.database import Database
+from scribe.database_quality_metrics import (
+    add_quality_metrics_schema, batch_store_quality_metrics, store_quality_metrics,
+    store_segment_quality_scores, store_timing_coordination_metrics,
+    get_segment_quality_history, get_quality_metrics,
+    calculate_quality_trends, calculate_archive_quality_trends
+)
+
+
+@pytest.fixture
+def metrics_db(temp_dir):
+    """Database with the quality metrics schema and two interviews."""
+    db = Database(temp_dir / "test.db")
+    add_quality_metrics_schema(db)
+    interviews = [
+        db.add_file(f"/test/{name}.mp4", f"{name}_mp4", media_type="video")
+        for name in ("a", "b")
+    ]
+    yield db, interviews
+    db.close()
+
+
+class TestBulkWrites:
+    """Test executemany upserts."""
+    
+    @pytest.mark.unit
+    @pytest.mark.database
+    def test_batch_store_upserts_metrics(self, metrics_db):
+        """Test that re-storing a metric updates it in place."""
+        db, (interview_a, interview_b) = metrics_db
+        
+        assert batch_store_quality_metrics(db, [
+            (interview_a, 'en', {'overall_quality': 7.0, 'evaluation_method': 'local'}),
+            (interview_b, 'en', {'overall_quality': 8.0, 'timing_precision': 0.9}),
+        ])
+        first_id = db.execute_query(
+            "SELECT id FROM subtitle_quality_metrics WHERE interview_id = ?", (interview_a,)
+        )[0]['id']
+        
+        assert store_quality_metrics(db, interview_a, 'en', {'overall_quality': 9.0})
+        
+        rows = db.execute_query(
+            "SELECT id, metric_type, metric_value, evaluation_method FROM subtitle_quality_metrics "
+            "WHERE interview_id = ?", (interview_a,)
+        )
+        assert rows == [{
+            'id': first_id, 'metric_type': 'overall_quality', 'metric_value': 9.0,
+            'evaluation_method': 'enhanced_database_validation'
+        }]
+        assert db.execute_query("SELECT COUNT(*) AS n FROM subtitle_quality_metrics")[0]['n'] == 3
+    
+    @pytest.mark.unit
+    @pytest.mark.database
+    def test_segment_scores_upsert(self, metrics_db):
+        """Test that segment scores are stored once per segment and language."""
+        db, (interview_a, _) = metrics_db
+        scores = [{'segment_index': i, 'overall_score': 5.0} for i in range(50)]
+        
+        assert store_segment_quality_scores(db, interview_a, 'he', scores)
+        assert store_segment_quality_scores(db, interview_a, 'he', [{'segment_index': 3, 'overall_score': 9.0}])
+        
+        history = get_segment_quality_history(db, interview_a, 'he')
+        assert len(history) == 50
+        assert history[3]['overall_score'] == 9.0
+        
+        assert not store_segment_quality_scores(db, interview_a, 'he', [{'overall_score': 1.0}])
+
+
+class TestQualityTrends:
+    """Test set-based trend calculation."""
+    
+    @pytest.mark.unit
+    @pytest.mark.database
+    def test_archive_trends(self, metrics_db):
+        """Test that one query summarizes every interview and language."""
+        db, (interview_a, interview_b) = metrics_db
+        batch_store_quality_metrics(db, [
+            (interview_a, 'en', {'overall_quality': 7.5, 'timing_precision': 0.9}),
+            (interview_a, 'he', {'overall_quality': 6.0}),
+            (interview_b, 'de', {'overall_quality': 8.0}),
+        ])
+        
+        archive = calculate_archive_quality_trends(db)
+        
+        assert set(archive) == {interview_a, interview_b}
+        languages = archive[interview_a]['languages']
+        assert set(languages) == {'en', 'he'}
+        assert languages['en']['latest_score'] == 7.5
+        assert languages['en']['metrics']['timing_precision']['samples'] == 1
+        assert archive[interview_a]['overall_trend'] == 'stable'
+        
+        assert calculate_quality_trends(db, interview_b) == archive[interview_b]
+        assert calculate_archive_quality_trends(db, [interview_b]) == {interview_b: archive[interview_b]}
+        assert calculate_archive_quality_trends(db, []) == {}
+        assert calculate_quality_trends(db, "missing")['languages'] == {}
+    
+    @pytest.mark.unit
+    @pytest.mark.database
+    def test_trends_follow_history(self, metrics_db):
+        """Test that re-stored metrics are compared with their first value."""
+        db, (interview_a, _) = metrics_db
+        store_quality_metrics(db, interview_a, 'en', {'overall_quality': 6.0, 'timing_precision': 0.9})
+        store_quality_metrics(db, interview_a, 'en', {'overall_quality': 7.0, 'timing_precision': 0.5})
+        store_quality_metrics(db, interview_a, 'en', {'overall_quality': 8.5})
+        
+        trends = calculate_quality_trends(db, interview_a)
+        
+        metrics = trends['languages']['en']['metrics']
+        assert metrics['overall_quality']['samples'] == 3
+        assert (metrics['overall_quality']['first_value'], metrics['overall_quality']['latest_value']) == (6.0, 8.5)
+        assert trends['languages']['en']['latest_score'] == 8.5
+        assert trends['quality_improvements'] == [
+            {'language': 'en', 'metric': 'overall_quality', 'improvement': 2.5}
+        ]
+        assert trends['quality_degradations'][0]['metric'] == 'timing_precision'
+        assert trends['overall_trend'] == 'stable'
+        # The metrics table itself still holds one row per metric
+        assert db.execute_query(
+            "SELECT COUNT(*) AS n FROM subtitle_quality_metrics WHERE interview_id = ?", (interview_a,)
+        )[0]['n'] == 2
+    
+    @pytest.mark.unit
+    @pytest.mark.database
+    def test_history_is_backfilled(self, metrics_db):
+        """Test that databases without a history start from the stored values."""
+        db, (interview_a, _) = metrics_db
+        store_quality_metrics(db, interview_a, 'de', {'overall_quality': 5.0})
+        with db.transaction() as conn:
+            conn.execute("DROP TABLE subtitle_quality_metric_history")
+        
+        add_quality_metrics_schema(db)
+        store_quality_metrics(db, interview_a, 'de', {'overall_quality': 7.0})
+        
+        trends = calculate_quality_trends(db, interview_a)
+        assert trends['languages']['de']['metrics']['overall_quality']['samples'] == 2
+        assert trends['overall_trend'] == 'improving'
+
+
+
+class TestQualitySummary:
+    """Test the pre-aggregated quality summary."""
+    
+    @pytest.mark.unit
+    @pytest.mark.database
+    def test_writers_maintain_summary(self, metrics_db):
+        """Test that every writer refreshes its interview's summary row."""
+        db, (interview_a, interview_b) = metrics_db
+        
+        store_quality_metrics(db, interview_a, 'en', {'overall_quality': 8.0, 'timing_precision': 0.9})
+        store_segment_quality_scores(db, interview_a, 'en', [
+            {'segment_index': i, 'overall_score': float(i % 2 * 10)} for i in range(40)
+        ])
+        store_timing_coordination_metrics(db, interview_a, 'en', {'total_segments': 40, 'timing_gaps': 2})
+        store_quality_metrics(db, interview_b, 'en', {'overall_quality': 6.0})
+        
+        summary = get_quality_metrics(db, interview_a, 'en')
+        assert summary['overall_quality_score'] == 8.0
+        assert summary['timing_precision'] == 0.9
+        assert summary['evaluated_segments'] == 40
+        assert summary['avg_segment_score'] == 5.0
+        assert summary['timing_gaps'] == 2
+        assert get_quality_metrics(db, interview_b, 'en')['evaluated_segments'] == 0
+        
+        # Segment scores alone do not create a summary row, as with the old view
+        store_segment_quality_scores(db, interview_b, 'he', [{'segment_index': 0, 'overall_score': 1.0}])
+        assert get_quality_metrics(db, interview_b) == [get_quality_metrics(db, interview_b, 'en')]
+    
+    @pytest.mark.unit
+    @pytest.mark.database
+    def test_view_is_migrated(self, metrics_db):
+        """Test that databases with the old view get a backfilled table."""
+        db, (interview_a, _) = metrics_db
+        store_quality_metrics(db, interview_a, 'de', {'overall_quality': 7.0})
+        store_segment_quality_scores(db, interview_a, 'de', [
+            {'segment_index': i, 'overall_score': 4.0} for i in range(3)
+        ])
+        with db.transaction() as conn:
+            conn.execute("DROP TABLE interview_quality_summary")
+            conn.execute("""
+                CREATE VIEW interview_quality_summary AS
+                SELECT interview_id, language FROM subtitle_quality_metrics
+            """)
+        
+        add_quality_metrics_schema(db)
+        
+        kinds = db.execute_query(
+            "SELECT type FROM sqlite_master WHERE name = 'interview_quality_summary'"
+        )
+        assert kinds == [{'type': 'table'}]
+        summary = get_quality_metrics(db, interview_a, 'de')
+        assert summary['overall_quality_score'] == 7.0
+        assert summary['evaluated_segments'] == 3
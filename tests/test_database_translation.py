@@ -10,7 +10,9 @@ from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
 
 from scribe.database import Database
-from scribe.batch_language_detection import detect_languages_for_segments, detect_languages_batch
+from scribe.batch_language_detection import (
+    detect_languages_for_segments, detect_languages_batch, detect_languages_with_confidence
+)
 from scribe.database_translation import DatabaseTranslator, translate_interview_from_database
 from scribe.translate import HistoricalTranslator
 
@@ -135,6 +137,21 @@ class TestDatabaseTranslationCoordination:
         assert call_args[1]['model'] == 'gpt-4o-mini'
         assert 'Ich wurde geboren' in call_args[1]['messages'][0]['content']
     
+    @pytest.mark.unit
+    def test_batch_language_detection_confidence(self):
+        """Test that detection confidence is parsed when the model reports it."""
+        mock_openai = Mock()
+        mock_response = Mock()
+        mock_response.choices = [Mock(message=Mock(content="""1: German 0.97
+2: English
+3: Hebrew 7"""))]
+        mock_openai.chat.completions.create.return_value = mock_response
+        
+        results = detect_languages_with_confidence(['Guten Tag.', 'Hello.', 'שלום'], mock_openai)
+        
+        assert results == [('de', 0.97), ('en', None), ('he', None)]
+        assert detect_languages_with_confidence([], mock_openai) == []
+    
     @pytest.mark.unit
     @pytest.mark.database
     def test_segment_language_coordination_with_database(self, temp_dir):
@@ -454,6 +471,72 @@ class TestDatabaseTranslator:
         
         db.close()
     
+    @pytest.mark.unit
+    @pytest.mark.database
+    def test_translate_interview_multi(self, temp_dir):
+        """Test concurrent translation to several languages with one detection pass."""
+        db_path = temp_dir / "test_multi.db"
+        db = Database(db_path)
+        db._migrate_to_subtitle_segments()
+        
+        # Mock OpenAI client for language detection
+        mock_openai = Mock()
+        mock_response = Mock()
+        mock_response.choices = [Mock(message=Mock(content="""1: German
+2: English
+3: German"""))]
+        mock_openai.chat.completions.create.return_value = mock_response
+        
+        # Mock translator tagging each text with its target language
+        mock_translator = Mock(spec=HistoricalTranslator)
+        mock_translator.openai_client = mock_openai
+        mock_translator.is_same_language.side_effect = lambda a, b: a == b
+        mock_translator.batch_translate.side_effect = (
+            lambda texts, target, source: [f"{target}: {text}" for text in texts]
+        )
+        
+        interview_id = db.add_file("/test/multi.mp4", "multi_mp4", "video")
+        
+        segments = [
+            (0, 0.0, 2.5, 'In Deutschland.'),
+            (1, 3.0, 5.5, 'My name is John.'),
+            (2, 6.0, 8.5, 'Neunzehn dreißig.')
+        ]
+        
+        for idx, start, end, text in segments:
+            db.add_subtitle_segment(
+                interview_id=interview_id,
+                segment_index=idx,
+                start_time=start,
+                end_time=end,
+                original_text=text
+            )
+        
+        db_translator = DatabaseTranslator(db, mock_translator)
+        results = db_translator.translate_interview_multi(interview_id, ['en', 'de'], batch_size=2)
+        
+        assert results['en']['translated'] == 2
+        assert results['en']['skipped'] == 1
+        assert results['de']['translated'] == 1
+        assert results['de']['skipped'] == 2
+        assert not results['en']['errors'] and not results['de']['errors']
+        
+        # Detection ran once per segment (two batches of up to 2) for both
+        # languages and was stored on the segments
+        assert mock_openai.chat.completions.create.call_count == 2
+        segments_after = db.get_subtitle_segments(interview_id)
+        assert [seg['detected_language'] for seg in segments_after] == ['de', 'en', 'de']
+        assert segments_after[0]['english_text'] == 'en: In Deutschland.'
+        assert segments_after[1]['german_text'] == 'de: My name is John.'
+        assert segments_after[1]['english_text'] is None
+        
+        # Later translations reuse the stored detections
+        results = db_translator.translate_interview(interview_id, 'he')
+        assert results['translated'] == 3
+        assert mock_openai.chat.completions.create.call_count == 2
+        
+        db.close()
+    
     @pytest.mark.unit
     def test_non_verbal_segment_handling(self):
         """Test that non-verbal segments are skipped."""
@@ -1394,7 +1477,7 @@ class TestTimingCoordination:
     @pytest.mark.unit
     @pytest.mark.database
     def test_boundary_validation_with_srt_translator(self, temp_dir):
-        """Test that boundary validation uses existing SRTTranslator mechanisms."""
+        """Test that boundary validation does not convert segments to SRT."""
         db_path = temp_dir / "test_boundary.db"
         db = Database(db_path)
         db._migrate_to_subtitle_segments()
@@ -1419,22 +1502,13 @@ class TestTimingCoordination:
                 english_text=english
             )
         
-        # Test that validation uses SRTTranslator's boundary validation
+        # Validation reads timing straight from the database, without SRT round-trips
         db_translator = DatabaseTranslator(db)
         
-        # Mock SRTTranslator to verify it's being used
-        with patch('scribe.database_translation.SRTTranslator') as mock_srt_class:
-            mock_srt_instance = Mock()
-            mock_srt_instance._validate_segment_boundaries.return_value = True
-            mock_srt_class.return_value = mock_srt_instance
-            
+        with patch.object(db_translator, 'convert_segments_to_srt_format') as mock_convert:
             validation = db_translator.validate_timing_coordination(interview_id, 'en')
             
-            # Verify SRTTranslator was instantiated
-            mock_srt_class.assert_called_once_with(db_translator.translator)
-            
-            # Verify boundary validation was called
-            mock_srt_instance._validate_segment_boundaries.assert_called_once()
+            mock_convert.assert_not_called()
             
             # Verify validation passed
             assert validation['boundary_validation'] == True
@@ -1471,24 +1545,17 @@ class TestTimingCoordination:
                 german_text=german
             )
         
-        # Test enhanced validation that builds upon SRTTranslator
+        # Test enhanced validation from a single fetch of segment timing
         db_translator = DatabaseTranslator(db)
         
-        # Mock SRTTranslator to verify it's still being used as foundation
-        with patch('scribe.database_translation.SRTTranslator') as mock_srt_class:
-            mock_srt_instance = Mock()
-            mock_srt_instance._validate_segment_boundaries.return_value = True
-            mock_srt_class.return_value = mock_srt_instance
-            
+        with patch.object(db_translator, 'convert_segments_to_srt_format') as mock_convert:
             validation = db_translator.validate_timing_coordination(interview_id, 'de')
             
-            # Verify SRTTranslator foundation is preserved
-            mock_srt_class.assert_called_once_with(db_translator.translator)
-            mock_srt_instance._validate_segment_boundaries.assert_called_once()
+            mock_convert.assert_not_called()
             
             # Verify enhanced validation results
             assert validation['timing_valid'] == True
-            assert validation['boundary_validation'] == True  # SRTTranslator validation
+            assert validation['boundary_validation'] == True  # Shared timing preserves SRT boundaries
             assert validation['database_consistency'] == True  # Enhanced database validation
             assert validation['srt_compatibility'] == True     # Cross-validation
             assert 'database_validation_details' in validation
@@ -1499,6 +1566,7 @@ class TestTimingCoordination:
             assert db_details['segment_integrity'] == True
             assert db_details['timestamp_consistency'] == True
             assert db_details['translation_alignment'] == True
+            assert validation['boundary_validation_method'] == 'shared_segment_timing'
             
         db.close()
 
@@ -1535,16 +1603,10 @@ class TestTimingCoordination:
         # Test that enhanced validation catches database issues
         db_translator = DatabaseTranslator(db)
         
-        # Mock SRTTranslator to pass boundary validation (testing database-specific detection)
-        with patch('scribe.database_translation.SRTTranslator') as mock_srt_class:
-            mock_srt_instance = Mock()
-            mock_srt_instance._validate_segment_boundaries.return_value = True
-            mock_srt_class.return_value = mock_srt_instance
-            
+        with patch.object(db_translator, 'convert_segments_to_srt_format') as mock_convert:
             validation = db_translator.validate_timing_coordination(interview_id, 'de')
             
-            # SRTTranslator validation should still be called (foundation preserved)
-            mock_srt_class.assert_called_once()
+            mock_convert.assert_not_called()
             
             # Enhanced validation should detect database issues
             assert validation['timing_valid'] == False  # Overall validation fails
@@ -1563,4 +1625,40 @@ class TestTimingCoordination:
             assert any('Gap of' in issue for issue in timing_issues)
             assert any('Overlap of' in issue for issue in timing_issues)
             
+        db.close()
+
+    @pytest.mark.unit
+    @pytest.mark.database
+    def test_validation_reports_untranslated_segments(self, temp_dir):
+        """Test that an untranslated segment is reported by index without timing mismatches."""
+        db = Database(temp_dir / "test_untranslated.db")
+        db._migrate_to_subtitle_segments()
+        interview_id = db.add_file("/test/untranslated.mp4", "untranslated_mp4", "video")
+        
+        segments = [
+            (0, 0.0, 1.5, 'First segment.', None),
+            (1, 1.5, 3.0, 'Second segment.', 'Zweites Segment.'),
+            (2, 3.0, 4.5, 'Third segment.', 'Drittes Segment.')
+        ]
+        for idx, start, end, original, german in segments:
+            db.add_subtitle_segment(
+                interview_id=interview_id,
+                segment_index=idx,
+                start_time=start,
+                end_time=end,
+                original_text=original,
+                german_text=german
+            )
+        
+        validation = DatabaseTranslator(db).validate_timing_coordination(interview_id, 'de')
+        
+        db_details = validation['database_validation_details']
+        assert db_details['translation_alignment'] == False
+        assert db_details['issues'] == [
+            "Segment count mismatch: original=3, de=2",
+            "Untranslated segment indices: [0]"
+        ]
+        assert not any('Timing mismatch' in issue for issue in validation['timing_issues'])
+        assert 'timing_drift_ms' not in validation
+        
         db.close()
\ No newline at end of file
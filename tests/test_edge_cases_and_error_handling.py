@@ -164,7 +164,7 @@ class TestCharacterEncodingIssues(unittest.TestCase):
             shutil.rmtree(self.test_dir)
     
     def test_utf8_with_bom(self):
-        """Test UTF-8 file with BOM affects parsing."""
+        """Test UTF-8 file with BOM is parsed completely."""
         content = """1
 00:00:00,000 --> 00:00:02,000
 German text: Ich bin ein Berliner
@@ -181,9 +181,11 @@ Hebrew text: מה שלומך"""
         
         segments = self.translator.parse_srt(str(filepath))
         
-        # BOM interferes with parsing - demonstrates robustness issue
-        self.assertEqual(len(segments), 1)  # Only second segment parsed
-        self.assertEqual(segments[0].text, "Hebrew text: מה שלומך")
+        # BOM is stripped before parsing, so the first segment is kept
+        self.assertEqual(len(segments), 2)
+        self.assertEqual(segments[0].index, 1)
+        self.assertEqual(segments[0].text, "German text: Ich bin ein Berliner")
+        self.assertEqual(segments[1].text, "Hebrew text: מה שלומך")
     
     def test_latin1_encoding(self):
         """Test Latin-1 encoded file (should fail gracefully)."""
@@ -17,6 +17,11 @@ from scribe.evaluate import (
     detect_language_ratio,
     validate_hebrew_translation,
     HistoricalEvaluator,
+    AlignedChunk,
+    align_chunks,
+    sample_chunks,
+    confidence_interval,
+    screen_translations,
     evaluate_translation,
     evaluate_file
 )
@@ -657,6 +662,231 @@ class TestModuleFunctions(unittest.TestCase):
         self.assertEqual(details, {})
 
 
+class TestBatchEvaluationAndCache(unittest.TestCase):
+    """Test concurrent batch evaluation and result caching."""
+    
+    def setUp(self):
+        """Set up a mocked OpenAI client that scores by translation text."""
+        self.openai_patcher = patch('scribe.evaluate.openai')
+        self.mock_openai = self.openai_patcher.start()
+        self.mock_client = Mock()
+        self.mock_openai.OpenAI.return_value = self.mock_client
+        self.mock_client.chat.completions.create.side_effect = self._respond
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache_path = Path(self.temp_dir.name) / ".evaluation_cache.json"
+    
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.openai_patcher.stop()
+        self.temp_dir.cleanup()
+    
+    @staticmethod
+    def _respond(**kwargs):
+        prompt = kwargs['messages'][-1]['content']
+        if 'FAIL' in prompt:
+            raise RuntimeError("API error")
+        score = float(re.search(r'Score (\d+)', prompt).group(1))
+        response = Mock()
+        response.choices = [Mock()]
+        response.choices[0].message.content = json.dumps({'composite_score': score, 'issues': []})
+        return response
+    
+    def test_evaluate_batch_preserves_order(self):
+        """Test that concurrent results come back in input order."""
+        evaluator = HistoricalEvaluator(max_workers=4)
+        pairs = [(f"Original {i}", f"Score {i}") for i in range(10)] + [("Original", "FAIL")]
+        
+        results = evaluator.evaluate_batch(pairs, language="en")
+        
+        self.assertEqual([r['composite_score'] for r in results[:10]], [float(i) for i in range(10)])
+        self.assertIsNone(results[10])
+        self.assertEqual(self.mock_client.chat.completions.create.call_count, 11)
+    
+    def test_cache_avoids_repeat_calls(self):
+        """Test that identical pairs are evaluated once and copies are returned."""
+        evaluator = HistoricalEvaluator()
+        
+        first = evaluator.evaluate("Original", "Score 7", language="en")
+        first['issues'].append('mutated')
+        second = evaluator.evaluate("Original", "Score 7", language="en")
+        
+        self.assertEqual(second['composite_score'], 7.0)
+        self.assertEqual(second['issues'], [])
+        self.assertEqual(self.mock_client.chat.completions.create.call_count, 1)
+    
+    def test_persistent_cache_keys(self):
+        """Test that the cache persists and is keyed by texts and model."""
+        evaluator = HistoricalEvaluator(cache_path=self.cache_path)
+        evaluator.evaluate_batch([("Original", "Score 7"), ("Original", "FAIL")], language="en")
+        self.assertTrue(self.cache_path.exists())
+        
+        reloaded = HistoricalEvaluator(cache_path=self.cache_path)
+        self.mock_client.chat.completions.create.reset_mock()
+        
+        results = reloaded.evaluate_batch([("Original", "Score 7"), ("Original", "FAIL")], language="en")
+        self.assertEqual(results[0]['composite_score'], 7.0)
+        self.assertIsNone(results[1])
+        # Only the failed pair is retried
+        self.assertEqual(self.mock_client.chat.completions.create.call_count, 1)
+        
+        other_model = HistoricalEvaluator(model="gpt-4.1", cache_path=self.cache_path)
+        other_model.evaluate("Original", "Score 7", language="en")
+        self.assertEqual(self.mock_client.chat.completions.create.call_count, 2)
+
+
+class TestChunkedEvaluation(unittest.TestCase):
+    """Test segment-aligned chunked evaluation."""
+    
+    def setUp(self):
+        """Set up a mocked OpenAI client that scores by translation text."""
+        self.openai_patcher = patch('scribe.evaluate.openai')
+        self.mock_openai = self.openai_patcher.start()
+        self.mock_client = Mock()
+        self.mock_openai.OpenAI.return_value = self.mock_client
+        self.mock_client.chat.completions.create.side_effect = TestBatchEvaluationAndCache._respond
+    
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.openai_patcher.stop()
+    
+    @staticmethod
+    def _chunks(translations):
+        return [
+            AlignedChunk(i, i, i * 60.0, i * 60.0 + 30.0, f"Original {i}", text)
+            for i, text in enumerate(translations)
+        ]
+    
+    def test_align_chunks(self):
+        """Test grouping by size and skipping untranslated or preserved segments."""
+        segments = [
+            {'segment_index': i, 'start_time': i * 2.0, 'end_time': i * 2.0 + 1.5,
+             'original_text': f"Satz {i:02d}"}
+            for i in range(6)
+        ]
+        translations = {0: "Sentence 00", 1: "Sentence 01", 2: "Satz 02",
+                        4: "Sentence 04", 5: "Sentence 05"}
+        
+        chunks = align_chunks(segments, translations, chunk_chars=14)
+        
+        self.assertEqual([(c.first_segment, c.last_segment) for c in chunks], [(0, 1), (4, 5)])
+        self.assertEqual(chunks[0].original, "Satz 00 Satz 01")
+        self.assertEqual(chunks[0].translation, "Sentence 00 Sentence 01")
+        self.assertEqual((chunks[1].start_time, chunks[1].end_time), (8.0, 11.5))
+    
+    def test_sample_chunks_spread(self):
+        """Test that samples are spread across the interview and deterministic."""
+        chunks = self._chunks([f"Score {i}" for i in range(10)])
+        
+        sample = sample_chunks(chunks, 4)
+        
+        self.assertEqual([c.first_segment for c in sample], [1, 3, 6, 8])
+        self.assertEqual(sample_chunks(chunks, 20), chunks)
+    
+    def test_confidence_interval(self):
+        """Test the t interval with finite population correction."""
+        self.assertIsNone(confidence_interval([7.0], 10))
+        self.assertEqual(confidence_interval([6.0, 8.0], 2), (7.0, 7.0))
+        
+        low, high = confidence_interval([3.0, 5.0, 7.0, 9.0], 8)
+        # t(3) = 3.182, s = 2.582, fpc = sqrt(4/7)
+        self.assertAlmostEqual(high - 6.0, 3.1, places=1)
+        self.assertAlmostEqual(6.0 - low, high - 6.0, places=2)
+    
+    def test_evaluate_chunks_aggregates(self):
+        """Test the mean, interval and skipping of failed chunks."""
+        evaluator = HistoricalEvaluator()
+        chunks = self._chunks(["Score 2", "Score 3", "Score 4", "FAIL",
+                               "Score 6", "Score 7", "Score 8", "Score 9"])
+        
+        result = evaluator.evaluate_chunks(chunks, language="en", sample_size=4)
+        
+        # Sampled chunks 1, 3, 5 and 7; chunk 3 fails
+        self.assertEqual(self.mock_client.chat.completions.create.call_count, 4)
+        self.assertEqual(result['evaluation_mode'], 'chunked')
+        self.assertEqual(result['composite_score'], 6.3)
+        self.assertEqual((result['chunks_evaluated'], result['total_chunks']), (3, 8))
+        self.assertEqual([c['first_segment'] for c in result['chunks']], [1, 5, 7])
+        self.assertEqual(result['confidence_interval'],
+                         list(confidence_interval([3.0, 7.0, 9.0], 8)))
+    
+    def test_evaluate_interview_from_database(self):
+        """Test loading aligned segments and translations from the database."""
+        db = Mock()
+        db.get_subtitle_segments.return_value = [
+            {'segment_index': i, 'start_time': i * 90.0, 'end_time': i * 90.0 + 5.0,
+             'original_text': f"Satz {i}"}
+            for i in range(3)
+        ]
+        db.get_segment_translations.return_value = [
+            {'segment_id': i + 1, 'segment_index': i, 'text': f"Score {i + 5}", 'provider': 'openai'}
+            for i in range(3)
+        ]
+        evaluator = HistoricalEvaluator()
+        
+        result = evaluator.evaluate_interview(db, "file-1", "en", chunk_chars=1)
+        
+        db.get_segment_translations.assert_called_once_with("file-1", "en")
+        self.assertEqual(result['composite_score'], 6.0)
+        self.assertEqual(result['total_chunks'], 3)
+        
+        db.get_segment_translations.return_value = []
+        self.assertIsNone(evaluator.evaluate_interview(db, "file-1", "en"))
+
+
+class TestLocalScreening(unittest.TestCase):
+    """Test local pre-screening of translations."""
+    
+    ORIGINAL = "Ich wurde 1921 in Hamburg geboren. Mein Vater war Arzt und wir wohnten in der Stadt."
+    
+    def test_clean_translations_pass(self):
+        """Test that plausible translations pass without flags."""
+        results = screen_translations([
+            (self.ORIGINAL, "I was born in Hamburg in 1921. My father was a doctor and we lived in the city."),
+            (self.ORIGINAL, "נולדתי בהמבורג בשנת 1921. אבי היה רופא וגרנו בעיר."),
+        ], "en")
+        
+        self.assertEqual(results[0].verdict, 'pass')
+        self.assertEqual(results[0].flags, [])
+        self.assertEqual(results[1].verdict, 'fail')
+        self.assertTrue(results[1].flags[0].startswith("WRONG_SCRIPT"))
+        
+        hebrew = screen_translations([(self.ORIGINAL, "נולדתי בהמבורג בשנת 1921. אבי היה רופא וגרנו בעיר.")], "he")
+        self.assertEqual(hebrew[0].verdict, 'pass')
+        self.assertEqual(hebrew[0].script_ratio, 1.0)
+    
+    def test_obvious_failures(self):
+        """Test empty, copied, placeholder, truncated and looping translations."""
+        looping = "\n".join(["I was born in Hamburg."] * 8)
+        results = screen_translations([
+            (self.ORIGINAL, "   "),
+            (self.ORIGINAL, self.ORIGINAL),
+            (self.ORIGINAL, "[Translation not available] " + self.ORIGINAL),
+            (self.ORIGINAL, "Born."),
+            ("\n".join(f"Dann kam Satz {i}" for i in range(8)), looping),
+        ], "en")
+        
+        self.assertEqual([r.verdict for r in results], ['fail'] * 5)
+        self.assertEqual(results[0].flags, ["EMPTY_TRANSLATION"])
+        self.assertIn("UNTRANSLATED_COPY", results[1].flags)
+        self.assertIn("TRANSLATION_PLACEHOLDER_DETECTED", results[2].flags)
+        self.assertTrue(results[3].flags[0].startswith("LENGTH_RATIO"))
+        self.assertTrue(any(flag.startswith("REPEATED_LINES") for flag in results[4].flags))
+    
+    def test_borderline_and_same_language_copies(self):
+        """Test borderline lengths and copies already in the target language."""
+        english = "I was born in Hamburg and my father was a doctor, that was the time."
+        results = screen_translations([
+            (self.ORIGINAL, "I was born in Hamburg in 1921."),
+            (english, english),
+            (self.ORIGINAL, self.ORIGINAL),
+        ], "de")
+        
+        self.assertEqual(results[0].verdict, 'borderline')
+        self.assertEqual(results[1].flags, ["UNTRANSLATED_COPY"])
+        self.assertEqual(results[2].verdict, 'pass')
+        self.assertEqual(results[2].metrics()['prescreen_verdict'], 1.0)
+
+
 class TestPrompts(unittest.TestCase):
     """Test evaluation prompts and their structure."""
     
@@ -0,0 +1,184 @@
+"""
+Tests for hot-path instrumentation.
+
+Tests cover:
+- Histogram percentile accuracy and merging
+- Timers, decorators and counters
+- Saving and accumulating metrics across runs
+- Database transaction instrumentation
+"""
+import json
+import random
+import threading
+
+import pytest
+
+from scribe.database import Database
+from scribe.instrumentation import (
+    Histogram, MetricsRegistry, registry, record_openai_usage,
+    load_metrics, save_metrics
+)
+
+
+class TestHistogram:
+    """Test the log-bucket latency histogram."""
+    
+    @pytest.mark.unit
+    def test_percentiles_within_bucket_error(self):
+        """Test that percentiles are within ~3% of the exact values."""
+        rng = random.Random(42)
+        values = sorted(rng.lognormvariate(-3, 1) for _ in range(10000))
+        histogram = Histogram()
+        for value in values:
+            histogram.record(value)
+        
+        for percent in (50, 95, 99):
+            exact = values[int(percent / 100 * len(values)) - 1]
+            assert histogram.percentile(percent) == pytest.approx(exact, rel=0.04)
+        assert histogram.percentile(100) == pytest.approx(values[-1], rel=1e-5)
+        assert Histogram().percentile(50) == 0.0
+    
+    @pytest.mark.unit
+    def test_merge_matches_single_histogram(self):
+        """Test that merged histograms equal one histogram of all values."""
+        values = [i / 1000 for i in range(1, 2000)]
+        combined, first, second = Histogram(), Histogram(), Histogram()
+        for value in values:
+            combined.record(value)
+        for value in values[:700]:
+            first.record(value)
+        for value in values[700:]:
+            second.record(value)
+        
+        first.merge(Histogram.from_dict(json.loads(json.dumps(second.to_dict()))))
+        
+        assert first.to_dict() == combined.to_dict()
+
+
+class TestMetricsRegistry:
+    """Test timers and counters."""
+    
+    @pytest.mark.unit
+    def test_timer_decorator_and_errors(self):
+        """Test that timed calls are recorded and failures counted."""
+        metrics = MetricsRegistry()
+        
+        @metrics.timed('stage.work')
+        def work(fail=False):
+            if fail:
+                raise RuntimeError("boom")
+            return 42
+        
+        assert work() == 42
+        with pytest.raises(RuntimeError):
+            work(fail=True)
+        with metrics.timer('stage.block'):
+            pass
+        
+        assert metrics.histograms['stage.work'].count == 2
+        assert metrics.histograms['stage.block'].count == 1
+        assert metrics.counters == {'stage.work.errors': 1}
+        assert {row['stage'] for row in metrics.report()} == {'stage.work', 'stage.block'}
+    
+    @pytest.mark.unit
+    def test_concurrent_counters(self):
+        """Test that counters are exact under concurrent updates."""
+        metrics = MetricsRegistry()
+        
+        def work():
+            for _ in range(1000):
+                metrics.increment('api.calls')
+                metrics.observe('api.latency', 0.001)
+        
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        assert metrics.counters['api.calls'] == 8000
+        assert metrics.histograms['api.latency'].count == 8000
+    
+    @pytest.mark.unit
+    def test_openai_usage(self):
+        """Test token counting from OpenAI responses."""
+        class Usage:
+            prompt_tokens = 100
+            completion_tokens = 20
+            total_tokens = 120
+        
+        class Response:
+            usage = Usage()
+        
+        registry.reset()
+        try:
+            record_openai_usage('openai.translate', Response())
+            record_openai_usage('openai.translate', object())
+        
+            assert registry.counters == {
+                'openai.translate.calls': 2,
+                'openai.translate.prompt_tokens': 100,
+                'openai.translate.completion_tokens': 20,
+                'openai.translate.total_tokens': 120,
+            }
+        finally:
+            registry.reset()
+
+
+class TestPersistence:
+    """Test accumulating metrics in the metrics file."""
+    
+    @pytest.mark.unit
+    def test_save_accumulates_runs(self, temp_dir):
+        """Test that each save merges into the existing file."""
+        path = temp_dir / "perf.json"
+        run = MetricsRegistry()
+        run.observe('ffmpeg.extract_audio', 2.0)
+        run.increment('deepl.characters', 500)
+        
+        assert save_metrics(path, run) == path
+        assert save_metrics(path, run) == path
+        assert save_metrics(path, MetricsRegistry()) is None
+        
+        loaded = load_metrics(path)
+        assert loaded.histograms['ffmpeg.extract_audio'].count == 2
+        assert loaded.counters['deepl.characters'] == 1000
+        assert load_metrics(temp_dir / "missing.json").is_empty()
+    
+    @pytest.mark.unit
+    def test_concurrent_saves_are_not_lost(self, temp_dir):
+        """Test that concurrent saves all end up in the metrics file."""
+        path = temp_dir / "perf.json"
+        
+        def work():
+            for _ in range(10):
+                run = MetricsRegistry()
+                run.observe('stage.work', 0.01)
+                save_metrics(path, run)
+        
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        assert load_metrics(path).histograms['stage.work'].count == 40
+    
+    @pytest.mark.unit
+    @pytest.mark.database
+    def test_database_transaction_timing(self, temp_dir):
+        """Test that transactions and commits are timed."""
+        db = Database(temp_dir / "test.db")
+        registry.reset()
+        try:
+            with db.transaction() as conn:
+                conn.execute("SELECT 1")
+            with pytest.raises(ValueError):
+                with db.transaction():
+                    raise ValueError("rollback")
+        
+            assert registry.histograms['db.transaction'].count == 2
+            assert registry.histograms['db.commit'].count == 1
+        finally:
+            registry.reset()
+            db.close()
@@ -9,6 +9,7 @@ Tests cover all major functionality including:
 - Error handling and recovery
 - Progress tracking
 """
+import json
 import pytest
 import time
 from pathlib import Path
@@ -805,8 +806,8 @@ class TestMainPublicAPIMethods:
         assert results == []
     
     @pytest.mark.unit
-    @patch('scribe.pipeline.evaluate_translation')
-    def test_evaluate_translations_success(self, mock_evaluate, pipeline, temp_dir):
+    @patch('scribe.pipeline.HistoricalEvaluator')
+    def test_evaluate_translations_success(self, mock_evaluator_class, pipeline, temp_dir):
         """Test successful translation evaluation."""
         # Create test files
         file_id = "test-1"
@@ -822,15 +823,13 @@ class TestMainPublicAPIMethods:
         # Mock database query
         pipeline.db.execute_query.return_value = [{'file_id': file_id}]
         
-        # Mock database connection for INSERT
-        mock_conn = Mock()
-        pipeline.db._get_connection.return_value = mock_conn
-        
         # Mock evaluation
-        mock_evaluate.return_value = (8.5, {
+        mock_evaluator = mock_evaluator_class.return_value
+        mock_evaluator.evaluate_batch.return_value = [{
+            'composite_score': 8.5,
             'issues': ['minor grammar'],
             'feedback': 'Good translation overall'
-        })
+        }]
         
         results = pipeline.evaluate_translations("en", sample_size=1)
         
@@ -838,14 +837,19 @@ class TestMainPublicAPIMethods:
         assert results[0][0] == file_id
         assert results[0][1] == 8.5
         assert results[0][2]['issues'] == ['minor grammar']
+        mock_evaluator.evaluate_batch.assert_called_once_with(
+            [("Original German text", "English translation")], language="en", enhanced=False
+        )
         
-        # Verify database insert was called
-        mock_conn.execute.assert_called_once()
-        mock_conn.commit.assert_called_once()
+        # Verify evaluations were saved in one bulk insert
+        pipeline.db.add_quality_evaluations.assert_called_once()
+        rows = pipeline.db.add_quality_evaluations.call_args[0][0]
+        assert len(rows) == 1
+        assert rows[0][:4] == (file_id, "en", "gpt-4", 8.5)
     
     @pytest.mark.unit
-    @patch('scribe.pipeline.evaluate_translation')
-    def test_evaluate_translations_enhanced_hebrew(self, mock_evaluate, pipeline, temp_dir):
+    @patch('scribe.pipeline.HistoricalEvaluator')
+    def test_evaluate_translations_enhanced_hebrew(self, mock_evaluator_class, pipeline, temp_dir):
         """Test enhanced Hebrew evaluation with validation info."""
         # Create test files
         file_id = "test-1"
@@ -861,30 +865,101 @@ class TestMainPublicAPIMethods:
         # Mock database query
         pipeline.db.execute_query.return_value = [{'file_id': file_id}]
         
-        # Mock database connection for INSERT
-        mock_conn = Mock()
-        pipeline.db._get_connection.return_value = mock_conn
-        
         # Mock evaluation with Hebrew validation details
-        mock_evaluate.return_value = (9.0, {
+        mock_evaluator_class.return_value.evaluate_batch.return_value = [{
+            'composite_score': 9.0,
             'issues': [],
             'feedback': 'Excellent Hebrew translation',
             'suitability': 'Very suitable for historical preservation',
             'hebrew_validation': {'hebrew_ratio': 0.85}
-        })
+        }]
         
         results = pipeline.evaluate_translations("he", sample_size=1, enhanced=True, model="gpt-4.1")
         
         assert len(results) == 1
         assert results[0][1] == 9.0
+        assert mock_evaluator_class.call_args[1]['model'] == "gpt-4.1"
         
         # Verify enhanced Hebrew info was included
-        mock_conn.execute.assert_called_once()
-        call_args = mock_conn.execute.call_args[0]
-        comment = call_args[1][5]  # comment parameter
+        pipeline.db.add_quality_evaluations.assert_called_once()
+        rows = pipeline.db.add_quality_evaluations.call_args[0][0]
+        comment = rows[0][5]  # comment parameter
         assert "Very suitable for historical preservation" in comment
         assert "Hebrew ratio: 85.0%" in comment
     
+    @pytest.mark.unit
+    @patch('scribe.pipeline.HistoricalEvaluator')
+    def test_evaluate_translations_chunked(self, mock_evaluator_class, pipeline, temp_dir):
+        """Test chunked evaluation with whole-text fallback for files without segments."""
+        fallback_dir = temp_dir / "output" / "test-2"
+        fallback_dir.mkdir(parents=True)
+        (fallback_dir / "test-2.txt").write_text("Original German text")
+        (fallback_dir / "test-2.en.txt").write_text("English translation")
+        
+        pipeline.db.execute_query.return_value = [{'file_id': 'test-1'}, {'file_id': 'test-2'}]
+        
+        mock_evaluator = mock_evaluator_class.return_value
+        mock_evaluator.evaluate_interview.side_effect = [{
+            'evaluation_mode': 'chunked',
+            'composite_score': 7.5,
+            'confidence_interval': [6.8, 8.2],
+            'issues': ['[12:05] omitted hesitation'],
+            'chunks_evaluated': 8,
+            'total_chunks': 40
+        }, None]
+        mock_evaluator.evaluate_batch.return_value = [{'composite_score': 8.0, 'issues': []}]
+        
+        results = pipeline.evaluate_translations("en", sample_size=2, chunked=True, chunks=8)
+        
+        assert [(r[0], r[1]) for r in results] == [("test-1", 7.5), ("test-2", 8.0)]
+        mock_evaluator.evaluate_interview.assert_any_call(
+            pipeline.db, "test-1", "en", enhanced=False, sample_size=8
+        )
+        mock_evaluator.evaluate_batch.assert_called_once_with(
+            [("Original German text", "English translation")], language="en", enhanced=False
+        )
+        
+        rows = pipeline.db.add_quality_evaluations.call_args[0][0]
+        assert rows[0][5] == "Chunked: 8/40 chunks, 95% CI 6.8-8.2"
+    
+    @pytest.mark.unit
+    @patch('scribe.pipeline.batch_store_quality_metrics')
+    @patch('scribe.pipeline.add_quality_metrics_schema')
+    @patch('scribe.pipeline.HistoricalEvaluator')
+    def test_evaluate_translations_prescreen(self, mock_evaluator_class, mock_schema, mock_store, pipeline, temp_dir):
+        """Test that only borderline translations reach the LLM after local screening."""
+        original = "Ich wurde 1921 in Hamburg geboren. Mein Vater war Arzt und wir wohnten in der Stadt."
+        translations = {
+            "broken": "",
+            "clean": "I was born in Hamburg in 1921. My father was a doctor and we lived in the city.",
+            "short": "I was born in Hamburg in 1921.",
+        }
+        for file_id, text in translations.items():
+            file_dir = temp_dir / "output" / file_id
+            file_dir.mkdir(parents=True)
+            (file_dir / f"{file_id}.txt").write_text(original)
+            (file_dir / f"{file_id}.en.txt").write_text(text)
+        
+        pipeline.db.execute_query.return_value = [{'file_id': f} for f in translations]
+        mock_evaluator = mock_evaluator_class.return_value
+        mock_evaluator.evaluate_batch.return_value = [{'composite_score': 6.0, 'issues': []}]
+        
+        results = pipeline.evaluate_translations("en", sample_size=3, prescreen=True)
+        
+        assert [(r[0], r[1]) for r in results] == [("broken", 0.0), ("short", 6.0)]
+        mock_schema.assert_called_once_with(pipeline.db)
+        assert "prescreen_verdict" in pipeline.db.execute_query.call_args[0][0]
+        mock_evaluator.evaluate_batch.assert_called_once_with(
+            [(original, translations["short"])], language="en", enhanced=False
+        )
+        mock_store.assert_called_once()
+        stored = {entry[0]: entry[2]['prescreen_verdict'] for entry in mock_store.call_args[0][1]}
+        assert stored == {"broken": 0.0, "clean": 1.0, "short": 0.5}
+        
+        rows = pipeline.db.add_quality_evaluations.call_args[0][0]
+        assert [row[2] for row in rows] == ["sanity-check", "gpt-4"]
+        assert json.loads(rows[0][4]) == ["EMPTY_TRANSLATION"]
+    
     @pytest.mark.unit
     def test_translate_srt_files_no_pending(self, pipeline):
         """Test SRT translation when no files are pending."""
@@ -0,0 +1,225 @@
+"""
+Tests for the passage retrieval service.
+
+Tests cover:
+- bm25 retrieval of time-coded passages with neighbouring context
+- Vector retrieval with the hashing embedder (brute force and IVF)
+- Hybrid rank fusion
+- The HTTP shim used by the viewer
+"""
+import json
+import threading
+import urllib.request
+
+import pytest
+
+from scribe.database import Database
+from scribe.retrieval import (
+    RetrievalService, HashingEmbedder, VectorIndex, build_vector_index,
+    reciprocal_rank_fusion, make_server, np
+)
+
+requires_numpy = pytest.mark.skipif(np is None, reason="NumPy not installed")
+
+SEGMENTS = [
+    ("Ich wurde 1921 in Hamburg geboren", "I was born in Hamburg in 1921"),
+    ("Mein Vater war Arzt", "My father was a doctor"),
+    ("1939 wurde ich zur Wehrmacht eingezogen", "In 1939 I was drafted into the Wehrmacht"),
+    ("Niemand wusste, dass meine Mutter Jüdin war", "Nobody knew my mother was Jewish"),
+    ("Wir kämpften in Russland", "We fought in Russia"),
+    ("Im Winter war es sehr kalt", "In winter it was very cold"),
+    ("Nach dem Krieg ging ich nach Amerika", "After the war I went to America"),
+]
+
+
+@pytest.fixture
+def archive(temp_dir):
+    """Database with two interviews and English translations."""
+    db = Database(temp_dir / "test.db")
+    db._migrate_to_subtitle_segments()
+    interviews = []
+    for name in ("a", "b"):
+        file_id = db.add_file(f"/test/{name}.mp4", f"{name}_mp4", media_type="video")
+        for i, (original, english) in enumerate(SEGMENTS if name == "a" else SEGMENTS[4:]):
+            segment_id = db.add_subtitle_segment(file_id, i, i * 4.0, i * 4.0 + 3.5, original)
+            db.set_segment_translation(segment_id, 'en', english)
+        interviews.append(file_id)
+    yield db, interviews
+    db.close()
+
+
+class TestKeywordRetrieval:
+    """Test bm25 passage retrieval."""
+    
+    @pytest.mark.unit
+    @pytest.mark.database
+    def test_question_returns_passage_with_context(self, archive):
+        """Test that a full-sentence question finds a time-coded passage."""
+        db, (interview_a, _) = archive
+        service = RetrievalService(db)
+        
+        passages = service.search("When were you drafted into the Wehrmacht?",
+                                  lang='en', mode='bm25', context=1)
+        
+        assert len(passages) == 1
+        passage = passages[0]
+        assert passage.interview_id == interview_a
+        assert passage.lang == 'en'
+        assert passage.matched_segments == [2]
+        assert (passage.first_segment, passage.last_segment) == (1, 3)
+        assert (passage.start_time, passage.end_time) == (4.0, 15.5)
+        assert passage.text == ("My father was a doctor In 1939 I was drafted into the "
+                                "Wehrmacht Nobody knew my mother was Jewish")
+    
+    @pytest.mark.unit
+    @pytest.mark.database
+    def test_overlapping_hits_are_merged(self, archive):
+        """Test that hits within each other's context form one passage."""
+        db, (interview_a, _) = archive
+        service = RetrievalService(db)
+        
+        passages = service.search("father mother", lang='en', mode='bm25', context=1)
+        
+        assert len(passages) == 1
+        assert passages[0].matched_segments == [1, 3]
+        assert (passages[0].first_segment, passages[0].last_segment) == (0, 4)
+    
+    @pytest.mark.unit
+    @pytest.mark.database
+    def test_language_filter(self, archive):
+        """Test original-language search, unknown languages and stopword-only queries."""
+        db, _ = archive
+        service = RetrievalService(db)
+        
+        passages = service.search("Russland", lang='orig', mode='bm25', context=0)
+        assert {p.text for p in passages} == {"Wir kämpften in Russland"}
+        assert len(passages) == 2
+        
+        assert service.search("Russland", lang='en', mode='bm25') == []
+        assert service.search("Russland", lang='xx') == []
+        assert service.search("what did you do", mode='bm25') == []
+        
+        with pytest.raises(ValueError):
+            service.search("Russland", mode='semantic')
+        with pytest.raises(ValueError):
+            service.search("Russland", mode='vector')
+
+
+class TestVectorRetrieval:
+    """Test vector retrieval with the hashing embedder."""
+    
+    @pytest.mark.unit
+    def test_reciprocal_rank_fusion(self):
+        """Test that keys ranked by both lists come first."""
+        fused = reciprocal_rank_fusion([['a', 'b', 'c'], ['b', 'c']])
+        
+        assert [key for key, _ in fused] == ['b', 'c', 'a']
+    
+    @requires_numpy
+    @pytest.mark.unit
+    def test_hashing_embedder(self):
+        """Test that embeddings are normalized and deterministic."""
+        embedder = HashingEmbedder(dim=64)
+        vectors = embedder(["Wehrmacht soldier", "Wehrmacht soldier", ""])
+        
+        assert vectors.shape == (3, 64)
+        assert np.allclose(np.linalg.norm(vectors[0]), 1.0)
+        assert np.array_equal(vectors[0], vectors[1])
+        assert not vectors[2].any()
+    
+    @requires_numpy
+    @pytest.mark.unit
+    @pytest.mark.database
+    def test_vector_search(self, archive, temp_dir):
+        """Test vector-only and hybrid retrieval against a built index."""
+        db, (interview_a, interview_b) = archive
+        index_dir = temp_dir / "vectors"
+        meta = build_vector_index(db, index_dir, HashingEmbedder(dim=256), nlist=0)
+        
+        assert meta['count'] == 2 * (len(SEGMENTS) + 3)
+        assert meta['embedder'] == 'hashing-256'
+        
+        service = RetrievalService(db, index_dir=index_dir)
+        passages = service.search("my mother was Jewish", lang='en', mode='vector',
+                                  context=0, limit=1)
+        assert passages[0].interview_id == interview_a
+        assert passages[0].matched_segments == [3]
+        
+        passages = service.search("the war in Russia", mode='hybrid', context=0, limit=2)
+        assert {(p.interview_id, p.matched_segments[0]) for p in passages} == {
+            (interview_a, 4), (interview_b, 0)
+        }
+        
+        with pytest.raises(ValueError):
+            RetrievalService(db, index_dir=index_dir, embedder=HashingEmbedder(dim=128))
+    
+    @requires_numpy
+    @pytest.mark.unit
+    @pytest.mark.database
+    def test_vector_only_without_fts(self, archive, temp_dir):
+        """Test that a database without FTS5 tables falls back to vector retrieval."""
+        db, (interview_a, _) = archive
+        with db.transaction() as conn:
+            conn.execute("DROP TABLE segment_fts")
+            conn.execute("DROP TABLE search_languages")
+        index_dir = temp_dir / "vectors"
+        build_vector_index(db, index_dir, HashingEmbedder(dim=256), nlist=0)
+        
+        service = RetrievalService(db, index_dir=index_dir)
+        
+        assert not service.keyword_search
+        passages = service.search("my mother was Jewish", lang='en', context=0, limit=1)
+        assert passages[0].interview_id == interview_a
+        assert passages[0].matched_segments == [3]
+        with pytest.raises(ValueError):
+            service.search("Hamburg", mode='bm25')
+    
+    @requires_numpy
+    @pytest.mark.unit
+    @pytest.mark.database
+    def test_ivf_matches_brute_force(self, archive, temp_dir):
+        """Test that probing every IVF list returns the brute-force scores."""
+        db, _ = archive
+        embedder = HashingEmbedder(dim=256)
+        build_vector_index(db, temp_dir / "brute", embedder, nlist=0)
+        build_vector_index(db, temp_dir / "ivf", embedder, nlist=4)
+        brute = VectorIndex.load(temp_dir / "brute")
+        ivf = VectorIndex.load(temp_dir / "ivf")
+        
+        assert len(ivf.offsets) == 5
+        assert ivf.offsets[-1] == len(brute)
+        
+        query = embedder(["cold winter in Russia"])[0]
+        expected = dict(brute.search(query, len(brute)))
+        assert dict(ivf.search(query, len(brute), nprobe=4)) == pytest.approx(expected)
+
+
+class TestHttpShim:
+    """Test the HTTP endpoint the viewer calls."""
+    
+    @pytest.mark.integration
+    @pytest.mark.database
+    def test_search_endpoint(self, archive):
+        """Test /search, /health and error responses."""
+        db, (interview_a, _) = archive
+        server = make_server(RetrievalService(db), port=0)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        base = f"http://127.0.0.1:{server.server_address[1]}"
+        
+        try:
+            with urllib.request.urlopen(f"{base}/search?q=Hamburg&lang=en&context=0") as response:
+                payload = json.load(response)
+            assert [p['interview_id'] for p in payload['passages']] == [interview_a]
+            assert payload['passages'][0]['start_time'] == 0.0
+            assert 'took_ms' in payload
+        
+            with urllib.request.urlopen(f"{base}/health") as response:
+                assert json.load(response)['status'] == 'ok'
+        
+            with pytest.raises(urllib.error.HTTPError) as error:
+                urllib.request.urlopen(f"{base}/search?q=Hamburg&mode=semantic")
+            assert error.value.code == 400
+        finally:
+            server.shutdown()
+            server.server_close()
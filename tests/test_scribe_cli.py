@@ -0,0 +1,49 @@
+"""
+Tests for the scribe command line interface.
+
+Tests cover:
+- Pending counts reported by the status command
+"""
+import re
+
+import pytest
+
+pytest.importorskip("click")
+from click.testing import CliRunner
+
+import scribe_cli
+from scribe.database import Database
+
+
+@pytest.mark.unit
+@pytest.mark.database
+class TestStatusCommand:
+    """Test the status command against the database."""
+    
+    def test_pending_matches_pending_files(self, temp_dir, monkeypatch):
+        """Files that failed overall are not reported as pending work."""
+        db_path = temp_dir / "test.db"
+        db = Database(db_path)
+        healthy = db.add_file("/test/healthy.mp4", "healthy_mp4", media_type="video")
+        failed = db.add_file("/test/failed.mp4", "failed_mp4", media_type="video")
+        db.update_status(healthy, transcription_status='completed')
+        db.update_status(failed, status='failed')
+        
+        monkeypatch.setattr(scribe_cli, 'Database', lambda: Database(db_path))
+        result = CliRunner().invoke(scribe_cli.cli, ['status'])
+        
+        assert result.exit_code == 0, result.output
+        pending = result.output.split("Pending:")[1]
+        reported = {
+            'transcription': int(re.search(r"Transcription: (\d+)", pending).group(1)),
+            **{
+                f'translation_{lang}': int(re.search(rf"{lang.upper()} translation: (\d+)", pending).group(1))
+                for lang in ('en', 'de', 'he')
+            }
+        }
+        assert reported == {
+            stage: len(db.get_pending_files(stage)) for stage in reported
+        }
+        assert reported['translation_en'] == 1
+        
+        db.close()
@@ -0,0 +1,127 @@
+"""
+Tests for the prebuilt search index of the viewer.
+
+Tests cover:
+- Tokenization of Hebrew, German and English cue text
+- Delta-encoded postings
+- Plain and gzipped output
+"""
+import gzip
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scribe-viewer" / "scripts"))
+
+from search_index import INDEX_VERSION, SearchIndexBuilder, tokenize
+
+
+def decode_posting(posting):
+    """Return (doc, cue indexes) from a delta-encoded posting."""
+    doc, cues = posting[0], [posting[1]]
+    for gap in posting[2:]:
+        cues.append(cues[-1] + gap)
+    return doc, cues
+
+
+def make_entry(file_id, language, texts):
+    """Manifest entry with one transcript whose cues are a second apart."""
+    return {
+        'id': file_id,
+        'transcripts': [{
+            'language': language,
+            'cues': [{'time': float(i), 'text': text} for i, text in enumerate(texts)]
+        }]
+    }
+
+
+@pytest.mark.unit
+class TestTokenize:
+    """Test normalization and splitting of search tokens."""
+    
+    def test_hebrew_niqqud_is_removed(self):
+        """Pointed and unpointed Hebrew produce the same tokens."""
+        assert tokenize("שָׁלוֹם עֲלֵיכֶם") == tokenize("שלום עליכם") == ["שלום", "עליכם"]
+    
+    def test_hebrew_gershayim_and_maqaf(self):
+        """Gershayim join an acronym; maqaf separates words."""
+        assert tokenize("צה״ל") == ["צהל"]
+        assert tokenize("בית־ספר") == ["בית", "ספר"]
+    
+    def test_german_umlauts_and_eszett(self):
+        """Umlauts fold to their base letter; ß is kept."""
+        assert tokenize("Müller ÄRGER Straße") == ["muller", "arger", "straße"]
+    
+    def test_punctuation_and_case(self):
+        """Punctuation and underscores split tokens, which are lowercased."""
+        assert tokenize("Hello, WORLD... 1945; e-mail_x!") == ["hello", "world", "1945", "e", "mail", "x"]
+    
+    def test_empty_text(self):
+        """Text without letters or digits has no tokens."""
+        assert tokenize(" -- ... ") == []
+
+
+@pytest.mark.unit
+class TestSearchIndexBuilder:
+    """Test building and serializing the inverted index."""
+    
+    def test_postings_round_trip_to_cue_ids(self):
+        """Decoding a posting yields the cues containing the token."""
+        builder = SearchIndexBuilder()
+        texts = ["Hamburg", "Berlin", "Hamburg again", "nothing", "nothing", "back to hamburg"]
+        builder.add_interview(make_entry("int-1", "en", texts))
+        
+        postings = builder.terms['en']['hamburg']
+        
+        assert postings == [[0, 0, 2, 3]]
+        assert decode_posting(postings[0]) == (0, [0, 2, 5])
+        assert builder.times[0] == [0.0, 1.0, 2.0, 3.0, 4.0, 5.0]
+    
+    def test_docs_per_language(self):
+        """Each transcript is its own doc and terms are split by language."""
+        builder = SearchIndexBuilder()
+        builder.add_interview(make_entry("int-1", "de", ["Straße"]))
+        builder.add_interview(make_entry("int-2", "de", ["Strasse", "straße"]))
+        builder.add_interview(make_entry("int-2", "he", ["שָׁלוֹם"]))
+        
+        assert builder.docs == [["int-1", "de"], ["int-2", "de"], ["int-2", "he"]]
+        assert [decode_posting(p) for p in builder.terms['de']['straße']] == [(0, [0]), (1, [1])]
+        assert builder.terms['he'] == {"שלום": [[2, 0]]}
+        assert builder.posting_count == 4
+    
+    def test_transcripts_without_cues_are_skipped(self):
+        """Empty transcripts do not create docs."""
+        builder = SearchIndexBuilder()
+        builder.add_interview({'id': "int-1", 'transcripts': [{'language': 'en', 'cues': []}]})
+        
+        assert builder.docs == []
+        assert builder.terms == {}
+    
+    def test_write_plain_json(self, temp_dir):
+        """The plain index is compact UTF-8 JSON."""
+        builder = SearchIndexBuilder()
+        builder.add_interview(make_entry("int-1", "he", ["שלום"]))
+        path = temp_dir / "search-index.json"
+        
+        size = builder.write(str(path))
+        
+        assert size == path.stat().st_size
+        assert "שלום" in path.read_text(encoding='utf-8')
+        assert json.loads(path.read_bytes())['version'] == INDEX_VERSION
+        assert not (temp_dir / "search-index.json.tmp").exists()
+    
+    def test_write_gzip(self, temp_dir):
+        """The gzipped index decompresses to the plain one and is reproducible."""
+        builder = SearchIndexBuilder()
+        builder.add_interview(make_entry("int-1", "en", ["Hamburg", "Berlin", "Hamburg"]))
+        path = temp_dir / "search-index.json.gz"
+        
+        size = builder.write(str(path), compress=True)
+        
+        data = path.read_bytes()
+        assert size == len(data)
+        assert gzip.decompress(data) == builder.serialize()
+        assert builder.serialize(compress=True) == data
+        assert json.loads(gzip.decompress(data)) == builder.to_dict()
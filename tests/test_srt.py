@@ -0,0 +1,128 @@
+"""
+Tests for the shared SRT parser.
+
+Tests cover:
+- Cue parsing, including lenient handling of real-world files
+- Exact preservation of timestamps and empty cues
+- WebVTT rendering and single-read conversion
+"""
+import pytest
+
+from scribe.srt import (
+    SubtitleCue, format_timestamp, parse_srt, parse_srt_file, cues_to_vtt, srt_to_vtt
+)
+
+
+SAMPLE_SRT = """1
+00:00:00,000 --> 00:00:02,500
+In die Wehrmacht gekommen?
+
+2
+00:00:02,500 --> 00:00:05,000
+Yes, in 1941.
+I was eighteen.
+
+3
+01:02:03,456 --> 01:02:04,000
+Danke.
+"""
+
+
+class TestParseSrt:
+    """Test SRT parsing."""
+    
+    @pytest.mark.unit
+    def test_parse_basic(self):
+        """Test parsing well-formed SRT content."""
+        cues = parse_srt(SAMPLE_SRT)
+        
+        assert len(cues) == 3
+        assert cues[0] == SubtitleCue(
+            index=1, start=0.0, end=2.5,
+            start_time='00:00:00,000', end_time='00:00:02,500',
+            text='In die Wehrmacht gekommen?'
+        )
+        assert cues[1].text == 'Yes, in 1941.\nI was eighteen.'
+        assert cues[2].start == pytest.approx(3723.456)
+        assert cues[2].start_time == '01:02:03,456'
+    
+    @pytest.mark.unit
+    def test_parse_bom_and_crlf(self):
+        """Test files with a UTF-8 BOM and Windows line endings."""
+        content = '\ufeff' + SAMPLE_SRT.replace('\n', '\r\n')
+        
+        assert parse_srt(content) == parse_srt(SAMPLE_SRT)
+    
+    @pytest.mark.unit
+    def test_parse_keeps_empty_cues(self):
+        """Test that empty and whitespace-only cues keep their place."""
+        content = (
+            "1\n00:00:00,000 --> 00:00:01,000\nFirst\n\n"
+            "2\n00:00:01,000 --> 00:00:02,000\n\n"
+            "3\n00:00:02,000 --> 00:00:03,000\n   \n\n"
+            "4\n00:00:03,000 --> 00:00:04,000\nLast\n"
+        )
+        cues = parse_srt(content)
+        
+        assert [c.index for c in cues] == [1, 2, 3, 4]
+        assert [c.text for c in cues] == ['First', '', '   ', 'Last']
+    
+    @pytest.mark.unit
+    def test_parse_missing_separators(self):
+        """Test cues without blank lines or index lines between them."""
+        content = (
+            "1\n00:00:00,000 --> 00:00:01,000\nFirst\n"
+            "2\n00:00:01,000-->00:00:02,000\nSecond\n\n"
+            "00:00:02.000 --> 00:00:03.000 X1:100 X2:200\nThird\n"
+        )
+        cues = parse_srt(content)
+        
+        assert [c.text for c in cues] == ['First', 'Second', 'Third']
+        assert [c.index for c in cues] == [1, 2, None]
+        assert cues[2].end == 3.0
+    
+    @pytest.mark.unit
+    def test_parse_skips_garbage(self):
+        """Test that text outside cues is ignored."""
+        cues = parse_srt("not a subtitle\n\n" + SAMPLE_SRT)
+        
+        assert len(cues) == 3
+    
+    @pytest.mark.unit
+    def test_parse_file_latin1_fallback(self, tmp_path):
+        """Test reading legacy Latin-1 files."""
+        srt_file = tmp_path / "legacy.srt"
+        srt_file.write_bytes("1\n00:00:00,000 --> 00:00:01,000\nMüller\n".encode('latin-1'))
+        
+        assert parse_srt_file(srt_file)[0].text == 'Müller'
+
+
+class TestVtt:
+    """Test WebVTT rendering."""
+    
+    @pytest.mark.unit
+    def test_format_timestamp(self):
+        """Test SRT and VTT timestamp formatting."""
+        assert format_timestamp(3723.456) == '01:02:03,456'
+        assert format_timestamp(0.1, '.') == '00:00:00.100'
+    
+    @pytest.mark.unit
+    def test_cues_to_vtt(self):
+        """Test VTT output."""
+        vtt = cues_to_vtt(parse_srt(SAMPLE_SRT))
+        
+        assert vtt.startswith("WEBVTT\n\n00:00:00.000 --> 00:00:02.500\nIn die Wehrmacht gekommen?\n")
+        assert "00:00:02.500 --> 00:00:05.000\nYes, in 1941.\nI was eighteen.\n" in vtt
+        assert "01:02:03.456 --> 01:02:04.000\nDanke.\n" in vtt
+    
+    @pytest.mark.unit
+    def test_srt_to_vtt(self, tmp_path):
+        """Test conversion writes the VTT and returns the cues."""
+        srt_file = tmp_path / "interview.orig.srt"
+        vtt_file = tmp_path / "interview.orig.vtt"
+        srt_file.write_text(SAMPLE_SRT, encoding='utf-8')
+        
+        cues = srt_to_vtt(srt_file, vtt_file)
+        
+        assert cues == parse_srt(SAMPLE_SRT)
+        assert vtt_file.read_text(encoding='utf-8') == cues_to_vtt(cues)
@@ -429,6 +429,121 @@ class TestSRTTranslatorDatabaseIntegration:
         
         db.close()
     
+    @pytest.mark.integration
+    @pytest.mark.database
+    def test_srt_translation_reuses_stored_detection(self, temp_dir, mock_translator):
+        """Test that SRT translation only detects segments without a stored language."""
+        db_path = temp_dir / "test_stored_detection.db"
+        db = Database(db_path)
+        db._migrate_to_subtitle_segments()
+        
+        interview_id = db.add_file("/test/stored.mp4", "stored_mp4", "video")
+        texts = ['Ich wurde geboren.', 'My family moved away.', 'Das war neunzehn dreißig.']
+        for idx, text in enumerate(texts):
+            db.add_subtitle_segment(
+                interview_id=interview_id,
+                segment_index=idx,
+                start_time=idx * 2.0,
+                end_time=idx * 2.0 + 2.0,
+                original_text=text
+            )
+        
+        # The database path already detected the first two segments
+        rows = db.get_segment_languages(interview_id)
+        db.set_segment_detected_languages(
+            {rows[0]['id']: 'de', rows[1]['id']: 'en'},
+            {rows[0]['id']: 0.9, rows[1]['id']: 0.95}
+        )
+        
+        srt_path = temp_dir / "stored.srt"
+        srt_path.write_text(''.join(
+            f"{idx + 1}\n00:00:{idx * 2:02d},000 --> 00:00:{idx * 2 + 2:02d},000\n{text}\n\n"
+            for idx, text in enumerate(texts)
+        ), encoding='utf-8')
+        
+        create = mock_translator.openai_client.chat.completions.create
+        create.return_value = Mock(choices=[Mock(message=Mock(content="1: German 0.8"))])
+        
+        cache_dir = temp_dir / "detect_cache"
+        srt_translator = SRTTranslator(translator=mock_translator, db=db, detect_cache_dir=cache_dir)
+        translated = srt_translator.translate_srt(str(srt_path), 'en', interview_id=interview_id)
+        
+        # Only the undetected segment was sent for detection
+        create.assert_called_once()
+        prompt = create.call_args[1]['messages'][0]['content']
+        assert 'Das war neunzehn' in prompt
+        assert 'Ich wurde geboren' not in prompt
+        
+        assert [seg.detected_language for seg in translated] == ['de', 'en', 'de']
+        assert translated[1].text == 'My family moved away.'  # Preserved as English
+        stored = db.get_segment_languages(interview_id)
+        assert [row['detected_language'] for row in stored] == ['de', 'en', 'de']
+        assert [row['detection_confidence'] for row in stored] == [0.9, 0.95, 0.8]
+        assert not cache_dir.exists()  # Fully matched files are cached in the database
+        
+        # Every segment is now stored, so nothing is detected again
+        srt_translator.translate_srt(str(srt_path), 'de', interview_id=interview_id)
+        create.assert_called_once()
+        
+        db.close()
+    
+    @pytest.mark.integration
+    @pytest.mark.database
+    def test_partial_match_detects_only_missing_segments(self, temp_dir, mock_translator):
+        """Test that segments without a database row use the file cache and matched rows are stored."""
+        db = Database(temp_dir / "test_partial_detection.db")
+        db._migrate_to_subtitle_segments()
+        
+        interview_id = db.add_file("/test/partial.mp4", "partial_mp4", "video")
+        texts = ['Ich wurde geboren.', 'My family moved away.', 'Das war neunzehn dreißig.']
+        for idx, text in enumerate(texts):
+            db.add_subtitle_segment(
+                interview_id=interview_id,
+                segment_index=idx,
+                start_time=idx * 2.0,
+                end_time=idx * 2.0 + 2.0,
+                original_text=text
+            )
+        rows = db.get_segment_languages(interview_id)
+        db.set_segment_detected_languages({rows[0]['id']: 'de'}, {rows[0]['id']: 0.9})
+        
+        # The SRT has a fourth segment that is not in the database
+        srt_texts = texts + ['Wir gingen nach Amerika.']
+        srt_path = temp_dir / "partial.srt"
+        srt_path.write_text(''.join(
+            f"{idx + 1}\n00:00:{idx * 2:02d},000 --> 00:00:{idx * 2 + 2:02d},000\n{text}\n\n"
+            for idx, text in enumerate(srt_texts)
+        ), encoding='utf-8')
+        
+        create = mock_translator.openai_client.chat.completions.create
+        create.return_value = Mock(choices=[Mock(message=Mock(
+            content="1: English 0.9\n2: German 0.8\n3: German 0.7"
+        ))])
+        
+        cache_dir = temp_dir / "detect_cache"
+        srt_translator = SRTTranslator(translator=mock_translator, db=db, detect_cache_dir=cache_dir)
+        translated = srt_translator.translate_srt(str(srt_path), 'en', interview_id=interview_id)
+        
+        # The stored segment is not detected again
+        create.assert_called_once()
+        prompt = create.call_args[1]['messages'][0]['content']
+        assert 'Ich wurde geboren' not in prompt
+        assert 'Wir gingen nach Amerika' in prompt
+        assert [seg.detected_language for seg in translated] == ['de', 'en', 'de', 'de']
+        
+        # Results for matched rows are stored; the unmatched segment is in the file cache
+        stored = db.get_segment_languages(interview_id)
+        assert [row['detected_language'] for row in stored] == ['de', 'en', 'de']
+        assert [row['detection_confidence'] for row in stored] == [0.9, 0.9, 0.8]
+        assert len(list(cache_dir.glob('*.json'))) == 1
+        
+        # The next run reads the stored rows and the cache without detecting
+        translated = srt_translator.translate_srt(str(srt_path), 'de', interview_id=interview_id)
+        create.assert_called_once()
+        assert translated[3].detected_language == 'de'
+        
+        db.close()
+    
     @pytest.mark.integration
     @pytest.mark.database
     def test_database_srt_batch_processing_efficiency(self, temp_dir, mock_translator):
@@ -9,8 +9,10 @@ Tests cover all utility functions including:
 - Directory management
 - General utility functions
 """
+import json
 import pytest
 import time
+import threading
 import uuid
 import hashlib
 import unicodedata
@@ -21,7 +23,8 @@ from concurrent.futures import TimeoutError
 from scribe.utils import (
     normalize_path, sanitize_filename, generate_file_id,
     ensure_directory, ProgressTracker, SimpleWorkerPool, WorkerPoolError,
-    calculate_checksum, get_file_info, find_transcript_file, chunk_list, safe_execute
+    calculate_checksum, get_file_info, find_transcript_file, chunk_list, safe_execute,
+    JSONLMetricsSink, PrometheusTextfileSink
 )
 
 
@@ -247,6 +250,97 @@ class TestProgressTracker:
         
         captured = capsys.readouterr()
         assert "completed" in captured.out.lower()
+    
+    @pytest.mark.unit
+    def test_progress_tracker_throttles_output(self, capsys):
+        """Test that only the first and final updates print within the refresh interval."""
+        tracker = ProgressTracker(total=100, description="Throttled", refresh_interval=60)
+        
+        tracker.start()
+        for _ in range(100):
+            tracker.update(1)
+        
+        lines = capsys.readouterr().out.strip().splitlines()
+        assert len(lines) == 3
+        assert "1/100" in lines[1]
+        assert "100/100" in lines[2]
+    
+    @pytest.mark.unit
+    def test_progress_tracker_concurrent_updates(self):
+        """Test that counters stay exact under concurrent updates."""
+        tracker = ProgressTracker(total=8000, description="Concurrent",
+                                  refresh_interval=60, sink=Mock())
+        
+        def work(success):
+            for _ in range(1000):
+                tracker.update(1, success=success)
+        
+        threads = [threading.Thread(target=work, args=(i % 2 == 0,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        stats = tracker.get_stats()
+        assert stats['processed'] == 8000
+        assert stats['completed'] == 4000
+        assert stats['failed'] == 4000
+    
+    @pytest.mark.unit
+    def test_progress_tracker_sliding_window_rate(self):
+        """Test that throughput and ETA use only recent updates."""
+        sink = Mock()
+        tracker = ProgressTracker(total=100, description="Window", window=10,
+                                  refresh_interval=0, sink=sink)
+        
+        with patch('scribe.utils.time.monotonic') as monotonic:
+            monotonic.return_value = 0.0
+            tracker.start()
+            # Slow start: 10 items in 100s, then 2 items/s
+            monotonic.return_value = 100.0
+            tracker.update(10)
+            for second in range(1, 21):
+                monotonic.return_value = 100.0 + second
+                tracker.update(2)
+        
+        stats = sink.emit.call_args[0][0]
+        assert stats['processed'] == 50
+        assert stats['rate'] == pytest.approx(2.0)
+        assert stats['eta_seconds'] == pytest.approx(25.0)
+    
+    @pytest.mark.unit
+    def test_progress_tracker_jsonl_sink(self, temp_dir, capsys):
+        """Test that snapshots go to a JSONL sink instead of stdout."""
+        path = temp_dir / "progress.jsonl"
+        
+        with ProgressTracker(total=2, description="Sink", sink=JSONLMetricsSink(path)) as tracker:
+            tracker.update(1)
+            tracker.update(1, success=False)
+        
+        assert capsys.readouterr().out == ""
+        records = [json.loads(line) for line in path.read_text().splitlines()]
+        assert records[0]['processed'] == 0
+        assert records[-1]['finished'] is True
+        assert records[-1]['completed'] == 1
+        assert records[-1]['failed'] == 1
+        assert all(r['description'] == "Sink" for r in records)
+    
+    @pytest.mark.unit
+    def test_progress_tracker_prometheus_sink(self, temp_dir, monkeypatch):
+        """Test the Prometheus textfile sink configured from the environment."""
+        path = temp_dir / "scribe.prom"
+        monkeypatch.setenv('SCRIBE_PROGRESS_SINK', f"prometheus:{path}")
+        
+        tracker = ProgressTracker(total=4, description='DE "Translation"')
+        assert isinstance(tracker.sink, PrometheusTextfileSink)
+        tracker.start()
+        tracker.update(3)
+        
+        content = path.read_text()
+        assert '# TYPE scribe_progress_processed gauge' in content
+        assert 'scribe_progress_processed{task="DE \\"Translation\\""} 3' in content
+        assert 'scribe_progress_total{task="DE \\"Translation\\""} 4' in content
+        assert not path.with_name("scribe.prom.tmp").exists()
 
 
 class TestSimpleWorkerPool: